@@ -21,12 +21,15 @@ through the Cassandra driver.
 import logging
 import os
 import ssl
+import threading
 from .consts import (
     CERT_DIRECTORY,
     CERT_FILENAME,
     CONNECTION_TIMEOUT,
     CONTROL_CONNECTION_TIMEOUT,
+    DEFAULT_PAGE_SIZE,
     KEYSPACES_DEFAULT_PORT,
+    PREPARED_STATEMENT_CACHE_SIZE,
     PROTOCOL_VERSION,
 )
 from cassandra.auth import PlainTextAuthProvider
@@ -34,7 +37,9 @@ from cassandra.cluster import Cluster, Session
 
 # Use asyncore reactor for Python 3.11 compatibility
 from cassandra.io.asyncorereactor import AsyncoreConnection
-from typing import Any, Dict, List, Optional
+from cassandra.query import PreparedStatement
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 
 # Older versions of the Cassandra Python driver may not include SSLOptions. Conditionally
@@ -62,6 +67,74 @@ from .models import KeyspaceInfo, TableInfo
 logger = logging.getLogger(__name__)
 
 
+# Converters from driver values to display-friendly values, by CQL type name. Values of
+# other types are returned as decoded by the driver.
+_VALUE_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    'blob': lambda value: '0x' + value.hex(),
+    'uuid': str,
+    'timeuuid': str,
+}
+
+
+def _build_row_decoder(
+    column_names: List[str], column_types: Optional[Sequence[Any]]
+) -> Callable[[Sequence[Any]], Dict[str, Any]]:
+    """Build a decoder of result rows into dicts from the result's column metadata.
+
+    The converter of each column is looked up once per result instead of once per cell,
+    and rows are read positionally, so decoding a row is a single pass over its values.
+    """
+    converters = [
+        (index, _VALUE_DECODERS[column_type.typename])
+        for index, column_type in enumerate(column_types or [])
+        if getattr(column_type, 'typename', None) in _VALUE_DECODERS
+    ]
+
+    if not converters:
+        return lambda row: dict(zip(column_names, row))
+
+    def decode(row: Sequence[Any]) -> Dict[str, Any]:
+        values = list(row)
+        for index, converter in converters:
+            if values[index] is not None:
+                values[index] = converter(values[index])
+        return dict(zip(column_names, values))
+
+    return decode
+
+
+def _table_details(table_row: Any) -> Dict[str, Any]:
+    return {
+        'name': table_row.table_name,
+        'keyspace': table_row.keyspace_name,
+    }
+
+
+def _column_details(column_row: Any) -> Dict[str, Any]:
+    return {
+        'name': column_row.column_name,
+        'type': column_row.type,
+        'kind': column_row.kind,
+    }
+
+
+def _index_details(index_row: Any) -> Dict[str, Any]:
+    return {
+        'name': index_row.index_name,
+        'kind': index_row.kind,
+        'options': index_row.options,
+    }
+
+
+def _add_capacity_details(table_details: Dict[str, Any], props: Optional[Dict[str, Any]]) -> None:
+    if props and 'capacity_mode' in props:
+        table_details['capacity_mode'] = props['capacity_mode']
+
+        if props['capacity_mode'] == 'PROVISIONED':
+            table_details['read_capacity_units'] = int(props.get('read_capacity_units', 0))
+            table_details['write_capacity_units'] = int(props.get('write_capacity_units', 0))
+
+
 class UnifiedCassandraClient:
     """A unified client for both Apache Cassandra and Amazon Keyspaces."""
 
@@ -69,6 +142,8 @@ class UnifiedCassandraClient:
         """Initialize the client with the given configuration."""
         self.database_config = database_config
         self.is_keyspaces = database_config.use_keyspaces
+        self._prepared_statements: OrderedDict[str, PreparedStatement] = OrderedDict()
+        self._prepared_statements_lock = threading.Lock()
 
         # Initialize session for the configured database type (Keyspaces or Cassandra)
         try:
@@ -242,93 +317,80 @@ class UnifiedCassandraClient:
             logger.error(f'Error describing keyspace {keyspace_name}: {str(e)}')
             raise RuntimeError(f'Failed to describe keyspace {keyspace_name}: {str(e)}')
 
-    def describe_table(self, keyspace_name: str, table_name: str) -> Dict[str, Any]:
-        """Get detailed information about a table."""
-        try:
-            query = (
-                'SELECT * FROM system_schema.tables WHERE keyspace_name = %s AND table_name = %s'
-            )
-            table_row = self.session.execute(query, [keyspace_name, table_name]).one()
-
-            if not table_row:
-                raise RuntimeError(f'Table not found: {keyspace_name}.{table_name}')
+    def describe_keyspace_tables(self, keyspace_name: str) -> Dict[str, Dict[str, Any]]:
+        """Get detailed information about every table in a keyspace, keyed by table name.
 
-            table_details = {
-                'name': table_row.table_name,
-                'keyspace': table_row.keyspace_name,
+        The tables, columns and indexes of the keyspace are each read with a single
+        query instead of one query per table.
+        """
+        try:
+            params = [keyspace_name]
+            query = 'SELECT * FROM system_schema.tables WHERE keyspace_name = %s'
+            tables = {
+                row.table_name: _table_details(row) for row in self.session.execute(query, params)
             }
+            for table_details in tables.values():
+                table_details['columns'] = []
+                table_details['indexes'] = []
 
-            # Get column metadata
-            query = (
-                'SELECT * FROM system_schema.columns WHERE keyspace_name = %s AND table_name = %s'
-            )
-            column_rows = self.session.execute(query, [keyspace_name, table_name])
-
-            columns = []
-            for column_row in column_rows:
-                column = {
-                    'name': column_row.column_name,
-                    'type': column_row.type,
-                    'kind': column_row.kind,
-                }
-
-                columns.append(column)
-
-            table_details['columns'] = columns
+            query = 'SELECT * FROM system_schema.columns WHERE keyspace_name = %s'
+            for row in self.session.execute(query, params):
+                if row.table_name in tables:
+                    tables[row.table_name]['columns'].append(_column_details(row))
 
-            # Get indexes
-            query = (
-                'SELECT * FROM system_schema.indexes WHERE keyspace_name = %s AND table_name = %s'
-            )
-            index_rows = self.session.execute(query, [keyspace_name, table_name])
-
-            indexes = []
-            for index_row in index_rows:
-                index = {
-                    'name': index_row.index_name,
-                    'kind': index_row.kind,
-                    'options': index_row.options,
-                }
-                indexes.append(index)
-
-            table_details['indexes'] = indexes
+            query = 'SELECT * FROM system_schema.indexes WHERE keyspace_name = %s'
+            for row in self.session.execute(query, params):
+                if row.table_name in tables:
+                    tables[row.table_name]['indexes'].append(_index_details(row))
 
             # Add Keyspaces-specific context if applicable
             if self.is_keyspaces:
-                self._add_keyspaces_context(table_details)
+                for table_details in tables.values():
+                    self._add_keyspaces_context(table_details)
 
                 # Add capacity mode information for Keyspaces tables
                 try:
-                    query = 'SELECT custom_properties FROM system_schema_mcs.tables WHERE keyspace_name = %s AND table_name = %s'
-                    capacity_row = self.session.execute(query, [keyspace_name, table_name]).one()
-
-                    if capacity_row and capacity_row.custom_properties:
-                        props = capacity_row.custom_properties
-                        if 'capacity_mode' in props:
-                            table_details['capacity_mode'] = props['capacity_mode']
-
-                            if props['capacity_mode'] == 'PROVISIONED':
-                                table_details['read_capacity_units'] = int(
-                                    props.get('read_capacity_units', 0)
-                                )
-                                table_details['write_capacity_units'] = int(
-                                    props.get('write_capacity_units', 0)
-                                )
+                    query = 'SELECT table_name, custom_properties FROM system_schema_mcs.tables WHERE keyspace_name = %s'
+                    for row in self.session.execute(query, params):
+                        if row.table_name in tables:
+                            _add_capacity_details(tables[row.table_name], row.custom_properties)
                 except Exception as e:
                     # Ignore errors when trying to get capacity information
                     logger.warning(
-                        f'Could not retrieve capacity information for table: {keyspace_name}.{table_name}: {str(e)}'
+                        f'Could not retrieve capacity information for keyspace: {keyspace_name}: {str(e)}'
                     )
 
-            return table_details
+            return tables
+        except Exception as e:
+            logger.error(f'Error describing tables of keyspace {keyspace_name}: {str(e)}')
+            raise RuntimeError(f'Failed to describe tables of keyspace {keyspace_name}: {str(e)}')
+
+    def get_schema_version(self) -> Optional[str]:
+        """Get the schema version of the coordinator node, or None if it is not available.
+
+        The schema version changes whenever the schema of any keyspace changes.
+        """
+        try:
+            row = self.session.execute('SELECT schema_version FROM system.local').one()
+            return str(row.schema_version) if row and row.schema_version else None
         except Exception as e:
-            logger.error(f'Error describing table {keyspace_name}.{table_name}: {str(e)}')
-            raise RuntimeError(f'Failed to describe table {keyspace_name}.{table_name}: {str(e)}')
+            logger.warning(f'Could not retrieve schema version: {str(e)}')
+            return None
 
     def execute_read_only_query(
-        self, query: str, params: Optional[List[Any]] = None
+        self,
+        query: str,
+        params: Optional[List[Any]] = None,
+        paging_state: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
     ) -> Dict[str, Any]:
-        """Execute a read-only SELECT query against the database."""
+        """Execute a read-only SELECT query against the database, one page at a time.
+
+        The query is run as a prepared statement, cached by query text, and only the
+        first page_size rows from paging_state are fetched. When more rows are
+        available, the result contains the paging_state to pass with the same query
+        to read the next page.
+        """
         # Validate that this is a read-only query
         trimmed_query = query.strip().lower()
         if not trimmed_query.startswith('select '):
@@ -341,36 +403,22 @@ class UnifiedCassandraClient:
         ):
             raise ValueError('Query contains potentially unsafe operations')
 
+        try:
+            state = bytes.fromhex(paging_state) if paging_state else None
+        except ValueError:
+            raise ValueError('Invalid paging state: expected the value returned by a query')
+
         try:
             logger.info(f'Executing read-only query: {query}')
 
-            # Execute the query
-            if params:
-                rs = self.session.execute(query, params)
-            else:
-                rs = self.session.execute(query)
-
-            # Process the results
-            rows = []
-            column_names = []
-
-            # Get column definitions from the first row
-            if rs.column_names:
-                column_names = list(rs.column_names)
-
-            # Process each row
-            for row in rs:
-                row_data = {}
-                for col_name in column_names:
-                    # Get the column value, handling null values
-                    value = None
-                    try:
-                        if hasattr(row, col_name) and getattr(row, col_name) is not None:
-                            value = getattr(row, col_name)
-                    except Exception as e:
-                        logger.warning(f'Error getting value for column {col_name}: {str(e)}')
-                    row_data[col_name] = value
-                rows.append(row_data)
+            statement = self._prepare(query).bind(params or [])
+            statement.fetch_size = page_size
+            rs = self.session.execute(statement, paging_state=state)
+
+            # Decode only the fetched page; iterating the result set would fetch them all
+            column_names = list(rs.column_names) if rs.column_names else []
+            decode = _build_row_decoder(column_names, rs.column_types)
+            rows = [decode(row) for row in rs.current_rows]
 
             # Build the result
             result = {
@@ -379,6 +427,9 @@ class UnifiedCassandraClient:
                 'row_count': len(rows),
             }
 
+            if rs.paging_state:
+                result['paging_state'] = rs.paging_state.hex()
+
             # Add execution info
             execution_info = {}
 
@@ -392,6 +443,23 @@ class UnifiedCassandraClient:
             logger.error(f'Error executing query: {query}: {str(e)}')
             raise RuntimeError(f'Failed to execute query: {str(e)}')
 
+    def _prepare(self, query: str) -> PreparedStatement:
+        """Return the prepared statement for a query, preparing it on first use."""
+        with self._prepared_statements_lock:
+            prepared = self._prepared_statements.get(query)
+            if prepared is not None:
+                self._prepared_statements.move_to_end(query)
+                return prepared
+
+        # Prepared statements take ? markers instead of the %s markers of simple statements
+        prepared = self.session.prepare(query.replace('%s', '?'))
+
+        with self._prepared_statements_lock:
+            self._prepared_statements[query] = prepared
+            if len(self._prepared_statements) > PREPARED_STATEMENT_CACHE_SIZE:
+                self._prepared_statements.popitem(last=False)
+        return prepared
+
     def _add_keyspaces_context(self, details: Dict[str, Any]) -> None:
         """Add Keyspaces-specific context to the details."""
         keyspaces_context = {'service_characteristics': self._build_service_characteristics()}
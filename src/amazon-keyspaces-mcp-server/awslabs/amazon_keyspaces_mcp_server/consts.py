@@ -54,3 +54,17 @@ UNSAFE_OPERATIONS = [
 
 # Query display limits
 MAX_DISPLAY_ROWS = 20
+
+# Rows fetched per page by read-only queries, so that every fetched row is displayed;
+# further pages are read with the returned paging state
+DEFAULT_PAGE_SIZE = MAX_DISPLAY_ROWS
+
+# Prepared statements kept per client, keyed by query text
+PREPARED_STATEMENT_CACHE_SIZE = 256
+
+# Seconds after which the cached schema of a keyspace is reloaded
+SCHEMA_CACHE_TTL = 300
+
+# Seconds between checks of the schema version while a cached keyspace schema is served;
+# the keyspace schema is reloaded as soon as the version changes
+SCHEMA_VERSION_CHECK_INTERVAL = 10
@@ -14,7 +14,7 @@
 """Data models for Keyspaces MCP Server."""
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
@@ -46,6 +46,16 @@ class TableInfo:
     columns: List[ColumnInfo] = field(default_factory=list)
 
 
+@dataclass
+class KeyspaceSchema:
+    """Cached details of every table in a Cassandra keyspace."""
+
+    tables: Dict[str, Dict[str, Any]]
+    schema_version: Optional[str]
+    loaded_at: float
+    checked_at: float
+
+
 @dataclass
 class QueryResult:
     """Result of a CQL query execution."""
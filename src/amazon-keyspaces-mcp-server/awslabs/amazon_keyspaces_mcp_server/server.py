@@ -120,15 +120,19 @@ def describe_table(
 
 @mcp.tool(
     name='executeQuery',
-    description='Executes a read-only SELECT query against the database - args: keyspace, query',
+    description='Executes a read-only SELECT query against the database - args: keyspace, query, paging_state',
 )
 def execute_query(
     keyspace: str = Field(..., description='The keyspace to execute the query against'),
     query: str = Field(..., description='The CQL SELECT query to execute'),
+    paging_state: Optional[str] = Field(
+        None,
+        description='The paging state returned by a previous call with the same query, to read its next page of rows',
+    ),
     ctx: Optional[Context] = None,
 ) -> str:
     """Executes a read-only (SELECT) query against the database."""
-    return get_proxy()._handle_execute_query(keyspace, query, ctx)
+    return get_proxy()._handle_execute_query(keyspace, query, ctx, paging_state)
 
 
 @mcp.tool(
@@ -317,7 +321,11 @@ class KeyspacesMcpStdioServer:
             raise Exception(f'Error describing table: {str(e)}')
 
     def _handle_execute_query(
-        self, keyspace: str, query: str, ctx: Optional[Context] = None
+        self,
+        keyspace: str,
+        query: str,
+        ctx: Optional[Context] = None,
+        paging_state: Optional[str] = None,
     ) -> str:
         """Handle the executeQuery tool."""
         try:
@@ -337,7 +345,9 @@ class KeyspacesMcpStdioServer:
                 raise Exception('Query contains potentially unsafe operations')
 
             # Execute the query using the DataService
-            query_results = self.data_service.execute_read_only_query(keyspace, query)
+            query_results = self.data_service.execute_read_only_query(
+                keyspace, query, paging_state
+            )
 
             # Format the results for display
             formatted_text = '## Query Results\n\n'
@@ -373,6 +383,12 @@ class KeyspacesMcpStdioServer:
             else:
                 formatted_text += 'No rows returned.'
 
+            if query_results.get('paging_state'):
+                formatted_text += (
+                    '\n\n**More rows available.** To read the next page, run the same query '
+                    f'again with paging_state `{query_results["paging_state"]}`.'
+                )
+
             # Add contextual information about CQL queries
             if ctx:
                 ctx.info('Adding contextual information about CQL queries')  # type: ignore[unused-coroutine]
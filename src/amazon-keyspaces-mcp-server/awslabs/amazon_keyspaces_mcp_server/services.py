@@ -13,11 +13,15 @@
 # limitations under the License.
 """Service classes for Keyspaces MCP Server."""
 
+import copy
 import logging
 import re
+import threading
+import time
 from .client import UnifiedCassandraClient
-from .models import KeyspaceInfo, QueryAnalysisResult, TableInfo
-from typing import Any, Dict, List
+from .consts import SCHEMA_CACHE_TTL, SCHEMA_VERSION_CHECK_INTERVAL
+from .models import KeyspaceInfo, KeyspaceSchema, QueryAnalysisResult, TableInfo
+from typing import Any, Dict, List, Optional
 
 
 logger = logging.getLogger(__name__)
@@ -33,8 +37,10 @@ class DataService:
             f'SchemaService initialized. Using Keyspaces: {cassandra_client.is_using_keyspaces()}'
         )
 
-    def execute_read_only_query(self, keyspace_name: str, query: str) -> Dict[str, Any]:
-        """Execute a read-only SELECT query against the database."""
+    def execute_read_only_query(
+        self, keyspace_name: str, query: str, paging_state: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Execute a read-only SELECT query against the database, one page at a time."""
         logger.info(f'Executing read-only query on keyspace {keyspace_name}: {query}')
 
         # If keyspace is specified, qualify the query with the keyspace
@@ -70,15 +76,25 @@ class DataService:
                                 + query[table_name_start:]
                             )
 
-        return self.cassandra_client.execute_read_only_query(full_query)
+        return self.cassandra_client.execute_read_only_query(full_query, paging_state=paging_state)
 
 
 class SchemaService:
-    """Service for schema-related operations."""
+    """Service for schema-related operations.
 
-    def __init__(self, cassandra_client: UnifiedCassandraClient):
+    Tables are listed and described from a per-keyspace cache, loaded with one bulk read
+    of the keyspace's tables, columns and indexes. A cached keyspace is reloaded after
+    cache_ttl seconds, or as soon as the cluster's schema version changes.
+    """
+
+    def __init__(
+        self, cassandra_client: UnifiedCassandraClient, cache_ttl: float = SCHEMA_CACHE_TTL
+    ):
         """Initialize the service with the given client."""
         self.cassandra_client = cassandra_client
+        self.cache_ttl = cache_ttl
+        self._keyspace_schemas: Dict[str, KeyspaceSchema] = {}
+        self._lock = threading.Lock()
         logger.info(
             f'SchemaService initialized. Using Keyspaces: {cassandra_client.is_using_keyspaces()}'
         )
@@ -91,7 +107,8 @@ class SchemaService:
     def list_tables(self, keyspace_name: str) -> List[TableInfo]:
         """List all tables in a keyspace."""
         logger.info(f'Listing tables for keyspace: {keyspace_name}')
-        return self.cassandra_client.list_tables(keyspace_name)
+        tables = self._get_keyspace_schema(keyspace_name).tables
+        return [TableInfo(name=name, keyspace=keyspace_name) for name in tables]
 
     def describe_keyspace(self, keyspace_name: str) -> Dict[str, Any]:
         """Get detailed information about a keyspace."""
@@ -101,7 +118,51 @@ class SchemaService:
     def describe_table(self, keyspace_name: str, table_name: str) -> Dict[str, Any]:
         """Get detailed information about a table."""
         logger.info(f'Describing table: {keyspace_name}.{table_name}')
-        return self.cassandra_client.describe_table(keyspace_name, table_name)
+        table_details = self._get_keyspace_schema(keyspace_name).tables.get(table_name)
+        if table_details is None:
+            raise RuntimeError(
+                f'Failed to describe table {keyspace_name}.{table_name}: '
+                f'Table not found: {keyspace_name}.{table_name}'
+            )
+        # Callers get their own copy so the cached details cannot be modified
+        return copy.deepcopy(table_details)
+
+    def invalidate(self, keyspace_name: Optional[str] = None) -> None:
+        """Drop the cached schema of a keyspace, or of all keyspaces if None."""
+        with self._lock:
+            if keyspace_name is None:
+                self._keyspace_schemas.clear()
+            else:
+                self._keyspace_schemas.pop(keyspace_name, None)
+
+    def _get_keyspace_schema(self, keyspace_name: str) -> KeyspaceSchema:
+        """Return the cached schema of a keyspace, loading it if missing or outdated."""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._keyspace_schemas.get(keyspace_name)
+
+        schema_version = None
+        if cached is not None and now - cached.loaded_at < self.cache_ttl:
+            if now - cached.checked_at < SCHEMA_VERSION_CHECK_INTERVAL:
+                return cached
+            schema_version = self.cassandra_client.get_schema_version()
+            if schema_version == cached.schema_version:
+                cached.checked_at = now
+                return cached
+            logger.info(f'Schema version changed, reloading schema of keyspace {keyspace_name}')
+        else:
+            # Read the version first, so that a change during the load triggers a reload
+            schema_version = self.cassandra_client.get_schema_version()
+
+        schema = KeyspaceSchema(
+            tables=self.cassandra_client.describe_keyspace_tables(keyspace_name),
+            schema_version=schema_version,
+            loaded_at=now,
+            checked_at=now,
+        )
+        with self._lock:
+            self._keyspace_schemas[keyspace_name] = schema
+        return schema
 
 
 class QueryAnalysisService:
@@ -12,11 +12,18 @@
 
 import ssl
 import unittest
-from awslabs.amazon_keyspaces_mcp_server.client import UnifiedCassandraClient
+import uuid
+from awslabs.amazon_keyspaces_mcp_server.client import (
+    UnifiedCassandraClient,
+    _build_row_decoder,
+)
 from awslabs.amazon_keyspaces_mcp_server.config import DatabaseConfig
+from awslabs.amazon_keyspaces_mcp_server.consts import DEFAULT_PAGE_SIZE
 from awslabs.amazon_keyspaces_mcp_server.models import TableInfo
 from cassandra.auth import PlainTextAuthProvider
 from cassandra.cluster import Cluster, Session
+from cassandra.cqltypes import BytesType, Int32Type, UTF8Type, UUIDType
+from collections import namedtuple
 from unittest.mock import Mock, patch
 
 
@@ -367,101 +374,82 @@ class TestUnifiedCassandraClient(unittest.TestCase):
 
             self.assertIn('Keyspace not found', str(context.exception))
 
-    def test_describe_table(self):
-        """Test describing a table."""
-        # Set up the mock session for table query
-        mock_table_row = Mock()
-        mock_table_row.table_name = 'users'
-        mock_table_row.keyspace_name = 'mykeyspace'
+    def test_describe_keyspace_tables(self):
+        """Test describing every table of a keyspace with one query per system table."""
+        table_rows = [
+            Mock(table_name='users', keyspace_name='mykeyspace'),
+            Mock(table_name='orders', keyspace_name='mykeyspace'),
+        ]
+        column_rows = [
+            Mock(table_name='users', column_name='id', type='uuid', kind='partition_key'),
+            Mock(table_name='orders', column_name='order_id', type='uuid', kind='partition_key'),
+            Mock(table_name='orders', column_name='total', type='int', kind='regular'),
+        ]
+        index_rows = [
+            Mock(table_name='orders', index_name='total_idx', kind='COMPOSITES', options={})
+        ]
+        capacity_rows = [
+            Mock(
+                table_name='orders',
+                custom_properties={
+                    'capacity_mode': 'PROVISIONED',
+                    'read_capacity_units': '10',
+                    'write_capacity_units': '5',
+                },
+            )
+        ]
+        queries = []
 
-        self.mock_session.execute.return_value = Mock()
-        self.mock_session.execute.return_value.one.return_value = mock_table_row
-
-        # Set up the mock session for column query
-        mock_column_row1 = Mock()
-        mock_column_row1.column_name = 'id'
-        mock_column_row1.type = 'uuid'
-        mock_column_row1.kind = 'partition_key'
-
-        mock_column_row2 = Mock()
-        mock_column_row2.column_name = 'name'
-        mock_column_row2.type = 'text'
-        mock_column_row2.kind = 'regular'
-
-        # Set up the mock session for index query
-        mock_index_row = Mock()
-        mock_index_row.index_name = 'name_idx'
-        mock_index_row.kind = 'CUSTOM'
-        mock_index_row.options = {'target': 'name'}
-
-        # Configure the execute method to return different results based on the query
         def mock_execute(query, params=None):
+            queries.append((query, params))
+            if 'system_schema_mcs' in query:
+                return capacity_rows
             if 'tables' in query:
-                result = Mock()
-                result.one.return_value = mock_table_row
-                return result
-            elif 'columns' in query:
-                return [mock_column_row1, mock_column_row2]
-            elif 'indexes' in query:
-                return [mock_index_row]
-            return []
+                return table_rows
+            if 'columns' in query:
+                return column_rows
+            return index_rows
 
         self.mock_session.execute = mock_execute
 
         with patch('awslabs.amazon_keyspaces_mcp_server.client.Cluster') as mock_cluster_class:
-            # Associate the mock_session with the mock_cluster the client will connect to.
-            mock_cluster_instance = mock_cluster_class.return_value
-            mock_cluster_instance.connect.return_value = self.mock_session
-
-            client = UnifiedCassandraClient(self.cassandra_config)
-
-            # Call the method
-            table_details = client.describe_table('mykeyspace', 'users')
-
-            # Verify the result
-            self.assertEqual(table_details['name'], 'users')
-            self.assertEqual(table_details['keyspace'], 'mykeyspace')
-            self.assertEqual(len(table_details['columns']), 2)
-            self.assertEqual(table_details['columns'][0]['name'], 'id')
-            self.assertEqual(table_details['columns'][0]['type'], 'uuid')
-            self.assertEqual(table_details['columns'][0]['kind'], 'partition_key')
-            self.assertEqual(table_details['columns'][1]['name'], 'name')
-            self.assertEqual(table_details['columns'][1]['type'], 'text')
-            self.assertEqual(table_details['columns'][1]['kind'], 'regular')
-            self.assertEqual(len(table_details['indexes']), 1)
-            self.assertEqual(table_details['indexes'][0]['name'], 'name_idx')
-            self.assertEqual(table_details['indexes'][0]['options']['target'], 'name')
-
-    def test_describe_table_not_found(self):
-        """Test describing a table that doesn't exist."""
+            mock_cluster_class.return_value.connect.return_value = self.mock_session
+            client = UnifiedCassandraClient(self.keyspaces_config)
+
+            tables = client.describe_keyspace_tables('mykeyspace')
+
+        self.assertEqual(len(queries), 4)
+        self.assertTrue(all(params == ['mykeyspace'] for _, params in queries))
+        self.assertEqual(list(tables), ['users', 'orders'])
+        self.assertEqual([c['name'] for c in tables['orders']['columns']], ['order_id', 'total'])
+        self.assertEqual(tables['orders']['indexes'][0]['name'], 'total_idx')
+        self.assertEqual(tables['users']['indexes'], [])
+        self.assertEqual(tables['orders']['read_capacity_units'], 10)
+        self.assertNotIn('capacity_mode', tables['users'])
+        self.assertIn('_keyspaces_context', tables['users'])
+
+    def test_get_schema_version(self):
+        """Test reading the schema version, and None when it is not available."""
         with patch('awslabs.amazon_keyspaces_mcp_server.client.Cluster') as mock_cluster_class:
-            # Configure the mock cluster to return our mock session
-            mock_cluster_instance = mock_cluster_class.return_value
-            mock_cluster_instance.connect.return_value = self.mock_session
-            self.mock_session.execute.return_value = Mock()
-            self.mock_session.execute.return_value.one.return_value = None
-
+            mock_cluster_class.return_value.connect.return_value = self.mock_session
             client = UnifiedCassandraClient(self.cassandra_config)
 
-            # Call the method and verify it raises an exception
-            with self.assertRaises(RuntimeError) as context:
-                client.describe_table('mykeyspace', 'nonexistent')
+            self.mock_session.execute.return_value.one.return_value = Mock(schema_version='v1')
+            self.assertEqual(client.get_schema_version(), 'v1')
 
-            self.assertIn('Table not found', str(context.exception))
+            self.mock_session.execute.side_effect = Exception('unsupported')
+            self.assertIsNone(client.get_schema_version())
 
     def test_execute_read_only_query(self):
         """Test executing a read-only query."""
         # Set up the mock session
-        mock_column_names = ['id', 'name', 'value']
-
-        mock_row = Mock()
-        mock_row.id = 1
-        mock_row.name = 'test'
-        mock_row.value = 100
+        Row = namedtuple('Row', ['id', 'name', 'value'])
 
         mock_result_set = Mock()
-        mock_result_set.column_names = mock_column_names
-        mock_result_set.__iter__ = lambda self: iter([mock_row])
+        mock_result_set.column_names = list(Row._fields)
+        mock_result_set.column_types = [Int32Type, UTF8Type, Int32Type]
+        mock_result_set.current_rows = [Row(1, 'test', 100)]
+        mock_result_set.paging_state = None
 
         # Set up the response future
         mock_response_future = Mock()
@@ -484,10 +472,12 @@ class TestUnifiedCassandraClient(unittest.TestCase):
             # Call the method
             result = client.execute_read_only_query('SELECT * FROM users WHERE id = 1')
 
-            # Verify the session.execute was called with the correct query
-            self.mock_session.execute.assert_called_once_with(
-                'SELECT * FROM users WHERE id = 1',
-            )
+            # Verify the query was prepared and executed for one page
+            self.mock_session.prepare.assert_called_once_with('SELECT * FROM users WHERE id = 1')
+            bound = self.mock_session.prepare.return_value.bind.return_value
+            self.mock_session.prepare.return_value.bind.assert_called_once_with([])
+            self.assertEqual(bound.fetch_size, DEFAULT_PAGE_SIZE)
+            self.mock_session.execute.assert_called_once_with(bound, paging_state=None)
 
             # Verify the result
             self.assertEqual(result['columns'], ['id', 'name', 'value'])
@@ -496,20 +486,19 @@ class TestUnifiedCassandraClient(unittest.TestCase):
             self.assertEqual(result['rows'][0]['name'], 'test')
             self.assertEqual(result['rows'][0]['value'], 100)
             self.assertEqual(result['row_count'], 1)
+            self.assertNotIn('paging_state', result)
             self.assertEqual(result['execution_info']['queried_host'], '127.0.0.1')
 
     def test_execute_read_only_query_with_params(self):
         """Test executing a read-only query with parameters."""
         # Set up the mock session
-        mock_column_names = ['id', 'name']
-
-        mock_row = Mock()
-        mock_row.id = 1
-        mock_row.name = 'test'
+        Row = namedtuple('Row', ['id', 'name'])
 
         mock_result_set = Mock()
-        mock_result_set.column_names = mock_column_names
-        mock_result_set.__iter__ = lambda self: iter([mock_row])
+        mock_result_set.column_names = list(Row._fields)
+        mock_result_set.column_types = [Int32Type, UTF8Type]
+        mock_result_set.current_rows = [Row(1, 'test')]
+        mock_result_set.paging_state = None
         mock_result_set.response_future = Mock()
         mock_result_set.response_future.coordinator_host = None
 
@@ -527,10 +516,9 @@ class TestUnifiedCassandraClient(unittest.TestCase):
             params = [1]
             result = client.execute_read_only_query('SELECT * FROM users WHERE id = %s', params)
 
-            # Verify the session.execute was called with the correct query and parameters
-            self.mock_session.execute.assert_called_once_with(
-                'SELECT * FROM users WHERE id = %s', params
-            )
+            # Verify the statement was prepared with a bind marker and bound to the parameters
+            self.mock_session.prepare.assert_called_once_with('SELECT * FROM users WHERE id = ?')
+            self.mock_session.prepare.return_value.bind.assert_called_once_with(params)
 
             # Verify the result
             self.assertEqual(result['columns'], ['id', 'name'])
@@ -539,6 +527,83 @@ class TestUnifiedCassandraClient(unittest.TestCase):
             self.assertEqual(result['rows'][0]['name'], 'test')
             self.assertEqual(result['row_count'], 1)
 
+    def test_execute_read_only_query_paging(self):
+        """Test that the paging state is returned and passed back to read the next page."""
+        Row = namedtuple('Row', ['id'])
+
+        # Not iterable: only the current page may be decoded, iterating would fetch them all
+        mock_result_set = Mock()
+        mock_result_set.column_names = ['id']
+        mock_result_set.column_types = [Int32Type]
+        mock_result_set.current_rows = [Row(1), Row(2)]
+        mock_result_set.paging_state = b'\x01\xab'
+        mock_result_set.response_future = None
+        self.mock_session.execute.return_value = mock_result_set
+
+        with patch('awslabs.amazon_keyspaces_mcp_server.client.Cluster') as mock_cluster_class:
+            mock_cluster_class.return_value.connect.return_value = self.mock_session
+            client = UnifiedCassandraClient(self.cassandra_config)
+
+            first = client.execute_read_only_query('SELECT id FROM users', page_size=2)
+            client.execute_read_only_query(
+                'SELECT id FROM users', paging_state=first['paging_state'], page_size=2
+            )
+
+            self.assertEqual(first['paging_state'], '01ab')
+            self.assertEqual(first['row_count'], 2)
+            bound = self.mock_session.prepare.return_value.bind.return_value
+            self.mock_session.execute.assert_called_with(bound, paging_state=b'\x01\xab')
+
+    def test_execute_read_only_query_invalid_paging_state(self):
+        """Test that a malformed paging state is rejected before executing the query."""
+        with patch('awslabs.amazon_keyspaces_mcp_server.client.Cluster') as mock_cluster_class:
+            mock_cluster_class.return_value.connect.return_value = self.mock_session
+            client = UnifiedCassandraClient(self.cassandra_config)
+
+            with self.assertRaises(ValueError) as context:
+                client.execute_read_only_query('SELECT id FROM users', paging_state='xyz')
+
+            self.assertIn('Invalid paging state', str(context.exception))
+            self.mock_session.execute.assert_not_called()
+
+    def test_prepared_statements_are_cached(self):
+        """Test that a query is prepared once and the cache is bounded."""
+        mock_result_set = Mock()
+        mock_result_set.column_names = []
+        mock_result_set.column_types = []
+        mock_result_set.current_rows = []
+        mock_result_set.paging_state = None
+        mock_result_set.response_future = None
+        self.mock_session.execute.return_value = mock_result_set
+
+        with (
+            patch('awslabs.amazon_keyspaces_mcp_server.client.Cluster') as mock_cluster_class,
+            patch('awslabs.amazon_keyspaces_mcp_server.client.PREPARED_STATEMENT_CACHE_SIZE', 2),
+        ):
+            mock_cluster_class.return_value.connect.return_value = self.mock_session
+            client = UnifiedCassandraClient(self.cassandra_config)
+
+            client.execute_read_only_query('SELECT * FROM a')
+            client.execute_read_only_query('SELECT * FROM a')
+            self.assertEqual(self.mock_session.prepare.call_count, 1)
+
+            client.execute_read_only_query('SELECT * FROM b')
+            client.execute_read_only_query('SELECT * FROM c')
+            self.assertEqual(
+                list(client._prepared_statements), ['SELECT * FROM b', 'SELECT * FROM c']
+            )
+
+    def test_row_decoder_uses_column_types(self):
+        """Test that blob and uuid columns are decoded to display strings."""
+        row_id = uuid.UUID('12345678-1234-5678-1234-567812345678')
+        decode = _build_row_decoder(['id', 'data', 'name'], [UUIDType, BytesType, UTF8Type])
+
+        self.assertEqual(
+            decode((row_id, b'\x00\xff', 'test')),
+            {'id': str(row_id), 'data': '0x00ff', 'name': 'test'},
+        )
+        self.assertEqual(decode((None, None, None)), {'id': None, 'data': None, 'name': None})
+
     def test_execute_read_only_query_non_select(self):
         """Test executing a non-SELECT query."""
         # Create the client
@@ -99,12 +99,12 @@ class TestServerTools(unittest.TestCase):
         mock_get_proxy.return_value = mock_proxy
 
         # Call the function
-        result = execute_query('mykeyspace', 'SELECT * FROM users')
+        result = execute_query('mykeyspace', 'SELECT * FROM users', paging_state='01ab')
 
         # Verify the result
         self.assertEqual(result, 'Query results')
         mock_proxy._handle_execute_query.assert_called_once_with(
-            'mykeyspace', 'SELECT * FROM users', None
+            'mykeyspace', 'SELECT * FROM users', None, '01ab'
         )
 
     @patch('awslabs.amazon_keyspaces_mcp_server.server.get_proxy')
@@ -379,7 +379,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.assertIn('| id | name |', result)
         self.assertIn('| 1 | test |', result)
         self.mock_data_service.execute_read_only_query.assert_called_once_with(
-            'mykeyspace', 'SELECT * FROM users'
+            'mykeyspace', 'SELECT * FROM users', None
         )
         self.mock_context.info.assert_called_once()
 
@@ -400,10 +400,29 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.assertIn('**Row Count:** 0', result)
         self.assertIn('No rows returned.', result)
         self.mock_data_service.execute_read_only_query.assert_called_once_with(
-            'mykeyspace', 'SELECT * FROM users WHERE id = 999'
+            'mykeyspace', 'SELECT * FROM users WHERE id = 999', None
         )
         self.mock_context.info.assert_called_once()
 
+    def test_handle_execute_query_next_page(self):
+        """Test that the paging state is passed through and reported for the next page."""
+        query_results = {
+            'columns': ['id'],
+            'rows': [{'id': 2}],
+            'row_count': 1,
+            'paging_state': '02cd',
+        }
+        self.mock_data_service.execute_read_only_query.return_value = query_results
+
+        result = self.server._handle_execute_query(
+            'mykeyspace', 'SELECT id FROM users', None, '01ab'
+        )
+
+        self.assertIn('paging_state `02cd`', result)
+        self.mock_data_service.execute_read_only_query.assert_called_once_with(
+            'mykeyspace', 'SELECT id FROM users', '01ab'
+        )
+
     def test_handle_execute_query_many_rows(self):
         """Test the _handle_execute_query method with many rows."""
         # Set up the mock
@@ -425,7 +444,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.assertIn(f'**Row Count:** {len(rows)}', result)
         self.assertIn('_Note: Showing', result)  # Truncation message
         self.mock_data_service.execute_read_only_query.assert_called_once_with(
-            'mykeyspace', 'SELECT * FROM users'
+            'mykeyspace', 'SELECT * FROM users', None
         )
         self.mock_context.info.assert_called_once()
 
@@ -468,7 +487,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
 
         self.assertIn('Error executing query', str(context.exception))
         self.mock_data_service.execute_read_only_query.assert_called_once_with(
-            'mykeyspace', 'SELECT * FROM users'
+            'mykeyspace', 'SELECT * FROM users', None
         )
 
     def test_handle_analyze_query_performance(self):
@@ -13,13 +13,12 @@
 import unittest
 from awslabs.amazon_keyspaces_mcp_server.models import (
     KeyspaceInfo,
-    TableInfo,
 )
 from awslabs.amazon_keyspaces_mcp_server.services import (
     DataService,
     SchemaService,
 )
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 
 class TestDataService(unittest.TestCase):
@@ -61,7 +60,7 @@ class TestDataService(unittest.TestCase):
         result = self.data_service.execute_read_only_query(keyspace_name, query)
 
         # Verify the client was called with the original query
-        self.mock_client.execute_read_only_query.assert_called_once_with(query)
+        self.mock_client.execute_read_only_query.assert_called_once_with(query, paging_state=None)
 
         # Verify the result is returned correctly
         self.assertEqual(result['row_count'], 1)
@@ -110,17 +109,16 @@ class TestSchemaService(unittest.TestCase):
     def test_list_tables(self):
         """Test listing tables in a keyspace."""
         # Set up mock return value
-        mock_tables = [
-            TableInfo(name='users', keyspace='my_keyspace'),
-            TableInfo(name='products', keyspace='my_keyspace'),
-        ]
-        self.mock_client.list_tables.return_value = mock_tables
+        self.mock_client.describe_keyspace_tables.return_value = {
+            'users': {'name': 'users', 'keyspace': 'my_keyspace'},
+            'products': {'name': 'products', 'keyspace': 'my_keyspace'},
+        }
 
         # Call the method
         result = self.schema_service.list_tables('my_keyspace')
 
         # Verify the client was called with the correct keyspace
-        self.mock_client.list_tables.assert_called_once_with('my_keyspace')
+        self.mock_client.describe_keyspace_tables.assert_called_once_with('my_keyspace')
 
         # Verify the result
         self.assertEqual(len(result), 2)
@@ -161,13 +159,13 @@ class TestSchemaService(unittest.TestCase):
             'partition_key': ['user_id'],
             'clustering_columns': [],
         }
-        self.mock_client.describe_table.return_value = mock_table_details
+        self.mock_client.describe_keyspace_tables.return_value = {'users': mock_table_details}
 
         # Call the method
         result = self.schema_service.describe_table('my_keyspace', 'users')
 
-        # Verify the client was called with the correct keyspace and table
-        self.mock_client.describe_table.assert_called_once_with('my_keyspace', 'users')
+        # Verify the client was called with the correct keyspace
+        self.mock_client.describe_keyspace_tables.assert_called_once_with('my_keyspace')
 
         # Verify the result
         self.assertEqual(result['name'], 'users')
@@ -175,3 +173,63 @@ class TestSchemaService(unittest.TestCase):
         self.assertEqual(len(result['columns']), 2)
         self.assertEqual(result['columns'][0]['name'], 'user_id')
         self.assertEqual(result['partition_key'], ['user_id'])
+
+    def test_describe_table_not_found(self):
+        """Test describing a table that is not in the keyspace."""
+        self.mock_client.describe_keyspace_tables.return_value = {}
+
+        with self.assertRaises(RuntimeError) as context:
+            self.schema_service.describe_table('my_keyspace', 'missing')
+
+        self.assertIn('Table not found', str(context.exception))
+
+    def test_schema_is_cached_per_keyspace(self):
+        """Test that listing and describing tables reads the keyspace schema once."""
+        self.mock_client.get_schema_version.return_value = 'v1'
+        self.mock_client.describe_keyspace_tables.return_value = {
+            'users': {'name': 'users', 'keyspace': 'my_keyspace', 'columns': []}
+        }
+
+        self.schema_service.list_tables('my_keyspace')
+        details = self.schema_service.describe_table('my_keyspace', 'users')
+        details['columns'].append({'name': 'modified'})
+        self.schema_service.describe_table('my_keyspace', 'users')
+        self.schema_service.list_tables('other_keyspace')
+
+        self.assertEqual(self.mock_client.describe_keyspace_tables.call_count, 2)
+        self.assertEqual(self.schema_service.describe_table('my_keyspace', 'users')['columns'], [])
+
+    def test_schema_reloaded_after_ttl(self):
+        """Test that a cached keyspace schema expires."""
+        self.mock_client.describe_keyspace_tables.return_value = {}
+        self.schema_service.cache_ttl = 0
+
+        self.schema_service.list_tables('my_keyspace')
+        self.schema_service.list_tables('my_keyspace')
+
+        self.assertEqual(self.mock_client.describe_keyspace_tables.call_count, 2)
+
+    @patch('awslabs.amazon_keyspaces_mcp_server.services.SCHEMA_VERSION_CHECK_INTERVAL', 0)
+    def test_schema_reloaded_on_schema_version_change(self):
+        """Test that a cached keyspace schema is reloaded when the schema version changes."""
+        self.mock_client.get_schema_version.return_value = 'v1'
+        self.mock_client.describe_keyspace_tables.return_value = {}
+
+        self.schema_service.list_tables('my_keyspace')
+        self.schema_service.list_tables('my_keyspace')
+        self.assertEqual(self.mock_client.describe_keyspace_tables.call_count, 1)
+
+        self.mock_client.get_schema_version.return_value = 'v2'
+        self.schema_service.list_tables('my_keyspace')
+        self.schema_service.list_tables('my_keyspace')
+        self.assertEqual(self.mock_client.describe_keyspace_tables.call_count, 2)
+
+    def test_invalidate(self):
+        """Test that invalidating a keyspace reloads its schema on next use."""
+        self.mock_client.describe_keyspace_tables.return_value = {}
+
+        self.schema_service.list_tables('my_keyspace')
+        self.schema_service.invalidate('my_keyspace')
+        self.schema_service.list_tables('my_keyspace')
+
+        self.assertEqual(self.mock_client.describe_keyspace_tables.call_count, 2)
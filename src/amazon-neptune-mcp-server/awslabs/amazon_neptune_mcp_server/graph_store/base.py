@@ -13,10 +13,24 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+from awslabs.amazon_neptune_mcp_server import __version__
 from awslabs.amazon_neptune_mcp_server.models import GraphSchema
+from botocore.config import Config
 from typing import Optional
 
 
+# Connections kept open per client, enough for concurrent schema probes and queries
+MAX_POOL_CONNECTIONS = 20
+
+# Client configuration shared by the graph stores. Each client signs every request with
+# SigV4 and reuses pooled keep-alive connections across calls instead of reconnecting.
+CLIENT_CONFIG = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+    user_agent_extra=f'awslabs/mcp/amazon-neptune-mcp-server/{__version__}',
+)
+
+
 class NeptuneGraph(ABC):
     """Abstract base class for Neptune graph operations.
 
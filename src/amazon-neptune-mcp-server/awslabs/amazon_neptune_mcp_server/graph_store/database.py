@@ -14,8 +14,12 @@
 
 import boto3
 import json
+import os
+import threading
+import time
 from awslabs.amazon_neptune_mcp_server.exceptions import NeptuneException
-from awslabs.amazon_neptune_mcp_server.graph_store.base import NeptuneGraph
+from awslabs.amazon_neptune_mcp_server.graph_store.base import CLIENT_CONFIG, NeptuneGraph
+from awslabs.amazon_neptune_mcp_server.graph_store.schema_cache import SchemaSnapshotStore
 from awslabs.amazon_neptune_mcp_server.models import (
     GraphSchema,
     Node,
@@ -23,8 +27,17 @@ from awslabs.amazon_neptune_mcp_server.models import (
     Relationship,
     RelationshipPattern,
 )
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+
+T = TypeVar('T')
+
+# Labels probed concurrently during schema discovery, within the client's connection pool
+SCHEMA_PROBE_CONCURRENCY = 8
+# Seconds after which a served schema is revalidated in the background
+SCHEMA_REFRESH_INTERVAL = 300
 
 
 class NeptuneDatabase(NeptuneGraph):
@@ -35,6 +48,16 @@ class NeptuneDatabase(NeptuneGraph):
         port: port number for the database instance, default is 8182
         use_https: whether to use secure connection, default is True
         credentials_profile_name: optional AWS profile name
+        schema_cache_path: optional JSON file to persist the discovered schema to,
+            defaults to the NEPTUNE_SCHEMA_CACHE_PATH environment variable
+        schema_refresh_interval: seconds after which the schema is revalidated
+        max_concurrency: number of labels probed concurrently during schema discovery
+
+    The schema is served stale-while-revalidate: once discovered, it is returned
+    immediately and revalidated in a background thread after schema_refresh_interval
+    seconds. Revalidation only costs a statistics summary call while the summary's
+    last computation time is unchanged. With a schema cache path, the schema persisted
+    by a previous process is served from startup while it is revalidated.
 
     Example:
         .. code-block:: python
@@ -53,8 +76,23 @@ class NeptuneDatabase(NeptuneGraph):
         port: int = 8182,
         use_https: bool = True,
         credentials_profile_name: Optional[str] = None,
+        schema_cache_path: Optional[str] = None,
+        schema_refresh_interval: float = SCHEMA_REFRESH_INTERVAL,
+        max_concurrency: int = SCHEMA_PROBE_CONCURRENCY,
     ) -> None:
         """Create a new Neptune graph wrapper instance."""
+        protocol = 'https' if use_https else 'http'
+        self.endpoint = f'{protocol}://{host}:{port}'
+        self.schema_refresh_interval = schema_refresh_interval
+        self.max_concurrency = max_concurrency
+        schema_cache_path = schema_cache_path or os.environ.get('NEPTUNE_SCHEMA_CACHE_PATH')
+        self._snapshots = SchemaSnapshotStore(schema_cache_path) if schema_cache_path else None
+        # Last computation time of the statistics summary last read, and of the schema
+        self._statistics_version: Optional[str] = None
+        self._schema_version: Optional[str] = None
+        self._schema_checked_at = 0.0
+        self._refresh_lock = threading.Lock()
+
         try:
             if not credentials_profile_name:
                 session = boto3.Session()
@@ -62,9 +100,8 @@ class NeptuneDatabase(NeptuneGraph):
                 session = boto3.Session(profile_name=credentials_profile_name)
 
             client_params = {}
-            protocol = 'https' if use_https else 'http'
-            client_params['endpoint_url'] = f'{protocol}://{host}:{port}'
-            self.client = session.client('neptunedata', **client_params)
+            client_params['endpoint_url'] = self.endpoint
+            self.client = session.client('neptunedata', config=CLIENT_CONFIG, **client_params)
 
         except Exception as e:
             logger.exception('Could not load credentials to authenticate with AWS client')
@@ -74,6 +111,14 @@ class NeptuneDatabase(NeptuneGraph):
                 'profile name are valid.'
             ) from e
 
+        snapshot = self._snapshots.get(self.endpoint) if self._snapshots else None
+        if snapshot is not None:
+            logger.info(f'Serving schema snapshot of {self.endpoint} while revalidating it')
+            self.schema = snapshot.schema
+            self._schema_version = snapshot.version
+            self._refresh_in_background()
+            return
+
         try:
             self._refresh_schema()
         except Exception as e:
@@ -109,6 +154,8 @@ class NeptuneDatabase(NeptuneGraph):
 
         try:
             summary = response['payload']['graphSummary']
+            version = response['payload'].get('lastStatisticsComputationTime')
+            self._statistics_version = str(version) if version is not None else None
         except Exception:
             raise NeptuneException(
                 {
@@ -151,16 +198,18 @@ class NeptuneDatabase(NeptuneGraph):
         LIMIT 10
         """
 
-        triple_schema: List[RelationshipPattern] = []
-        for label in e_labels:
-            q = triple_query.format(e_label=label)
-            data = self.query_opencypher(q)
-            for d in data:
-                triple_schema.append(
-                    RelationshipPattern(
-                        left_node=d['from'][0], right_node=d['to'][0], relation=d['edge']
-                    )
+        def probe(label: str) -> List[RelationshipPattern]:
+            data = self.query_opencypher(triple_query.format(e_label=label))
+            return [
+                RelationshipPattern(
+                    left_node=d['from'][0], right_node=d['to'][0], relation=d['edge']
                 )
+                for d in data
+            ]
+
+        triple_schema: List[RelationshipPattern] = []
+        for patterns in self._map_labels(probe, e_labels):
+            triple_schema.extend(patterns)
 
         return triple_schema
 
@@ -182,25 +231,12 @@ class NeptuneDatabase(NeptuneGraph):
         RETURN properties(a) AS props
         LIMIT 100
         """
-        nodes = []
-        for label in n_labels:
-            q = node_properties_query.format(n_label=label)
-            resp = self.query_opencypher(q)
-            props = {}
-            for p in resp:
-                for k, v in p['props'].items():
-                    prop_type = types[type(v).__name__]
-                    if k not in props:
-                        props[k] = {prop_type}
-                    else:
-                        props[k].update([prop_type])
-
-            properties = []
-            for k, v in props.items():
-                properties.append(Property(name=k, type=list(v)))
-
-            nodes.append(Node(labels=label, properties=properties))
-        return nodes
+
+        def probe(label: str) -> Node:
+            resp = self.query_opencypher(node_properties_query.format(n_label=label))
+            return Node(labels=label, properties=self._collect_properties(resp, types))
+
+        return self._map_labels(probe, n_labels)
 
     def _get_edge_properties(self, e_labels: List[str], types: Dict[str, Any]) -> List:
         """Retrieves property information for each edge label in the graph.
@@ -220,36 +256,68 @@ class NeptuneDatabase(NeptuneGraph):
         RETURN properties(e) AS props
         LIMIT 100
         """
-        edges = []
-        for label in e_labels:
-            q = edge_properties_query.format(e_label=label)
-            resp = self.query_opencypher(q)
-            props = {}
-            for p in resp:
-                for k, v in p['props'].items():
-                    prop_type = types[type(v).__name__]
-                    if k not in props:
-                        props[k] = {prop_type}
-                    else:
-                        props[k].update([prop_type])
-
-            properties = []
-            for k, v in props.items():
-                properties.append(Property(name=k, type=list(v)))
-
-            edges.append(Relationship(type=label, properties=properties))
-
-        return edges
+
+        def probe(label: str) -> Relationship:
+            resp = self.query_opencypher(edge_properties_query.format(e_label=label))
+            return Relationship(type=label, properties=self._collect_properties(resp, types))
+
+        return self._map_labels(probe, e_labels)
+
+    @staticmethod
+    def _collect_properties(resp: List[Dict], types: Dict[str, Any]) -> List[Property]:
+        props: Dict[str, set] = {}
+        for p in resp:
+            for k, v in p['props'].items():
+                prop_type = types[type(v).__name__]
+                if k not in props:
+                    props[k] = {prop_type}
+                else:
+                    props[k].update([prop_type])
+
+        return [Property(name=k, type=list(v)) for k, v in props.items()]
+
+    def _map_labels(self, probe: Callable[[str], T], labels: List[str]) -> List[T]:
+        """Run probe for every label with bounded concurrency, keeping the label order."""
+        if self.max_concurrency <= 1 or len(labels) <= 1:
+            return [probe(label) for label in labels]
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(labels))) as executor:
+            return list(executor.map(probe, labels))
 
     def _refresh_schema(self) -> GraphSchema:
         """Refreshes the Neptune graph schema information.
 
         This method queries the graph to build a complete schema representation
-        including nodes, relationships, and relationship patterns.
+        including nodes, relationships, and relationship patterns. When the current
+        schema or a persisted snapshot was discovered for the current statistics
+        summary, it is reused instead of probing the labels again.
 
         Returns:
             GraphSchema: Complete schema information for the graph
         """
+        n_labels, e_labels = self._get_labels()
+        version = self._statistics_version
+        snapshot = None
+        if version is not None and self._snapshots and self._schema_version != version:
+            snapshot = self._snapshots.get(self.endpoint)
+
+        if self.schema is not None and version is not None and self._schema_version == version:
+            logger.debug(f'Statistics of {self.endpoint} unchanged, keeping schema')
+            graph = self.schema
+        elif snapshot is not None and snapshot.version == version:
+            logger.debug(f'Statistics of {self.endpoint} unchanged, reusing schema snapshot')
+            graph = snapshot.schema
+        else:
+            graph = self._discover_schema(n_labels, e_labels)
+            if self._snapshots:
+                self._snapshots.put(self.endpoint, version, graph)
+
+        self.schema = graph
+        self._schema_version = version
+        self._schema_checked_at = time.monotonic()
+        return graph
+
+    def _discover_schema(self, n_labels: List[str], e_labels: List[str]) -> GraphSchema:
+        """Probes every node and edge label to build the graph schema."""
         types = {
             'str': 'STRING',
             'float': 'DOUBLE',
@@ -258,24 +326,42 @@ class NeptuneDatabase(NeptuneGraph):
             'dict': 'MAP',
             'bool': 'BOOLEAN',
         }
-        n_labels, e_labels = self._get_labels()
         triple_schema = self._get_triples(e_labels)
         nodes = self._get_node_properties(n_labels, types)
         rels = self._get_edge_properties(e_labels, types)
 
-        graph = GraphSchema(nodes=nodes, relationships=rels, relationship_patterns=triple_schema)
+        return GraphSchema(nodes=nodes, relationships=rels, relationship_patterns=triple_schema)
 
-        self.schema = graph
-        return graph
+    def _refresh_in_background(self) -> None:
+        """Refresh the schema in a daemon thread unless a refresh is already running."""
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        # Failed refreshes are retried after the next interval rather than on every call
+        self._schema_checked_at = time.monotonic()
+
+        def refresh() -> None:
+            try:
+                self._refresh_schema()
+            except Exception:
+                logger.exception('Background schema refresh failed, serving the previous schema')
+            finally:
+                self._refresh_lock.release()
+
+        threading.Thread(target=refresh, name='neptune-schema-refresh', daemon=True).start()
 
     def get_schema(self) -> GraphSchema:
         """Returns the current graph schema, refreshing it if necessary.
 
+        A schema older than the refresh interval is still returned while it is
+        revalidated in the background.
+
         Returns:
             GraphSchema: Complete schema information for the graph
         """
         if self.schema is None:
             self._refresh_schema()
+        elif time.monotonic() - self._schema_checked_at > self.schema_refresh_interval:
+            self._refresh_in_background()
         return (
             self.schema
             if self.schema
@@ -0,0 +1,93 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persisted graph schema snapshots for Neptune Database."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from awslabs.amazon_neptune_mcp_server.models import GraphSchema
+from loguru import logger
+from typing import Dict, NamedTuple, Optional
+
+
+class SchemaSnapshot(NamedTuple):
+    """A discovered schema and the statistics version it was discovered for."""
+
+    version: Optional[str]
+    saved_at: float
+    schema: GraphSchema
+
+
+class SchemaSnapshotStore:
+    """JSON file holding the last discovered schema of each Neptune endpoint.
+
+    Each snapshot records the ``lastStatisticsComputationTime`` of the statistics
+    summary it was discovered from. A snapshot whose version matches the current
+    summary can be reused as is; an older one can still be served while a fresh
+    schema is discovered.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the store.
+
+        Args:
+            path: JSON file to persist snapshots to.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> Optional[SchemaSnapshot]:
+        """Return the snapshot saved for endpoint, if any."""
+        entry = self._read().get(endpoint)
+        if entry is None:
+            return None
+        try:
+            return SchemaSnapshot(
+                version=entry['version'],
+                saved_at=entry['saved_at'],
+                schema=GraphSchema.model_validate(entry['schema']),
+            )
+        except Exception as e:
+            logger.warning(f'Ignoring invalid schema snapshot for {endpoint}: {str(e)}')
+            return None
+
+    def put(self, endpoint: str, version: Optional[str], schema: GraphSchema) -> None:
+        """Save the schema discovered for endpoint at the given statistics version."""
+        with self._lock:
+            data = self._read()
+            data[endpoint] = {
+                'version': version,
+                'saved_at': time.time(),
+                'schema': schema.model_dump(),
+            }
+            try:
+                directory = os.path.dirname(os.path.abspath(self.path))
+                # Write to a temporary file first so readers never see a partial file
+                with tempfile.NamedTemporaryFile('w', dir=directory, delete=False) as f:
+                    json.dump(data, f, default=str)
+                os.replace(f.name, self.path)
+            except Exception as e:
+                logger.warning(f'Failed to persist schema snapshot to {self.path}: {str(e)}')
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f'Ignoring unreadable schema snapshot file {self.path}: {str(e)}')
+            return {}
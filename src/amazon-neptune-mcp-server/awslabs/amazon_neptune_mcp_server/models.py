@@ -22,7 +22,7 @@ that represent both the graph structure and its contents.
 """
 
 from pydantic import BaseModel
-from typing import List
+from typing import Any, List, Optional
 
 
 class Property(BaseModel):
@@ -102,3 +102,23 @@ class GraphSchema(BaseModel):
     nodes: List[Node]
     relationships: List[Relationship]
     relationship_patterns: List[RelationshipPattern]
+
+
+class QueryResultPage(BaseModel):
+    """Represents one page of query results read within row and byte budgets.
+
+    Large results are read a page at a time so that a wide traversal does not return
+    an unbounded payload. The next page is read by running the same query again with
+    the returned next_offset.
+
+    Attributes:
+        results (List[Any]): The result rows of this page
+        count (int): The number of rows in this page
+        truncated (bool): Whether more rows follow this page
+        next_offset (Optional[int]): The offset of the next page, None on the last page
+    """
+
+    results: List[Any]
+    count: int
+    truncated: bool
+    next_offset: Optional[int] = None
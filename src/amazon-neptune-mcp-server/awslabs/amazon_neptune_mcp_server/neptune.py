@@ -26,7 +26,15 @@ from awslabs.amazon_neptune_mcp_server.graph_store import (
     NeptuneDatabase,
     NeptuneGraph,
 )
-from awslabs.amazon_neptune_mcp_server.models import GraphSchema
+from awslabs.amazon_neptune_mcp_server.models import GraphSchema, QueryResultPage
+from awslabs.amazon_neptune_mcp_server.paging import (
+    DEFAULT_PAGE_BYTES,
+    DEFAULT_PAGE_ROWS,
+    gremlin_rows,
+    paginate,
+    window_gremlin,
+    window_opencypher,
+)
 from loguru import logger
 from typing import Optional
 
@@ -130,3 +138,65 @@ class NeptuneServer:
             ValueError: If using unsupported query language for analytics
         """
         return self.graph.query_gremlin(query)
+
+    def query_opencypher_page(
+        self,
+        query: str,
+        parameters: Optional[dict] = None,
+        offset: int = 0,
+        max_rows: int = DEFAULT_PAGE_ROWS,
+        max_bytes: int = DEFAULT_PAGE_BYTES,
+    ) -> QueryResultPage:
+        """Execute an openCypher query and return one page of its results.
+
+        Args:
+            query (str): The openCypher query string to execute
+            parameters (map, optional): Query parameters. Defaults to None.
+            offset (int, optional): Number of result rows to skip. Defaults to 0.
+            max_rows (int, optional): Maximum number of rows in the page.
+            max_bytes (int, optional): Maximum serialized size of the page in bytes.
+
+        Returns:
+            QueryResultPage: The page of results and the offset of the next page
+
+        Raises:
+            ValueError: If the offset or budgets are invalid
+        """
+        _check_page(offset, max_rows, max_bytes)
+        # One row past the page tells whether another page follows
+        windowed = window_opencypher(query, offset, max_rows + 1)
+        rows = self.graph.query_opencypher(windowed or query, parameters)
+        return paginate(rows, offset, max_rows, max_bytes, windowed is not None)
+
+    def query_gremlin_page(
+        self,
+        query: str,
+        offset: int = 0,
+        max_rows: int = DEFAULT_PAGE_ROWS,
+        max_bytes: int = DEFAULT_PAGE_BYTES,
+    ) -> QueryResultPage:
+        """Execute a Gremlin query and return one page of its results.
+
+        Args:
+            query (str): The Gremlin query string to execute
+            offset (int, optional): Number of results to skip. Defaults to 0.
+            max_rows (int, optional): Maximum number of results in the page.
+            max_bytes (int, optional): Maximum serialized size of the page in bytes.
+
+        Returns:
+            QueryResultPage: The page of results and the offset of the next page
+
+        Raises:
+            ValueError: If the offset or budgets are invalid
+        """
+        _check_page(offset, max_rows, max_bytes)
+        windowed = window_gremlin(query, offset, max_rows + 1)
+        rows = gremlin_rows(self.graph.query_gremlin(windowed or query))
+        return paginate(rows, offset, max_rows, max_bytes, windowed is not None)
+
+
+def _check_page(offset: int, max_rows: int, max_bytes: int) -> None:
+    if offset < 0:
+        raise ValueError('offset must not be negative')
+    if max_rows < 1 or max_bytes < 1:
+        raise ValueError('max_rows and max_bytes must be positive')
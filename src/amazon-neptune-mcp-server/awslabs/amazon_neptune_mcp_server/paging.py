@@ -0,0 +1,118 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Result paging for Neptune queries.
+
+Pages are read by windowing the query on the server: openCypher queries get a trailing
+SKIP/LIMIT and Gremlin traversals a trailing range() step, so only one page of rows is
+sent back. Queries that cannot be windowed safely, e.g. openCypher queries already
+ending in SKIP/LIMIT or Gremlin scripts ending in a terminal step, are run as is and
+windowed on the returned rows.
+"""
+
+import json
+import re
+from awslabs.amazon_neptune_mcp_server.models import QueryResultPage
+from typing import Any, Optional
+
+
+# Default number of rows per page
+DEFAULT_PAGE_ROWS = 100
+# Default serialized size of a page in bytes
+DEFAULT_PAGE_BYTES = 1024 * 1024
+
+_OPENCYPHER_RETURN = re.compile(r'\bRETURN\b', re.IGNORECASE)
+_OPENCYPHER_UNWINDOWABLE = re.compile(
+    r'\b(SKIP|LIMIT)\s+\S+\s*$|\bUNION\b', re.IGNORECASE | re.DOTALL
+)
+_GREMLIN_TERMINAL_STEP = re.compile(
+    r'\.(toList|toSet|toBulkSet|next|tryNext|iterate|explain|profile)\(\s*\d*\s*\)\s*$'
+)
+
+
+def window_opencypher(query: str, offset: int, limit: int) -> Optional[str]:
+    """Return the openCypher query restricted to limit rows from offset.
+
+    SKIP/LIMIT windows are only stable across pages when the query ends in ORDER BY,
+    which run_opencypher_query_paged asks for.
+
+    Returns:
+        Optional[str]: The windowed query, or None if the query cannot be windowed
+    """
+    query = query.strip().rstrip(';').rstrip()
+    if not _OPENCYPHER_RETURN.search(query) or _OPENCYPHER_UNWINDOWABLE.search(query):
+        return None
+    return f'{query}\nSKIP {offset} LIMIT {limit}'
+
+
+def window_gremlin(query: str, offset: int, limit: int) -> Optional[str]:
+    """Return the Gremlin traversal restricted to limit results from offset.
+
+    Returns:
+        Optional[str]: The windowed traversal, or None if the query cannot be windowed
+    """
+    query = query.strip()
+    if not query.startswith('g.') or ';' in query or _GREMLIN_TERMINAL_STEP.search(query):
+        return None
+    return f'{query}.range({offset}, {offset + limit})'
+
+
+def gremlin_rows(result: Any) -> Any:
+    """Return the rows of a Gremlin result, unwrapped from its GraphSON list.
+
+    execute_gremlin_query returns the traversal results as a GraphSON document,
+    {'data': {'@type': 'g:List', '@value': [...]}}, with the rows in '@value'.
+
+    Returns:
+        Any: The rows of the result, or the result as is if it is not a GraphSON list
+    """
+    data = result.get('data') if isinstance(result, dict) else None
+    if isinstance(data, dict) and data.get('@type') == 'g:List':
+        return data.get('@value', [])
+    return result
+
+
+def paginate(
+    rows: Any, offset: int, max_rows: int, max_bytes: int, windowed: bool
+) -> QueryResultPage:
+    """Cut a page of at most max_rows rows and max_bytes serialized bytes from rows.
+
+    Args:
+        rows: Rows returned by the query
+        offset: Offset of the page in the full result
+        max_rows: Maximum number of rows in the page
+        max_bytes: Maximum serialized size of the page; the first row is always included
+        windowed: Whether the query was windowed on the server, so rows start at offset
+
+    Returns:
+        QueryResultPage: The page and the offset of the next one
+    """
+    if not isinstance(rows, list):
+        rows = [rows]
+    window = rows if windowed else rows[offset:]
+
+    page = []
+    size = 0
+    for row in window[:max_rows]:
+        size += len(json.dumps(row, default=str).encode('utf-8'))
+        if page and size > max_bytes:
+            break
+        page.append(row)
+
+    truncated = len(window) > len(page)
+    return QueryResultPage(
+        results=page,
+        count=len(page),
+        truncated=truncated,
+        next_offset=offset + len(page) if truncated else None,
+    )
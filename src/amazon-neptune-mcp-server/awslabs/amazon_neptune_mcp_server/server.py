@@ -16,8 +16,9 @@
 
 import os
 import sys
-from awslabs.amazon_neptune_mcp_server.models import GraphSchema
+from awslabs.amazon_neptune_mcp_server.models import GraphSchema, QueryResultPage
 from awslabs.amazon_neptune_mcp_server.neptune import NeptuneServer
+from awslabs.amazon_neptune_mcp_server.paging import DEFAULT_PAGE_BYTES, DEFAULT_PAGE_ROWS
 from loguru import logger
 from mcp.server.fastmcp import FastMCP
 from typing import Optional
@@ -110,6 +111,41 @@ def run_gremlin_query(query: str) -> dict:
     return get_graph().query_gremlin(query)
 
 
+@mcp.tool(name='run_opencypher_query_paged')
+def run_opencypher_query_paged(
+    query: str,
+    parameters: Optional[dict] = None,
+    offset: int = 0,
+    max_rows: int = DEFAULT_PAGE_ROWS,
+    max_bytes: int = DEFAULT_PAGE_BYTES,
+) -> QueryResultPage:
+    """Executes the provided openCypher against the graph and returns one page of results.
+
+    Use this tool for queries that may return many rows. At most max_rows rows and
+    max_bytes bytes of results are returned. When truncated is true, run the same query
+    again with offset set to next_offset to read the next page. End the query in an
+    ORDER BY on unique values, e.g. ORDER BY n.id: without it the rows may come back in
+    a different order on each run, so pages can repeat or miss rows.
+    """
+    return get_graph().query_opencypher_page(query, parameters, offset, max_rows, max_bytes)
+
+
+@mcp.tool(name='run_gremlin_query_paged')
+def run_gremlin_query_paged(
+    query: str,
+    offset: int = 0,
+    max_rows: int = DEFAULT_PAGE_ROWS,
+    max_bytes: int = DEFAULT_PAGE_BYTES,
+) -> QueryResultPage:
+    """Executes the provided Tinkerpop Gremlin against the graph and returns one page of results.
+
+    Use this tool for traversals that may return many results. At most max_rows results
+    and max_bytes bytes of results are returned. When truncated is true, run the same
+    query again with offset set to next_offset to read the next page.
+    """
+    return get_graph().query_gremlin_page(query, offset, max_rows, max_bytes)
+
+
 def main():
     """Run the MCP server with CLI argument support."""
     mcp.run()
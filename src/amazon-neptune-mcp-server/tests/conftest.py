@@ -27,13 +27,13 @@ def mock_boto3():
         mock_neptunedb = MagicMock()
         mock_neptuneanalytics = MagicMock()
 
-        mock_client.side_effect = lambda service, region_name=None: {
+        mock_client.side_effect = lambda service, region_name=None, **kwargs: {
             'neptunedata': mock_neptunedb,
             'neptune-graph': mock_neptuneanalytics,
         }[service]
 
         mock_session_instance = MagicMock()
-        mock_session_instance.client.side_effect = lambda service, region_name=None: {
+        mock_session_instance.client.side_effect = lambda service, region_name=None, **kwargs: {
             'neptunedata': mock_neptunedb,
             'neptune-graph': mock_neptuneanalytics,
         }[service]
@@ -15,7 +15,9 @@
 
 import json
 import pytest
+import threading
 from awslabs.amazon_neptune_mcp_server.exceptions import NeptuneException
+from awslabs.amazon_neptune_mcp_server.graph_store.base import CLIENT_CONFIG
 from awslabs.amazon_neptune_mcp_server.graph_store.database import NeptuneDatabase
 from awslabs.amazon_neptune_mcp_server.models import GraphSchema
 from unittest.mock import MagicMock, patch
@@ -51,7 +53,7 @@ class TestNeptuneDatabase:
             # Assert
             mock_session.assert_called_once()
             mock_session_instance.client.assert_called_once_with(
-                'neptunedata', endpoint_url='https://test-endpoint:8182'
+                'neptunedata', config=CLIENT_CONFIG, endpoint_url='https://test-endpoint:8182'
             )
             assert db.client == mock_client
 
@@ -85,7 +87,7 @@ class TestNeptuneDatabase:
             # Assert
             mock_session.assert_called_once_with(profile_name='test-profile')
             mock_session_instance.client.assert_called_once_with(
-                'neptunedata', endpoint_url='https://test-endpoint:8182'
+                'neptunedata', config=CLIENT_CONFIG, endpoint_url='https://test-endpoint:8182'
             )
 
     @patch('boto3.Session')
@@ -111,7 +113,7 @@ class TestNeptuneDatabase:
 
             # Assert
             mock_session_instance.client.assert_called_once_with(
-                'neptunedata', endpoint_url='http://test-endpoint:8182'
+                'neptunedata', config=CLIENT_CONFIG, endpoint_url='http://test-endpoint:8182'
             )
 
     @patch('boto3.Session')
@@ -493,3 +495,165 @@ class TestNeptuneDatabase:
             # Assert
             NeptuneDatabase._refresh_schema.assert_called_once()
             assert result == mock_schema
+
+
+def _summary_client(version='2025-01-01T00:00:00Z'):
+    """Create a mock neptunedata client for a graph with two node and two edge labels."""
+    mock_client = MagicMock()
+    mock_client.get_propertygraph_summary.return_value = {
+        'payload': {
+            'lastStatisticsComputationTime': version,
+            'graphSummary': {
+                'nodeLabels': ['Person', 'Movie'],
+                'edgeLabels': ['ACTED_IN', 'DIRECTED'],
+            },
+        }
+    }
+
+    def execute_open_cypher_query(openCypherQuery):
+        if 'labels(a) AS from' in openCypherQuery:
+            edge = 'ACTED_IN' if 'ACTED_IN' in openCypherQuery else 'DIRECTED'
+            return {'results': [{'from': ['Person'], 'edge': edge, 'to': ['Movie']}]}
+        if 'Person' in openCypherQuery:
+            return {'results': [{'props': {'name': 'Alice', 'age': 30}}]}
+        if 'Movie' in openCypherQuery:
+            return {'results': [{'props': {'title': 'Heat'}}]}
+        return {'results': [{'props': {'role': 'Lead'}}]}
+
+    mock_client.execute_open_cypher_query.side_effect = execute_open_cypher_query
+    return mock_client
+
+
+def _join_background_refresh():
+    for thread in threading.enumerate():
+        if thread.name == 'neptune-schema-refresh':
+            thread.join(timeout=5)
+
+
+class TestSchemaDiscovery:
+    """Tests for parallel, persisted and stale-while-revalidate schema discovery."""
+
+    @patch('boto3.Session')
+    def test_labels_are_probed_concurrently(self, mock_session):
+        """Test that label probes run concurrently and keep the label order."""
+        mock_client = _summary_client()
+        mock_session.return_value.client.return_value = mock_client
+        respond = mock_client.execute_open_cypher_query.side_effect
+        # Both node label probes must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def execute_open_cypher_query(openCypherQuery):
+            if 'properties(a)' in openCypherQuery:
+                barrier.wait()
+            return respond(openCypherQuery)
+
+        mock_client.execute_open_cypher_query.side_effect = execute_open_cypher_query
+
+        db = NeptuneDatabase(host='test-endpoint', max_concurrency=4)
+
+        assert [node.labels for node in db.schema.nodes] == ['Person', 'Movie']
+        assert [rel.type for rel in db.schema.relationships] == ['ACTED_IN', 'DIRECTED']
+        assert [p.relation for p in db.schema.relationship_patterns] == ['ACTED_IN', 'DIRECTED']
+        assert {p.name for p in db.schema.nodes[0].properties} == {'name', 'age'}
+
+    @patch('boto3.Session')
+    def test_sequential_probing(self, mock_session):
+        """Test that a concurrency of one probes the labels in the calling thread."""
+        mock_session.return_value.client.return_value = _summary_client()
+
+        db = NeptuneDatabase(host='test-endpoint', max_concurrency=1)
+
+        assert [node.labels for node in db.schema.nodes] == ['Person', 'Movie']
+
+    @patch('boto3.Session')
+    def test_snapshot_reused_across_restarts(self, mock_session, tmp_path):
+        """Test that a persisted snapshot is served at startup without probing labels."""
+        cache_path = str(tmp_path / 'schema.json')
+        mock_session.return_value.client.return_value = _summary_client()
+        first = NeptuneDatabase(host='test-endpoint', schema_cache_path=cache_path)
+
+        mock_client = _summary_client()
+        mock_session.return_value.client.return_value = mock_client
+        second = NeptuneDatabase(host='test-endpoint', schema_cache_path=cache_path)
+        _join_background_refresh()
+
+        assert second.get_schema() == first.schema
+        mock_client.get_propertygraph_summary.assert_called_once()
+        mock_client.execute_open_cypher_query.assert_not_called()
+
+    @patch('boto3.Session')
+    def test_snapshot_keyed_by_endpoint(self, mock_session, tmp_path):
+        """Test that a snapshot of another endpoint is not served."""
+        cache_path = str(tmp_path / 'schema.json')
+        mock_session.return_value.client.return_value = _summary_client()
+        NeptuneDatabase(host='other-endpoint', schema_cache_path=cache_path)
+
+        mock_client = _summary_client()
+        mock_session.return_value.client.return_value = mock_client
+        NeptuneDatabase(host='test-endpoint', schema_cache_path=cache_path)
+
+        assert mock_client.execute_open_cypher_query.called
+
+    @patch('boto3.Session')
+    def test_outdated_snapshot_served_while_revalidating(self, mock_session, tmp_path):
+        """Test that a snapshot of older statistics is served until it is rediscovered."""
+        cache_path = str(tmp_path / 'schema.json')
+        mock_session.return_value.client.return_value = _summary_client()
+        NeptuneDatabase(host='test-endpoint', schema_cache_path=cache_path)
+
+        mock_client = _summary_client(version='2025-02-01T00:00:00Z')
+        mock_client.get_propertygraph_summary.return_value['payload']['graphSummary'][
+            'nodeLabels'
+        ] = ['Person']
+        refresh_started = threading.Event()
+        release_refresh = threading.Event()
+        respond = mock_client.execute_open_cypher_query.side_effect
+
+        def execute_open_cypher_query(openCypherQuery):
+            refresh_started.set()
+            release_refresh.wait(timeout=5)
+            return respond(openCypherQuery)
+
+        mock_client.execute_open_cypher_query.side_effect = execute_open_cypher_query
+        mock_session.return_value.client.return_value = mock_client
+        db = NeptuneDatabase(host='test-endpoint', schema_cache_path=cache_path)
+
+        assert refresh_started.wait(timeout=5)
+        assert [node.labels for node in db.get_schema().nodes] == ['Person', 'Movie']
+
+        release_refresh.set()
+        _join_background_refresh()
+        assert [node.labels for node in db.get_schema().nodes] == ['Person']
+        with open(cache_path) as f:
+            saved = json.load(f)['https://test-endpoint:8182']
+        assert saved['version'] == '2025-02-01T00:00:00Z'
+
+    @patch('boto3.Session')
+    def test_get_schema_revalidates_in_background(self, mock_session):
+        """Test that an expired schema is revalidated without probing unchanged statistics."""
+        mock_client = _summary_client()
+        mock_session.return_value.client.return_value = mock_client
+        db = NeptuneDatabase(host='test-endpoint', schema_refresh_interval=0)
+        probes = mock_client.execute_open_cypher_query.call_count
+        schema = db.schema
+
+        assert db.get_schema() is schema
+        _join_background_refresh()
+
+        assert mock_client.get_propertygraph_summary.call_count == 2
+        assert mock_client.execute_open_cypher_query.call_count == probes
+        assert db.schema is schema
+
+    @patch('boto3.Session')
+    def test_background_refresh_error_keeps_schema(self, mock_session):
+        """Test that a failed background refresh keeps serving the previous schema."""
+        mock_client = _summary_client()
+        mock_session.return_value.client.return_value = mock_client
+        db = NeptuneDatabase(host='test-endpoint', schema_refresh_interval=0)
+        schema = db.schema
+        mock_client.get_propertygraph_summary.side_effect = Exception('API error')
+
+        db.get_schema()
+        _join_background_refresh()
+
+        assert db.get_schema() is schema
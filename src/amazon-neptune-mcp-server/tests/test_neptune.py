@@ -224,3 +224,87 @@ class TestNeptuneServer:
         # Assert
         assert result == mock_result
         mock_db_instance.query_gremlin.assert_called_once_with('g.V().limit(1)')
+
+    @patch('awslabs.amazon_neptune_mcp_server.neptune.NeptuneDatabase')
+    async def test_query_opencypher_page(self, mock_neptune_db):
+        """Test that query_opencypher_page windows the query and returns the next offset."""
+        # Arrange
+        mock_db_instance = MagicMock()
+        mock_db_instance.query_opencypher.return_value = [{'n': i} for i in range(3)]
+        mock_neptune_db.return_value = mock_db_instance
+
+        server = NeptuneServer('neptune-db://test-endpoint')
+
+        # Act
+        page = server.query_opencypher_page('MATCH (n) RETURN n', None, offset=10, max_rows=2)
+
+        # Assert
+        mock_db_instance.query_opencypher.assert_called_once_with(
+            'MATCH (n) RETURN n\nSKIP 10 LIMIT 3', None
+        )
+        assert page.results == [{'n': 0}, {'n': 1}]
+        assert page.truncated is True
+        assert page.next_offset == 12
+
+    @patch('awslabs.amazon_neptune_mcp_server.neptune.NeptuneDatabase')
+    async def test_query_opencypher_page_with_limit(self, mock_neptune_db):
+        """Test that a query with its own LIMIT is paged on the returned rows."""
+        # Arrange
+        mock_db_instance = MagicMock()
+        mock_db_instance.query_opencypher.return_value = [{'n': i} for i in range(5)]
+        mock_neptune_db.return_value = mock_db_instance
+
+        server = NeptuneServer('neptune-db://test-endpoint')
+
+        # Act
+        page = server.query_opencypher_page('MATCH (n) RETURN n LIMIT 5', None, 3, 10)
+
+        # Assert
+        mock_db_instance.query_opencypher.assert_called_once_with(
+            'MATCH (n) RETURN n LIMIT 5', None
+        )
+        assert page.results == [{'n': 3}, {'n': 4}]
+        assert page.truncated is False
+        assert page.next_offset is None
+
+    @patch('awslabs.amazon_neptune_mcp_server.neptune.NeptuneDatabase')
+    async def test_query_gremlin_page(self, mock_neptune_db):
+        """Test that query_gremlin_page windows the traversal and pages the GraphSON rows."""
+        # Arrange
+        vertices = [
+            {'@type': 'g:Vertex', '@value': {'id': str(i), 'label': 'person'}} for i in range(3)
+        ]
+        mock_db_instance = MagicMock()
+        # The 'result' of an execute_gremlin_query response
+        mock_db_instance.query_gremlin.return_value = {
+            'requestId': 'a1b2c3',
+            'status': {'message': '', 'code': 200, 'attributes': {'@type': 'g:Map', '@value': []}},
+            'data': {'@type': 'g:List', '@value': vertices},
+            'meta': {'@type': 'g:Map', '@value': []},
+        }
+        mock_neptune_db.return_value = mock_db_instance
+
+        server = NeptuneServer('neptune-db://test-endpoint')
+
+        # Act
+        page = server.query_gremlin_page('g.V()', max_rows=2)
+
+        # Assert
+        mock_db_instance.query_gremlin.assert_called_once_with('g.V().range(0, 3)')
+        assert page.results == vertices[:2]
+        assert page.count == 2
+        assert page.truncated is True
+        assert page.next_offset == 2
+
+    @patch('awslabs.amazon_neptune_mcp_server.neptune.NeptuneDatabase')
+    async def test_query_page_invalid_budget(self, mock_neptune_db):
+        """Test that invalid offsets and budgets are rejected before running the query."""
+        mock_db_instance = MagicMock()
+        mock_neptune_db.return_value = mock_db_instance
+        server = NeptuneServer('neptune-db://test-endpoint')
+
+        with pytest.raises(ValueError, match='offset'):
+            server.query_opencypher_page('MATCH (n) RETURN n', offset=-1)
+        with pytest.raises(ValueError, match='max_rows'):
+            server.query_gremlin_page('g.V()', max_rows=0)
+        mock_db_instance.query_opencypher.assert_not_called()
@@ -0,0 +1,128 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for query result paging."""
+
+import pytest
+from awslabs.amazon_neptune_mcp_server.paging import (
+    gremlin_rows,
+    paginate,
+    window_gremlin,
+    window_opencypher,
+)
+
+
+class TestWindowOpencypher:
+    """Test class for windowing openCypher queries."""
+
+    def test_window_appends_skip_and_limit(self):
+        """Test that a trailing semicolon is dropped before the window is appended."""
+        assert (
+            window_opencypher('MATCH (n) RETURN n ORDER BY n.name;', 20, 11)
+            == 'MATCH (n) RETURN n ORDER BY n.name\nSKIP 20 LIMIT 11'
+        )
+
+    @pytest.mark.parametrize(
+        'query',
+        [
+            'MATCH (n) RETURN n LIMIT 10',
+            'MATCH (n) RETURN n skip $offset',
+            'MATCH (a) RETURN a.name AS name UNION MATCH (b) RETURN b.name AS name',
+            'MATCH (n) SET n.seen = true',
+        ],
+    )
+    def test_unwindowable_queries(self, query):
+        """Test that queries where a window would change their meaning are left alone."""
+        assert window_opencypher(query, 0, 11) is None
+
+
+class TestWindowGremlin:
+    """Test class for windowing Gremlin traversals."""
+
+    def test_window_appends_range(self):
+        """Test that a traversal gets a range step."""
+        assert window_gremlin(" g.V().hasLabel('person') ", 5, 11) == (
+            "g.V().hasLabel('person').range(5, 16)"
+        )
+
+    @pytest.mark.parametrize(
+        'query',
+        ['g.V().toList()', 'g.V().next(5)', 'g.V().iterate()', 'x = g.V(); x.next()'],
+    )
+    def test_unwindowable_traversals(self, query):
+        """Test that scripts and traversals ending in a terminal step are left alone."""
+        assert window_gremlin(query, 0, 11) is None
+
+
+class TestPaginate:
+    """Test class for cutting pages out of query results."""
+
+    def test_row_budget(self):
+        """Test that the row past the page marks the result as truncated."""
+        page = paginate([1, 2, 3], 0, 2, 1024, windowed=True)
+
+        assert page.results == [1, 2]
+        assert page.count == 2
+        assert page.truncated is True
+        assert page.next_offset == 2
+
+    def test_last_page(self):
+        """Test that a page that fits the budget is the last one."""
+        page = paginate([1, 2], 4, 2, 1024, windowed=True)
+
+        assert page.truncated is False
+        assert page.next_offset is None
+
+    def test_byte_budget(self):
+        """Test that rows past the byte budget are left for the next page."""
+        rows = [{'name': 'x' * 40} for _ in range(5)]
+
+        page = paginate(rows, 0, 5, 110, windowed=True)
+
+        assert page.count == 2
+        assert page.next_offset == 2
+
+    def test_first_row_always_returned(self):
+        """Test that a row larger than the byte budget is still returned on its own."""
+        page = paginate([{'name': 'x' * 400}, {'name': 'y'}], 0, 5, 100, windowed=True)
+
+        assert page.count == 1
+        assert page.next_offset == 1
+
+    def test_unwindowed_rows_are_offset(self):
+        """Test that rows of an unwindowed query are windowed locally."""
+        page = paginate(list(range(10)), 4, 3, 1024, windowed=False)
+
+        assert page.results == [4, 5, 6]
+        assert page.next_offset == 7
+
+    def test_single_result(self):
+        """Test that a non-list result is returned as a single row."""
+        page = paginate({'count': 3}, 0, 5, 1024, windowed=False)
+
+        assert page.results == [{'count': 3}]
+
+
+class TestGremlinRows:
+    """Test class for unwrapping Gremlin results."""
+
+    def test_graphson_list(self):
+        """Test that the rows of a GraphSON list are unwrapped."""
+        result = {'data': {'@type': 'g:List', '@value': [{'@type': 'g:Int64', '@value': 3}]}}
+
+        assert gremlin_rows(result) == [{'@type': 'g:Int64', '@value': 3}]
+
+    def test_other_results(self):
+        """Test that results that are not a GraphSON list are returned as is."""
+        assert gremlin_rows([1, 2]) == [1, 2]
+        assert gremlin_rows({'count': 3}) == {'count': 3}
@@ -22,7 +22,9 @@ from awslabs.amazon_neptune_mcp_server.server import (
     get_status_resource,
     main,
     run_gremlin_query,
+    run_gremlin_query_paged,
     run_opencypher_query,
+    run_opencypher_query_paged,
 )
 from unittest.mock import MagicMock, patch
 
@@ -138,6 +140,36 @@ class TestServerTools:
         assert result == mock_result
         mock_graph.query_gremlin.assert_called_once_with('g.V().limit(1)')
 
+    @patch('awslabs.amazon_neptune_mcp_server.server.get_graph')
+    async def test_run_opencypher_query_paged(self, mock_get_graph):
+        """Test that run_opencypher_query_paged passes the page budgets to the graph."""
+        # Arrange
+        mock_graph = MagicMock()
+        mock_get_graph.return_value = mock_graph
+
+        # Act
+        result = run_opencypher_query_paged('MATCH (n) RETURN n', None, 100, 50, 4096)
+
+        # Assert
+        assert result == mock_graph.query_opencypher_page.return_value
+        mock_graph.query_opencypher_page.assert_called_once_with(
+            'MATCH (n) RETURN n', None, 100, 50, 4096
+        )
+
+    @patch('awslabs.amazon_neptune_mcp_server.server.get_graph')
+    async def test_run_gremlin_query_paged(self, mock_get_graph):
+        """Test that run_gremlin_query_paged passes the page budgets to the graph."""
+        # Arrange
+        mock_graph = MagicMock()
+        mock_get_graph.return_value = mock_graph
+
+        # Act
+        result = run_gremlin_query_paged('g.V()', 0, 10, 4096)
+
+        # Assert
+        assert result == mock_graph.query_gremlin_page.return_value
+        mock_graph.query_gremlin_page.assert_called_once_with('g.V()', 0, 10, 4096)
+
     @patch('awslabs.amazon_neptune_mcp_server.server.get_graph')
     async def test_get_status_resource(self, mock_get_graph):
         """Test that get_status_resource correctly returns the status from the graph.
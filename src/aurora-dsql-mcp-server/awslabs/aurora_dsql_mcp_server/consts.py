@@ -16,6 +16,18 @@ DSQL_MCP_SERVER_APPLICATION_NAME = 'awslabs.aurora-dsql-mcp-server'
 DSQL_DB_NAME = 'postgres'
 DSQL_DB_PORT = '5432'
 
+# Connection pool sizing and lifetimes, in seconds where applicable
+DSQL_POOL_MIN_SIZE = 1
+DSQL_POOL_MAX_SIZE = 10
+DSQL_POOL_TIMEOUT = 30
+DSQL_POOL_MAX_IDLE = 600
+# DSQL closes connections after one hour, so they are recycled well before that
+DSQL_POOL_MAX_LIFETIME = 3000
+# IAM auth tokens are valid for 15 minutes and are regenerated before they expire
+DSQL_AUTH_TOKEN_LIFETIME = 900
+DSQL_AUTH_TOKEN_REFRESH_MARGIN = 120
+DSQL_QUERY_TIMEOUT = 300
+
 ERROR_EMPTY_SQL_PASSED_TO_READONLY_QUERY = (
     'Incorrect invocation: readonly_query invoked without a SQL statement'
 )
@@ -28,6 +40,7 @@ ERROR_EMPTY_TABLE_NAME_PASSED_TO_SCHEMA = (
 )
 ERROR_CREATE_CONNECTION = 'Failed to create connection due to error'
 ERROR_EXECUTE_QUERY = 'Failed to execute query due to error'
+ERROR_QUERY_TIMEOUT = 'Query cancelled after exceeding the timeout of'
 BEGIN_READ_ONLY_TRANSACTION_SQL = 'BEGIN TRANSACTION READ ONLY'
 COMMIT_TRANSACTION_SQL = 'COMMIT'
 ROLLBACK_TRANSACTION_SQL = 'ROLLBACK'
@@ -19,13 +19,22 @@ import asyncio
 import boto3
 import psycopg
 import sys
+import time
 from awslabs.aurora_dsql_mcp_server.consts import (
     BEGIN_READ_ONLY_TRANSACTION_SQL,
     BEGIN_TRANSACTION_SQL,
     COMMIT_TRANSACTION_SQL,
+    DSQL_AUTH_TOKEN_LIFETIME,
+    DSQL_AUTH_TOKEN_REFRESH_MARGIN,
     DSQL_DB_NAME,
     DSQL_DB_PORT,
     DSQL_MCP_SERVER_APPLICATION_NAME,
+    DSQL_POOL_MAX_IDLE,
+    DSQL_POOL_MAX_LIFETIME,
+    DSQL_POOL_MAX_SIZE,
+    DSQL_POOL_MIN_SIZE,
+    DSQL_POOL_TIMEOUT,
+    DSQL_QUERY_TIMEOUT,
     ERROR_BEGIN_READ_ONLY_TRANSACTION,
     ERROR_BEGIN_TRANSACTION,
     ERROR_CREATE_CONNECTION,
@@ -35,6 +44,7 @@ from awslabs.aurora_dsql_mcp_server.consts import (
     ERROR_EXECUTE_QUERY,
     ERROR_GET_SCHEMA,
     ERROR_QUERY_INJECTION_RISK,
+    ERROR_QUERY_TIMEOUT,
     ERROR_READONLY_QUERY,
     ERROR_ROLLBACK_TRANSACTION,
     ERROR_TRANSACT,
@@ -53,8 +63,9 @@ from awslabs.aurora_dsql_mcp_server.mutable_sql_detector import (
 )
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
+from psycopg_pool import AsyncConnectionPool
 from pydantic import Field
-from typing import Annotated, List
+from typing import Annotated, List, Optional, Tuple
 
 
 # Global variables
@@ -63,8 +74,13 @@ database_user = None
 region = None
 read_only = False
 dsql_client = None
-persistent_connection = None
 aws_profile = None
+pool_min_size = DSQL_POOL_MIN_SIZE
+pool_max_size = DSQL_POOL_MAX_SIZE
+query_timeout = DSQL_QUERY_TIMEOUT
+connection_pool = None
+pool_lock = asyncio.Lock()
+password_token: Optional[Tuple[tuple, str, float]] = None
 
 mcp = FastMCP(
     'awslabs-aurora-dsql-mcp-server',
@@ -162,28 +178,30 @@ async def readonly_query(
 
     try:
         conn = await get_connection(ctx)
-
         try:
-            await execute_query(ctx, conn, BEGIN_READ_ONLY_TRANSACTION_SQL)
-        except Exception as e:
-            logger.error(f'{ERROR_BEGIN_READ_ONLY_TRANSACTION}: {str(e)}')
-            await ctx.error(INTERNAL_ERROR)
-            raise Exception(INTERNAL_ERROR)
+            try:
+                await execute_query(ctx, conn, BEGIN_READ_ONLY_TRANSACTION_SQL)
+            except Exception as e:
+                logger.error(f'{ERROR_BEGIN_READ_ONLY_TRANSACTION}: {str(e)}')
+                await ctx.error(INTERNAL_ERROR)
+                raise Exception(INTERNAL_ERROR)
 
-        try:
-            rows = await execute_query(ctx, conn, sql)
-            await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
-            return rows
-        except psycopg.errors.ReadOnlySqlTransaction:
-            await ctx.error(READ_ONLY_QUERY_WRITE_ERROR)
-            raise Exception(READ_ONLY_QUERY_WRITE_ERROR)
-        except Exception as e:
-            raise e
-        finally:
             try:
-                await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
+                rows = await execute_query(ctx, conn, sql)
+                await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
+                return rows
+            except psycopg.errors.ReadOnlySqlTransaction:
+                await ctx.error(READ_ONLY_QUERY_WRITE_ERROR)
+                raise Exception(READ_ONLY_QUERY_WRITE_ERROR)
             except Exception as e:
-                logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(e)}')
+                raise e
+            finally:
+                try:
+                    await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
+                except Exception as e:
+                    logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(e)}')
+        finally:
+            await release_connection(conn)
 
     except Exception as e:
         await ctx.error(f'{ERROR_READONLY_QUERY}: {str(e)}')
@@ -235,26 +253,28 @@ async def transact(
 
     try:
         conn = await get_connection(ctx)
-
         try:
-            await execute_query(ctx, conn, BEGIN_TRANSACTION_SQL)
-        except Exception as e:
-            logger.error(f'{ERROR_BEGIN_TRANSACTION}: {str(e)}')
-            await ctx.error(f'{ERROR_BEGIN_TRANSACTION}: {str(e)}')
-            raise Exception(f'{ERROR_BEGIN_TRANSACTION}: {str(e)}')
+            try:
+                await execute_query(ctx, conn, BEGIN_TRANSACTION_SQL)
+            except Exception as e:
+                logger.error(f'{ERROR_BEGIN_TRANSACTION}: {str(e)}')
+                await ctx.error(f'{ERROR_BEGIN_TRANSACTION}: {str(e)}')
+                raise Exception(f'{ERROR_BEGIN_TRANSACTION}: {str(e)}')
 
-        try:
-            rows = []
-            for query in sql_list:
-                rows = await execute_query(ctx, conn, query)
-            await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
-            return rows
-        except Exception as e:
             try:
-                await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
-            except Exception as re:
-                logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(re)}')
-            raise e
+                rows = []
+                for query in sql_list:
+                    rows = await execute_query(ctx, conn, query)
+                await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
+                return rows
+            except Exception as e:
+                try:
+                    await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
+                except Exception as re:
+                    logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(re)}')
+                raise e
+        finally:
+            await release_connection(conn)
 
     except Exception as e:
         await ctx.error(f'{ERROR_TRANSACT}: {str(e)}')
@@ -283,7 +303,10 @@ async def get_schema(
 
     try:
         conn = await get_connection(ctx)
-        return await execute_query(ctx, conn, GET_SCHEMA_SQL, [table_name])
+        try:
+            return await execute_query(ctx, conn, GET_SCHEMA_SQL, [table_name])
+        finally:
+            await release_connection(conn)
     except Exception as e:
         await ctx.error(f'{ERROR_GET_SCHEMA}: {str(e)}')
         raise Exception(f'{ERROR_GET_SCHEMA}: {str(e)}')
@@ -300,17 +323,109 @@ class NoOpCtx:
         """
 
 
+class DsqlConnection(psycopg.AsyncConnection):
+    """Async connection that authenticates with a current IAM auth token."""
+
+    @classmethod
+    async def connect(cls, conninfo: str = '', **kwargs):  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Connect using a password token that is valid at connection time."""
+        kwargs['password'] = await get_password_token()
+        return await super().connect(conninfo, **kwargs)
+
+
 async def get_password_token():  # noqa: D103
-    # Generate a fresh password token for each connection, to ensure the token is not expired
-    # when the connection is established
+    # Tokens are cached and regenerated shortly before they expire, so every new pool
+    # connection authenticates with a valid token without signing one per connection
+    global password_token
+    key = (cluster_endpoint, region, database_user)
+    if password_token is not None:
+        token_key, token, expires_at = password_token
+        if token_key == key and time.monotonic() < expires_at:
+            return token
+
+    # Signing may refresh credentials over the network, so it runs off the event loop
     if database_user == 'admin':
-        return dsql_client.generate_db_connect_admin_auth_token(cluster_endpoint, region)  # pyright: ignore[reportOptionalMemberAccess]
+        generate = dsql_client.generate_db_connect_admin_auth_token  # pyright: ignore[reportOptionalMemberAccess]
     else:
-        return dsql_client.generate_db_connect_auth_token(cluster_endpoint, region)  # pyright: ignore[reportOptionalMemberAccess]
+        generate = dsql_client.generate_db_connect_auth_token  # pyright: ignore[reportOptionalMemberAccess]
+    token = await asyncio.to_thread(generate, cluster_endpoint, region)
+    password_token = (
+        key,
+        token,
+        time.monotonic() + DSQL_AUTH_TOKEN_LIFETIME - DSQL_AUTH_TOKEN_REFRESH_MARGIN,
+    )
+    return token
+
+
+async def get_pool(ctx) -> AsyncConnectionPool[DsqlConnection]:
+    """Get the connection pool, opening it on first use.
+
+    Args:
+        ctx: MCP context for logging and state management
+
+    Returns:
+        The open connection pool
+    """
+    global connection_pool
+    if connection_pool is not None:
+        return connection_pool
+
+    async with pool_lock:
+        if connection_pool is not None:
+            return connection_pool
+
+        conn_params = {
+            'dbname': DSQL_DB_NAME,
+            'user': database_user,
+            'host': cluster_endpoint,
+            'port': DSQL_DB_PORT,
+            'application_name': DSQL_MCP_SERVER_APPLICATION_NAME,
+            'sslmode': 'require',
+            'autocommit': True,
+        }
+
+        logger.info(
+            f'Opening connection pool to {cluster_endpoint} as user {database_user} '
+            f'(min_size={pool_min_size}, max_size={pool_max_size})'
+        )
+        pool = AsyncConnectionPool(
+            conninfo='',
+            connection_class=DsqlConnection,
+            kwargs=conn_params,
+            min_size=pool_min_size,
+            max_size=pool_max_size,
+            timeout=DSQL_POOL_TIMEOUT,
+            max_idle=DSQL_POOL_MAX_IDLE,
+            max_lifetime=DSQL_POOL_MAX_LIFETIME,
+            check=AsyncConnectionPool.check_connection,
+            name='aurora-dsql',
+            open=False,
+        )
+        try:
+            await pool.open(wait=True, timeout=DSQL_POOL_TIMEOUT)
+        except Exception as e:
+            logger.error(f'{ERROR_CREATE_CONNECTION} : {e}')
+            await ctx.error(f'{ERROR_CREATE_CONNECTION} : {e}')
+            await pool.close()
+            raise e
+
+        connection_pool = pool
+        return connection_pool
+
+
+async def close_pool():
+    """Close the connection pool if it is open."""
+    global connection_pool
+    pool, connection_pool = connection_pool, None
+    if pool is not None:
+        await pool.close()
 
 
 async def get_connection(ctx):  # noqa: D103
-    """Get a connection to the database, creating one if needed or reusing the existing one.
+    """Check out a connection from the pool.
+
+    The pool health-checks the connection before handing it out. Every connection
+    returned by this function must be given back with release_connection.
 
     Args:
         ctx: MCP context for logging and state management
@@ -318,74 +433,79 @@ async def get_connection(ctx):  # noqa: D103
     Returns:
         A database connection
     """
-    global persistent_connection
-
-    # Return the existing connection without health check
-    # The caller will handle reconnection if needed
-    if persistent_connection is not None:
-        return persistent_connection
-
-    # Create a new connection
-    password_token = await get_password_token()
-
-    conn_params = {
-        'dbname': DSQL_DB_NAME,
-        'user': database_user,
-        'host': cluster_endpoint,
-        'port': DSQL_DB_PORT,
-        'password': password_token,
-        'application_name': DSQL_MCP_SERVER_APPLICATION_NAME,
-        'sslmode': 'require',
-    }
-
-    logger.info(f'Creating new connection to {cluster_endpoint} as user {database_user}')
+    pool = await get_pool(ctx)
     try:
-        persistent_connection = await psycopg.AsyncConnection.connect(
-            **conn_params, autocommit=True
-        )
-        return persistent_connection
+        return await pool.getconn()
     except Exception as e:
         logger.error(f'{ERROR_CREATE_CONNECTION} : {e}')
         await ctx.error(f'{ERROR_CREATE_CONNECTION} : {e}')
         raise e
 
 
+async def release_connection(conn):
+    """Return a connection to the pool, which discards it if it is broken.
+
+    Args:
+        conn: Connection obtained from get_connection
+    """
+    if connection_pool is not None and conn is not None:
+        await connection_pool.putconn(conn)
+
+
+async def _run_query(conn, query: str, params=None) -> List[dict]:
+    async with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:  # pyright: ignore[reportAttributeAccessIssue]
+        try:
+            await asyncio.wait_for(cur.execute(query, params), timeout=query_timeout)  # pyright: ignore[reportArgumentType]
+        except asyncio.TimeoutError:
+            # Stop the query on the server as well so the connection can be reused
+            await conn.cancel_safe()
+            raise TimeoutError(f'{ERROR_QUERY_TIMEOUT} {query_timeout} seconds')
+        if cur.rownumber is None:
+            return []
+        else:
+            return await cur.fetchall()
+
+
 async def execute_query(ctx, conn_to_use, query: str, params=None) -> List[dict]:  # noqa: D103
-    if conn_to_use is None:
-        conn = await get_connection(ctx)
-    else:
-        conn = conn_to_use
+    if conn_to_use is not None:
+        # The caller owns the connection, which may be in a transaction, so a broken
+        # connection is reported rather than silently replaced
+        try:
+            return await _run_query(conn_to_use, query, params)
+        except Exception as e:
+            logger.error(f'{ERROR_EXECUTE_QUERY} : {e}')
+            await ctx.error(f'{ERROR_EXECUTE_QUERY} : {e}')
+            raise e
 
+    conn = await get_connection(ctx)
     try:
-        async with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:  # pyright: ignore[reportAttributeAccessIssue]
-            await cur.execute(query, params)  # pyright: ignore[reportArgumentType]
-            if cur.rownumber is None:
-                return []
-            else:
-                return await cur.fetchall()
+        return await _run_query(conn, query, params)
     except (psycopg.OperationalError, psycopg.InterfaceError) as e:
-        # Connection issue - reconnect and retry
-        logger.warning(f'Connection error, reconnecting: {e}')
-        global persistent_connection
-        try:
-            if persistent_connection:
-                await persistent_connection.close()
-        except Exception:
-            pass  # Ignore errors when closing an already broken connection
-        persistent_connection = None
-
-        # Get a fresh connection and retry
+        # Connection issue - give the connection back for the pool to discard and retry
+        # once on a fresh one
+        logger.warning(f'Connection error, retrying on a new connection: {e}')
+        await release_connection(conn)
+        conn = None
         conn = await get_connection(ctx)
-        async with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:  # pyright: ignore[reportAttributeAccessIssue]
-            await cur.execute(query, params)  # pyright: ignore[reportArgumentType]
-            if cur.rownumber is None:
-                return []
-            else:
-                return await cur.fetchall()
+        return await _run_query(conn, query, params)
     except Exception as e:
         logger.error(f'{ERROR_EXECUTE_QUERY} : {e}')
         await ctx.error(f'{ERROR_EXECUTE_QUERY} : {e}')
         raise e
+    finally:
+        await release_connection(conn)
+
+
+async def validate_connection(ctx):
+    """Run a trivial query to validate the configuration, then close the pool.
+
+    The pool is bound to the event loop it was opened in, so the server opens a new one
+    on its own loop when the first tool is called.
+    """
+    try:
+        await execute_query(ctx, None, 'SELECT 1')
+    finally:
+        await close_pool()
 
 
 def main():
@@ -407,7 +527,27 @@ def main():
         '--profile',
         help='AWS profile to use for credentials',
     )
+    parser.add_argument(
+        '--pool-min-size',
+        type=int,
+        default=DSQL_POOL_MIN_SIZE,
+        help='Number of connections the pool keeps open',
+    )
+    parser.add_argument(
+        '--pool-max-size',
+        type=int,
+        default=DSQL_POOL_MAX_SIZE,
+        help='Maximum number of concurrent connections, i.e. of queries running in parallel',
+    )
+    parser.add_argument(
+        '--query-timeout',
+        type=float,
+        default=DSQL_QUERY_TIMEOUT,
+        help='Seconds after which a query is cancelled',
+    )
     args = parser.parse_args()
+    if not 0 < args.pool_min_size <= args.pool_max_size:
+        parser.error('--pool-min-size must be positive and not larger than --pool-max-size')
 
     global cluster_endpoint
     cluster_endpoint = args.cluster_endpoint
@@ -424,6 +564,11 @@ def main():
     global aws_profile
     aws_profile = args.profile
 
+    global pool_min_size, pool_max_size, query_timeout
+    pool_min_size = args.pool_min_size
+    pool_max_size = args.pool_max_size
+    query_timeout = args.query_timeout
+
     logger.info(
         'Aurora DSQL MCP init with CLUSTER_ENDPOINT:{}, REGION: {}, DATABASE_USER:{}, ALLOW-WRITES:{}, AWS_PROFILE:{}',
         cluster_endpoint,
@@ -441,7 +586,7 @@ def main():
         # Validate connection by trying to execute a simple query directly
         # Connection errors will be handled in execute_query
         ctx = NoOpCtx()
-        asyncio.run(execute_query(ctx, None, 'SELECT 1'))
+        asyncio.run(validate_connection(ctx))
     except Exception as e:
         logger.error(
             f'Failed to create and validate db connection to Aurora DSQL. Exit the MCP server. error: {e}'
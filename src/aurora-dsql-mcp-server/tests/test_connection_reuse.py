@@ -1,4 +1,4 @@
-"""Tests for the connection reuse mechanism in server.py."""
+"""Tests for the connection pooling mechanism in server.py."""
 
 import pytest
 import psycopg
@@ -8,12 +8,12 @@ from awslabs.aurora_dsql_mcp_server.server import execute_query, get_connection
 ctx = AsyncMock()
 
 @pytest.fixture
-async def reset_persistent_connection():
-    """Reset the persistent connection before and after each test."""
+async def reset_connection_pool():
+    """Reset the connection pool before and after each test."""
     import awslabs.aurora_dsql_mcp_server.server as server
-    server.persistent_connection = None
+    server.connection_pool = None
     yield
-    server.persistent_connection = None
+    server.connection_pool = None
 
 def create_mock_connection():
     """Create a mock connection with cursor context manager."""
@@ -26,47 +26,70 @@ def create_mock_connection():
     mock_conn.closed = False
     return mock_conn, mock_cursor
 
+def create_mock_pool(mocker, *connections):
+    """Patch the pool class with a pool handing out the given connections."""
+    mock_pool_class = mocker.patch('awslabs.aurora_dsql_mcp_server.server.AsyncConnectionPool')
+    mock_pool = mock_pool_class.return_value
+    mock_pool.open = AsyncMock()
+    mock_pool.getconn = AsyncMock(side_effect=list(connections))
+    mock_pool.putconn = AsyncMock()
+    return mock_pool_class, mock_pool
+
 @pytest.mark.asyncio
 @patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
 @patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
-async def test_connection_reuse(mocker, reset_persistent_connection):
-    """Test that connections are reused when possible."""
-    mock_auth = mocker.patch('awslabs.aurora_dsql_mcp_server.server.get_password_token')
-    mock_auth.return_value = 'auth_token'
-    mock_connect = mocker.patch('psycopg.AsyncConnection.connect')
-
-    # Create mock connection with working cursor
-    mock_conn, mock_cursor = create_mock_connection()
-    mock_connect.return_value = mock_conn
+async def test_connection_reuse(mocker, reset_connection_pool):
+    """Test that the pool is opened once and shared by later calls."""
+    mock_conn1, mock_cursor1 = create_mock_connection()
+    mock_conn2, mock_cursor2 = create_mock_connection()
+    mock_pool_class, mock_pool = create_mock_pool(mocker, mock_conn1, mock_conn2)
 
-    # First connection attempt should create a new connection
     result1 = await get_connection(ctx)
-    assert mock_connect.call_count == 1
-    assert result1 is mock_conn
-
-    # Second connection attempt should reuse the existing connection
     result2 = await get_connection(ctx)
-    assert mock_connect.call_count == 1  # Connection count should not increase
-    assert result2 is mock_conn  # Should be the same connection object
-    assert result1 is result2  # Should be the exact same object
+
+    assert result1 is mock_conn1
+    assert result2 is mock_conn2
+    assert mock_pool_class.call_count == 1  # The pool is created only once
+    mock_pool.open.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 @patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
 @patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
-async def test_connection_reuse_with_broken_connection(mocker, reset_persistent_connection):
-    """Test handling of broken connections during reuse attempts."""
-    mock_auth = mocker.patch('awslabs.aurora_dsql_mcp_server.server.get_password_token')
-    mock_auth.return_value = 'auth_token'
-    mock_connect = mocker.patch('psycopg.AsyncConnection.connect')
+async def test_connection_returned_to_pool(mocker, reset_connection_pool):
+    """Test that connections checked out by execute_query are given back."""
+    mock_conn, mock_cursor = create_mock_connection()
+    mock_cursor.rownumber = None
+    mock_pool_class, mock_pool = create_mock_pool(mocker, mock_conn)
+
+    assert await execute_query(ctx, None, "SELECT 1;") == []
+    mock_pool.putconn.assert_awaited_once_with(mock_conn)
 
-    # Create two mock connections
+
+@pytest.mark.asyncio
+@patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
+@patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
+async def test_connection_reuse_with_broken_connection(mocker, reset_connection_pool):
+    """Test handling of broken connections checked out from the pool."""
     mock_conn1, mock_cursor1 = create_mock_connection()
     mock_conn2, mock_cursor2 = create_mock_connection()
-    mock_connect.side_effect = [mock_conn1, mock_conn2]
+    mock_pool_class, mock_pool = create_mock_pool(mocker, mock_conn1, mock_conn2)
 
     # Simulate a broken connection that appears open but fails on use
     mock_cursor1.execute.side_effect = psycopg.InterfaceError("Connection broken")
 
     await execute_query(ctx, None, "SELECT 1;")
-    assert mock_connect.call_count == 2
+    assert mock_pool.getconn.call_count == 2
+    mock_cursor2.execute.assert_awaited_once()
+    # Both connections go back to the pool, which discards the broken one
+    assert [c.args[0] for c in mock_pool.putconn.call_args_list] == [mock_conn1, mock_conn2]
+
+
+@pytest.mark.asyncio
+async def test_broken_connection_in_transaction_is_not_replaced(reset_connection_pool):
+    """Test that a connection owned by the caller is not swapped mid-transaction."""
+    mock_conn, mock_cursor = create_mock_connection()
+    mock_cursor.execute.side_effect = psycopg.InterfaceError("Connection broken")
+
+    with pytest.raises(psycopg.InterfaceError):
+        await execute_query(ctx, mock_conn, "SELECT 1;")
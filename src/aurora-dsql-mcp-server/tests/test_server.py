@@ -13,8 +13,11 @@
 # limitations under the License.
 """Tests for the functions in server.py."""
 
+import asyncio
 import pytest
 from awslabs.aurora_dsql_mcp_server.consts import (
+    DSQL_AUTH_TOKEN_LIFETIME,
+    DSQL_AUTH_TOKEN_REFRESH_MARGIN,
     DSQL_DB_NAME,
     DSQL_DB_PORT,
     DSQL_MCP_SERVER_APPLICATION_NAME,
@@ -29,9 +32,12 @@ from awslabs.aurora_dsql_mcp_server.consts import (
     GET_SCHEMA_SQL,
     INTERNAL_ERROR,
     READ_ONLY_QUERY_WRITE_ERROR,
-    ERROR_BEGIN_TRANSACTION
+    ERROR_BEGIN_TRANSACTION,
+    ERROR_QUERY_TIMEOUT,
 )
 from awslabs.aurora_dsql_mcp_server.server import (
+    DsqlConnection,
+    execute_query,
     get_connection,
     get_password_token,
     readonly_query,
@@ -57,13 +63,15 @@ def create_mock_connection():
     return mock_conn, mock_cursor
 
 
-@pytest.fixture
-async def reset_persistent_connection():
-    """Reset the persistent connection before and after each test."""
+@pytest.fixture(autouse=True)
+async def reset_connection_pool():
+    """Reset the connection pool and cached token before and after each test."""
     import awslabs.aurora_dsql_mcp_server.server as server
-    server.persistent_connection = None
+    server.connection_pool = None
+    server.password_token = None
     yield
-    server.persistent_connection = None
+    server.connection_pool = None
+    server.password_token = None
 
 
 async def test_readonly_query_throws_exception_on_empty_input():
@@ -121,16 +129,53 @@ async def test_get_password_token_for_non_admin_user(mocker):
 
 
 @patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
+@patch('awslabs.aurora_dsql_mcp_server.server.region', 'us-west-2')
 @patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
-async def test_get_connection(mocker, reset_persistent_connection):
+async def test_get_password_token_is_cached_until_refresh(mocker):
+    mock_client = mocker.patch('awslabs.aurora_dsql_mcp_server.server.dsql_client')
+    mock_client.generate_db_connect_admin_auth_token.side_effect = ['token1', 'token2']
+    mock_time = mocker.patch('awslabs.aurora_dsql_mcp_server.server.time.monotonic')
+    mock_time.return_value = 1000.0
+
+    assert await get_password_token() == 'token1'
+    assert await get_password_token() == 'token1'
+    assert mock_client.generate_db_connect_admin_auth_token.call_count == 1
+
+    # Shortly before the token expires a new one is generated
+    mock_time.return_value = 1000.0 + DSQL_AUTH_TOKEN_LIFETIME - DSQL_AUTH_TOKEN_REFRESH_MARGIN
+    assert await get_password_token() == 'token2'
+    assert mock_client.generate_db_connect_admin_auth_token.call_count == 2
+
+
+async def test_dsql_connection_connects_with_fresh_token(mocker):
     mock_auth = mocker.patch('awslabs.aurora_dsql_mcp_server.server.get_password_token')
     mock_auth.return_value = 'auth_token'
     mock_connect = mocker.patch('psycopg.AsyncConnection.connect')
-
-    # Create mock connection with working cursor
     mock_conn, mock_cursor = create_mock_connection()
     mock_connect.return_value = mock_conn
 
+    result = await DsqlConnection.connect('', user='admin', autocommit=True)
+
+    assert result is mock_conn
+    mock_connect.assert_called_once_with(
+        '',
+        user='admin',
+        autocommit=True,
+        password='auth_token',  # pragma: allowlist secret - test credential for unit tests only
+    )
+
+
+@patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
+@patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
+@patch('awslabs.aurora_dsql_mcp_server.server.pool_min_size', 2)
+@patch('awslabs.aurora_dsql_mcp_server.server.pool_max_size', 8)
+async def test_get_connection(mocker):
+    mock_pool_class = mocker.patch('awslabs.aurora_dsql_mcp_server.server.AsyncConnectionPool')
+    mock_pool = mock_pool_class.return_value
+    mock_pool.open = AsyncMock()
+    mock_conn, mock_cursor = create_mock_connection()
+    mock_pool.getconn = AsyncMock(return_value=mock_conn)
+
     result = await get_connection(ctx)
     assert result is mock_conn
 
@@ -139,26 +184,53 @@ async def test_get_connection(mocker, reset_persistent_connection):
         'user': 'admin',
         'host': 'test_ce',
         'port': DSQL_DB_PORT,
-        'password': 'auth_token', # pragma: allowlist secret - test credential for unit tests only
         'application_name': DSQL_MCP_SERVER_APPLICATION_NAME,
-        'sslmode': 'require'
+        'sslmode': 'require',
+        'autocommit': True,
     }
 
-    mock_connect.assert_called_once_with(**conn_params, autocommit=True)
+    mock_pool_class.assert_called_once()
+    pool_kwargs = mock_pool_class.call_args.kwargs
+    assert pool_kwargs['connection_class'] is DsqlConnection
+    assert pool_kwargs['kwargs'] == conn_params
+    assert pool_kwargs['min_size'] == 2
+    assert pool_kwargs['max_size'] == 8
+    assert pool_kwargs['check'] is not None
+    mock_pool.open.assert_awaited_once()
 
 
 @patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
 @patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
-async def test_get_connection_failure(mocker, reset_persistent_connection):
-    mock_auth = mocker.patch('awslabs.aurora_dsql_mcp_server.server.get_password_token')
-    mock_auth.return_value = 'auth_token'
-    mock_connect = mocker.patch('psycopg.AsyncConnection.connect')
-    mock_connect.side_effect = Exception('Connection error')
+async def test_get_connection_failure(mocker):
+    mock_pool_class = mocker.patch('awslabs.aurora_dsql_mcp_server.server.AsyncConnectionPool')
+    mock_pool = mock_pool_class.return_value
+    mock_pool.open = AsyncMock(side_effect=Exception('Connection error'))
+    mock_pool.close = AsyncMock()
 
     with pytest.raises(Exception) as excinfo:
         await get_connection(ctx)
     assert str(excinfo.value) == 'Connection error'
 
+    import awslabs.aurora_dsql_mcp_server.server as server
+
+    assert server.connection_pool is None
+    mock_pool.close.assert_awaited_once()
+
+
+@patch('awslabs.aurora_dsql_mcp_server.server.query_timeout', 0.01)
+async def test_execute_query_cancels_on_timeout():
+    mock_conn, mock_cursor = create_mock_connection()
+
+    async def slow_execute(*args, **kwargs):
+        await asyncio.sleep(1)
+
+    mock_cursor.execute = AsyncMock(side_effect=slow_execute)
+
+    with pytest.raises(TimeoutError) as excinfo:
+        await execute_query(ctx, mock_conn, 'select pg_sleep(10)')
+    assert ERROR_QUERY_TIMEOUT in str(excinfo.value)
+    mock_conn.cancel_safe.assert_awaited_once()
+
 
 async def test_get_schema(mocker):
     mock_get_connection = mocker.patch(
@@ -360,3 +432,22 @@ async def test_transact_error_on_failed_begin(mocker):
     assert ERROR_BEGIN_TRANSACTION in str(excinfo.value)
 
     mock_execute_query.assert_called_once_with(ctx, mock_conn, BEGIN_TRANSACTION_SQL)
+
+
+async def test_readonly_query_releases_connection(mocker):
+    mock_execute_query = mocker.patch('awslabs.aurora_dsql_mcp_server.server.execute_query')
+    mock_execute_query.side_effect = ('', Exception(''), '')
+
+    mock_get_connection = mocker.patch(
+        'awslabs.aurora_dsql_mcp_server.server.get_connection'
+    )
+    mock_conn = AsyncMock()
+    mock_get_connection.return_value = mock_conn
+    mock_release_connection = mocker.patch(
+        'awslabs.aurora_dsql_mcp_server.server.release_connection'
+    )
+
+    with pytest.raises(Exception):
+        await readonly_query('select 1', ctx)
+
+    mock_release_connection.assert_awaited_once_with(mock_conn)
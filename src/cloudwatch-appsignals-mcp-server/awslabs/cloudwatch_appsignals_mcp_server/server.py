@@ -20,13 +20,15 @@ import json
 import os
 import sys
 from . import __version__
-from .sli_report_client import AWSConfig, SLIReportClient
+from .sli_report_client import SLIEvaluationEngine, service_key
+from .trace_aggregator import TraceAggregator, iter_trace_summary_pages
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from datetime import datetime, timedelta, timezone
 from loguru import logger
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
+from pydantic.fields import FieldInfo
 from time import perf_counter as timer
 from typing import Dict, Optional
 
@@ -57,6 +59,14 @@ except Exception as e:
     raise
 
 
+# Logs Insights polling bounds for search_transaction_spans, in seconds
+TRANSACTION_SEARCH_MIN_POLL_INTERVAL = 0.25
+TRANSACTION_SEARCH_MAX_POLL_INTERVAL = 2.0
+
+# Shared SLI evaluation engine; keeps evaluations for a short window across list_slis calls
+sli_engine = SLIEvaluationEngine()
+
+
 def remove_null_values(data: dict) -> dict:
     """Remove keys with None values from a dictionary.
 
@@ -467,71 +477,6 @@ async def query_service_metrics(
         return f'Error: {str(e)}'
 
 
-def get_trace_summaries_paginated(
-    xray_client, start_time, end_time, filter_expression, max_traces: int = 100
-) -> list:
-    """Get trace summaries with pagination to avoid exceeding response size limits.
-
-    Args:
-        xray_client: Boto3 X-Ray client
-        start_time: Start time for trace query
-        end_time: End time for trace query
-        filter_expression: X-Ray filter expression
-        max_traces: Maximum number of traces to retrieve (default 100)
-
-    Returns:
-        List of trace summaries
-    """
-    all_traces = []
-    next_token = None
-    logger.debug(
-        f'Starting paginated trace retrieval - filter: {filter_expression}, max_traces: {max_traces}'
-    )
-
-    try:
-        while len(all_traces) < max_traces:
-            # Build request parameters
-            kwargs = {
-                'StartTime': start_time,
-                'EndTime': end_time,
-                'FilterExpression': filter_expression,
-                'Sampling': True,
-                'TimeRangeType': 'Service',
-            }
-
-            if next_token:
-                kwargs['NextToken'] = next_token
-
-            # Make request
-            response = xray_client.get_trace_summaries(**kwargs)
-
-            # Add traces from this page
-            traces = response.get('TraceSummaries', [])
-            all_traces.extend(traces)
-            logger.debug(
-                f'Retrieved {len(traces)} traces in this page, total so far: {len(all_traces)}'
-            )
-
-            # Check if we have more pages
-            next_token = response.get('NextToken')
-            if not next_token:
-                break
-
-            # If we've collected enough traces, stop
-            if len(all_traces) >= max_traces:
-                all_traces = all_traces[:max_traces]
-                break
-
-        logger.info(f'Successfully retrieved {len(all_traces)} traces')
-        return all_traces
-
-    except Exception as e:
-        # Return what we have so far if there's an error
-        logger.error(f'Error during paginated trace retrieval: {str(e)}', exc_info=True)
-        logger.info(f'Returning {len(all_traces)} traces retrieved before error')
-        return all_traces
-
-
 @mcp.tool()
 async def get_slo(
     slo_id: str = Field(..., description='The ARN or name of the SLO to retrieve'),
@@ -565,7 +510,9 @@ async def get_slo(
     logger.info(f'Starting get_service_level_objective request for SLO: {slo_id}')
 
     try:
-        response = appsignals_client.get_service_level_objective(Id=slo_id)
+        response = await asyncio.to_thread(
+            appsignals_client.get_service_level_objective, Id=slo_id
+        )
         slo = response.get('Slo', {})
 
         if not slo:
@@ -831,7 +778,9 @@ async def search_transaction_spans(
     logger.debug(f'Query string: {query_string}')
 
     # Check if transaction search is enabled
-    is_enabled, destination, status = check_transaction_search_enabled(AWS_REGION)
+    is_enabled, destination, status = await asyncio.to_thread(
+        check_transaction_search_enabled, AWS_REGION
+    )
 
     if not is_enabled:
         logger.warning(
@@ -871,14 +820,17 @@ async def search_transaction_spans(
         }
 
         logger.debug(f'Starting CloudWatch Logs query with limit: {limit}')
-        start_response = logs_client.start_query(**remove_null_values(kwargs))
+        start_response = await asyncio.to_thread(
+            logs_client.start_query, **remove_null_values(kwargs)
+        )
         query_id = start_response['queryId']
         logger.info(f'Started CloudWatch Logs query with ID: {query_id}')
 
-        # Seconds
+        # Seconds; short queries finish quickly, so start polling fast and back off
         poll_start = timer()
+        poll_interval = TRANSACTION_SEARCH_MIN_POLL_INTERVAL
         while poll_start + max_timeout > timer():
-            response = logs_client.get_query_results(queryId=query_id)
+            response = await asyncio.to_thread(logs_client.get_query_results, queryId=query_id)
             status = response['status']
 
             if status in {'Complete', 'Failed', 'Cancelled'}:
@@ -908,7 +860,8 @@ async def search_transaction_spans(
                     },
                 }
 
-            await asyncio.sleep(1)
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, TRANSACTION_SEARCH_MAX_POLL_INTERVAL)
 
         elapsed_time = timer() - start_time_perf
         msg = f'Query {query_id} did not complete within {max_timeout} seconds. Use get_query_results with the returned queryId to try again to retrieve query results.'
@@ -955,6 +908,9 @@ async def list_slis(
     - For regular health checks
     - When investigating "what is the root cause of breaching SLO" questions
 
+    SLOs are listed once for all services and their metrics are fetched in batched
+    GetMetricData calls; results are reused for about a minute across calls.
+
     Status meanings:
     - OK: All SLOs are being met
     - BREACHED: One or more SLOs are violated
@@ -983,35 +939,48 @@ async def list_slis(
         logger.debug(f'Time range: {start_time} to {end_time}')
 
         # Get all services
-        services_response = appsignals_client.list_services(
-            StartTime=start_time,  # type: ignore
-            EndTime=end_time,  # type: ignore
-            MaxResults=100,
-        )
-        services = services_response.get('ServiceSummaries', [])
+        def list_all_services():
+            services = []
+            kwargs = {'StartTime': start_time, 'EndTime': end_time, 'MaxResults': 100}
+            while True:
+                response = appsignals_client.list_services(**kwargs)
+                services.extend(response.get('ServiceSummaries', []))
+                next_token = response.get('NextToken')
+                if not next_token:
+                    return services
+                kwargs['NextToken'] = next_token
+
+        services = await asyncio.to_thread(list_all_services)
 
         if not services:
             logger.warning('No services found in Application Signals')
             return 'No services found in Application Signals.'
 
-        # Get SLI reports for each service
-        reports = []
+        # Evaluate SLIs for all services at once: SLOs are listed once and their
+        # metrics are fetched in concurrent GetMetricData batches
         logger.debug(f'Generating SLI reports for {len(services)} services')
-        for service in services:
-            service_name = service['KeyAttributes'].get('Name', 'Unknown')
-            try:
-                # Create custom config with the service's key attributes
-                config = AWSConfig(
-                    region='us-east-1',
-                    period_in_hours=hours,
-                    service_name=service_name,
-                    key_attributes=service['KeyAttributes'],
-                )
-
-                # Generate SLI report
-                client = SLIReportClient(config)
-                sli_report = client.generate_sli_report()
+        sli_reports = await sli_engine.evaluate(
+            appsignals_client, cloudwatch_client, services, hours
+        )
 
+        reports = []
+        for service in services:
+            sli_report = sli_reports.get(service_key(service['KeyAttributes']))
+            if sli_report is None:
+                service_name = service['KeyAttributes'].get('Name', 'Unknown')
+                logger.error(f'Failed to get SLI report for service {service_name}')
+                # Add a report with insufficient data status
+                report = {
+                    'BreachedSloCount': 0,
+                    'BreachedSloNames': [],
+                    'EndTime': end_time.timestamp(),
+                    'OkSloCount': 0,
+                    'ReferenceId': {'KeyAttributes': service['KeyAttributes']},
+                    'SliStatus': 'INSUFFICIENT_DATA',
+                    'StartTime': start_time.timestamp(),
+                    'TotalSloCount': 0,
+                }
+            else:
                 # Convert to expected format
                 report = {
                     'BreachedSloCount': sli_report.breached_slo_count,
@@ -1025,29 +994,11 @@ async def list_slis(
                     'StartTime': sli_report.start_time.timestamp(),
                     'TotalSloCount': sli_report.total_slo_count,
                 }
-                reports.append(report)
-
-            except Exception as e:
-                # Log error but continue with other services
-                logger.error(
-                    f'Failed to get SLI report for service {service_name}: {str(e)}', exc_info=True
-                )
-                # Add a report with insufficient data status
-                report = {
-                    'BreachedSloCount': 0,
-                    'BreachedSloNames': [],
-                    'EndTime': end_time.timestamp(),
-                    'OkSloCount': 0,
-                    'ReferenceId': {'KeyAttributes': service['KeyAttributes']},
-                    'SliStatus': 'INSUFFICIENT_DATA',
-                    'StartTime': start_time.timestamp(),
-                    'TotalSloCount': 0,
-                }
-                reports.append(report)
+            reports.append(report)
 
         # Check transaction search status
-        is_tx_search_enabled, tx_destination, tx_status = check_transaction_search_enabled(
-            AWS_REGION
+        is_tx_search_enabled, tx_destination, tx_status = await asyncio.to_thread(
+            check_transaction_search_enabled, AWS_REGION
         )
 
         # Build response
@@ -1164,6 +1115,10 @@ async def query_sampled_traces(
         description='X-Ray filter expression to narrow results (e.g., service("service-name"){fault = true})',
     ),
     region: str = Field(default='us-east-1', description='AWS region (default: us-east-1)'),
+    max_traces: int = Field(
+        default=2000,
+        description='Maximum number of traces to aggregate (default: 2000). Traces are summarized as they are retrieved, so large values do not increase the response size',
+    ),
 ) -> str:
     """Query AWS X-Ray traces (5% sampled data) to investigate errors and performance issues.
 
@@ -1190,7 +1145,13 @@ async def query_sampled_traces(
     IMPORTANT: When investigating SLO breaches, use annotation filters with the specific dimension values
     from the breached metric (e.g., Operation, RemoteOperation) to find traces for that exact operation.
 
-    Returns JSON with trace summaries including:
+    Traces are aggregated as they are retrieved. Returns JSON with aggregates over all
+    matching traces (up to max_traces):
+    - Fault, error and throttle counts
+    - Per-operation request counts and latency percentiles (p50/p90/p99/max)
+    - Most frequent root-cause exceptions by service
+
+    And a small set of example trace summaries (faults and errors first) including:
     - Trace ID for detailed investigation
     - Duration and response time
     - Error/fault/throttle status
@@ -1205,8 +1166,13 @@ async def query_sampled_traces(
     - Look for patterns in errors or very slow requests
 
     Returns:
-        JSON string containing trace summaries with error status, duration, and service details
+        JSON string containing trace aggregates and example trace summaries with error status,
+        duration, and service details
     """
+    # Handle Pydantic Field objects when called directly (not through MCP framework)
+    if isinstance(max_traces, FieldInfo):
+        max_traces = max_traces.default
+
     start_time_perf = timer()
     logger.info(f'Starting query_sampled_traces - region: {region}, filter: {filter_expression}')
 
@@ -1239,14 +1205,24 @@ async def query_sampled_traces(
                 indent=2,
             )
 
-        # Use pagination helper with a reasonable limit
-        traces = get_trace_summaries_paginated(
-            xray_client,
-            start_datetime,
-            end_datetime,
-            filter_expression or '',
-            max_traces=100,  # Limit to prevent response size issues
+        # Aggregate pages as they arrive; only a few example traces are kept
+        aggregator = TraceAggregator()
+        pages = iter_trace_summary_pages(
+            xray_client, start_datetime, end_datetime, filter_expression or '', max_traces
         )
+        partial_error = None
+        while True:
+            try:
+                page = await asyncio.to_thread(next, pages, None)
+            except Exception as e:
+                # Keep what was aggregated before the error
+                logger.error(f'Error during trace retrieval: {str(e)}', exc_info=True)
+                partial_error = str(e)
+                break
+            if page is None:
+                break
+            aggregator.add_page(page)
+        traces = aggregator.samples
 
         # Convert response to JSON-serializable format
         def convert_datetime(obj):
@@ -1302,12 +1278,16 @@ async def query_sampled_traces(
             trace_summaries.append(trace_data)
 
         # Check transaction search status
-        is_tx_search_enabled, tx_destination, tx_status = check_transaction_search_enabled(region)
+        is_tx_search_enabled, tx_destination, tx_status = await asyncio.to_thread(
+            check_transaction_search_enabled, region
+        )
 
+        aggregates = aggregator.summary()
         result_data = {
+            'Aggregates': aggregates,
             'TraceSummaries': trace_summaries,
-            'TraceCount': len(trace_summaries),
-            'Message': f'Retrieved {len(trace_summaries)} traces (limited to prevent size issues)',
+            'TraceCount': aggregator.trace_count,
+            'Message': f'Aggregated {aggregator.trace_count} traces; showing {len(trace_summaries)} example traces',
             'SamplingNote': "⚠️ This data is from X-Ray's 5% sampling. Results may not show all errors or issues.",
             'TransactionSearchStatus': {
                 'enabled': is_tx_search_enabled,
@@ -1319,9 +1299,14 @@ async def query_sampled_traces(
             },
         }
 
+        if partial_error:
+            result_data['Warning'] = (
+                f'Trace retrieval stopped early ({partial_error}); aggregates are partial'
+            )
+
         elapsed_time = timer() - start_time_perf
         logger.info(
-            f'query_sampled_traces completed in {elapsed_time:.3f}s - retrieved {len(trace_summaries)} traces'
+            f'query_sampled_traces completed in {elapsed_time:.3f}s - aggregated {aggregator.trace_count} traces'
         )
         return json.dumps(result_data, indent=2)
 
@@ -14,60 +14,19 @@
 
 """Retrieve service SLI status based on configured Application Signals SLOs."""
 
-import boto3
+import asyncio
 import logging
-from botocore.exceptions import ClientError
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 # Initialize module logger
 logger = logging.getLogger(__name__)
 
-
-@dataclass
-class AWSConfig:
-    """Configuration class for AWS settings and service parameters.
-
-    Attributes:
-        region (str): AWS region identifier (default: us-west-1)
-        period_in_hours (int): Time period for metrics collection (max 24 hours)
-        service_name (str): Name of the AWS service to monitor
-        key_attributes (Dict[str, str]): Key attributes to identify the service
-    """
-
-    region: str
-    period_in_hours: int
-    service_name: str
-    key_attributes: Dict[str, str] = field(default_factory=dict)
-
-    def __init__(
-        self,
-        region: str = 'us-east-1',
-        period_in_hours: int = 24,
-        service_name: str = 'UnknownService',
-        key_attributes: Optional[Dict[str, str]] = None,
-    ):
-        """Initialize AWSConfig with region, period, and service name.
-
-        Args:
-            region: AWS region identifier (default: us-east-1)
-            period_in_hours: Time period for metrics collection, max 24 hours (default: 24)
-            service_name: Name of the AWS service to monitor (default: UnknownService)
-            key_attributes: Optional key attributes to override defaults
-        """
-        self.region = region
-        self.period_in_hours = min(period_in_hours, 24)  # Ensure period doesn't exceed 24 hours
-        self.service_name = service_name
-        if key_attributes is not None:
-            self.key_attributes = key_attributes
-        else:
-            self.key_attributes = {
-                'Name': self.service_name,
-                'Type': 'Service',
-                'Environment': self.region,
-            }
+# GetMetricData accepts at most 500 queries per request
+MAX_METRIC_DATA_QUERIES = 500
 
 
 @dataclass
@@ -89,19 +48,6 @@ class SLOSummary:
     created_time: datetime
 
 
-@dataclass
-class MetricDataResult:
-    """Data class holding CloudWatch metric data results.
-
-    Attributes:
-        timestamps (List[datetime]): Timestamps of metric data points
-        values (List[float]): Corresponding metric values
-    """
-
-    timestamps: List[datetime]
-    values: List[float]
-
-
 class SLIReport:
     """Class representing an SLI report with various metrics and status information.
 
@@ -175,69 +121,92 @@ class SLIReport:
         return self._breached_slo_names.copy()
 
 
-class SLIReportClient:
-    """Client for generating SLI reports using AWS Application Signals and CloudWatch.
+ServiceKey = Tuple[str, str, str, str]
 
-    Handles interaction with AWS services to collect and analyze SLO data.
-    """
 
-    def __init__(self, config: AWSConfig):
-        """Initialize SLIReportClient with AWS configuration.
+def service_key(key_attributes: Dict[str, str]) -> ServiceKey:
+    """Return the (Type, Name, Environment, AwsAccountId) tuple identifying a service."""
+    return (
+        key_attributes.get('Type', ''),
+        key_attributes.get('Name', ''),
+        key_attributes.get('Environment', ''),
+        key_attributes.get('AwsAccountId', ''),
+    )
 
-        Args:
-            config: AWSConfig instance containing region, period, and service settings
 
-        Raises:
-            Exception: If AWS clients fail to initialize
-        """
-        self.config = config
-        logger.info(
-            f'Initializing SLIReportClient for service: {config.service_name}, region: {config.region}'
-        )
+class SLIEvaluationEngine:
+    """Evaluates SLI status for many services with a fixed number of API calls.
 
-        try:
-            # Initialize AWS service clients
-            self.signals_client = boto3.client('application-signals', region_name=config.region)
-            self.cloudwatch_client = boto3.client('cloudwatch', region_name=config.region)
-            logger.debug('AWS clients initialized successfully')
-        except Exception as e:
-            logger.error(f'Failed to initialize AWS clients: {str(e)}', exc_info=True)
-            raise
+    Instead of listing SLOs and querying metrics once per service, the engine lists all
+    service SLOs once, fetches their BreachedCount metrics through batched GetMetricData
+    requests that run concurrently in worker threads, and keeps the per-service reports
+    for a short time so repeated health checks do not hit the APIs again.
+    """
 
-    def get_slo_summaries(self) -> List[SLOSummary]:
-        """Fetches SLO summaries from AWS Application Signals."""
-        logger.debug(f'Fetching SLO summaries for {self.config.service_name}')
+    def __init__(self, max_concurrency: int = 8, cache_ttl: float = 60):
+        """Initialize the engine.
 
-        try:
-            response = self.signals_client.list_service_level_objectives(
-                KeyAttributes=self.config.key_attributes,
-                MetricSourceTypes=['ServiceOperation'],
-                IncludeLinkedAccounts=True,
-            )
-            logger.info(f'Retrieved {len(response.get("SloSummaries", []))} SLO summaries')
-        except ClientError as e:
-            error_msg = e.response.get('Error', {}).get('Message', 'Unknown error')
-            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            logger.error(f'AWS ClientError getting SLO summaries: {error_code} - {error_msg}')
-            raise
-        except Exception as e:
-            logger.error(f'Unexpected error getting SLO summaries: {str(e)}', exc_info=True)
-            raise
-
-        return [
-            SLOSummary(
-                name=slo['Name'],
-                arn=slo['Arn'],
-                key_attributes=slo.get('KeyAttributes', {}),
-                operation_name=slo.get('OperationName', 'N/A'),
-                created_time=slo.get('CreatedTime', datetime.now(timezone.utc)),
-            )
-            for slo in response['SloSummaries']
-        ]
+        Args:
+            max_concurrency: Maximum number of GetMetricData batches in flight
+            cache_ttl: Seconds to reuse an evaluation for the same period and services
+        """
+        self.max_concurrency = max_concurrency
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[Tuple, Tuple[float, Dict[ServiceKey, Optional[SLIReport]]]] = {}
+
+    def clear_cache(self) -> None:
+        """Drop all cached evaluations."""
+        self._cache.clear()
+
+    def list_slo_summaries(self, signals_client) -> List[SLOSummary]:
+        """List all service-operation SLOs, following pagination."""
+        summaries = []
+        kwargs: Dict[str, Any] = {
+            'MetricSourceTypes': ['ServiceOperation'],
+            'IncludeLinkedAccounts': True,
+            'MaxResults': 50,
+        }
+        while True:
+            response = signals_client.list_service_level_objectives(**kwargs)
+            for slo in response.get('SloSummaries', []):
+                summaries.append(
+                    SLOSummary(
+                        name=slo['Name'],
+                        arn=slo['Arn'],
+                        key_attributes=slo.get('KeyAttributes', {}),
+                        operation_name=slo.get('OperationName', 'N/A'),
+                        created_time=slo.get('CreatedTime', datetime.now(timezone.utc)),
+                    )
+                )
+            next_token = response.get('NextToken')
+            if not next_token:
+                break
+            kwargs['NextToken'] = next_token
+
+        logger.info(f'Retrieved {len(summaries)} SLO summaries')
+        return summaries
+
+    def get_breached_counts(
+        self,
+        cloudwatch_client,
+        slo_summaries: List[SLOSummary],
+        start_time: datetime,
+        end_time: datetime,
+        period_in_hours: int,
+    ) -> Dict[str, Optional[float]]:
+        """Fetch the maximum BreachedCount of each SLO with one GetMetricData batch.
 
-    def create_metric_queries(self, slo_summaries: List[SLOSummary]) -> List[Dict[str, Any]]:
-        """Creates CloudWatch metric queries for each SLO."""
-        return [
+        Args:
+            cloudwatch_client: CloudWatch client to use
+            slo_summaries: At most MAX_METRIC_DATA_QUERIES SLOs
+            start_time: Start of the evaluation window
+            end_time: End of the evaluation window
+            period_in_hours: Metric period, which spans the whole window
+
+        Returns:
+            Mapping of SLO ARN to its BreachedCount, or None when there is no datapoint
+        """
+        queries = [
             {
                 'Id': f'slo{i}',
                 'MetricStat': {
@@ -246,7 +215,7 @@ class SLIReportClient:
                         'MetricName': 'BreachedCount',
                         'Dimensions': [{'Name': 'SloName', 'Value': slo.name}],
                     },
-                    'Period': self.config.period_in_hours * 60 * 60,
+                    'Period': period_in_hours * 60 * 60,
                     'Stat': 'Maximum',
                 },
                 'ReturnData': True,
@@ -254,87 +223,132 @@ class SLIReportClient:
             for i, slo in enumerate(slo_summaries)
         ]
 
-    def get_metric_data(
-        self, queries: List[Dict[str, Any]], start_time: datetime, end_time: datetime
-    ) -> List[MetricDataResult]:
-        """Retrieves metric data from CloudWatch using the specified queries."""
-        logger.debug(f'Fetching metric data with {len(queries)} queries')
-
-        try:
-            response = self.cloudwatch_client.get_metric_data(
-                MetricDataQueries=queries,  # type: ignore
-                StartTime=start_time,
-                EndTime=end_time,
-            )
-            logger.debug(f'Retrieved {len(response.get("MetricDataResults", []))} metric results')
-        except ClientError as e:
-            error_msg = e.response.get('Error', {}).get('Message', 'Unknown error')
-            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            logger.error(f'AWS ClientError getting metric data: {error_code} - {error_msg}')
-            raise
-        except Exception as e:
-            logger.error(f'Unexpected error getting metric data: {str(e)}', exc_info=True)
-            raise
+        values: Dict[str, List[float]] = {}
+        kwargs: Dict[str, Any] = {
+            'MetricDataQueries': queries,
+            'StartTime': start_time,
+            'EndTime': end_time,
+        }
+        while True:
+            response = cloudwatch_client.get_metric_data(**kwargs)
+            for result in response.get('MetricDataResults', []):
+                values.setdefault(result['Id'], []).extend(result.get('Values', []))
+            next_token = response.get('NextToken')
+            if not next_token:
+                break
+            kwargs['NextToken'] = next_token
+
+        return {
+            slo.arn: max(values[f'slo{i}']) if values.get(f'slo{i}') else None
+            for i, slo in enumerate(slo_summaries)
+        }
 
-        return [
-            MetricDataResult(
-                timestamps=result.get('Timestamps', []), values=result.get('Values', [])
-            )
-            for result in response['MetricDataResults']
-        ]
+    async def evaluate(
+        self,
+        signals_client,
+        cloudwatch_client,
+        services: List[Dict[str, Any]],
+        hours: int,
+    ) -> Dict[ServiceKey, Optional[SLIReport]]:
+        """Evaluate SLI status for all services.
 
-    def get_sli_status(self, num_breaching: int) -> str:
-        """Determines overall SLI status based on number of breaching SLOs."""
-        return 'CRITICAL' if num_breaching > 0 else 'OK'
+        Args:
+            signals_client: Application Signals client to use
+            cloudwatch_client: CloudWatch client to use
+            services: Service summaries as returned by ListServices
+            hours: Evaluation window in hours (capped at 24)
+
+        Returns:
+            Mapping of service key to its SLIReport, or None when its SLOs or metrics
+            could not be retrieved
+        """
+        period_in_hours = min(hours, 24)
+        keys = sorted({service_key(service['KeyAttributes']) for service in services})
+        cache_key = (period_in_hours, tuple(keys))
+        cached = self._cache.get(cache_key)
+        if cached and time.time() - cached[0] < self.cache_ttl:
+            logger.debug('Using cached SLI evaluation')
+            return cached[1]
 
-    def generate_sli_report(self) -> SLIReport:
-        """Generates a comprehensive SLI report.
+        end_time = datetime.now(timezone.utc)
+        start_time = end_time - timedelta(hours=period_in_hours)
 
-        Collects SLO data, analyzes metrics, and produces a report containing
-        the overall status and details about breaching/healthy SLOs.
-        """
-        logger.info(f'Generating SLI report for {self.config.service_name}')
-        end_time = datetime.now()
-        start_time = end_time - timedelta(hours=self.config.period_in_hours)
-        logger.debug(f'Report time range: {start_time} to {end_time}')
+        try:
+            slo_summaries = await asyncio.to_thread(self.list_slo_summaries, signals_client)
+        except Exception as e:
+            logger.error(f'Failed to list SLOs: {e}')
+            return dict.fromkeys(keys)
+
+        wanted = set(keys)
+        by_identity: Dict[Tuple[str, str, str], List[ServiceKey]] = {}
+        for key in keys:
+            by_identity.setdefault(key[:3], []).append(key)
+
+        def owner(key: ServiceKey) -> Optional[ServiceKey]:
+            if key in wanted:
+                return key
+            # Only one side may carry the account; match on the rest when that is unambiguous
+            candidates = by_identity.get(key[:3], [])
+            if len(candidates) == 1 and '' in (key[3], candidates[0][3]):
+                return candidates[0]
+            return None
+
+        slos_by_service: Dict[ServiceKey, List[SLOSummary]] = {key: [] for key in keys}
+        for slo in slo_summaries:
+            key = owner(service_key(slo.key_attributes))
+            if key is not None:
+                slos_by_service[key].append(slo)
+
+        slos = [slo for key in keys for slo in slos_by_service[key]]
+        batches = [
+            slos[i : i + MAX_METRIC_DATA_QUERIES]
+            for i in range(0, len(slos), MAX_METRIC_DATA_QUERIES)
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_batch(batch: List[SLOSummary]) -> Dict[str, Optional[float]]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.get_breached_counts,
+                    cloudwatch_client,
+                    batch,
+                    start_time,
+                    end_time,
+                    period_in_hours,
+                )
+
+        results = await asyncio.gather(
+            *(fetch_batch(batch) for batch in batches), return_exceptions=True
+        )
+        breached: Dict[str, Optional[float]] = {}
+        failed = set()
+        for batch, result in zip(batches, results):
+            if isinstance(result, BaseException):
+                logger.error(f'Failed to get SLI metrics for {len(batch)} SLOs: {result}')
+                failed.update(slo.arn for slo in batch)
+            else:
+                breached.update(result)
 
-        slo_summaries = self.get_slo_summaries()
+        reports: Dict[ServiceKey, Optional[SLIReport]] = {}
+        for key in keys:
+            service_slos = slos_by_service[key]
+            if any(slo.arn in failed for slo in service_slos):
+                reports[key] = None
+                continue
 
-        # If no SLOs found, return empty report
-        if not slo_summaries:
-            logger.warning(f'No SLOs found for service {self.config.service_name}')
-            return SLIReport(
+            breaching = [slo.name for slo in service_slos if (breached.get(slo.arn) or 0) > 0]
+            reports[key] = SLIReport(
                 start_time=start_time,
                 end_time=end_time,
-                sli_status='OK',  # No SLOs means nothing can be breached
-                total_slo_count=0,
-                ok_slo_count=0,
-                breached_slo_count=0,
-                breached_slo_names=[],
+                sli_status='CRITICAL' if breaching else 'OK',
+                total_slo_count=len(service_slos),
+                ok_slo_count=len(service_slos) - len(breaching),
+                breached_slo_count=len(breaching),
+                breached_slo_names=breaching,
             )
 
-        metric_queries = self.create_metric_queries(slo_summaries)
-        metric_results = self.get_metric_data(metric_queries, start_time, end_time)
-
-        healthy_slos = []
-        breaching_slos = []
-
-        for i, result in enumerate(metric_results):
-            # Check if we have any values and if the SLO is breached
-            if result.values and len(result.values) > 0 and result.values[0] > 0:
-                breaching_slos.append(slo_summaries[i].name)
-            else:
-                healthy_slos.append(slo_summaries[i].name)
-
-        logger.debug(
-            f'SLI report generated - Total SLOs: {len(slo_summaries)}, Breaching: {len(breaching_slos)}, Healthy: {len(healthy_slos)}'
-        )
-        return SLIReport(
-            start_time=start_time,
-            end_time=end_time,
-            sli_status=self.get_sli_status(len(breaching_slos)),
-            total_slo_count=len(slo_summaries),
-            ok_slo_count=len(healthy_slos),
-            breached_slo_count=len(breaching_slos),
-            breached_slo_names=breaching_slos,
+        logger.info(
+            f'Evaluated {len(slos)} SLOs for {len(keys)} services in {len(batches)} batches'
         )
+        self._cache[cache_key] = (time.time(), reports)
+        return reports
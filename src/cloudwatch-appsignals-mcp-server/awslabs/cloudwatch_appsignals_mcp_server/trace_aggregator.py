@@ -0,0 +1,231 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming aggregation of X-Ray trace summaries with bounded memory."""
+
+import random
+from collections import Counter
+from loguru import logger
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Latency samples kept per operation for percentile estimates
+LATENCY_RESERVOIR_SIZE = 512
+# Distinct operations tracked before further ones are folded into OTHER_OPERATION
+MAX_OPERATIONS = 200
+# Distinct exceptions tracked before the least frequent ones are pruned
+MAX_EXCEPTIONS = 500
+# Trace summaries kept verbatim as examples, faults and errors first
+MAX_SAMPLE_TRACES = 20
+OTHER_OPERATION = '(other)'
+
+
+def iter_trace_summary_pages(
+    xray_client,
+    start_time,
+    end_time,
+    filter_expression: str,
+    max_traces: Optional[int] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield pages of X-Ray trace summaries as they are retrieved.
+
+    Args:
+        xray_client: Boto3 X-Ray client
+        start_time: Start time for trace query
+        end_time: End time for trace query
+        filter_expression: X-Ray filter expression
+        max_traces: Maximum number of traces to yield in total (None for no limit)
+
+    Yields:
+        Lists of trace summaries, one per GetTraceSummaries page
+    """
+    kwargs = {
+        'StartTime': start_time,
+        'EndTime': end_time,
+        'FilterExpression': filter_expression,
+        'Sampling': True,
+        'TimeRangeType': 'Service',
+    }
+    remaining = max_traces
+    while remaining is None or remaining > 0:
+        response = xray_client.get_trace_summaries(**kwargs)
+        traces = response.get('TraceSummaries', [])
+        if remaining is not None:
+            traces = traces[:remaining]
+            remaining -= len(traces)
+        logger.debug(f'Retrieved {len(traces)} traces in this page')
+        yield traces
+
+        next_token = response.get('NextToken')
+        if not next_token:
+            break
+        kwargs['NextToken'] = next_token
+
+
+def _annotation_value(value: Any) -> Optional[str]:
+    """Return the string value of an X-Ray annotation, which may be a list of typed values."""
+    if isinstance(value, list):
+        if not value:
+            return None
+        value = value[0].get('AnnotationValue', {}) if isinstance(value[0], dict) else value[0]
+        if isinstance(value, dict):
+            value = next(iter(value.values()), None)
+    return None if value is None else str(value)
+
+
+class _OperationStats:
+    """Counters and a latency reservoir for one operation."""
+
+    def __init__(self, rng: random.Random):
+        self.count = 0
+        self.faults = 0
+        self.errors = 0
+        self.max_duration = 0.0
+        self.durations: List[float] = []
+        self._rng = rng
+
+    def add(self, trace: Dict[str, Any]) -> None:
+        self.count += 1
+        self.faults += bool(trace.get('HasFault'))
+        self.errors += bool(trace.get('HasError'))
+
+        duration = trace.get('Duration')
+        if duration is None:
+            return
+        self.max_duration = max(self.max_duration, duration)
+        # Reservoir sampling keeps a uniform sample of at most LATENCY_RESERVOIR_SIZE durations
+        if len(self.durations) < LATENCY_RESERVOIR_SIZE:
+            self.durations.append(duration)
+        else:
+            slot = self._rng.randrange(self.count)
+            if slot < LATENCY_RESERVOIR_SIZE:
+                self.durations[slot] = duration
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self.durations:
+            return None
+        ordered = sorted(self.durations)
+        index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+
+class TraceAggregator:
+    """Aggregates trace summaries page by page without keeping the pages.
+
+    Tracks fault, error and throttle counts, per-operation request counts and latency
+    percentiles, the most frequent root-cause exceptions, and a small set of example
+    traces. Memory use is bounded by the module-level limits regardless of how many
+    traces are added.
+    """
+
+    def __init__(self, seed: int = 0):
+        """Initialize an empty aggregation.
+
+        Args:
+            seed: Seed for the latency reservoir sampling, for reproducible results
+        """
+        self.trace_count = 0
+        self.fault_count = 0
+        self.error_count = 0
+        self.throttle_count = 0
+        self.operations: Dict[str, _OperationStats] = {}
+        self.exceptions: Counter = Counter()
+        self.samples: List[Dict[str, Any]] = []
+        self._rng = random.Random(seed)
+
+    def add_page(self, traces: List[Dict[str, Any]]) -> None:
+        """Add one page of trace summaries to the aggregation."""
+        for trace in traces:
+            self.add(trace)
+
+    def add(self, trace: Dict[str, Any]) -> None:
+        """Add one trace summary to the aggregation."""
+        self.trace_count += 1
+        self.fault_count += bool(trace.get('HasFault'))
+        self.error_count += bool(trace.get('HasError'))
+        self.throttle_count += bool(trace.get('HasThrottle'))
+
+        operation = (
+            _annotation_value(trace.get('Annotations', {}).get('aws.local.operation')) or 'UNKNOWN'
+        )
+        if operation not in self.operations and len(self.operations) >= MAX_OPERATIONS:
+            operation = OTHER_OPERATION
+        if operation not in self.operations:
+            self.operations[operation] = _OperationStats(self._rng)
+        self.operations[operation].add(trace)
+
+        for key in self._root_cause_exceptions(trace):
+            self.exceptions[key] += 1
+        if len(self.exceptions) > MAX_EXCEPTIONS:
+            # Drop the least frequent half so heavy hitters keep accumulating
+            self.exceptions = Counter(dict(self.exceptions.most_common(MAX_EXCEPTIONS // 2)))
+
+        self._add_sample(trace)
+
+    def _root_cause_exceptions(self, trace: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+        keys = []
+        for cause_type in ('FaultRootCauses', 'ErrorRootCauses'):
+            for cause in trace.get(cause_type, []):
+                for service in cause.get('Services', []):
+                    exceptions = list(service.get('Exceptions', []))
+                    for entity in service.get('EntityPath', []):
+                        exceptions.extend(entity.get('Exceptions', []))
+                    for exception in exceptions:
+                        keys.append(
+                            (
+                                service.get('Name', 'Unknown'),
+                                exception.get('Name', 'Unknown'),
+                                (exception.get('Message') or '')[:200],
+                            )
+                        )
+        return keys
+
+    def _add_sample(self, trace: Dict[str, Any]) -> None:
+        priority = 2 if trace.get('HasFault') else 1 if trace.get('HasError') else 0
+        if len(self.samples) < MAX_SAMPLE_TRACES:
+            self.samples.append(trace)
+            return
+        # Replace a lower-priority example so faults and errors are always represented
+        for i, sample in enumerate(self.samples):
+            sample_priority = 2 if sample.get('HasFault') else 1 if sample.get('HasError') else 0
+            if sample_priority < priority:
+                self.samples[i] = trace
+                return
+
+    def summary(self, top_operations: int = 20, top_exceptions: int = 10) -> Dict[str, Any]:
+        """Return the aggregates as a JSON-serializable dictionary."""
+        operations = sorted(self.operations.items(), key=lambda item: -item[1].count)
+        return {
+            'TraceCount': self.trace_count,
+            'FaultCount': self.fault_count,
+            'ErrorCount': self.error_count,
+            'ThrottleCount': self.throttle_count,
+            'Operations': [
+                {
+                    'Operation': name,
+                    'Count': stats.count,
+                    'FaultCount': stats.faults,
+                    'ErrorCount': stats.errors,
+                    'LatencyP50': stats.percentile(50),
+                    'LatencyP90': stats.percentile(90),
+                    'LatencyP99': stats.percentile(99),
+                    'LatencyMax': stats.max_duration,
+                }
+                for name, stats in operations[:top_operations]
+            ],
+            'TopExceptions': [
+                {'Service': service, 'Exception': name, 'Message': message, 'Count': count}
+                for (service, name, message), count in self.exceptions.most_common(top_exceptions)
+            ],
+        }
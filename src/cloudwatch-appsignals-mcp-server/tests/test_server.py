@@ -6,7 +6,6 @@ from awslabs.cloudwatch_appsignals_mcp_server.server import (
     check_transaction_search_enabled,
     get_service_detail,
     get_slo,
-    get_trace_summaries_paginated,
     list_monitored_services,
     list_slis,
     main,
@@ -14,6 +13,7 @@ from awslabs.cloudwatch_appsignals_mcp_server.server import (
     query_service_metrics,
     remove_null_values,
     search_transaction_spans,
+    sli_engine,
 )
 from botocore.exceptions import ClientError
 from datetime import datetime, timedelta, timezone
@@ -42,6 +42,7 @@ def mock_aws_clients():
                 with patch(
                     'awslabs.cloudwatch_appsignals_mcp_server.server.xray_client', mock_xray_client
                 ):
+                    sli_engine.clear_cache()
                     yield {
                         'logs_client': mock_logs_client,
                         'appsignals_client': mock_appsignals_client,
@@ -372,36 +373,38 @@ async def test_list_slis_success(mock_aws_clients):
         ]
     }
 
-    # Mock SLIReportClient
     with patch(
-        'awslabs.cloudwatch_appsignals_mcp_server.server.SLIReportClient'
-    ) as mock_sli_client:
-        with patch(
-            'awslabs.cloudwatch_appsignals_mcp_server.server.check_transaction_search_enabled'
-        ) as mock_check:
-            mock_aws_clients[
-                'appsignals_client'
-            ].list_services.return_value = mock_services_response
-            mock_check.return_value = (True, 'CloudWatchLogs', 'ACTIVE')
-
-            # Mock SLI report
-            mock_report = MagicMock()
-            mock_report.breached_slo_count = 1
-            mock_report.breached_slo_names = ['test-slo']
-            mock_report.ok_slo_count = 2
-            mock_report.total_slo_count = 3
-            mock_report.sli_status = 'BREACHED'
-            mock_report.start_time = datetime.now(timezone.utc) - timedelta(hours=24)
-            mock_report.end_time = datetime.now(timezone.utc)
-
-            mock_sli_client.return_value.generate_sli_report.return_value = mock_report
+        'awslabs.cloudwatch_appsignals_mcp_server.server.check_transaction_search_enabled'
+    ) as mock_check:
+        mock_aws_clients['appsignals_client'].list_services.return_value = mock_services_response
+        mock_check.return_value = (True, 'CloudWatchLogs', 'ACTIVE')
 
-            result = await list_slis(hours=24)
+        # One SLO per breach state, all for the same service
+        key_attributes = mock_services_response['ServiceSummaries'][0]['KeyAttributes']
+        mock_aws_clients['appsignals_client'].list_service_level_objectives.return_value = {
+            'SloSummaries': [
+                {'Name': name, 'Arn': f'arn:{name}', 'KeyAttributes': key_attributes}
+                for name in ('test-slo', 'ok-slo-1', 'ok-slo-2')
+            ]
+        }
+        mock_aws_clients['cloudwatch_client'].get_metric_data.return_value = {
+            'MetricDataResults': [
+                {'Id': 'slo0', 'Values': [1.0]},
+                {'Id': 'slo1', 'Values': [0.0]},
+                {'Id': 'slo2', 'Values': []},
+            ]
+        }
+
+        result = await list_slis(hours=24)
 
-            assert 'SLI Status Report - Last 24 hours' in result
-            assert 'Transaction Search: ENABLED' in result
-            assert 'BREACHED SERVICES:' in result
-            assert 'test-service' in result
+        assert 'SLI Status Report - Last 24 hours' in result
+        assert 'Transaction Search: ENABLED' in result
+        assert 'BREACHED SERVICES:' in result
+        assert 'test-service' in result
+        assert 'SLOs: 1/3 breached' in result
+        assert 'test-slo' in result
+        mock_aws_clients['appsignals_client'].list_service_level_objectives.assert_called_once()
+        mock_aws_clients['cloudwatch_client'].get_metric_data.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -430,12 +433,12 @@ async def test_query_sampled_traces_success(mock_aws_clients):
     ]
 
     with patch(
-        'awslabs.cloudwatch_appsignals_mcp_server.server.get_trace_summaries_paginated'
+        'awslabs.cloudwatch_appsignals_mcp_server.server.iter_trace_summary_pages'
     ) as mock_get_traces:
         with patch(
             'awslabs.cloudwatch_appsignals_mcp_server.server.check_transaction_search_enabled'
         ) as mock_check:
-            mock_get_traces.return_value = mock_traces
+            mock_get_traces.return_value = iter([mock_traces])
             mock_check.return_value = (False, 'XRay', 'INACTIVE')
 
             result_json = await query_sampled_traces(
@@ -448,6 +451,8 @@ async def test_query_sampled_traces_success(mock_aws_clients):
             assert result['TraceCount'] == 1
             assert result['TraceSummaries'][0]['Id'] == 'trace1'
             assert result['TraceSummaries'][0]['HasFault'] is True
+            assert result['Aggregates']['FaultCount'] == 1
+            assert result['Aggregates']['Operations'][0]['LatencyP50'] == 0.5
 
 
 @pytest.mark.asyncio
@@ -464,42 +469,6 @@ async def test_query_sampled_traces_time_window_too_large(mock_aws_clients):
     assert 'Time window too large' in result['error']
 
 
-def test_get_trace_summaries_paginated():
-    """Test paginated trace retrieval."""
-    mock_client = MagicMock()
-    mock_responses = [
-        {'TraceSummaries': [{'Id': 'trace1'}, {'Id': 'trace2'}], 'NextToken': 'token1'},
-        {'TraceSummaries': [{'Id': 'trace3'}]},
-    ]
-    mock_client.get_trace_summaries.side_effect = mock_responses
-
-    start_time = datetime.now(timezone.utc) - timedelta(hours=1)
-    end_time = datetime.now(timezone.utc)
-
-    traces = get_trace_summaries_paginated(
-        mock_client, start_time, end_time, 'service("test")', max_traces=10
-    )
-
-    assert len(traces) == 3
-    assert traces[0]['Id'] == 'trace1'
-    assert traces[2]['Id'] == 'trace3'
-
-
-def test_get_trace_summaries_paginated_with_error():
-    """Test paginated trace retrieval with error."""
-    mock_client = MagicMock()
-    mock_client.get_trace_summaries.side_effect = Exception('API Error')
-
-    start_time = datetime.now(timezone.utc) - timedelta(hours=1)
-    end_time = datetime.now(timezone.utc)
-
-    traces = get_trace_summaries_paginated(
-        mock_client, start_time, end_time, 'service("test")', max_traces=10
-    )
-
-    assert len(traces) == 0  # Should return empty list on error
-
-
 def test_check_transaction_search_enabled(mock_aws_clients):
     """Test checking transaction search status."""
     mock_aws_clients['xray_client'].get_trace_segment_destination.return_value = {
@@ -782,7 +751,7 @@ async def test_get_slo_period_based(mock_aws_clients):
 
 @pytest.mark.asyncio
 async def test_list_slis_with_error_in_sli_client(mock_aws_clients):
-    """Test list_slis when SLIReportClient throws error for some services."""
+    """Test list_slis when SLI metrics cannot be retrieved for some services."""
     mock_services_response = {
         'ServiceSummaries': [
             {
@@ -803,37 +772,49 @@ async def test_list_slis_with_error_in_sli_client(mock_aws_clients):
     }
 
     with patch(
-        'awslabs.cloudwatch_appsignals_mcp_server.server.SLIReportClient'
-    ) as mock_sli_client:
-        with patch(
-            'awslabs.cloudwatch_appsignals_mcp_server.server.check_transaction_search_enabled'
-        ) as mock_check:
-            mock_aws_clients[
-                'appsignals_client'
-            ].list_services.return_value = mock_services_response
-            mock_check.return_value = (False, 'XRay', 'INACTIVE')
+        'awslabs.cloudwatch_appsignals_mcp_server.server.check_transaction_search_enabled'
+    ) as mock_check:
+        mock_aws_clients['appsignals_client'].list_services.return_value = mock_services_response
+        mock_check.return_value = (False, 'XRay', 'INACTIVE')
 
-            # First service succeeds, second fails
-            mock_report = MagicMock()
-            mock_report.breached_slo_count = 0
-            mock_report.ok_slo_count = 3
-            mock_report.total_slo_count = 3
-            mock_report.sli_status = 'OK'
-            mock_report.start_time = datetime.now(timezone.utc) - timedelta(hours=24)
-            mock_report.end_time = datetime.now(timezone.utc)
-
-            mock_sli_client.return_value.generate_sli_report.side_effect = [
-                mock_report,
-                Exception('Failed to get SLI report'),
+        # Each service has more SLOs than fit in one GetMetricData batch, so each
+        # service's SLOs land in their own batch; the second batch fails
+        summaries = mock_services_response['ServiceSummaries']
+        mock_aws_clients['appsignals_client'].list_service_level_objectives.return_value = {
+            'SloSummaries': [
+                {
+                    'Name': f'slo-{i}-{j}',
+                    'Arn': f'arn:slo-{i}-{j}',
+                    'KeyAttributes': summary['KeyAttributes'],
+                }
+                for i, summary in enumerate(summaries)
+                for j in range(3)
             ]
+        }
+
+        def get_metric_data(MetricDataQueries, **kwargs):
+            slo_name = MetricDataQueries[0]['MetricStat']['Metric']['Dimensions'][0]['Value']
+            if slo_name.startswith('slo-1'):
+                raise Exception('Failed to get metric data')
+            return {
+                'MetricDataResults': [
+                    {'Id': query['Id'], 'Values': [0.0]} for query in MetricDataQueries
+                ]
+            }
+
+        mock_aws_clients['cloudwatch_client'].get_metric_data.side_effect = get_metric_data
 
+        with patch(
+            'awslabs.cloudwatch_appsignals_mcp_server.sli_report_client.MAX_METRIC_DATA_QUERIES',
+            3,
+        ):
             result = await list_slis(hours=24)
 
-            assert 'Transaction Search: NOT ENABLED' in result
-            assert 'HEALTHY SERVICES:' in result
-            assert 'INSUFFICIENT DATA:' in result
-            assert 'test-service-1' in result
-            assert 'test-service-2' in result
+        assert 'Transaction Search: NOT ENABLED' in result
+        assert 'HEALTHY SERVICES:' in result
+        assert 'INSUFFICIENT DATA:' in result
+        assert 'test-service-1' in result
+        assert 'test-service-2' in result
 
 
 @pytest.mark.asyncio
@@ -1162,37 +1143,6 @@ async def test_list_monitored_services_with_attributes_branch(mock_aws_clients):
     assert 'Key Attributes:' not in result  # Should not show when empty
 
 
-@pytest.mark.asyncio
-async def test_get_trace_summaries_paginated_with_limit(mock_aws_clients):
-    """Test get_trace_summaries_paginated when it hits the max_traces limit."""
-    # Mock responses with more traces than the limit
-    mock_response_1 = {
-        'TraceSummaries': [{'Id': f'trace-{i}', 'Duration': 100} for i in range(10)],
-        'NextToken': 'token1',
-    }
-    mock_response_2 = {
-        'TraceSummaries': [{'Id': f'trace-{i}', 'Duration': 100} for i in range(10, 15)]
-    }
-
-    mock_aws_clients['xray_client'].get_trace_summaries.side_effect = [
-        mock_response_1,
-        mock_response_2,
-    ]
-
-    # Test with max_traces=12
-    traces = get_trace_summaries_paginated(
-        mock_aws_clients['xray_client'],
-        datetime.now(timezone.utc),
-        datetime.now(timezone.utc),
-        'service("test")',
-        max_traces=12,
-    )
-
-    # The function continues until it gets all traces from the current page
-    # before checking the limit, so we might get more than max_traces
-    assert len(traces) >= 12  # Should have at least the limit
-
-
 @pytest.mark.asyncio
 async def test_get_slo_with_period_based_sli_full_details(mock_aws_clients):
     """Test get_slo with comprehensive period-based SLI configuration."""
@@ -1483,9 +1433,9 @@ async def test_query_sampled_traces_with_defaults(mock_aws_clients):
     }
 
     with patch(
-        'awslabs.cloudwatch_appsignals_mcp_server.server.get_trace_summaries_paginated'
+        'awslabs.cloudwatch_appsignals_mcp_server.server.iter_trace_summary_pages'
     ) as mock_paginated:
-        mock_paginated.return_value = mock_trace_response['TraceSummaries']
+        mock_paginated.return_value = iter([mock_trace_response['TraceSummaries']])
 
         # Call without start_time and end_time to test defaults
         result_json = await query_sampled_traces(
@@ -1525,9 +1475,9 @@ async def test_query_sampled_traces_with_annotations(mock_aws_clients):
     }
 
     with patch(
-        'awslabs.cloudwatch_appsignals_mcp_server.server.get_trace_summaries_paginated'
+        'awslabs.cloudwatch_appsignals_mcp_server.server.iter_trace_summary_pages'
     ) as mock_paginated:
-        mock_paginated.return_value = [mock_trace]
+        mock_paginated.return_value = iter([[mock_trace]])
 
         result_json = await query_sampled_traces(
             start_time='2024-01-01T00:00:00Z',
@@ -1565,9 +1515,9 @@ async def test_query_sampled_traces_with_fault_causes(mock_aws_clients):
     }
 
     with patch(
-        'awslabs.cloudwatch_appsignals_mcp_server.server.get_trace_summaries_paginated'
+        'awslabs.cloudwatch_appsignals_mcp_server.server.iter_trace_summary_pages'
     ) as mock_paginated:
-        mock_paginated.return_value = [mock_trace]
+        mock_paginated.return_value = iter([[mock_trace]])
 
         result_json = await query_sampled_traces(
             start_time='2024-01-01T00:00:00Z', end_time='2024-01-01T01:00:00Z'
@@ -1585,7 +1535,7 @@ async def test_query_sampled_traces_with_fault_causes(mock_aws_clients):
 async def test_query_sampled_traces_general_exception(mock_aws_clients):
     """Test query_sampled_traces with general exception."""
     with patch(
-        'awslabs.cloudwatch_appsignals_mcp_server.server.get_trace_summaries_paginated'
+        'awslabs.cloudwatch_appsignals_mcp_server.server.iter_trace_summary_pages'
     ) as mock_paginated:
         mock_paginated.side_effect = Exception('Trace query failed')
 
@@ -1612,9 +1562,9 @@ async def test_query_sampled_traces_datetime_conversion(mock_aws_clients):
     }
 
     with patch(
-        'awslabs.cloudwatch_appsignals_mcp_server.server.get_trace_summaries_paginated'
+        'awslabs.cloudwatch_appsignals_mcp_server.server.iter_trace_summary_pages'
     ) as mock_paginated:
-        mock_paginated.return_value = [mock_trace]
+        mock_paginated.return_value = iter([[mock_trace]])
 
         result_json = await query_sampled_traces(
             start_time='2024-01-01T00:00:00Z', end_time='2024-01-01T01:00:00Z'
@@ -2,63 +2,15 @@
 
 import pytest
 from awslabs.cloudwatch_appsignals_mcp_server.sli_report_client import (
-    AWSConfig,
-    MetricDataResult,
+    SLIEvaluationEngine,
     SLIReport,
-    SLIReportClient,
     SLOSummary,
+    service_key,
 )
-from botocore.exceptions import ClientError
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 
-class TestAWSConfig:
-    """Test cases for AWSConfig class."""
-
-    def test_init_defaults(self):
-        """Test AWSConfig initialization with default values."""
-        config = AWSConfig()
-        assert config.region == 'us-east-1'
-        assert config.period_in_hours == 24
-        assert config.service_name == 'UnknownService'
-
-    def test_init_custom_values(self):
-        """Test AWSConfig initialization with custom values."""
-        config = AWSConfig(region='us-west-2', period_in_hours=12, service_name='MyService')
-        assert config.region == 'us-west-2'
-        assert config.period_in_hours == 12
-        assert config.service_name == 'MyService'
-
-    def test_period_max_limit(self):
-        """Test that period_in_hours is capped at 24."""
-        config = AWSConfig(period_in_hours=48)
-        assert config.period_in_hours == 24
-
-    def test_key_attributes(self):
-        """Test key_attributes property."""
-        config = AWSConfig(region='eu-west-1', service_name='TestService')
-        expected = {'Name': 'TestService', 'Type': 'Service', 'Environment': 'eu-west-1'}
-        assert config.key_attributes == expected
-
-    def test_key_attributes_direct_call(self):
-        """Test key_attributes to ensure line 63 coverage."""
-        # Directly test the return statement to cover line 63
-        config = AWSConfig(region='us-west-2', service_name='MyService')
-
-        # Access the expected result directly to ensure line 63 is covered
-        expected_result = {
-            'Name': config.service_name,
-            'Type': 'Service',
-            'Environment': config.region,
-        }
-        assert expected_result == {
-            'Name': 'MyService',
-            'Type': 'Service',
-            'Environment': 'us-west-2',
-        }
-
-
 class TestSLOSummary:
     """Test cases for SLOSummary dataclass."""
 
@@ -80,20 +32,6 @@ class TestSLOSummary:
         assert summary.created_time == created_time
 
 
-class TestMetricDataResult:
-    """Test cases for MetricDataResult dataclass."""
-
-    def test_metric_data_result_creation(self):
-        """Test MetricDataResult dataclass creation."""
-        timestamps = [datetime.now(timezone.utc), datetime.now(timezone.utc) + timedelta(hours=1)]
-        values = [0.0, 1.0]
-
-        result = MetricDataResult(timestamps=timestamps, values=values)
-
-        assert result.timestamps == timestamps
-        assert result.values == values
-
-
 class TestSLIReport:
     """Test cases for SLIReport class."""
 
@@ -127,317 +65,208 @@ class TestSLIReport:
         assert len(report.breached_slo_names) == 2  # Original list unchanged
 
 
-class TestSLIReportClient:
-    """Test cases for SLIReportClient class."""
-
-    @pytest.fixture
-    def mock_aws_clients(self):
-        """Mock AWS clients."""
-        with patch(
-            'awslabs.cloudwatch_appsignals_mcp_server.sli_report_client.boto3.client'
-        ) as mock_client:
-            mock_signals = MagicMock()
-            mock_cloudwatch = MagicMock()
-
-            def client_side_effect(service_name, **kwargs):
-                if service_name == 'application-signals':
-                    return mock_signals
-                elif service_name == 'cloudwatch':
-                    return mock_cloudwatch
-
-            mock_client.side_effect = client_side_effect
-            yield {
-                'signals_client': mock_signals,
-                'cloudwatch_client': mock_cloudwatch,
-                'mock_client': mock_client,
-            }
-
-    def test_init_success(self, mock_aws_clients):
-        """Test successful SLIReportClient initialization."""
-        config = AWSConfig(region='us-west-2', service_name='TestService')
-        client = SLIReportClient(config)
-
-        assert client.config == config
-        assert client.signals_client == mock_aws_clients['signals_client']
-        assert client.cloudwatch_client == mock_aws_clients['cloudwatch_client']
-
-        # Verify clients were created with correct region
-        calls = mock_aws_clients['mock_client'].call_args_list
-        assert calls[0][0][0] == 'application-signals'
-        assert calls[0][1]['region_name'] == 'us-west-2'
-        assert calls[1][0][0] == 'cloudwatch'
-        assert calls[1][1]['region_name'] == 'us-west-2'
-
-    def test_init_failure(self, mock_aws_clients):
-        """Test SLIReportClient initialization failure."""
-        mock_aws_clients['mock_client'].side_effect = Exception('Failed to connect')
+SERVICE_A = {'Type': 'Service', 'Name': 'service-a', 'Environment': 'prod'}
+SERVICE_B = {'Type': 'Service', 'Name': 'service-b', 'Environment': 'prod'}
 
-        config = AWSConfig()
-        with pytest.raises(Exception) as exc_info:
-            SLIReportClient(config)
 
-        assert 'Failed to connect' in str(exc_info.value)
+class TestSLIEvaluationEngine:
+    """Test cases for SLIEvaluationEngine class."""
 
-    def test_get_slo_summaries_success(self, mock_aws_clients):
-        """Test successful retrieval of SLO summaries."""
-        config = AWSConfig(service_name='TestService')
-        client = SLIReportClient(config)
-
-        # Mock response
-        created_time = datetime.now(timezone.utc)
-        mock_response = {
-            'SloSummaries': [
-                {
-                    'Name': 'slo-1',
-                    'Arn': 'arn:aws:application-signals:us-east-1:123456789012:slo/slo-1',
-                    'KeyAttributes': {'Name': 'TestService'},
-                    'OperationName': 'GetItem',
-                    'CreatedTime': created_time,
-                },
-                {
-                    'Name': 'slo-2',
-                    'Arn': 'arn:aws:application-signals:us-east-1:123456789012:slo/slo-2',
-                    'KeyAttributes': {'Name': 'TestService'},
-                    'CreatedTime': created_time,
-                },
-            ]
-        }
-        mock_aws_clients[
-            'signals_client'
-        ].list_service_level_objectives.return_value = mock_response
-
-        summaries = client.get_slo_summaries()
-
-        assert len(summaries) == 2
-        assert summaries[0].name == 'slo-1'
-        assert summaries[0].operation_name == 'GetItem'
-        assert summaries[1].name == 'slo-2'
-        assert summaries[1].operation_name == 'N/A'  # Default when not provided
-
-    def test_get_slo_summaries_client_error(self, mock_aws_clients):
-        """Test get_slo_summaries with ClientError."""
-        config = AWSConfig()
-        client = SLIReportClient(config)
-
-        error_response = {
-            'Error': {'Code': 'AccessDeniedException', 'Message': 'User is not authorized'},
-            'ResponseMetadata': {'RequestId': '12345', 'HTTPStatusCode': 403},
-        }
-        mock_aws_clients['signals_client'].list_service_level_objectives.side_effect = ClientError(
-            error_response,  # type: ignore
-            'ListServiceLevelObjectives',
-        )
+    @pytest.fixture
+    def clients(self):
+        """Create mock Application Signals and CloudWatch clients."""
+        signals_client = MagicMock()
+        signals_client.list_service_level_objectives.side_effect = [
+            {
+                'SloSummaries': [
+                    {'Name': 'a-latency', 'Arn': 'arn:a1', 'KeyAttributes': SERVICE_A},
+                    {'Name': 'a-availability', 'Arn': 'arn:a2', 'KeyAttributes': SERVICE_A},
+                ],
+                'NextToken': 'page-2',
+            },
+            {
+                'SloSummaries': [
+                    {'Name': 'b-latency', 'Arn': 'arn:b1', 'KeyAttributes': SERVICE_B},
+                    {'Name': 'other', 'Arn': 'arn:o1', 'KeyAttributes': {'Name': 'other'}},
+                ]
+            },
+        ]
 
-        with pytest.raises(ClientError):
-            client.get_slo_summaries()
+        cloudwatch_client = MagicMock()
+
+        def get_metric_data(MetricDataQueries, **kwargs):
+            breached = {'a-latency', 'b-latency'}
+            return {
+                'MetricDataResults': [
+                    {
+                        'Id': query['Id'],
+                        'Values': [
+                            1.0
+                            if query['MetricStat']['Metric']['Dimensions'][0]['Value'] in breached
+                            else 0.0
+                        ],
+                    }
+                    for query in MetricDataQueries
+                ]
+            }
 
-    def test_get_slo_summaries_general_error(self, mock_aws_clients):
-        """Test get_slo_summaries with general exception."""
-        config = AWSConfig()
-        client = SLIReportClient(config)
+        cloudwatch_client.get_metric_data.side_effect = get_metric_data
+        return signals_client, cloudwatch_client
 
-        mock_aws_clients['signals_client'].list_service_level_objectives.side_effect = Exception(
-            'Network error'
+    def test_service_key(self):
+        """Test that the service key includes the account and ignores other attributes."""
+        assert service_key({**SERVICE_A, 'AwsAccountId': '123', 'Identifier': 'x'}) == (
+            'Service',
+            'service-a',
+            'prod',
+            '123',
         )
 
-        with pytest.raises(Exception) as exc_info:
-            client.get_slo_summaries()
-
-        assert 'Network error' in str(exc_info.value)
-
-    def test_create_metric_queries(self, mock_aws_clients):
-        """Test creation of CloudWatch metric queries."""
-        config = AWSConfig(period_in_hours=6)
-        client = SLIReportClient(config)
-
-        summaries = [
-            SLOSummary(
-                name='slo-1',
-                arn='arn:1',
-                key_attributes={},
-                operation_name='Op1',
-                created_time=datetime.now(timezone.utc),
-            ),
-            SLOSummary(
-                name='slo-2',
-                arn='arn:2',
-                key_attributes={},
-                operation_name='Op2',
-                created_time=datetime.now(timezone.utc),
-            ),
+    @pytest.mark.asyncio
+    async def test_evaluate_separates_accounts(self, clients):
+        """Test that same-named services in different accounts keep their own SLOs."""
+        signals_client, cloudwatch_client = clients
+        account_1 = {**SERVICE_A, 'AwsAccountId': '111'}
+        account_2 = {**SERVICE_A, 'AwsAccountId': '222'}
+        signals_client.list_service_level_objectives.side_effect = [
+            {
+                'SloSummaries': [
+                    {'Name': 'a-latency', 'Arn': 'arn:a1', 'KeyAttributes': account_1},
+                    {'Name': 'a-availability', 'Arn': 'arn:a2', 'KeyAttributes': account_2},
+                ]
+            }
         ]
 
-        queries = client.create_metric_queries(summaries)
-
-        assert len(queries) == 2
-        assert queries[0]['Id'] == 'slo0'
-        assert queries[0]['MetricStat']['Metric']['MetricName'] == 'BreachedCount'
-        assert queries[0]['MetricStat']['Metric']['Dimensions'][0]['Value'] == 'slo-1'
-        assert queries[0]['MetricStat']['Period'] == 6 * 60 * 60  # 6 hours in seconds
-        assert queries[1]['Id'] == 'slo1'
-        assert queries[1]['MetricStat']['Metric']['Dimensions'][0]['Value'] == 'slo-2'
-
-    def test_get_metric_data_success(self, mock_aws_clients):
-        """Test successful retrieval of metric data."""
-        config = AWSConfig()
-        client = SLIReportClient(config)
-
-        queries = [{'Id': 'slo0'}, {'Id': 'slo1'}]
-        start_time = datetime.now(timezone.utc) - timedelta(hours=24)
-        end_time = datetime.now(timezone.utc)
-
-        # Mock response
-        mock_response = {
-            'MetricDataResults': [
-                {'Id': 'slo0', 'Timestamps': [start_time, end_time], 'Values': [0.0, 1.0]},
-                {'Id': 'slo1', 'Timestamps': [start_time, end_time], 'Values': [0.0, 0.0]},
-            ]
-        }
-        mock_aws_clients['cloudwatch_client'].get_metric_data.return_value = mock_response
-
-        results = client.get_metric_data(queries, start_time, end_time)
-
-        assert len(results) == 2
-        assert results[0].values == [0.0, 1.0]
-        assert results[1].values == [0.0, 0.0]
-
-    def test_get_metric_data_client_error(self, mock_aws_clients):
-        """Test get_metric_data with ClientError."""
-        config = AWSConfig()
-        client = SLIReportClient(config)
-
-        error_response = {
-            'Error': {'Code': 'InvalidParameterValue', 'Message': 'Invalid metric query'},
-            'ResponseMetadata': {'RequestId': '12345', 'HTTPStatusCode': 400},
-        }
-        mock_aws_clients['cloudwatch_client'].get_metric_data.side_effect = ClientError(
-            error_response,  # type: ignore
-            'GetMetricData',
+        reports = await SLIEvaluationEngine().evaluate(
+            signals_client,
+            cloudwatch_client,
+            [{'KeyAttributes': account_1}, {'KeyAttributes': account_2}],
+            24,
         )
 
-        with pytest.raises(ClientError):
-            client.get_metric_data([], datetime.now(), datetime.now())
-
-    def test_get_metric_data_general_error(self, mock_aws_clients):
-        """Test get_metric_data with general exception."""
-        config = AWSConfig()
-        client = SLIReportClient(config)
-
-        mock_aws_clients['cloudwatch_client'].get_metric_data.side_effect = Exception('Timeout')
-
-        with pytest.raises(Exception) as exc_info:
-            client.get_metric_data([], datetime.now(), datetime.now())
-
-        assert 'Timeout' in str(exc_info.value)
-
-    def test_get_sli_status(self, mock_aws_clients):
-        """Test SLI status determination."""
-        config = AWSConfig()
-        client = SLIReportClient(config)
-
-        assert client.get_sli_status(0) == 'OK'
-        assert client.get_sli_status(1) == 'CRITICAL'
-        assert client.get_sli_status(5) == 'CRITICAL'
-
-    def test_generate_sli_report_no_slos(self, mock_aws_clients):
-        """Test report generation when no SLOs exist."""
-        config = AWSConfig(service_name='EmptyService', period_in_hours=12)
-        client = SLIReportClient(config)
+        report_1 = reports[service_key(account_1)]
+        report_2 = reports[service_key(account_2)]
+        assert report_1 is not None and report_2 is not None
+        assert report_1.breached_slo_names == ['a-latency']
+        assert report_2.total_slo_count == 1
+        assert report_2.breached_slo_count == 0
+
+    @pytest.mark.asyncio
+    async def test_evaluate_matches_slos_without_account(self, clients):
+        """Test that SLOs without an account match the single service of that name."""
+        signals_client, cloudwatch_client = clients
+        service = {**SERVICE_A, 'AwsAccountId': '111'}
+
+        reports = await SLIEvaluationEngine().evaluate(
+            signals_client, cloudwatch_client, [{'KeyAttributes': service}], 24
+        )
 
-        # Mock empty SLO response
-        mock_aws_clients['signals_client'].list_service_level_objectives.return_value = {
-            'SloSummaries': []
-        }
+        report = reports[service_key(service)]
+        assert report is not None
+        assert report.total_slo_count == 2
 
-        report = client.generate_sli_report()
+    @pytest.mark.asyncio
+    async def test_evaluate_listing_failure(self, clients):
+        """Test that a failure listing SLOs leaves every service without a report."""
+        signals_client, cloudwatch_client = clients
+        signals_client.list_service_level_objectives.side_effect = Exception('Throttled')
+
+        reports = await SLIEvaluationEngine().evaluate(
+            signals_client,
+            cloudwatch_client,
+            [{'KeyAttributes': SERVICE_A}, {'KeyAttributes': SERVICE_B}],
+            24,
+        )
 
-        assert report.sli_status == 'OK'
-        assert report.total_slo_count == 0
-        assert report.ok_slo_count == 0
-        assert report.breached_slo_count == 0
-        assert report.breached_slo_names == []
-        assert (report.end_time - report.start_time).total_seconds() == 12 * 3600
+        assert reports == {service_key(SERVICE_A): None, service_key(SERVICE_B): None}
+        cloudwatch_client.get_metric_data.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_evaluate_lists_slos_once_and_batches_metrics(self, clients):
+        """Test that all services are evaluated with one paginated listing and one batch."""
+        signals_client, cloudwatch_client = clients
+        engine = SLIEvaluationEngine()
+        services = [{'KeyAttributes': SERVICE_A}, {'KeyAttributes': SERVICE_B}]
+
+        reports = await engine.evaluate(signals_client, cloudwatch_client, services, 48)
+
+        assert signals_client.list_service_level_objectives.call_count == 2
+        cloudwatch_client.get_metric_data.assert_called_once()
+        queries = cloudwatch_client.get_metric_data.call_args.kwargs['MetricDataQueries']
+        assert len(queries) == 3
+        assert queries[0]['MetricStat']['Period'] == 24 * 60 * 60
+
+        report_a = reports[service_key(SERVICE_A)]
+        report_b = reports[service_key(SERVICE_B)]
+        assert report_a is not None and report_b is not None
+        assert report_a.sli_status == 'CRITICAL'
+        assert report_a.total_slo_count == 2
+        assert report_a.breached_slo_names == ['a-latency']
+        assert report_b.breached_slo_count == 1
+
+    @pytest.mark.asyncio
+    async def test_evaluate_is_cached(self, clients):
+        """Test that a repeated evaluation within the TTL does not call the APIs."""
+        signals_client, cloudwatch_client = clients
+        engine = SLIEvaluationEngine(cache_ttl=60)
+        services = [{'KeyAttributes': SERVICE_A}]
+
+        first = await engine.evaluate(signals_client, cloudwatch_client, services, 24)
+        second = await engine.evaluate(signals_client, cloudwatch_client, services, 24)
+
+        assert first is second
+        cloudwatch_client.get_metric_data.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_evaluate_splits_large_batches(self, clients):
+        """Test that SLOs are split into GetMetricData batches."""
+        signals_client, cloudwatch_client = clients
+        engine = SLIEvaluationEngine()
+        services = [{'KeyAttributes': SERVICE_A}, {'KeyAttributes': SERVICE_B}]
 
-    def test_generate_sli_report_with_breaches(self, mock_aws_clients):
-        """Test report generation with breaching SLOs."""
-        config = AWSConfig(service_name='TestService', period_in_hours=24)
-        client = SLIReportClient(config)
+        with patch(
+            'awslabs.cloudwatch_appsignals_mcp_server.sli_report_client.MAX_METRIC_DATA_QUERIES',
+            2,
+        ):
+            reports = await engine.evaluate(signals_client, cloudwatch_client, services, 24)
+
+        assert cloudwatch_client.get_metric_data.call_count == 2
+        report_b = reports[service_key(SERVICE_B)]
+        assert report_b is not None
+        assert report_b.breached_slo_names == ['b-latency']
+
+    @pytest.mark.asyncio
+    async def test_evaluate_failed_batch(self, clients):
+        """Test that services in a failed batch have no report."""
+        signals_client, cloudwatch_client = clients
+        cloudwatch_client.get_metric_data.side_effect = Exception('Throttled')
+        engine = SLIEvaluationEngine()
+
+        reports = await engine.evaluate(
+            signals_client, cloudwatch_client, [{'KeyAttributes': SERVICE_A}], 24
+        )
 
-        # Mock SLO summaries
-        created_time = datetime.now(timezone.utc)
-        mock_slo_response = {
-            'SloSummaries': [
-                {
-                    'Name': 'slo-healthy',
-                    'Arn': 'arn:1',
-                    'KeyAttributes': {},
-                    'OperationName': 'Op1',
-                    'CreatedTime': created_time,
-                },
-                {
-                    'Name': 'slo-breached',
-                    'Arn': 'arn:2',
-                    'KeyAttributes': {},
-                    'OperationName': 'Op2',
-                    'CreatedTime': created_time,
-                },
-            ]
-        }
-        mock_aws_clients[
-            'signals_client'
-        ].list_service_level_objectives.return_value = mock_slo_response
-
-        # Mock metric data - first SLO healthy (0.0), second SLO breached (1.0)
-        mock_metric_response = {
-            'MetricDataResults': [
-                {'Id': 'slo0', 'Timestamps': [datetime.now(timezone.utc)], 'Values': [0.0]},
-                {'Id': 'slo1', 'Timestamps': [datetime.now(timezone.utc)], 'Values': [1.0]},
-            ]
-        }
-        mock_aws_clients['cloudwatch_client'].get_metric_data.return_value = mock_metric_response
-
-        report = client.generate_sli_report()
+        assert reports == {service_key(SERVICE_A): None}
 
-        assert report.sli_status == 'CRITICAL'
-        assert report.total_slo_count == 2
-        assert report.ok_slo_count == 1
-        assert report.breached_slo_count == 1
-        assert report.breached_slo_names == ['slo-breached']
+    def test_get_breached_counts_follows_next_token(self):
+        """Test that GetMetricData pagination is merged per query."""
+        cloudwatch_client = MagicMock()
+        cloudwatch_client.get_metric_data.side_effect = [
+            {'MetricDataResults': [{'Id': 'slo0', 'Values': [0.0]}], 'NextToken': 'next'},
+            {'MetricDataResults': [{'Id': 'slo0', 'Values': [2.0]}]},
+        ]
+        slo = SLOSummary(
+            name='slo',
+            arn='arn:slo',
+            key_attributes=SERVICE_A,
+            operation_name='N/A',
+            created_time=datetime.now(timezone.utc),
+        )
+        now = datetime.now(timezone.utc)
 
-    def test_generate_sli_report_all_healthy(self, mock_aws_clients):
-        """Test report generation with all SLOs healthy."""
-        config = AWSConfig(service_name='TestService')
-        client = SLIReportClient(config)
+        counts = SLIEvaluationEngine().get_breached_counts(
+            cloudwatch_client, [slo], now - timedelta(hours=1), now, 1
+        )
 
-        # Mock SLO summaries
-        created_time = datetime.now(timezone.utc)
-        mock_slo_response = {
-            'SloSummaries': [
-                {'Name': 'slo-1', 'Arn': 'arn:1', 'CreatedTime': created_time},
-                {'Name': 'slo-2', 'Arn': 'arn:2', 'CreatedTime': created_time},
-            ]
-        }
-        mock_aws_clients[
-            'signals_client'
-        ].list_service_level_objectives.return_value = mock_slo_response
-
-        # Mock metric data - all healthy
-        mock_metric_response = {
-            'MetricDataResults': [
-                {'Id': 'slo0', 'Timestamps': [datetime.now(timezone.utc)], 'Values': [0.0]},
-                {
-                    'Id': 'slo1',
-                    'Timestamps': [],
-                    'Values': [],  # Empty values also means healthy
-                },
-            ]
-        }
-        mock_aws_clients['cloudwatch_client'].get_metric_data.return_value = mock_metric_response
-
-        report = client.generate_sli_report()
-
-        assert report.sli_status == 'OK'
-        assert report.total_slo_count == 2
-        assert report.ok_slo_count == 2
-        assert report.breached_slo_count == 0
-        assert report.breached_slo_names == []
+        assert counts == {'arn:slo': 2.0}
+        assert cloudwatch_client.get_metric_data.call_args.kwargs['NextToken'] == 'next'
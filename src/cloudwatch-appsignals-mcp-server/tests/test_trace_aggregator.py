@@ -0,0 +1,145 @@
+"""Tests for streaming trace aggregation."""
+
+import pytest
+from awslabs.cloudwatch_appsignals_mcp_server import trace_aggregator
+from awslabs.cloudwatch_appsignals_mcp_server.trace_aggregator import (
+    TraceAggregator,
+    iter_trace_summary_pages,
+)
+from unittest.mock import MagicMock, patch
+
+
+def make_trace(i, operation='GET /items', duration=1.0, fault=False, error=False):
+    """Build a trace summary with an operation annotation."""
+    return {
+        'Id': f'trace{i}',
+        'Duration': duration,
+        'HasFault': fault,
+        'HasError': error,
+        'Annotations': {'aws.local.operation': [{'AnnotationValue': {'StringValue': operation}}]},
+    }
+
+
+class TestIterTraceSummaryPages:
+    """Test cases for iter_trace_summary_pages."""
+
+    def test_yields_pages_until_max_traces(self):
+        """Test that pages are yielded lazily and truncated at max_traces."""
+        mock_client = MagicMock()
+        mock_client.get_trace_summaries.side_effect = [
+            {'TraceSummaries': [make_trace(i) for i in range(3)], 'NextToken': 'a'},
+            {'TraceSummaries': [make_trace(i) for i in range(3, 6)], 'NextToken': 'b'},
+            {'TraceSummaries': [make_trace(i) for i in range(6, 9)]},
+        ]
+
+        pages = iter_trace_summary_pages(mock_client, 'start', 'end', 'filter', max_traces=5)
+
+        assert [len(page) for page in pages] == [3, 2]
+        assert mock_client.get_trace_summaries.call_count == 2
+        assert mock_client.get_trace_summaries.call_args.kwargs['NextToken'] == 'a'
+
+
+class TestTraceAggregator:
+    """Test cases for TraceAggregator."""
+
+    def test_counts_and_percentiles(self):
+        """Test counts and per-operation latency percentiles."""
+        aggregator = TraceAggregator()
+        aggregator.add_page([make_trace(i, duration=float(i + 1)) for i in range(100)])
+        aggregator.add_page(
+            [make_trace(100, operation='POST /orders', duration=3.0, fault=True, error=True)]
+        )
+
+        summary = aggregator.summary()
+        assert summary['TraceCount'] == 101
+        assert summary['FaultCount'] == 1
+        assert summary['ErrorCount'] == 1
+
+        get_items, post_orders = summary['Operations']
+        assert get_items['Operation'] == 'GET /items'
+        assert get_items['Count'] == 100
+        assert get_items['LatencyP50'] == 50.0
+        assert get_items['LatencyP99'] == 99.0
+        assert get_items['LatencyMax'] == 100.0
+        assert post_orders['FaultCount'] == 1
+
+    def test_plain_string_annotations(self):
+        """Test that plain string annotations are used as operation names."""
+        aggregator = TraceAggregator()
+        aggregator.add({'Id': 't', 'Annotations': {'aws.local.operation': 'GetItem'}})
+        assert aggregator.summary()['Operations'][0]['Operation'] == 'GetItem'
+
+    def test_top_exceptions(self):
+        """Test that root-cause exceptions are counted across cause types."""
+        aggregator = TraceAggregator()
+        cause = {
+            'Services': [
+                {
+                    'Name': 'orders',
+                    'EntityPath': [
+                        {'Exceptions': [{'Name': 'TimeoutError', 'Message': 'timed out'}]}
+                    ],
+                }
+            ]
+        }
+        for i in range(3):
+            aggregator.add({**make_trace(i, fault=True), 'FaultRootCauses': [cause]})
+        aggregator.add({**make_trace(3, error=True), 'ErrorRootCauses': [cause]})
+
+        assert aggregator.summary()['TopExceptions'] == [
+            {'Service': 'orders', 'Exception': 'TimeoutError', 'Message': 'timed out', 'Count': 4}
+        ]
+
+    def test_memory_is_bounded(self):
+        """Test that operations, latency samples and examples stay within their limits."""
+        aggregator = TraceAggregator()
+        with (
+            patch.object(trace_aggregator, 'MAX_OPERATIONS', 3),
+            patch.object(trace_aggregator, 'LATENCY_RESERVOIR_SIZE', 10),
+            patch.object(trace_aggregator, 'MAX_SAMPLE_TRACES', 2),
+        ):
+            for i in range(50):
+                aggregator.add(make_trace(i, operation=f'op{i % 5}'))
+            aggregator.add(make_trace(50, fault=True))
+
+        assert len(aggregator.operations) == 4
+        assert trace_aggregator.OTHER_OPERATION in aggregator.operations
+        assert all(len(stats.durations) <= 10 for stats in aggregator.operations.values())
+        assert len(aggregator.samples) == 2
+        assert any(sample['HasFault'] for sample in aggregator.samples)
+
+
+@pytest.mark.asyncio
+async def test_query_sampled_traces_partial_failure():
+    """Test that aggregates collected before a retrieval error are returned."""
+    import json
+    from awslabs.cloudwatch_appsignals_mcp_server.server import query_sampled_traces
+
+    def pages(*args):
+        yield [make_trace(0, fault=True)]
+        raise Exception('Throttled')
+
+    with (
+        patch(
+            'awslabs.cloudwatch_appsignals_mcp_server.server.iter_trace_summary_pages',
+            side_effect=pages,
+        ),
+        patch(
+            'awslabs.cloudwatch_appsignals_mcp_server.server.check_transaction_search_enabled',
+            return_value=(False, 'XRay', 'INACTIVE'),
+        ),
+        patch('awslabs.cloudwatch_appsignals_mcp_server.server.xray_client'),
+    ):
+        result = json.loads(
+            await query_sampled_traces(
+                start_time='2024-01-01T00:00:00Z',
+                end_time='2024-01-01T01:00:00Z',
+                filter_expression='service("orders")',
+                region='us-east-1',
+                max_traces=100,
+            )
+        )
+
+    assert result['TraceCount'] == 1
+    assert result['Aggregates']['FaultCount'] == 1
+    assert 'Throttled' in result['Warning']
@@ -0,0 +1,204 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared AWS client factory for the CloudWatch tools."""
+
+import asyncio
+import bisect
+import boto3
+import functools
+import os
+import threading
+import time
+from awslabs.cloudwatch_mcp_server import MCP_SERVER_VERSION
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from loguru import logger
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+
+T = TypeVar('T')
+
+# Maximum number of blocking SDK calls running at the same time
+DEFAULT_MAX_WORKERS = 16
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram for one API."""
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float, error: bool = False) -> None:
+        """Record one call."""
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.errors += error
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Return the upper bound of the bucket holding the given percentile."""
+        if not self.count:
+            return None
+        rank = pct / 100 * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the histogram as a JSON-serializable dictionary."""
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'avg_ms': round(self.total_ms / self.count, 3) if self.count else None,
+            'max_ms': round(self.max_ms, 3),
+            'p50_ms': self.percentile(50),
+            'p90_ms': self.percentile(90),
+            'p99_ms': self.percentile(99),
+            'buckets': dict(
+                zip([f'le_{bound}' for bound in LATENCY_BUCKETS_MS] + ['le_inf'], self.counts)
+            ),
+        }
+
+
+class AwsClientFactory:
+    """Caches boto3 sessions and clients and runs blocking SDK calls off the event loop.
+
+    Sessions are cached per (region, profile) and clients per (service, region, profile),
+    so tools no longer pay for a new session and client on every call. Blocking calls
+    made through ``call`` run on a bounded thread pool so that concurrent tool calls do
+    not serialize on the event loop, and their latencies are recorded per API.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        """Initialize the factory.
+
+        Args:
+            max_workers: Size of the thread pool used for blocking SDK calls
+        """
+        self.max_workers = max_workers
+        self._config = Config(
+            user_agent_extra=f'awslabs/mcp/cloudwatch-mcp-server/{MCP_SERVER_VERSION}'
+        )
+        self._sessions: Dict[Tuple[str, Optional[str]], boto3.Session] = {}
+        self._clients: Dict[Tuple[str, str, Optional[str]], Any] = {}
+        self._latencies: Dict[str, LatencyHistogram] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def get_client(self, service: str, region: str, profile: Optional[str] = None):
+        """Return a cached client for the service, creating it on first use.
+
+        Args:
+            service: AWS service name, e.g. 'logs' or 'cloudwatch'
+            region: AWS region
+            profile: AWS profile name; defaults to the AWS_PROFILE environment variable
+
+        Returns:
+            boto3 client
+        """
+        profile = profile or os.environ.get('AWS_PROFILE')
+        key = (service, region, profile)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        # boto3 sessions are not thread-safe, so clients are created under the lock
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                session = self._sessions.get((region, profile))
+                if session is None:
+                    if profile:
+                        session = boto3.Session(profile_name=profile, region_name=region)
+                    else:
+                        session = boto3.Session(region_name=region)
+                    self._sessions[(region, profile)] = session
+                client = session.client(service, config=self._config)
+                self._clients[key] = client
+                logger.debug(f'Created {service} client for region {region}')
+        return client
+
+    async def call(
+        self, func: Callable[..., T], *args, api_name: Optional[str] = None, **kwargs
+    ) -> T:
+        """Run a blocking SDK call on the thread pool and record its latency.
+
+        Args:
+            func: Blocking callable, usually a client method
+            *args: Positional arguments for func
+            api_name: Name the latency is recorded under; defaults to the service and
+                method name of a client method
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The result of func
+        """
+        name = api_name or self._api_name(func)
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        error = False
+        try:
+            return await loop.run_in_executor(
+                self._get_executor(), functools.partial(func, *args, **kwargs)
+            )
+        except Exception:
+            error = True
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._latencies.setdefault(name, LatencyHistogram()).record(elapsed_ms, error)
+
+    def latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the latency histograms recorded so far, keyed by API name."""
+        return {name: hist.snapshot() for name, hist in sorted(self._latencies.items())}
+
+    def clear(self) -> None:
+        """Drop all cached sessions, clients and latency histograms."""
+        with self._lock:
+            self._sessions.clear()
+            self._clients.clear()
+            self._latencies.clear()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix='cloudwatch-mcp-aws'
+                    )
+        return self._executor
+
+    @staticmethod
+    def _api_name(func: Callable) -> str:
+        method = getattr(func, '__name__', type(func).__name__)
+        try:
+            return f'{func.__self__.meta.service_model.service_name}.{method}'  # type: ignore[attr-defined]
+        except AttributeError:
+            return method
+
+
+aws_client_factory = AwsClientFactory()
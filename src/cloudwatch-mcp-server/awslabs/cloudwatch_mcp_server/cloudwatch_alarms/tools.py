@@ -14,10 +14,8 @@
 
 """CloudWatch Alarms tools for MCP server."""
 
-import boto3
 import json
-import os
-from awslabs.cloudwatch_mcp_server import MCP_SERVER_VERSION
+from awslabs.cloudwatch_mcp_server.aws_clients import aws_client_factory
 from awslabs.cloudwatch_mcp_server.cloudwatch_alarms.models import (
     ActiveAlarmsResponse,
     AlarmDetails,
@@ -28,7 +26,6 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_alarms.models import (
     MetricAlarmSummary,
     TimeRangeSuggestion,
 )
-from botocore.config import Config
 from datetime import datetime, timedelta
 from loguru import logger
 from mcp.server.fastmcp import Context
@@ -44,16 +41,9 @@ class CloudWatchAlarmsTools:
         pass
 
     def _get_cloudwatch_client(self, region: str):
-        """Create a CloudWatch client for the specified region."""
-        config = Config(user_agent_extra=f'awslabs/mcp/cloudwatch-mcp-server/{MCP_SERVER_VERSION}')
-
+        """Get the cached CloudWatch client for the specified region."""
         try:
-            if aws_profile := os.environ.get('AWS_PROFILE'):
-                return boto3.Session(profile_name=aws_profile, region_name=region).client(
-                    'cloudwatch', config=config
-                )
-            else:
-                return boto3.Session(region_name=region).client('cloudwatch', config=config)
+            return aws_client_factory.get_client('cloudwatch', region)
         except Exception as e:
             logger.error(f'Error creating cloudwatch client for region {region}: {str(e)}')
             raise
@@ -139,7 +129,9 @@ class CloudWatchAlarmsTools:
             total_items_fetched = 0
             items_to_return = 0
 
-            for page in page_iterator:
+            for page in await aws_client_factory.call(
+                list, page_iterator, api_name='cloudwatch.describe_alarms'
+            ):
                 metric_alarms_list = page.get('MetricAlarms', [])
                 composite_alarms_list = page.get('CompositeAlarms', [])
 
@@ -301,7 +293,9 @@ class CloudWatchAlarmsTools:
             total_items_fetched = 0
             items_to_return = 0
 
-            for page in page_iterator:
+            for page in await aws_client_factory.call(
+                list, page_iterator, api_name='cloudwatch.describe_alarm_history'
+            ):
                 items_list = page.get('AlarmHistoryItems', [])
                 total_items_fetched += len(items_list)
 
@@ -389,8 +383,10 @@ class CloudWatchAlarmsTools:
             logger.info(f'Fetching alarm details for {alarm_name}')
 
             # Call DescribeAlarms API for the specific alarm
-            response = cloudwatch_client.describe_alarms(
-                AlarmNames=[alarm_name], AlarmTypes=['MetricAlarm', 'CompositeAlarm']
+            response = await aws_client_factory.call(
+                cloudwatch_client.describe_alarms,
+                AlarmNames=[alarm_name],
+                AlarmTypes=['MetricAlarm', 'CompositeAlarm'],
             )
 
             # Check if alarm exists
@@ -15,10 +15,8 @@
 """CloudWatch Logs tools for MCP server."""
 
 import asyncio
-import boto3
 import datetime
-import os
-from awslabs.cloudwatch_mcp_server import MCP_SERVER_VERSION
+from awslabs.cloudwatch_mcp_server.aws_clients import aws_client_factory
 from awslabs.cloudwatch_mcp_server.cloudwatch_logs.models import (
     LogAnomaly,
     LogAnomalyDetector,
@@ -34,7 +32,6 @@ from awslabs.cloudwatch_mcp_server.common import (
     filter_by_prefixes,
     remove_null_values,
 )
-from botocore.config import Config
 from loguru import logger
 from mcp.server.fastmcp import Context
 from pydantic import Field
@@ -59,16 +56,9 @@ class CloudWatchLogsTools:
         return self._logs_client
 
     def _get_logs_client(self, region: str):
-        """Create a CloudWatch Logs client for the specified region."""
-        config = Config(user_agent_extra=f'awslabs/mcp/cloudwatch-mcp-server/{MCP_SERVER_VERSION}')
-
+        """Get the cached CloudWatch Logs client for the specified region."""
         try:
-            if aws_profile := os.environ.get('AWS_PROFILE'):
-                return boto3.Session(profile_name=aws_profile, region_name=region).client(
-                    'logs', config=config
-                )
-            else:
-                return boto3.Session(region_name=region).client('logs', config=config)
+            return aws_client_factory.get_client('logs', region)
         except Exception as e:
             logger.error(f'Error creating cloudwatch logs client for region {region}: {str(e)}')
             raise
@@ -168,7 +158,9 @@ class CloudWatchLogsTools:
         """
         poll_start = timer()
         while poll_start + max_timeout > timer():
-            response = logs_client.get_query_results(queryId=query_id)
+            response = await aws_client_factory.call(
+                logs_client.get_query_results, queryId=query_id
+            )
             status = response['status']
 
             if status in {'Complete', 'Failed', 'Cancelled'}:
@@ -322,8 +314,12 @@ class CloudWatchLogsTools:
             ]
 
         try:
-            log_groups = describe_log_groups()
-            filtered_saved_queries = get_filtered_saved_queries(log_groups)
+            log_groups = await aws_client_factory.call(
+                describe_log_groups, api_name='logs.describe_log_groups'
+            )
+            filtered_saved_queries = await aws_client_factory.call(
+                get_filtered_saved_queries, log_groups, api_name='logs.describe_query_definitions'
+            )
             return LogsMetadata(
                 log_group_metadata=log_groups, saved_queries=filtered_saved_queries
             )
@@ -405,7 +401,11 @@ class CloudWatchLogsTools:
         async def get_applicable_anomalies() -> LogAnomalyResults:
             detectors: List[LogAnomalyDetector] = []
             paginator = logs_client.get_paginator('list_log_anomaly_detectors')
-            for page in paginator.paginate(filterLogGroupArn=log_group_arn):
+            for page in await aws_client_factory.call(
+                list,
+                paginator.paginate(filterLogGroupArn=log_group_arn),
+                api_name='logs.list_log_anomaly_detectors',
+            ):
                 detectors.extend(
                     [
                         LogAnomalyDetector.model_validate(d)
@@ -420,8 +420,13 @@ class CloudWatchLogsTools:
             for detector in detectors:
                 paginator = logs_client.get_paginator('list_anomalies')
 
-                for page in paginator.paginate(
-                    anomalyDetectorArn=detector.anomalyDetectorArn, suppressionState='UNSUPPRESSED'
+                for page in await aws_client_factory.call(
+                    list,
+                    paginator.paginate(
+                        anomalyDetectorArn=detector.anomalyDetectorArn,
+                        suppressionState='UNSUPPRESSED',
+                    ),
+                    api_name='logs.list_anomalies',
                 ):
                     anomalies.extend(
                         LogAnomaly.model_validate(anomaly) for anomaly in page.get('anomalies', [])
@@ -567,7 +572,9 @@ class CloudWatchLogsTools:
             logs_client = self._get_logs_client(region)
 
             # Start the query
-            start_response = logs_client.start_query(**remove_null_values(kwargs))
+            start_response = await aws_client_factory.call(
+                logs_client.start_query, **remove_null_values(kwargs)
+            )
             query_id = start_response['queryId']
             logger.info(f'Started query with ID: {query_id}')
 
@@ -608,7 +615,9 @@ class CloudWatchLogsTools:
             # Create logs client for the specified region
             logs_client = self._get_logs_client(region)
 
-            response = logs_client.get_query_results(queryId=query_id)
+            response = await aws_client_factory.call(
+                logs_client.get_query_results, queryId=query_id
+            )
 
             logger.info(f'Retrieved results for query ID {query_id}')
 
@@ -643,7 +652,7 @@ class CloudWatchLogsTools:
             # Create logs client for the specified region
             logs_client = self._get_logs_client(region)
 
-            response = logs_client.stop_query(queryId=query_id)
+            response = await aws_client_factory.call(logs_client.stop_query, queryId=query_id)
             return LogsQueryCancelResult.model_validate(response)
         except Exception as e:
             logger.error(f'Error in cancel_query_tool: {str(e)}')
@@ -14,10 +14,8 @@
 
 """CloudWatch Metrics tools for MCP server."""
 
-import boto3
 import json
-import os
-from awslabs.cloudwatch_mcp_server import MCP_SERVER_VERSION
+from awslabs.cloudwatch_mcp_server.aws_clients import aws_client_factory
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
     AlarmRecommendation,
     AlarmRecommendationDimension,
@@ -29,7 +27,6 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
     MetricMetadata,
     MetricMetadataIndexKey,
 )
-from botocore.config import Config
 from datetime import datetime
 from loguru import logger
 from mcp.server.fastmcp import Context
@@ -50,16 +47,9 @@ class CloudWatchMetricsTools:
         logger.info(f'Loaded {len(self.metric_metadata_index)} metric metadata entries')
 
     def _get_cloudwatch_client(self, region: str):
-        """Create a CloudWatch client for the specified region."""
-        config = Config(user_agent_extra=f'awslabs/mcp/cloudwatch-mcp-server/{MCP_SERVER_VERSION}')
-
+        """Get the cached CloudWatch client for the specified region."""
         try:
-            if aws_profile := os.environ.get('AWS_PROFILE'):
-                return boto3.Session(profile_name=aws_profile, region_name=region).client(
-                    'cloudwatch', config=config
-                )
-            else:
-                return boto3.Session(region_name=region).client('cloudwatch', config=config)
+            return aws_client_factory.get_client('cloudwatch', region)
         except Exception as e:
             logger.error(f'Error creating cloudwatch client for region {region}: {str(e)}')
             raise
@@ -353,8 +343,11 @@ class CloudWatchMetricsTools:
             cloudwatch_client = self._get_cloudwatch_client(region)
 
             # Call the GetMetricData API
-            response = cloudwatch_client.get_metric_data(
-                MetricDataQueries=[metric_query], StartTime=start_time, EndTime=end_time
+            response = await aws_client_factory.call(
+                cloudwatch_client.get_metric_data,
+                MetricDataQueries=[metric_query],
+                StartTime=start_time,
+                EndTime=end_time,
             )
 
             # Process the response
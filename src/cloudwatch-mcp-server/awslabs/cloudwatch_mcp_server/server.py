@@ -14,6 +14,7 @@
 
 """awslabs cloudwatch MCP Server implementation."""
 
+from awslabs.cloudwatch_mcp_server.aws_clients import aws_client_factory
 from awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools import CloudWatchAlarmsTools
 from awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools import CloudWatchLogsTools
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools import CloudWatchMetricsTools
@@ -48,8 +49,13 @@ except Exception as e:
 
 def main():
     """Run the MCP server."""
-    mcp.run()
-    logger.info('CloudWatch MCP server started')
+    try:
+        mcp.run()
+        logger.info('CloudWatch MCP server started')
+    finally:
+        # Report the latency of every AWS API called while the server ran
+        for api_name, stats in aws_client_factory.latency_stats().items():
+            logger.info(f'{api_name} latency: {stats}')
 
 
 if __name__ == '__main__':
@@ -35,7 +35,7 @@ class TestParameterValidation:
 
     def test_validate_log_group_parameters_both_provided(self):
         """Test validation when both parameters are provided - should raise error."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session'):
             tools = CloudWatchLogsTools()
 
             with pytest.raises(ValueError) as exc_info:
@@ -48,7 +48,7 @@ class TestParameterValidation:
 
     def test_validate_log_group_parameters_neither_provided(self):
         """Test validation when neither parameter is provided - should raise error."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session'):
             tools = CloudWatchLogsTools()
 
             with pytest.raises(ValueError) as exc_info:
@@ -61,7 +61,7 @@ class TestParameterValidation:
 
     def test_validate_log_group_parameters_valid_cases(self):
         """Test validation with valid parameter combinations."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session'):
             tools = CloudWatchLogsTools()
 
             # Should not raise - only log_group_names provided
@@ -72,7 +72,7 @@ class TestParameterValidation:
 
     def test_convert_time_to_timestamp(self):
         """Test time string to timestamp conversion."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session'):
             tools = CloudWatchLogsTools()
 
             # Test valid ISO 8601 time
@@ -82,7 +82,7 @@ class TestParameterValidation:
 
     def test_build_logs_query_params(self):
         """Test building logs query parameters."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session'):
             tools = CloudWatchLogsTools()
 
             params = tools._build_logs_query_params(
@@ -103,7 +103,7 @@ class TestParameterValidation:
 
     def test_process_query_results(self):
         """Test processing query results."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session'):
             tools = CloudWatchLogsTools()
 
             raw_response = {
@@ -133,9 +133,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_describe_log_groups_api_error(self, mock_context):
         """Test describe_log_groups with API error - covers lines 367-371."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
             mock_client = Mock()
             mock_client.get_paginator.side_effect = Exception('API Error')
             mock_session.return_value.client.return_value = mock_client
@@ -151,9 +149,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_analyze_log_group_api_error(self, mock_context):
         """Test analyze_log_group with API error - covers lines 374-376, 379, 382."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
             mock_client = Mock()
             mock_client.get_paginator.side_effect = Exception('Anomaly API Error')
             mock_session.return_value.client.return_value = mock_client
@@ -176,9 +172,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_execute_log_insights_query_api_error(self, mock_context):
         """Test execute_log_insights_query with API error - covers lines 455-458."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
             mock_client = Mock()
             mock_client.start_query.side_effect = Exception('Query API Error')
             mock_session.return_value.client.return_value = mock_client
@@ -203,9 +197,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_get_logs_insight_query_results_api_error(self, mock_context):
         """Test get_logs_insight_query_results with API error - covers lines 579-582."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
             mock_client = Mock()
             mock_client.get_query_results.side_effect = Exception('Query Results API Error')
             mock_session.return_value.client.return_value = mock_client
@@ -221,9 +213,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_cancel_logs_insight_query_api_error(self, mock_context):
         """Test cancel_logs_insight_query with API error - covers lines 604-607."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
             mock_client = Mock()
             mock_client.stop_query.side_effect = Exception('Cancel Query API Error')
             mock_session.return_value.client.return_value = mock_client
@@ -239,9 +229,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_poll_for_query_completion_timeout(self, mock_context):
         """Test polling timeout scenario."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
             mock_client = Mock()
             # Always return 'Running' status to trigger timeout
             mock_client.get_query_results.return_value = {'status': 'Running', 'results': []}
@@ -259,9 +247,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_poll_for_query_completion_failed_status(self, mock_context):
         """Test polling with failed query status."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
             mock_client = Mock()
             mock_client.get_query_results.return_value = {
                 'queryId': 'test-query-id',
@@ -279,9 +265,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_poll_for_query_completion_cancelled_status(self, mock_context):
         """Test polling with cancelled query status."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
             mock_client = Mock()
             mock_client.get_query_results.return_value = {
                 'queryId': 'test-query-id',
@@ -302,7 +286,7 @@ class TestEdgeCases:
 
     def test_process_query_results_missing_fields(self):
         """Test processing query results with missing optional fields."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session'):
             tools = CloudWatchLogsTools()
 
             # Response with minimal fields
@@ -321,9 +305,7 @@ class TestEdgeCases:
     def test_aws_profile_initialization(self):
         """Test initialization with AWS_PROFILE environment variable."""
         with patch.dict('os.environ', {'AWS_PROFILE': 'test-profile'}):
-            with patch(
-                'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-            ) as mock_session:
+            with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
                 mock_client = Mock()
                 mock_session.return_value.client.return_value = mock_client
 
@@ -339,9 +321,7 @@ class TestEdgeCases:
     @pytest.mark.asyncio
     async def test_boto3_client_error_handling(self, mock_context):
         """Test error handling when boto3 client creation fails."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
             mock_session.side_effect = Exception('AWS credentials not found')
 
             tools = CloudWatchLogsTools()
@@ -350,7 +330,7 @@ class TestEdgeCases:
 
     def test_tools_registration(self):
         """Test that all tools are properly registered."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session'):
             tools = CloudWatchLogsTools()
 
             mock_mcp = Mock()
@@ -371,7 +351,7 @@ class TestEdgeCases:
 
     def test_build_logs_query_params_with_none_values(self):
         """Test building query params with None values."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session'):
             tools = CloudWatchLogsTools()
 
             params = tools._build_logs_query_params(
@@ -393,9 +373,7 @@ class TestRegionHandling:
 
     def test_get_logs_client_region_parameter(self):
         """Test that _get_logs_client creates client with correct region."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
             mock_client = Mock()
             mock_session.return_value.client.return_value = mock_client
 
@@ -412,9 +390,7 @@ class TestRegionHandling:
     def test_get_logs_client_with_aws_profile(self):
         """Test _get_logs_client with AWS_PROFILE environment variable."""
         with patch.dict('os.environ', {'AWS_PROFILE': 'test-profile'}):
-            with patch(
-                'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-            ) as mock_session:
+            with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
                 mock_client = Mock()
                 mock_session.return_value.client.return_value = mock_client
 
@@ -430,9 +406,7 @@ class TestRegionHandling:
     @pytest.mark.asyncio
     async def test_execute_log_insights_query_region_parameter(self, mock_context):
         """Test that execute_log_insights_query uses correct region for client creation."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
             mock_client = Mock()
             mock_client.start_query.return_value = {'queryId': 'test-query-id'}
             mock_client.get_query_results.return_value = {
@@ -464,9 +438,7 @@ class TestRegionHandling:
     @pytest.mark.asyncio
     async def test_get_logs_insight_query_results_region_parameter(self, mock_context):
         """Test that get_logs_insight_query_results uses correct region for client creation."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
             mock_client = Mock()
             mock_client.get_query_results.return_value = {
                 'status': 'Complete',
@@ -491,9 +463,7 @@ class TestRegionHandling:
     @pytest.mark.asyncio
     async def test_cancel_logs_insight_query_region_parameter(self, mock_context):
         """Test that cancel_logs_insight_query uses correct region for client creation."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
             mock_client = Mock()
             mock_client.stop_query.return_value = {'success': True}
             mock_session.return_value.client.return_value = mock_client
@@ -514,9 +484,7 @@ class TestRegionHandling:
     @pytest.mark.asyncio
     async def test_describe_log_groups_region_parameter(self, mock_context):
         """Test that describe_log_groups uses correct region for client creation."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
             mock_client = Mock()
             mock_paginator = Mock()
             mock_paginator.paginate.return_value = [{'logGroups': []}]
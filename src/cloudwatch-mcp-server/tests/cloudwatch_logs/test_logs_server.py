@@ -58,9 +58,7 @@ async def logs_client():
 @pytest_asyncio.fixture
 async def cloudwatch_tools(logs_client):
     """Create CloudWatchLogsTools instance with mocked client."""
-    with patch(
-        'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-    ) as mock_session:
+    with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
         mock_session.return_value.client.return_value = logs_client
         tools = CloudWatchLogsTools()
         yield tools
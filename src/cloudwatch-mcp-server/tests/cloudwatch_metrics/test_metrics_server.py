@@ -53,9 +53,7 @@ async def cloudwatch_client(aws_credentials):
 @pytest_asyncio.fixture
 async def cloudwatch_metrics_tools(cloudwatch_client):
     """Create CloudWatchMetricsTools instance with mocked client."""
-    with patch(
-        'awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'
-    ) as mock_session:
+    with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
         mock_session.return_value.client.return_value = cloudwatch_client
         tools = CloudWatchMetricsTools()
         yield tools
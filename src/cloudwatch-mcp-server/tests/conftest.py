@@ -0,0 +1,25 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared fixtures for the CloudWatch MCP Server tests."""
+
+import pytest
+from awslabs.cloudwatch_mcp_server.aws_clients import aws_client_factory
+
+
+@pytest.fixture(autouse=True)
+def clear_aws_clients():
+    """Drop clients cached by earlier tests so each test sees its own mocked session."""
+    aws_client_factory.clear()
+    yield
+    aws_client_factory.clear()
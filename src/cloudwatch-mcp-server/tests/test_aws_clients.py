@@ -0,0 +1,121 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the shared AWS client factory."""
+
+import asyncio
+import pytest
+import threading
+import time
+from awslabs.cloudwatch_mcp_server.aws_clients import AwsClientFactory, LatencyHistogram
+from unittest.mock import Mock, patch
+
+
+class TestGetClient:
+    """Tests for session and client caching."""
+
+    def test_clients_are_cached_per_service_region_and_profile(self):
+        """Test that sessions and clients are created once per key."""
+        factory = AwsClientFactory()
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
+            mock_session.return_value.client.side_effect = lambda service, config: Mock()
+
+            with patch.dict('os.environ', {}, clear=True):
+                logs = factory.get_client('logs', 'us-east-1')
+                assert factory.get_client('logs', 'us-east-1') is logs
+                cloudwatch = factory.get_client('cloudwatch', 'us-east-1')
+                assert cloudwatch is not logs
+                factory.get_client('logs', 'eu-west-1')
+
+            with patch.dict('os.environ', {'AWS_PROFILE': 'test-profile'}):
+                assert factory.get_client('logs', 'us-east-1') is not logs
+
+        # One session per (region, profile), one client per (service, region, profile)
+        assert mock_session.call_count == 3
+        assert mock_session.return_value.client.call_count == 4
+        mock_session.assert_called_with(profile_name='test-profile', region_name='us-east-1')
+
+    def test_clear(self):
+        """Test that clear drops cached clients."""
+        factory = AwsClientFactory()
+        with patch('awslabs.cloudwatch_mcp_server.aws_clients.boto3.Session') as mock_session:
+            factory.get_client('logs', 'us-east-1')
+            factory.clear()
+            factory.get_client('logs', 'us-east-1')
+        assert mock_session.call_count == 2
+
+
+class TestCall:
+    """Tests for running blocking calls on the thread pool."""
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently_off_the_event_loop(self):
+        """Test that blocking calls run in worker threads and do not serialize."""
+        factory = AwsClientFactory(max_workers=4)
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def blocking_call(value):
+            threads.append(threading.get_ident())
+            time.sleep(0.1)
+            return value
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(factory.call(blocking_call, i, api_name='logs.test') for i in range(4))
+        )
+        elapsed = time.perf_counter() - start
+
+        assert results == [0, 1, 2, 3]
+        assert loop_thread not in threads
+        assert elapsed < 0.35
+
+    @pytest.mark.asyncio
+    async def test_latency_is_recorded_per_api(self):
+        """Test that successes and errors are recorded under the API name."""
+        factory = AwsClientFactory()
+        client = Mock()
+        client.meta.service_model.service_name = 'logs'
+        client.stop_query = Mock(return_value={'success': True})
+        client.stop_query.__name__ = 'stop_query'
+        client.stop_query.__self__ = client
+
+        await factory.call(client.stop_query, queryId='q1')
+        with pytest.raises(ValueError):
+            await factory.call(Mock(side_effect=ValueError('boom')), api_name='logs.start_query')
+
+        stats = factory.latency_stats()
+        assert stats['logs.stop_query']['count'] == 1
+        assert stats['logs.stop_query']['errors'] == 0
+        assert stats['logs.start_query']['errors'] == 1
+        client.stop_query.assert_called_once_with(queryId='q1')
+
+
+class TestLatencyHistogram:
+    """Tests for the latency histogram."""
+
+    def test_percentiles_and_buckets(self):
+        """Test bucket counts and percentile estimates."""
+        histogram = LatencyHistogram()
+        for elapsed_ms in [3] * 90 + [40] * 9 + [60000]:
+            histogram.record(elapsed_ms)
+
+        snapshot = histogram.snapshot()
+        assert snapshot['count'] == 100
+        assert snapshot['p50_ms'] == 5.0
+        assert snapshot['p90_ms'] == 5.0
+        assert snapshot['p99_ms'] == 50.0
+        assert snapshot['max_ms'] == 60000
+        assert snapshot['buckets']['le_5'] == 90
+        assert snapshot['buckets']['le_inf'] == 1
+        assert LatencyHistogram().snapshot()['p50_ms'] is None
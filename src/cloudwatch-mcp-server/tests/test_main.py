@@ -31,6 +31,17 @@ class TestMain:
         mock_run.assert_called_once()
         assert mock_run.call_args[1].get('transport') is None
 
+    @patch('awslabs.cloudwatch_mcp_server.server.logger')
+    @patch('awslabs.cloudwatch_mcp_server.server.aws_client_factory')
+    @patch('awslabs.cloudwatch_mcp_server.server.mcp.run')
+    def test_main_logs_latency_stats(self, mock_run, mock_factory, mock_logger):
+        """Test that the recorded AWS API latencies are logged when the server stops."""
+        mock_factory.latency_stats.return_value = {'logs.filter_log_events': {'count': 2}}
+
+        main()
+
+        mock_logger.info.assert_any_call("logs.filter_log_events latency: {'count': 2}")
+
     def test_module_execution(self):
         """Test the module execution when run as __main__."""
         # This test directly executes the code in the if __name__ == '__main__': block
@@ -14,7 +14,9 @@
 
 """Analytic tools for DocumentDB MCP Server."""
 
+import asyncio
 from awslabs.documentdb_mcp_server.connection_tools import DocumentDBConnection
+from awslabs.documentdb_mcp_server.schema_inference import SchemaAccumulator
 from loguru import logger
 from pydantic import Field
 from typing import Annotated, Any, Dict, List, Optional
@@ -140,59 +142,30 @@ async def get_collection_stats(
         raise ValueError(f'Failed to get collection statistics: {str(e)}')
 
 
-def get_field_type(docs, path):
-    """Helper function to determine the data type of a field across documents."""
-    parts = path.split('.')
-    types = set()
-
-    for doc in docs:
-        value = doc
-        try:
-            for part in parts:
-                if '[' in part:
-                    # Handle array indexing
-                    array_part = part.split('[')[0]
-                    if array_part in value:
-                        value = value[array_part]
-                        # Try to get array item
-                        if isinstance(value, list) and len(value) > 0:
-                            index = int(part.split('[')[1].split(']')[0])
-                            if len(value) > index:
-                                value = value[index]
-                            else:
-                                value = None
-                                break
-                        else:
-                            value = None
-                            break
-                    else:
-                        value = None
-                        break
-                else:
-                    if isinstance(value, dict) and part in value:
-                        value = value[part]
-                    else:
-                        value = None
-                        break
-
-            if value is not None:
-                value_type = type(value).__name__
-                if value_type == 'dict':
-                    types.add('object')
-                elif value_type == 'list':
-                    types.add('array')
-                else:
-                    types.add(value_type)
-        except (ValueError, IndexError, KeyError, TypeError, AttributeError) as e:
-            logger.warning(f'Error processing document: {doc}. Error: {e}')
-            continue
-
-    if not types:
-        return 'null'
-    elif len(types) == 1:
-        return next(iter(types))
-    else:
-        return list(types)
+def server_side_type_pipeline() -> List[Dict[str, Any]]:
+    """Return the pipeline stages counting the BSON types of top-level fields on the server."""
+    return [
+        {
+            '$project': {
+                '_id': 0,
+                'fields': {
+                    '$map': {
+                        'input': {'$objectToArray': '$$ROOT'},
+                        'as': 'field',
+                        'in': {'path': '$$field.k', 'type': {'$type': '$$field.v'}},
+                    }
+                },
+            }
+        },
+        {'$unwind': '$fields'},
+        {'$match': {'fields.path': {'$ne': '_id'}}},
+        {
+            '$group': {
+                '_id': {'path': '$fields.path', 'type': '$fields.type'},
+                'count': {'$sum': 1},
+            }
+        },
+    ]
 
 
 async def analyze_schema(
@@ -202,13 +175,24 @@ async def analyze_schema(
     database: Annotated[str, Field(description='Name of the database')],
     collection: Annotated[str, Field(description='Name of the collection to analyze')],
     sample_size: Annotated[
-        int, Field(description='Number of documents to sample (default: 100)')
+        int,
+        Field(
+            description='Number of documents to sample (default: 100). Samples of tens of thousands of documents are supported.'
+        ),
     ] = 100,
+    server_side_types: Annotated[
+        bool,
+        Field(
+            description='Count the types of top-level fields on the server with $project/$type instead of transferring the sampled documents (default: false). Nested fields, examples and array lengths are not reported in this mode.'
+        ),
+    ] = False,
 ) -> Dict[str, Any]:
     """Analyze the schema of a collection by sampling documents.
 
     This tool samples documents from a collection and provides information about
-    the document structure and field coverage across the sampled documents.
+    the document structure across the sampled documents: field coverage, a histogram
+    of value types, example values and, for arrays, their minimum, maximum and average
+    length.
 
     Returns:
         Dict[str, Any]: Schema analysis results including field coverage
@@ -225,7 +209,7 @@ async def analyze_schema(
         coll = db[collection]
 
         # Count total documents to adjust sample size if needed
-        total_docs = coll.count_documents({})
+        total_docs = await asyncio.to_thread(coll.count_documents, {})
         actual_sample_size = min(sample_size, total_docs)
 
         if actual_sample_size == 0:
@@ -236,49 +220,33 @@ async def analyze_schema(
                 'sampled_documents': 0,
             }
 
-        # Sample documents (using aggregation with $sample stage)
-        sample_pipeline = [{'$sample': {'size': actual_sample_size}}]
-        sampled_docs = list(coll.aggregate(sample_pipeline))
-
-        # Analyze schema and calculate field coverage
-        field_paths = set()
-        field_counts = {}
-
-        def extract_paths(obj, prefix=''):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key == '_id':
-                        continue  # Skip _id field
-
-                    path = f'{prefix}.{key}' if prefix else key
-                    field_paths.add(path)
-
-                    if path not in field_counts:
-                        field_counts[path] = 0
-                    field_counts[path] += 1
-
-                    extract_paths(value, path)
-            elif isinstance(obj, list) and len(obj) > 0:
-                # For arrays, we'll only analyze the first item to avoid complexity
-                extract_paths(obj[0], f'{prefix}[0]')
-
-        for doc in sampled_docs:
-            extract_paths(doc)
-
-        # Calculate coverage percentages
-        coverage = {}
-        for path, count in field_counts.items():
-            coverage[path] = {
-                'count': count,
-                'percentage': round((count / actual_sample_size) * 100, 2),
-                'data_type': get_field_type(sampled_docs, path),
-            }
+        # Sample documents (using aggregation with $sample stage). When the whole
+        # collection is analyzed, it is read in natural order instead.
+        pipeline = []
+        if actual_sample_size < total_docs:
+            pipeline.append({'$sample': {'size': actual_sample_size}})
+
+        schema = SchemaAccumulator()
+
+        def accumulate() -> None:
+            if server_side_types:
+                for group in coll.aggregate(pipeline + server_side_type_pipeline()):
+                    schema.add_type_counts(
+                        group['_id']['path'], group['_id']['type'], group['count']
+                    )
+                schema.document_count = actual_sample_size
+            else:
+                # Documents are streamed from the cursor and walked once each
+                schema.add_all(coll.aggregate(pipeline))
+
+        # The cursor is read on a worker thread so the event loop is not blocked
+        await asyncio.to_thread(accumulate)
 
         logger.info(
             f"Analyzed schema for '{database}.{collection}' with {actual_sample_size} documents"
         )
         return {
-            'field_coverage': coverage,
+            'field_coverage': schema.summary(),
             'total_documents': total_docs,
             'sampled_documents': actual_sample_size,
             'database': database,
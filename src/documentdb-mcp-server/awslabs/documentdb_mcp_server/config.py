@@ -27,6 +27,11 @@ class ServerConfig:
         By default, the server starts in read-only mode for safety.
         """
         self.read_only_mode = True
+        # Connection pool of each MongoClient, shared by concurrent tool calls
+        self.max_pool_size = 100
+        self.min_pool_size = 0
+        # Documents fetched from the server per cursor batch
+        self.batch_size = 100
 
 
 # Singleton instance
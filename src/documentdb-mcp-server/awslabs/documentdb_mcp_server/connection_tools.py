@@ -14,7 +14,9 @@
 
 """Connection management tools for DocumentDB MCP Server."""
 
+import asyncio
 import uuid
+from awslabs.documentdb_mcp_server.config import serverConfig
 from datetime import datetime, timedelta
 from loguru import logger
 from pydantic import Field
@@ -38,6 +40,15 @@ class ConnectionInfo:
         self.client = client
         self.connection_id = str(uuid.uuid4())
         self.last_used = datetime.now()
+        # Open cursors of this connection, mapped by cursor_id
+        self.cursors: Dict[str, Any] = {}
+
+    def close(self) -> None:
+        """Close the open cursors and the client of this connection."""
+        for cursor in self.cursors.values():
+            cursor.close()
+        self.cursors.clear()
+        self.client.close()
 
 
 class DocumentDBConnection:
@@ -62,7 +73,13 @@ class DocumentDBConnection:
         """
         logger.info('Creating new DocumentDB connection')
         DocumentDBConnection.validate_retry_writes_false(connection_string)
-        client = MongoClient(connection_string)
+        # The client is thread-safe and pools its connections, so tool calls run it off the
+        # event loop concurrently with up to max_pool_size connections
+        client = MongoClient(
+            connection_string,
+            maxPoolSize=serverConfig.max_pool_size,
+            minPoolSize=serverConfig.min_pool_size,
+        )
 
         # Test connection
         try:
@@ -115,7 +132,7 @@ class DocumentDBConnection:
 
         logger.info(f'Closing DocumentDB connection {connection_id}')
         connection_info = cls._connections[connection_id]
-        connection_info.client.close()
+        connection_info.close()
         del cls._connections[connection_id]
 
     @classmethod
@@ -132,7 +149,7 @@ class DocumentDBConnection:
 
         for conn_id in idle_connections:
             logger.info(f'Closing idle DocumentDB connection {conn_id}')
-            cls._connections[conn_id].client.close()
+            cls._connections[conn_id].close()
             del cls._connections[conn_id]
 
     @classmethod
@@ -140,7 +157,7 @@ class DocumentDBConnection:
         """Close all open connections."""
         for conn_id, conn_info in list(cls._connections.items()):
             logger.info(f'Closing DocumentDB connection {conn_id}')
-            conn_info.client.close()
+            conn_info.close()
         cls._connections.clear()
 
     @staticmethod
@@ -187,11 +204,13 @@ async def connect(
     """
     try:
         # Create connection and get connection info
-        connection_info = DocumentDBConnection.create_connection(connection_string)
+        connection_info = await asyncio.to_thread(
+            DocumentDBConnection.create_connection, connection_string
+        )
         client = connection_info.client
 
         # List available databases
-        databases = client.list_database_names()
+        databases = await asyncio.to_thread(client.list_database_names)
 
         return {
             'connection_id': connection_info.connection_id,
@@ -0,0 +1,219 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cursor streaming tools for DocumentDB MCP Server."""
+
+import asyncio
+import uuid
+from awslabs.documentdb_mcp_server.config import serverConfig
+from awslabs.documentdb_mcp_server.connection_tools import ConnectionInfo, DocumentDBConnection
+from datetime import datetime
+from itertools import islice
+from loguru import logger
+from pydantic import Field
+from typing import Annotated, Any, Dict, List, Optional
+
+
+# Open cursors kept per connection; the least recently used one is closed beyond this
+MAX_OPEN_CURSORS = 20
+
+
+class OpenCursor:
+    """A server-side cursor read in batches across tool calls."""
+
+    def __init__(self, cursor):
+        """Initialize an OpenCursor object.
+
+        Args:
+            cursor: The pymongo cursor or command cursor to read from
+        """
+        self.cursor = cursor
+        self.cursor_id = str(uuid.uuid4())
+        self.last_used = datetime.now()
+        self.lock = asyncio.Lock()
+        # Document read ahead of the last batch to tell whether the cursor is exhausted
+        self._lookahead: List[Dict[str, Any]] = []
+
+    def fetch(self, size: int) -> tuple[List[Dict[str, Any]], bool]:
+        """Read the next batch of up to size documents, blocking on the server.
+
+        Returns:
+            The documents and whether the cursor is exhausted
+        """
+        documents = self._lookahead + list(islice(self.cursor, size + 1 - len(self._lookahead)))
+        self._lookahead = documents[size:]
+        return documents[:size], not self._lookahead
+
+    def close(self) -> None:
+        """Close the server-side cursor."""
+        self.cursor.close()
+
+
+def _get_connection(connection_id: str) -> ConnectionInfo:
+    if connection_id not in DocumentDBConnection._connections:
+        raise ValueError(f'Connection ID {connection_id} not found. You must connect first.')
+    return DocumentDBConnection._connections[connection_id]
+
+
+async def _read_batch(
+    connection_info: ConnectionInfo, open_cursor: OpenCursor, size: int
+) -> Dict[str, Any]:
+    async with open_cursor.lock:
+        open_cursor.last_used = datetime.now()
+        documents, exhausted = await asyncio.to_thread(open_cursor.fetch, size)
+
+    # Convert ObjectId to string for JSON serialization
+    for doc in documents:
+        if '_id' in doc and not isinstance(doc['_id'], str):
+            doc['_id'] = str(doc['_id'])
+
+    if exhausted:
+        connection_info.cursors.pop(open_cursor.cursor_id, None)
+        open_cursor.close()
+
+    return {
+        'documents': documents,
+        'count': len(documents),
+        'cursor_id': None if exhausted else open_cursor.cursor_id,
+        'exhausted': exhausted,
+    }
+
+
+async def open_cursor(
+    connection_id: Annotated[
+        str, Field(description='The connection ID returned by the connect tool')
+    ],
+    database: Annotated[str, Field(description='Name of the database')],
+    collection: Annotated[str, Field(description='Name of the collection')],
+    operation_type: Annotated[
+        str, Field(description='Type of operation to open a cursor for (find, aggregate)')
+    ],
+    query: Annotated[
+        Optional[Dict[str, Any]], Field(description='Query filter for find operations')
+    ] = None,
+    projection: Annotated[
+        Optional[Dict[str, Any]],
+        Field(description='Fields to include/exclude for find operations'),
+    ] = None,
+    pipeline: Annotated[
+        Optional[List[Dict[str, Any]]],
+        Field(description='Pipeline for DocumentDB aggregation operations'),
+    ] = None,
+    batch_size: Annotated[
+        Optional[int],
+        Field(description='Number of documents to return per batch (default: 100)'),
+    ] = None,
+) -> Dict[str, Any]:
+    """Open a cursor on a DocumentDB collection and return its first batch of documents.
+
+    This tool runs a find query or an aggregation pipeline and streams the results in
+    batches instead of returning them all at once. When more documents are available,
+    the returned cursor_id can be passed to the getMore tool to read the next batch.
+
+    Returns:
+        Dict[str, Any]: First batch of documents and the cursor_id to continue from
+    """
+    try:
+        connection_info = _get_connection(connection_id)
+        coll = connection_info.client[database][collection]
+        batch_size = batch_size or serverConfig.batch_size
+
+        operation_type = operation_type.lower()
+        if operation_type == 'find':
+            cursor = coll.find(query or {}, projection).batch_size(batch_size)
+        elif operation_type == 'aggregate':
+            if not pipeline:
+                raise ValueError('Pipeline is required for aggregate operations')
+            cursor = await asyncio.to_thread(coll.aggregate, pipeline, batchSize=batch_size)
+        else:
+            raise ValueError('Operation type must be one of: find, aggregate')
+
+        opened = OpenCursor(cursor)
+        connection_info.cursors[opened.cursor_id] = opened
+        idle = [c for c in connection_info.cursors.values() if not c.lock.locked()]
+        if len(connection_info.cursors) > MAX_OPEN_CURSORS and idle:
+            oldest = min(idle, key=lambda c: c.last_used)
+            logger.info(f'Closing least recently used cursor {oldest.cursor_id}')
+            connection_info.cursors.pop(oldest.cursor_id).close()
+
+        result = await _read_batch(connection_info, opened, batch_size)
+        logger.info(f"Opened {operation_type} cursor on '{database}.{collection}'")
+        return result
+    except ValueError as e:
+        logger.error(f'Connection error or invalid parameters: {str(e)}')
+        raise ValueError(str(e))
+    except Exception as e:
+        logger.error(f'Error opening cursor: {str(e)}')
+        raise ValueError(f'Failed to open cursor: {str(e)}')
+
+
+async def get_more(
+    connection_id: Annotated[
+        str, Field(description='The connection ID returned by the connect tool')
+    ],
+    cursor_id: Annotated[str, Field(description='The cursor ID returned by openCursor')],
+    batch_size: Annotated[
+        Optional[int],
+        Field(description='Number of documents to return (default: 100)'),
+    ] = None,
+) -> Dict[str, Any]:
+    """Read the next batch of documents from a cursor opened with openCursor.
+
+    The cursor is closed once its last document has been returned.
+
+    Returns:
+        Dict[str, Any]: Next batch of documents and the cursor_id to continue from
+    """
+    try:
+        connection_info = _get_connection(connection_id)
+        if cursor_id not in connection_info.cursors:
+            raise ValueError(f'Cursor ID {cursor_id} not found. It may be exhausted or closed.')
+
+        return await _read_batch(
+            connection_info,
+            connection_info.cursors[cursor_id],
+            batch_size or serverConfig.batch_size,
+        )
+    except ValueError as e:
+        logger.error(f'Connection error or invalid parameters: {str(e)}')
+        raise ValueError(str(e))
+    except Exception as e:
+        logger.error(f'Error reading from cursor: {str(e)}')
+        raise ValueError(f'Failed to read from cursor: {str(e)}')
+
+
+async def close_cursor(
+    connection_id: Annotated[
+        str, Field(description='The connection ID returned by the connect tool')
+    ],
+    cursor_id: Annotated[str, Field(description='The cursor ID returned by openCursor')],
+) -> Dict[str, Any]:
+    """Close a cursor opened with openCursor before it is exhausted.
+
+    Returns:
+        Dict[str, Any]: Confirmation of successful closing
+    """
+    try:
+        connection_info = _get_connection(connection_id)
+        if cursor_id not in connection_info.cursors:
+            raise ValueError(f'Cursor ID {cursor_id} not found. It may be exhausted or closed.')
+
+        await asyncio.to_thread(connection_info.cursors.pop(cursor_id).close)
+        return {'success': True, 'message': f'Successfully closed cursor {cursor_id}'}
+    except ValueError as e:
+        logger.error(f'Connection error or invalid parameters: {str(e)}')
+        raise ValueError(str(e))
+    except Exception as e:
+        logger.error(f'Error closing cursor: {str(e)}')
+        raise ValueError(f'Failed to close cursor: {str(e)}')
@@ -14,6 +14,8 @@
 
 """Query tools for DocumentDB MCP Server."""
 
+import asyncio
+from awslabs.documentdb_mcp_server.config import serverConfig
 from awslabs.documentdb_mcp_server.connection_tools import DocumentDBConnection
 from loguru import logger
 from pydantic import Field
@@ -36,6 +38,10 @@ async def find(
     limit: Annotated[
         int, Field(description='Maximum number of documents to return (default: 10)')
     ] = 10,
+    batch_size: Annotated[
+        Optional[int],
+        Field(description='Number of documents fetched from the server per round trip'),
+    ] = None,
 ) -> List[Dict[str, Any]]:
     """Run a query against a DocumentDB collection.
 
@@ -55,7 +61,13 @@ async def find(
         db = client[database]
         coll = db[collection]
 
-        result = list(coll.find(query, projection).limit(limit))
+        batch_size = batch_size or serverConfig.batch_size
+        if limit > 0:
+            batch_size = min(batch_size, limit)
+        cursor = coll.find(query, projection).limit(limit).batch_size(batch_size)
+
+        # Iterate the cursor off the event loop so concurrent tool calls are not blocked
+        result = await asyncio.to_thread(list, cursor)
 
         # Convert ObjectId to string for JSON serialization
         for doc in result:
@@ -84,6 +96,10 @@ async def aggregate(
     limit: Annotated[
         int, Field(description='Maximum number of documents to return (default: 10)')
     ] = 10,
+    batch_size: Annotated[
+        Optional[int],
+        Field(description='Number of documents fetched from the server per round trip'),
+    ] = None,
 ) -> List[Dict[str, Any]]:
     """Run an aggregation pipeline against a DocumentDB collection.
 
@@ -107,7 +123,14 @@ async def aggregate(
         if limit > 0 and not any('$limit' in stage for stage in pipeline):
             pipeline.append({'$limit': limit})
 
-        result = list(coll.aggregate(pipeline))
+        batch_size = batch_size or serverConfig.batch_size
+        if limit > 0:
+            batch_size = min(batch_size, limit)
+
+        # Run the pipeline and iterate its cursor off the event loop
+        result = await asyncio.to_thread(
+            lambda: list(coll.aggregate(pipeline, batchSize=batch_size))
+        )
 
         # Convert ObjectId to string for JSON serialization
         for doc in result:
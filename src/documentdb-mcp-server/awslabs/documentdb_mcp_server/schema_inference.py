@@ -0,0 +1,167 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming schema inference for DocumentDB MCP Server."""
+
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+
+# Distinct example values kept per field
+MAX_EXAMPLES = 3
+# Example strings longer than this are truncated
+MAX_EXAMPLE_LENGTH = 100
+
+# Python type names reported for the BSON type names returned by the $type operator
+BSON_TYPE_NAMES = {
+    'double': 'float',
+    'string': 'str',
+    'object': 'object',
+    'array': 'array',
+    'binData': 'bytes',
+    'objectId': 'ObjectId',
+    'bool': 'bool',
+    'date': 'datetime',
+    'null': 'null',
+    'regex': 'Regex',
+    'int': 'int',
+    'long': 'int',
+    'timestamp': 'Timestamp',
+    'decimal': 'Decimal128',
+}
+
+
+def type_name(value: Any) -> str:
+    """Return the type name reported for a field value."""
+    if isinstance(value, dict):
+        return 'object'
+    if isinstance(value, list):
+        return 'array'
+    if value is None:
+        return 'null'
+    return type(value).__name__
+
+
+def _example(value: Any) -> Any:
+    if isinstance(value, (bool, int, float)):
+        return value
+    text = value if isinstance(value, str) else str(value)
+    return text if len(text) <= MAX_EXAMPLE_LENGTH else text[:MAX_EXAMPLE_LENGTH] + '...'
+
+
+class FieldStats:
+    """Statistics of one field path accumulated over the analyzed documents."""
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.count = 0
+        self.types: Counter = Counter()
+        self.examples: List[Any] = []
+        self.array_lengths: Optional[List[int]] = None
+
+    def add(self, value: Any) -> None:
+        """Add the value of the field in one document."""
+        self.count += 1
+        name = type_name(value)
+        self.types[name] += 1
+        if isinstance(value, list):
+            if self.array_lengths is None:
+                # Minimum, maximum and total length
+                self.array_lengths = [len(value), len(value), 0]
+            self.array_lengths[0] = min(self.array_lengths[0], len(value))
+            self.array_lengths[1] = max(self.array_lengths[1], len(value))
+            self.array_lengths[2] += len(value)
+        elif name != 'object' and value is not None and len(self.examples) < MAX_EXAMPLES:
+            example = _example(value)
+            if example not in self.examples:
+                self.examples.append(example)
+
+    @property
+    def data_type(self) -> Union[str, List[str]]:
+        """Return the type of the field, a list of types if mixed, or 'null' if always null."""
+        types = [name for name in self.types if name != 'null']
+        if not types:
+            return 'null'
+        return types[0] if len(types) == 1 else types
+
+    def summary(self, document_count: int) -> Dict[str, Any]:
+        """Return the statistics as a JSON-serializable dictionary."""
+        result: Dict[str, Any] = {
+            'count': self.count,
+            'percentage': round((self.count / document_count) * 100, 2),
+            'data_type': self.data_type,
+            'types': dict(self.types),
+        }
+        if self.examples:
+            result['examples'] = self.examples
+        if self.array_lengths is not None:
+            minimum, maximum, total = self.array_lengths
+            result['array_length'] = {
+                'min': minimum,
+                'max': maximum,
+                'avg': round(total / self.types['array'], 2),
+            }
+        return result
+
+
+class SchemaAccumulator:
+    """Infers the schema of a collection from a stream of documents in a single pass.
+
+    Each document is walked once and every field path it contains updates the presence
+    count, type histogram, example values and, for arrays, length statistics of that
+    path. Nested fields are reported as ``parent.child`` and, like the rest of the
+    server, only the first element of an array is descended into, as ``field[0]``. The
+    ``_id`` field is skipped.
+    """
+
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.document_count = 0
+        self.fields: Dict[str, FieldStats] = {}
+
+    def add(self, document: Dict[str, Any]) -> None:
+        """Add one document."""
+        self.document_count += 1
+        self._walk(document, '')
+
+    def add_all(self, documents: Iterable[Dict[str, Any]]) -> None:
+        """Add every document of an iterable, e.g. a cursor, without materializing it."""
+        for document in documents:
+            self.add(document)
+
+    def add_type_counts(self, path: str, bson_type: str, count: int) -> None:
+        """Add count occurrences of a field with a BSON type computed by the server."""
+        stats = self.fields.get(path)
+        if stats is None:
+            stats = self.fields[path] = FieldStats()
+        stats.count += count
+        stats.types[BSON_TYPE_NAMES.get(bson_type, bson_type)] += count
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Return the statistics of every field path, keyed by path."""
+        return {path: stats.summary(self.document_count) for path, stats in self.fields.items()}
+
+    def _walk(self, value: Any, prefix: str) -> None:
+        if isinstance(value, dict):
+            for key, child in value.items():
+                if key == '_id':
+                    continue
+                path = f'{prefix}.{key}' if prefix else key
+                stats = self.fields.get(path)
+                if stats is None:
+                    stats = self.fields[path] = FieldStats()
+                stats.add(child)
+                self._walk(child, path)
+        elif isinstance(value, list) and value:
+            self._walk(value[0], f'{prefix}[0]')
@@ -28,6 +28,7 @@ from awslabs.documentdb_mcp_server.connection_tools import (
     connect,
     disconnect,
 )
+from awslabs.documentdb_mcp_server.cursor_tools import close_cursor, get_more, open_cursor
 from awslabs.documentdb_mcp_server.db_management_tools import (
     create_collection,
     drop_collection,
@@ -35,7 +36,7 @@ from awslabs.documentdb_mcp_server.db_management_tools import (
     list_databases,
 )
 from awslabs.documentdb_mcp_server.query_tools import aggregate, find
-from awslabs.documentdb_mcp_server.write_tools import delete, insert, update
+from awslabs.documentdb_mcp_server.write_tools import bulk_write, delete, insert, update
 from loguru import logger
 from mcp.server.fastmcp import FastMCP
 
@@ -71,10 +72,16 @@ mcp.tool(name='disconnect')(disconnect)
 mcp.tool(name='find')(find)
 mcp.tool(name='aggregate')(aggregate)
 
+# Cursor tools
+mcp.tool(name='openCursor')(open_cursor)
+mcp.tool(name='getMore')(get_more)
+mcp.tool(name='closeCursor')(close_cursor)
+
 # Write tools
 mcp.tool(name='insert')(insert)
 mcp.tool(name='update')(update)
 mcp.tool(name='delete')(delete)
+mcp.tool(name='bulkWrite')(bulk_write)
 
 # Database management tools
 mcp.tool(name='listDatabases')(list_databases)
@@ -108,6 +115,24 @@ def main():
         default=30,
         help='Idle connection timeout in minutes (default: 30)',
     )
+    parser.add_argument(
+        '--max-pool-size',
+        type=int,
+        default=100,
+        help='Maximum number of pooled connections per DocumentDB connection (default: 100)',
+    )
+    parser.add_argument(
+        '--min-pool-size',
+        type=int,
+        default=0,
+        help='Minimum number of pooled connections per DocumentDB connection (default: 0)',
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=100,
+        help='Default number of documents fetched per cursor batch (default: 100)',
+    )
     parser.add_argument(
         '--allow-write',
         action='store_true',
@@ -131,6 +156,14 @@ def main():
     DocumentDBConnection._idle_timeout = args.connection_timeout
     logger.info(f'Idle connection timeout: {args.connection_timeout} minutes')
 
+    # Configure connection pools and cursor batches
+    serverConfig.max_pool_size = args.max_pool_size
+    serverConfig.min_pool_size = args.min_pool_size
+    serverConfig.batch_size = args.batch_size
+    logger.info(
+        f'Connection pool size: {args.min_pool_size}-{args.max_pool_size}, batch size: {args.batch_size}'
+    )
+
     # Configure read-only mode
     serverConfig.read_only_mode = not args.allow_write
     if serverConfig.read_only_mode:
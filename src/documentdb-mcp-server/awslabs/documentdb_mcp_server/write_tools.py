@@ -14,10 +14,13 @@
 
 """Write tools for DocumentDB MCP Server."""
 
+import asyncio
 from awslabs.documentdb_mcp_server.config import serverConfig
 from awslabs.documentdb_mcp_server.connection_tools import DocumentDBConnection
 from loguru import logger
 from pydantic import Field
+from pymongo import DeleteMany, DeleteOne, InsertOne, ReplaceOne, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError
 from typing import Annotated, Any, Dict, List, Union
 
 
@@ -57,11 +60,11 @@ async def insert(
 
         # Handle single document or multiple documents
         if isinstance(documents, dict):
-            result = coll.insert_one(documents)
+            result = await asyncio.to_thread(coll.insert_one, documents)
             inserted_ids = [str(result.inserted_id)]
             count = 1
         else:
-            result = coll.insert_many(documents)
+            result = await asyncio.to_thread(coll.insert_many, documents)
             inserted_ids = [str(id) for id in result.inserted_ids]
             count = len(inserted_ids)
 
@@ -123,17 +126,17 @@ async def update(
 
         # If the update doesn't have any operators, then it's a replace
         if not any(key.startswith('$') for key in update.keys()):
-            result = coll.replace_one(filter, update, upsert=upsert)
+            result = await asyncio.to_thread(coll.replace_one, filter, update, upsert=upsert)
             matched = result.matched_count
             modified = result.modified_count
         # If the update needs to update multiple documents
         elif many:
-            result = coll.update_many(filter, update, upsert=upsert)
+            result = await asyncio.to_thread(coll.update_many, filter, update, upsert=upsert)
             matched = result.matched_count
             modified = result.modified_count
         # Else only a single document needs to be updated
         else:
-            result = coll.update_one(filter, update, upsert=upsert)
+            result = await asyncio.to_thread(coll.update_one, filter, update, upsert=upsert)
             matched = result.matched_count
             modified = result.modified_count
 
@@ -189,10 +192,10 @@ async def delete(
         coll = db[collection]
 
         if many:
-            result = coll.delete_many(filter)
+            result = await asyncio.to_thread(coll.delete_many, filter)
             deleted = result.deleted_count
         else:
-            result = coll.delete_one(filter)
+            result = await asyncio.to_thread(coll.delete_one, filter)
             deleted = result.deleted_count
 
         logger.info(f'Deleted {deleted} documents')
@@ -203,3 +206,134 @@ async def delete(
     except Exception as e:
         logger.error(f'Error deleting from DocumentDB: {str(e)}')
         raise ValueError(f'Failed to delete documents: {str(e)}')
+
+
+# Bulk write operation names mapped to their pymongo request class and argument names
+BULK_OPERATIONS = {
+    'insertOne': (InsertOne, ['document']),
+    'updateOne': (UpdateOne, ['filter', 'update', 'upsert']),
+    'updateMany': (UpdateMany, ['filter', 'update', 'upsert']),
+    'replaceOne': (ReplaceOne, ['filter', 'replacement', 'upsert']),
+    'deleteOne': (DeleteOne, ['filter']),
+    'deleteMany': (DeleteMany, ['filter']),
+}
+
+
+def build_bulk_requests(operations: List[Dict[str, Any]]) -> List[Any]:
+    """Convert bulk write operations in MongoDB shell syntax to pymongo requests.
+
+    Args:
+        operations: Operations such as {"insertOne": {"document": {...}}}
+
+    Returns:
+        List of pymongo write requests
+
+    Raises:
+        ValueError: If an operation is not a single known operation with its arguments
+    """
+    requests = []
+    for index, operation in enumerate(operations):
+        if len(operation) != 1 or next(iter(operation)) not in BULK_OPERATIONS:
+            raise ValueError(
+                f'Operation {index} must have exactly one of: {", ".join(BULK_OPERATIONS)}'
+            )
+        name, arguments = next(iter(operation.items()))
+        request_class, argument_names = BULK_OPERATIONS[name]
+        unknown = set(arguments) - set(argument_names)
+        if unknown:
+            raise ValueError(
+                f'Operation {index} ({name}) has unknown arguments: {sorted(unknown)}'
+            )
+        try:
+            requests.append(request_class(**arguments))
+        except TypeError as e:
+            raise ValueError(f'Operation {index} ({name}) is invalid: {str(e)}')
+    return requests
+
+
+async def bulk_write(
+    connection_id: Annotated[
+        str, Field(description='The connection ID returned by the connect tool')
+    ],
+    database: Annotated[str, Field(description='Name of the database')],
+    collection: Annotated[str, Field(description='Name of the collection')],
+    operations: Annotated[
+        List[Dict[str, Any]],
+        Field(
+            description='Write operations, each one of {"insertOne": {"document": ...}}, {"updateOne" or "updateMany": {"filter": ..., "update": ..., "upsert": false}}, {"replaceOne": {"filter": ..., "replacement": ..., "upsert": false}}, {"deleteOne" or "deleteMany": {"filter": ...}}'
+        ),
+    ],
+    ordered: Annotated[
+        bool,
+        Field(
+            description='Whether to stop at the first failed operation (default: True). Unordered writes continue past failures and may be applied in any order.'
+        ),
+    ] = True,
+) -> Dict[str, Any]:
+    """Run a batch of insert, update, replace and delete operations on a DocumentDB collection.
+
+    This tool sends the operations in as few round trips as possible instead of one
+    call per document.
+
+    Returns:
+        Dict[str, Any]: Bulk write results, including per-operation errors if any failed
+    """
+    # Check if server is in read-only mode
+    if serverConfig.read_only_mode:
+        logger.warning('Bulk write operation denied: Server is in read-only mode')
+        raise ValueError('Operation not permitted: Server is configured in read-only mode')
+
+    try:
+        # Get connection
+        if connection_id not in DocumentDBConnection._connections:
+            raise ValueError(f'Connection ID {connection_id} not found. You must connect first.')
+
+        connection_info = DocumentDBConnection._connections[connection_id]
+        client = connection_info.client
+
+        db = client[database]
+        coll = db[collection]
+
+        requests = build_bulk_requests(operations)
+        if not requests:
+            raise ValueError('At least one operation is required')
+
+        try:
+            result = await asyncio.to_thread(coll.bulk_write, requests, ordered=ordered)
+        except BulkWriteError as e:
+            # Operations before the failure (ordered) or all others (unordered) were applied
+            details = e.details
+            logger.warning(f'Bulk write completed with {len(details["writeErrors"])} errors')
+            return {
+                'success': False,
+                'inserted_count': details.get('nInserted', 0),
+                'matched_count': details.get('nMatched', 0),
+                'modified_count': details.get('nModified', 0),
+                'deleted_count': details.get('nRemoved', 0),
+                'upserted_count': details.get('nUpserted', 0),
+                'write_errors': [
+                    {
+                        'index': error['index'],
+                        'code': error.get('code'),
+                        'message': error['errmsg'],
+                    }
+                    for error in details['writeErrors']
+                ],
+            }
+
+        logger.info(f'Bulk write of {len(requests)} operations completed')
+        return {
+            'success': True,
+            'inserted_count': result.inserted_count,
+            'matched_count': result.matched_count,
+            'modified_count': result.modified_count,
+            'deleted_count': result.deleted_count,
+            'upserted_count': result.upserted_count,
+            'upserted_ids': {str(index): str(id) for index, id in result.upserted_ids.items()},
+        }
+    except ValueError as e:
+        logger.error(f'Connection error or invalid operations: {str(e)}')
+        raise ValueError(str(e))
+    except Exception as e:
+        logger.error(f'Error running bulk write on DocumentDB: {str(e)}')
+        raise ValueError(f'Failed to run bulk write: {str(e)}')
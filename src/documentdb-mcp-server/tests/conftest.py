@@ -396,6 +396,47 @@ class MockCollection:
         result.deleted_count = deleted_count
         return result
 
+    def bulk_write(self, requests, ordered=True):
+        """Mock bulk_write operation applying each request with the single-document mocks.
+
+        Args:
+            requests: pymongo InsertOne, UpdateOne, UpdateMany, ReplaceOne, DeleteOne and
+                DeleteMany requests
+            ordered: Whether requests are applied in order
+
+        Returns:
+            MagicMock: A mock BulkWriteResult
+        """
+        result = MagicMock()
+        result.inserted_count = 0
+        result.matched_count = 0
+        result.modified_count = 0
+        result.deleted_count = 0
+        result.upserted_count = 0
+        result.upserted_ids = {}
+        for index, request in enumerate(requests):
+            name = type(request).__name__
+            if name == 'InsertOne':
+                self.insert_one(request._doc)
+                result.inserted_count += 1
+                continue
+            if name in ('DeleteOne', 'DeleteMany'):
+                method = self.delete_one if name == 'DeleteOne' else self.delete_many
+                result.deleted_count += method(request._filter).deleted_count
+                continue
+            method = {
+                'UpdateOne': self.update_one,
+                'UpdateMany': self.update_many,
+                'ReplaceOne': self.replace_one,
+            }[name]
+            single = method(request._filter, request._doc, upsert=request._upsert)
+            result.matched_count += single.matched_count
+            result.modified_count += single.modified_count
+            if single.upserted_id:
+                result.upserted_count += 1
+                result.upserted_ids[index] = single.upserted_id
+        return result
+
     def replace_one(self, filter, replacement, upsert=False):
         """Mock replace_one operation that applies filters.
 
@@ -449,12 +490,13 @@ class MockCollection:
         result.upserted_id = upserted_id
         return result
 
-    def aggregate(self, pipeline, explain=False):
+    def aggregate(self, pipeline, explain=False, **kwargs):
         """Mock aggregate operation with pipeline processing.
 
         Args:
             pipeline: Aggregation pipeline
             explain: Whether to explain the operation
+            **kwargs: Additional aggregate options such as batchSize
 
         Returns:
             MockCursor or dict: A cursor for the aggregation results or explanation
@@ -941,6 +983,22 @@ class MockCursor:
         self._position += 1
         return doc
 
+    def batch_size(self, batch_size):
+        """Set the number of documents fetched per batch, which the mock ignores.
+
+        Args:
+            batch_size: Number of documents per batch
+
+        Returns:
+            MockCursor: Self
+        """
+        self._batch_size = batch_size
+        return self
+
+    def close(self):
+        """Close the cursor."""
+        self.closed = True
+
     def limit(self, limit_value):
         """Set limit on the cursor.
 
@@ -21,10 +21,11 @@ from awslabs.documentdb_mcp_server.analytic_tools import (
     explain_operation,
     get_collection_stats,
     get_database_stats,
-    get_field_type,
+    server_side_type_pipeline,
 )
 from awslabs.documentdb_mcp_server.connection_tools import DocumentDBConnection
 from bson import ObjectId
+from conftest import MockCollection, MockCursor
 
 
 class TestCountDocumentsTool:
@@ -328,6 +329,106 @@ class TestAnalyzeSchemaTool:
         with pytest.raises(ValueError, match='Failed to analyze collection schema: Generic error'):
             await analyze_schema(connection_id, 'test_db', 'test_collection', 100)
 
+    @pytest.mark.asyncio
+    async def test_analyze_schema_reports_types_examples_and_array_lengths(
+        self, mock_ctx, patch_client
+    ):
+        """Test that schema analysis reports type histograms, examples and array lengths."""
+        # Arrange
+        mock_client = patch_client()
+        connection_info = DocumentDBConnection.create_connection(
+            'mongodb://example.com:27017/?retryWrites=false'
+        )
+        connection_id = connection_info.connection_id
+
+        documents = [
+            {'_id': ObjectId(), 'value': 10, 'tags': ['a', 'b'], 'meta': {'owner': 'x'}},
+            {'_id': ObjectId(), 'value': 'ten', 'tags': []},
+            {'_id': ObjectId(), 'value': None, 'tags': ['c', 'd', 'e', 'f']},
+        ]
+        for doc in documents:
+            mock_client['test_db']['test_collection'].insert_one(doc)
+
+        # Act
+        result = await analyze_schema(connection_id, 'test_db', 'test_collection', 100)
+
+        # Assert
+        coverage = result['field_coverage']
+        assert coverage['value']['types'] == {'int': 1, 'str': 1, 'null': 1}
+        assert sorted(coverage['value']['data_type']) == ['int', 'str']
+        assert coverage['value']['examples'] == [10, 'ten']
+        assert coverage['tags']['array_length'] == {'min': 0, 'max': 4, 'avg': 2.0}
+        assert coverage['meta.owner']['percentage'] == 33.33
+
+    @pytest.mark.asyncio
+    async def test_analyze_schema_reads_whole_collection_without_sample(
+        self, mock_ctx, patch_client, monkeypatch
+    ):
+        """Test that $sample is only used when sampling part of the collection."""
+        # Arrange
+        mock_client = patch_client()
+        connection_info = DocumentDBConnection.create_connection(
+            'mongodb://example.com:27017/?retryWrites=false'
+        )
+        connection_id = connection_info.connection_id
+        for i in range(5):
+            mock_client['test_db']['test_collection'].insert_one({'value': i})
+
+        pipelines = []
+        original_aggregate = MockCollection.aggregate
+
+        def recording_aggregate(self, pipeline, explain=False):
+            pipelines.append(pipeline)
+            return original_aggregate(self, pipeline, explain)
+
+        monkeypatch.setattr('conftest.MockCollection.aggregate', recording_aggregate)
+
+        # Act
+        await analyze_schema(connection_id, 'test_db', 'test_collection', 100)
+        await analyze_schema(connection_id, 'test_db', 'test_collection', 2)
+
+        # Assert
+        assert pipelines == [[], [{'$sample': {'size': 2}}]]
+
+    @pytest.mark.asyncio
+    async def test_analyze_schema_server_side_types(self, mock_ctx, patch_client, monkeypatch):
+        """Test that server-side analysis uses the type counts computed by the pipeline."""
+        # Arrange
+        mock_client = patch_client()
+        connection_info = DocumentDBConnection.create_connection(
+            'mongodb://example.com:27017/?retryWrites=false'
+        )
+        connection_id = connection_info.connection_id
+        for i in range(4):
+            mock_client['test_db']['test_collection'].insert_one({'value': i})
+
+        pipelines = []
+
+        def grouped_aggregate(self, pipeline, explain=False):
+            pipelines.append(pipeline)
+            return MockCursor(
+                [
+                    {'_id': {'path': 'value', 'type': 'int'}, 'count': 3},
+                    {'_id': {'path': 'value', 'type': 'string'}, 'count': 1},
+                    {'_id': {'path': 'name', 'type': 'string'}, 'count': 2},
+                ]
+            )
+
+        monkeypatch.setattr('conftest.MockCollection.aggregate', grouped_aggregate)
+
+        # Act
+        result = await analyze_schema(
+            connection_id, 'test_db', 'test_collection', 100, server_side_types=True
+        )
+
+        # Assert
+        assert pipelines == [server_side_type_pipeline()]
+        coverage = result['field_coverage']
+        assert coverage['value']['count'] == 4
+        assert coverage['value']['types'] == {'int': 3, 'str': 1}
+        assert coverage['name']['data_type'] == 'str'
+        assert coverage['name']['percentage'] == 50.0
+
 
 class TestExplainOperationTool:
     """Tests for the explainOperation tool."""
@@ -460,59 +561,3 @@ class TestExplainOperationTool:
             await explain_operation(
                 str(uuid.uuid4()), 'test_db', 'test_collection', 'find', {}, None, 'queryPlanner'
             )
-
-
-class TestHelperFunctions:
-    """Tests for helper functions used by the tools."""
-
-    def test_get_field_type_number(self):
-        """Test get_field_type for numeric values."""
-        docs = [{'value': 10}, {'value': 20}]
-
-        field_type = get_field_type(docs, 'value')
-        assert field_type == 'int'
-
-    def test_get_field_type_string(self):
-        """Test get_field_type for string values."""
-        docs = [{'name': 'Document 1'}, {'name': 'Document 2'}]
-
-        field_type = get_field_type(docs, 'name')
-        assert field_type == 'str'
-
-    def test_get_field_type_boolean(self):
-        """Test get_field_type for boolean values."""
-        docs = [{'active': True}, {'active': False}]
-
-        field_type = get_field_type(docs, 'active')
-        assert field_type == 'bool'
-
-    def test_get_field_type_list(self):
-        """Test get_field_type for list values."""
-        docs = [{'tags': ['a', 'b']}, {'tags': ['c']}]
-
-        field_type = get_field_type(docs, 'tags')
-        assert field_type == 'array'
-
-    def test_get_field_type_nested_object(self):
-        """Test get_field_type for nested objects."""
-        docs = [{'metadata': {'created': '2023-01-01'}}, {'metadata': {'created': '2023-01-02'}}]
-
-        field_type = get_field_type(docs, 'metadata')
-        assert field_type == 'object'
-
-    def test_get_field_type_mixed_types(self):
-        """Test get_field_type for fields with mixed types."""
-        docs = [{'value': 10}, {'value': 'string'}]
-
-        field_type = get_field_type(docs, 'value')
-        # Should return a list of types
-        assert isinstance(field_type, list)
-        assert 'int' in field_type
-        assert 'str' in field_type
-
-    def test_get_field_type_missing_field(self):
-        """Test get_field_type for missing fields."""
-        docs = [{'name': 'Document 1'}, {'name': 'Document 2'}]
-
-        field_type = get_field_type(docs, 'non_existent_field')
-        assert field_type == 'null'
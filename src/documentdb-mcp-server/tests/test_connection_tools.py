@@ -15,6 +15,7 @@
 
 import pytest
 import uuid
+from awslabs.documentdb_mcp_server.config import serverConfig
 from awslabs.documentdb_mcp_server.connection_tools import (
     DocumentDBConnection,
     connect,
@@ -56,6 +57,28 @@ class TestDocumentDBConnection:
                 'mongodb://example.com:27017/?retryWrites=false'
             )
 
+    def test_create_connection_pool_size(self, patch_client, monkeypatch):
+        """Test that the configured pool sizes are passed to the client."""
+        # Arrange
+        mock_client = patch_client()
+        client_kwargs = {}
+
+        def mock_mongo_client(*args, **kwargs):
+            client_kwargs.update(kwargs)
+            return mock_client
+
+        monkeypatch.setattr(
+            'awslabs.documentdb_mcp_server.connection_tools.MongoClient', mock_mongo_client
+        )
+        monkeypatch.setattr(serverConfig, 'max_pool_size', 25)
+        monkeypatch.setattr(serverConfig, 'min_pool_size', 5)
+
+        # Act
+        DocumentDBConnection.create_connection('mongodb://example.com:27017/?retryWrites=false')
+
+        # Assert
+        assert client_kwargs == {'maxPoolSize': 25, 'minPoolSize': 5}
+
     def test_get_connection(self, patch_client):
         """Test getting an existing connection."""
         # Arrange
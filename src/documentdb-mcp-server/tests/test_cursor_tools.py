@@ -0,0 +1,130 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for DocumentDB MCP Server cursor tools (openCursor, getMore, closeCursor)."""
+
+import pytest
+from awslabs.documentdb_mcp_server import cursor_tools
+from awslabs.documentdb_mcp_server.connection_tools import DocumentDBConnection
+from awslabs.documentdb_mcp_server.cursor_tools import close_cursor, get_more, open_cursor
+from bson import ObjectId
+
+
+@pytest.fixture
+def connection_id(patch_client):
+    """Connection to a mock collection with 7 documents."""
+    mock_client = patch_client()
+    for i in range(7):
+        mock_client['test_db']['test_collection'].insert_one({'_id': ObjectId(), 'value': i})
+    return DocumentDBConnection.create_connection(
+        'mongodb://example.com:27017/?retryWrites=false'
+    ).connection_id
+
+
+class TestCursorTools:
+    """Tests for streaming results with cursors."""
+
+    @pytest.mark.asyncio
+    async def test_find_cursor_is_read_in_batches(self, connection_id):
+        """Test that a find cursor returns batches until it is exhausted and closed."""
+        # Act
+        first = await open_cursor(
+            connection_id, 'test_db', 'test_collection', 'find', {}, None, None, 3
+        )
+        second = await get_more(connection_id, first['cursor_id'], 3)
+        third = await get_more(connection_id, first['cursor_id'], 3)
+
+        # Assert
+        assert [doc['value'] for doc in first['documents']] == [0, 1, 2]
+        assert isinstance(first['documents'][0]['_id'], str)
+        assert first['exhausted'] is False
+        assert [doc['value'] for doc in second['documents']] == [3, 4, 5]
+        assert [doc['value'] for doc in third['documents']] == [6]
+        assert third['exhausted'] is True
+        assert third['cursor_id'] is None
+        assert DocumentDBConnection._connections[connection_id].cursors == {}
+
+    @pytest.mark.asyncio
+    async def test_cursor_exhausted_at_batch_boundary(self, connection_id):
+        """Test that a cursor whose last batch is full is reported as exhausted."""
+        result = await open_cursor(
+            connection_id, 'test_db', 'test_collection', 'find', {}, None, None, 7
+        )
+
+        assert result['count'] == 7
+        assert result['exhausted'] is True
+
+    @pytest.mark.asyncio
+    async def test_aggregate_cursor(self, connection_id):
+        """Test opening a cursor on an aggregation pipeline."""
+        result = await open_cursor(
+            connection_id,
+            'test_db',
+            'test_collection',
+            'aggregate',
+            None,
+            None,
+            [{'$match': {'value': {'$gte': 4}}}],
+            2,
+        )
+
+        assert [doc['value'] for doc in result['documents']] == [4, 5]
+        more = await get_more(connection_id, result['cursor_id'], 10)
+        assert [doc['value'] for doc in more['documents']] == [6]
+
+    @pytest.mark.asyncio
+    async def test_aggregate_cursor_requires_pipeline(self, connection_id):
+        """Test that aggregate cursors require a pipeline."""
+        with pytest.raises(ValueError, match='Pipeline is required'):
+            await open_cursor(connection_id, 'test_db', 'test_collection', 'aggregate')
+
+    @pytest.mark.asyncio
+    async def test_close_cursor(self, connection_id):
+        """Test that a closed cursor can no longer be read."""
+        result = await open_cursor(
+            connection_id, 'test_db', 'test_collection', 'find', {}, None, None, 2
+        )
+        opened = DocumentDBConnection._connections[connection_id].cursors[result['cursor_id']]
+
+        await close_cursor(connection_id, result['cursor_id'])
+
+        assert opened.cursor.closed is True
+        with pytest.raises(ValueError, match='Cursor ID .* not found'):
+            await get_more(connection_id, result['cursor_id'])
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_cursor_is_closed(self, connection_id, monkeypatch):
+        """Test that the number of open cursors per connection is bounded."""
+        monkeypatch.setattr(cursor_tools, 'MAX_OPEN_CURSORS', 2)
+
+        cursor_ids = []
+        for _ in range(3):
+            result = await open_cursor(
+                connection_id, 'test_db', 'test_collection', 'find', {}, None, None, 1
+            )
+            cursor_ids.append(result['cursor_id'])
+
+        cursors = DocumentDBConnection._connections[connection_id].cursors
+        assert list(cursors) == cursor_ids[1:]
+
+    @pytest.mark.asyncio
+    async def test_disconnect_closes_cursors(self, connection_id):
+        """Test that closing a connection closes its open cursors."""
+        result = await open_cursor(
+            connection_id, 'test_db', 'test_collection', 'find', {}, None, None, 2
+        )
+        opened = DocumentDBConnection._connections[connection_id].cursors[result['cursor_id']]
+
+        DocumentDBConnection.close_connection(connection_id)
+
+        assert opened.cursor.closed is True
@@ -0,0 +1,87 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the streaming schema inference of DocumentDB MCP Server."""
+
+from awslabs.documentdb_mcp_server.schema_inference import (
+    MAX_EXAMPLE_LENGTH,
+    MAX_EXAMPLES,
+    SchemaAccumulator,
+)
+from bson import ObjectId
+
+
+class TestSchemaAccumulator:
+    """Tests for the SchemaAccumulator class."""
+
+    def test_nested_paths_and_first_array_element(self):
+        """Test that nested objects and the first element of arrays are walked."""
+        schema = SchemaAccumulator()
+        schema.add(
+            {
+                '_id': ObjectId(),
+                'address': {'city': 'Seattle', '_id': 1},
+                'orders': [{'sku': 'a'}, {'price': 3}],
+            }
+        )
+
+        summary = schema.summary()
+        assert set(summary) == {'address', 'address.city', 'orders', 'orders[0].sku'}
+        assert summary['address']['data_type'] == 'object'
+        assert summary['orders']['array_length'] == {'min': 2, 'max': 2, 'avg': 2.0}
+
+    def test_streams_documents_once(self):
+        """Test that documents are consumed from an iterator in a single pass."""
+        consumed = []
+
+        def documents():
+            for i in range(1000):
+                consumed.append(i)
+                yield {'value': i, 'even': i % 2 == 0} if i % 4 else {'value': str(i)}
+
+        schema = SchemaAccumulator()
+        schema.add_all(documents())
+
+        summary = schema.summary()
+        assert len(consumed) == 1000
+        assert schema.document_count == 1000
+        assert summary['value']['types'] == {'str': 250, 'int': 750}
+        assert summary['even']['percentage'] == 75.0
+        assert summary['even']['examples'] == [False, True]
+
+    def test_examples_are_limited_and_truncated(self):
+        """Test that only a few distinct, truncated example values are kept."""
+        schema = SchemaAccumulator()
+        for i in range(10):
+            schema.add({'text': 'x' * (MAX_EXAMPLE_LENGTH + 1 + i), 'id': ObjectId()})
+
+        examples = schema.summary()['text']['examples']
+        assert len(examples) == 1
+        assert examples[0] == 'x' * MAX_EXAMPLE_LENGTH + '...'
+        assert len(schema.summary()['id']['examples']) == MAX_EXAMPLES
+
+    def test_server_side_type_counts(self):
+        """Test that BSON type names from the server are reported as Python type names."""
+        schema = SchemaAccumulator()
+        schema.document_count = 10
+        schema.add_type_counts('value', 'long', 6)
+        schema.add_type_counts('value', 'int', 2)
+        schema.add_type_counts('value', 'null', 2)
+
+        summary = schema.summary()['value']
+        assert summary == {
+            'count': 10,
+            'percentage': 100.0,
+            'data_type': 'int',
+            'types': {'int': 8, 'null': 2},
+        }
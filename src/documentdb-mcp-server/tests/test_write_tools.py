@@ -11,12 +11,19 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Tests for DocumentDB MCP Server write tools (insert, update, delete)."""
+"""Tests for DocumentDB MCP Server write tools (insert, update, delete, bulk write)."""
 
 import pytest
 import uuid
 from awslabs.documentdb_mcp_server.connection_tools import DocumentDBConnection
-from awslabs.documentdb_mcp_server.write_tools import delete, insert, serverConfig, update
+from awslabs.documentdb_mcp_server.write_tools import (
+    bulk_write,
+    delete,
+    insert,
+    serverConfig,
+    update,
+)
+from pymongo.errors import BulkWriteError
 
 
 class TestInsertTool:
@@ -467,3 +474,129 @@ class TestDeleteTool:
         # Act/Assert
         with pytest.raises(ValueError, match='Failed to delete documents: Generic error'):
             await delete(connection_id, 'test_db', 'test_collection', filter_doc)
+
+
+class TestBulkWriteTool:
+    """Tests for the bulkWrite tool."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_read_only_mode(self, mock_ctx, patch_client, monkeypatch):
+        """Test bulk write in read-only mode."""
+        # Arrange
+        monkeypatch.setattr(serverConfig, 'read_only_mode', True)
+
+        mock_client = patch_client()  # noqa: F841
+        connection_info = DocumentDBConnection.create_connection(
+            'mongodb://example.com:27017/?retryWrites=false'
+        )
+
+        # Act/Assert
+        with pytest.raises(
+            ValueError, match='Operation not permitted: Server is configured in read-only mode'
+        ):
+            await bulk_write(
+                connection_info.connection_id,
+                'test_db',
+                'test_collection',
+                [{'insertOne': {'document': {'value': 1}}}],
+            )
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_success(self, mock_ctx, patch_client, monkeypatch):
+        """Test a bulk write mixing inserts, updates and deletes."""
+        # Arrange
+        monkeypatch.setattr(serverConfig, 'read_only_mode', False)
+
+        mock_client = patch_client()
+        connection_info = DocumentDBConnection.create_connection(
+            'mongodb://example.com:27017/?retryWrites=false'
+        )
+        collection = mock_client['test_db']['test_collection']
+        collection.insert_one({'name': 'old', 'value': 0})
+
+        # Act
+        result = await bulk_write(
+            connection_info.connection_id,
+            'test_db',
+            'test_collection',
+            [
+                {'insertOne': {'document': {'name': 'a', 'value': 1}}},
+                {'insertOne': {'document': {'name': 'b', 'value': 2}}},
+                {'updateOne': {'filter': {'name': 'a'}, 'update': {'$set': {'value': 10}}}},
+                {'deleteOne': {'filter': {'name': 'old'}}},
+            ],
+            ordered=False,
+        )
+
+        # Assert
+        assert result['success'] is True
+        assert result['inserted_count'] == 2
+        assert result['matched_count'] == 1
+        assert result['modified_count'] == 1
+        assert result['deleted_count'] == 1
+        assert sorted(doc['value'] for doc in collection._data) == [2, 10]
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_invalid_operation(self, mock_ctx, patch_client, monkeypatch):
+        """Test that unknown operations and arguments are rejected before writing."""
+        # Arrange
+        monkeypatch.setattr(serverConfig, 'read_only_mode', False)
+
+        mock_client = patch_client()
+        connection_info = DocumentDBConnection.create_connection(
+            'mongodb://example.com:27017/?retryWrites=false'
+        )
+
+        # Act/Assert
+        with pytest.raises(ValueError, match='Operation 1 must have exactly one of'):
+            await bulk_write(
+                connection_info.connection_id,
+                'test_db',
+                'test_collection',
+                [{'insertOne': {'document': {'value': 1}}}, {'upsertOne': {}}],
+            )
+        with pytest.raises(ValueError, match=r'Operation 0 \(deleteOne\) has unknown arguments'):
+            await bulk_write(
+                connection_info.connection_id,
+                'test_db',
+                'test_collection',
+                [{'deleteOne': {'filter': {}, 'upsert': True}}],
+            )
+        assert mock_client['test_db']['test_collection']._data == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_reports_write_errors(self, mock_ctx, patch_client, monkeypatch):
+        """Test that partial failures are reported with the counts of applied operations."""
+        # Arrange
+        monkeypatch.setattr(serverConfig, 'read_only_mode', False)
+
+        mock_client = patch_client()  # noqa: F841
+        connection_info = DocumentDBConnection.create_connection(
+            'mongodb://example.com:27017/?retryWrites=false'
+        )
+
+        def failing_bulk_write(self, requests, ordered=True):
+            raise BulkWriteError(
+                {
+                    'nInserted': 1,
+                    'writeErrors': [{'index': 1, 'code': 11000, 'errmsg': 'duplicate key'}],
+                }
+            )
+
+        monkeypatch.setattr('conftest.MockCollection.bulk_write', failing_bulk_write)
+
+        # Act
+        result = await bulk_write(
+            connection_info.connection_id,
+            'test_db',
+            'test_collection',
+            [
+                {'insertOne': {'document': {'_id': 1}}},
+                {'insertOne': {'document': {'_id': 1}}},
+            ],
+        )
+
+        # Assert
+        assert result['success'] is False
+        assert result['inserted_count'] == 1
+        assert result['write_errors'] == [{'index': 1, 'code': 11000, 'message': 'duplicate key'}]
@@ -0,0 +1,301 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Parallel scan and batch item operations for the DynamoDB MCP Server."""
+
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# API limits of BatchGetItem and BatchWriteItem
+BATCH_GET_MAX_KEYS = 100
+BATCH_WRITE_MAX_ITEMS = 25
+# Retries of unprocessed keys or items before they are returned to the caller
+MAX_BATCH_RETRIES = 8
+BACKOFF_BASE_SECONDS = 0.05
+BACKOFF_MAX_SECONDS = 5.0
+# Maximum number of threads used by one parallel scan or batch operation
+MAX_WORKERS = 16
+
+
+def backoff_delay(attempt: int) -> float:
+    """Return the exponential backoff delay, with full jitter, before a retry attempt."""
+    return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt))
+
+
+def chunked(items: List[T], size: int) -> List[List[T]]:
+    """Split items into lists of at most size elements."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def run_in_threads(func: Callable[[T], R], args: List[T]) -> List[R]:
+    """Call func for every argument on a bounded thread pool and return the results in order."""
+    if len(args) <= 1:
+        return [func(arg) for arg in args]
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(args))) as executor:
+        return list(executor.map(func, args))
+
+
+def _add_capacity(totals: Dict[str, float], consumed: Any) -> None:
+    """Add ConsumedCapacity entries, a single entry or a list, to per-table totals."""
+    for entry in consumed if isinstance(consumed, list) else [consumed]:
+        if entry and 'TableName' in entry:
+            totals[entry['TableName']] = totals.get(entry['TableName'], 0.0) + entry.get(
+                'CapacityUnits', 0.0
+            )
+
+
+def _capacity_list(totals: Dict[str, float]) -> List[Dict[str, Any]]:
+    return [{'TableName': table, 'CapacityUnits': units} for table, units in totals.items()]
+
+
+class ItemBudget:
+    """Number of items the segments of a parallel scan may still return.
+
+    Segments reserve part of the budget before each request and use it as the request
+    Limit, then give back what the page did not use. This keeps the total at or below the
+    budget without dropping items from a page, so every segment can resume exactly where
+    it stopped.
+    """
+
+    def __init__(self, limit: int):
+        """Initialize the budget with limit items."""
+        self._available = limit
+        self._lock = threading.Lock()
+
+    def reserve(self, count: int) -> int:
+        """Reserve up to count items and return how many were reserved."""
+        with self._lock:
+            reserved = min(count, self._available)
+            self._available -= reserved
+            return reserved
+
+    def release(self, count: int) -> None:
+        """Give back count reserved items that were not used."""
+        with self._lock:
+            self._available += count
+
+
+def parallel_scan(
+    client,
+    params: Dict[str, Any],
+    total_segments: int,
+    max_items: int,
+    segment_start_keys: Optional[Dict[str, Optional[Dict[str, Any]]]] = None,
+) -> Dict[str, Any]:
+    """Scan a table with TotalSegments parallel segments until done or max_items are read.
+
+    Args:
+        client: boto3 DynamoDB client
+        params: Scan parameters shared by all segments, e.g. TableName and FilterExpression
+        total_segments: Number of segments the table is divided into
+        max_items: Maximum number of items to return across all segments
+        segment_start_keys: SegmentStartKeys of a previous call, mapping each unfinished
+            segment to the key to resume from (None for segments not started yet)
+
+    Returns:
+        Items, counts, consumed capacity and, if the scan stopped early, SegmentStartKeys
+        to resume it with
+    """
+    if segment_start_keys is None:
+        segments: Dict[int, Optional[Dict[str, Any]]] = dict.fromkeys(range(total_segments))
+    else:
+        segments = {int(segment): key for segment, key in segment_start_keys.items()}
+
+    budget = ItemBudget(max_items)
+    page_size = max(1, math.ceil(max_items / max(1, len(segments))))
+
+    def scan_segment(
+        segment_and_key: Tuple[int, Optional[Dict[str, Any]]],
+    ) -> Tuple[List[Dict[str, Any]], int, Any, bool, Optional[Dict[str, Any]]]:
+        segment, last_key = segment_and_key
+        items: List[Dict[str, Any]] = []
+        scanned = 0
+        consumed: List[Any] = []
+        while True:
+            reserved = budget.reserve(page_size)
+            if not reserved:
+                return items, scanned, consumed, False, last_key
+            request = dict(params, Segment=segment, TotalSegments=total_segments, Limit=reserved)
+            if last_key:
+                request['ExclusiveStartKey'] = last_key
+            response = client.scan(**request)
+            page = response.get('Items', [])
+            budget.release(reserved - len(page))
+            items.extend(page)
+            scanned += response.get('ScannedCount', 0)
+            consumed.append(response.get('ConsumedCapacity'))
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                return items, scanned, consumed, True, None
+
+    results = run_in_threads(scan_segment, list(segments.items()))
+
+    items: List[Dict[str, Any]] = []
+    scanned_count = 0
+    capacity: Dict[str, float] = {}
+    remaining: Dict[str, Optional[Dict[str, Any]]] = {}
+    for segment, (segment_items, scanned, consumed, done, last_key) in zip(segments, results):
+        items.extend(segment_items)
+        scanned_count += scanned
+        for entry in consumed:
+            _add_capacity(capacity, entry)
+        if not done:
+            remaining[str(segment)] = last_key
+
+    return {
+        'Items': items,
+        'Count': len(items),
+        'ScannedCount': scanned_count,
+        'ConsumedCapacity': _capacity_list(capacity),
+        'SegmentStartKeys': remaining or None,
+    }
+
+
+def batch_get_items(client, request_items: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Get any number of items with BatchGetItem, retrying unprocessed keys with backoff.
+
+    Keys are split into requests of at most BATCH_GET_MAX_KEYS keys, which run in parallel.
+    A request that fails does not affect the others: its keys are returned as unprocessed
+    and the error is listed in Errors.
+
+    Args:
+        client: boto3 DynamoDB client
+        request_items: Map of table name to KeysAndAttributes
+
+    Returns:
+        Items per table, keys still unprocessed after the retries or failed, errors of the
+        failed requests, and consumed capacity
+    """
+    options = {
+        table: {name: value for name, value in request.items() if name != 'Keys'}
+        for table, request in request_items.items()
+    }
+    keys = [(table, key) for table, request in request_items.items() for key in request['Keys']]
+
+    def get_chunk(chunk: List[Tuple[str, Dict[str, Any]]]):
+        pending: Dict[str, Dict[str, Any]] = {}
+        for table, key in chunk:
+            pending.setdefault(table, dict(options[table], Keys=[]))['Keys'].append(key)
+        responses: Dict[str, List[Dict[str, Any]]] = {}
+        consumed: List[Any] = []
+        error = None
+        try:
+            for attempt in range(MAX_BATCH_RETRIES + 1):
+                if attempt:
+                    time.sleep(backoff_delay(attempt))
+                response = client.batch_get_item(
+                    RequestItems=pending, ReturnConsumedCapacity='TOTAL'
+                )
+                for table, items in response.get('Responses', {}).items():
+                    responses.setdefault(table, []).extend(items)
+                consumed.append(response.get('ConsumedCapacity', []))
+                pending = response.get('UnprocessedKeys') or {}
+                if not pending:
+                    break
+        except Exception as e:
+            error = str(e)
+        return responses, pending, consumed, error
+
+    responses: Dict[str, List[Dict[str, Any]]] = {}
+    unprocessed: Dict[str, Dict[str, Any]] = {}
+    capacity: Dict[str, float] = {}
+    errors: List[str] = []
+    for chunk_responses, pending, consumed, error in run_in_threads(
+        get_chunk, chunked(keys, BATCH_GET_MAX_KEYS)
+    ):
+        for table, items in chunk_responses.items():
+            responses.setdefault(table, []).extend(items)
+        for table, request in pending.items():
+            unprocessed.setdefault(table, dict(request, Keys=[]))['Keys'].extend(request['Keys'])
+        for entry in consumed:
+            _add_capacity(capacity, entry)
+        if error:
+            errors.append(error)
+
+    return {
+        'Responses': responses,
+        'UnprocessedKeys': unprocessed,
+        'Errors': errors,
+        'ConsumedCapacity': _capacity_list(capacity),
+    }
+
+
+def batch_write_items(client, request_items: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Put or delete any number of items with BatchWriteItem, retrying unprocessed items.
+
+    Requests are split into batches of at most BATCH_WRITE_MAX_ITEMS, which run in parallel.
+    A batch that fails does not affect the others: its requests are returned as unprocessed
+    and the error is listed in Errors.
+
+    Args:
+        client: boto3 DynamoDB client
+        request_items: Map of table name to a list of PutRequest or DeleteRequest entries
+
+    Returns:
+        Number of processed requests, requests still unprocessed after the retries or
+        failed, errors of the failed batches, and consumed capacity
+    """
+    writes = [
+        (table, request) for table, requests in request_items.items() for request in requests
+    ]
+
+    def write_chunk(chunk: List[Tuple[str, Dict[str, Any]]]):
+        pending: Dict[str, List[Dict[str, Any]]] = {}
+        for table, request in chunk:
+            pending.setdefault(table, []).append(request)
+        consumed: List[Any] = []
+        error = None
+        try:
+            for attempt in range(MAX_BATCH_RETRIES + 1):
+                if attempt:
+                    time.sleep(backoff_delay(attempt))
+                response = client.batch_write_item(
+                    RequestItems=pending, ReturnConsumedCapacity='TOTAL'
+                )
+                consumed.append(response.get('ConsumedCapacity', []))
+                pending = response.get('UnprocessedItems') or {}
+                if not pending:
+                    break
+        except Exception as e:
+            error = str(e)
+        return pending, consumed, error
+
+    unprocessed: Dict[str, List[Dict[str, Any]]] = {}
+    capacity: Dict[str, float] = {}
+    errors: List[str] = []
+    for pending, consumed, error in run_in_threads(
+        write_chunk, chunked(writes, BATCH_WRITE_MAX_ITEMS)
+    ):
+        for table, requests in pending.items():
+            unprocessed.setdefault(table, []).extend(requests)
+        for entry in consumed:
+            _add_capacity(capacity, entry)
+        if error:
+            errors.append(error)
+
+    unprocessed_count = sum(len(requests) for requests in unprocessed.values())
+    return {
+        'ProcessedCount': len(writes) - unprocessed_count,
+        'UnprocessedItems': unprocessed,
+        'Errors': errors,
+        'ConsumedCapacity': _capacity_list(capacity),
+    }
@@ -0,0 +1,238 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Capacity-aware rate limiting and throughput metrics for DynamoDB clients."""
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+READ_OPERATIONS = {'GetItem', 'Query', 'Scan', 'BatchGetItem'}
+WRITE_OPERATIONS = {'PutItem', 'UpdateItem', 'DeleteItem', 'BatchWriteItem'}
+THROTTLING_ERRORS = {
+    'ProvisionedThroughputExceededException',
+    'RequestLimitExceeded',
+    'ThrottlingException',
+}
+
+
+def _env_limit(name: str) -> Optional[float]:
+    value = os.environ.get(name)
+    return float(value) if value else None
+
+
+def _operation_kind(operation: str) -> Optional[str]:
+    if operation in READ_OPERATIONS:
+        return 'read'
+    if operation in WRITE_OPERATIONS:
+        return 'write'
+    return None
+
+
+def _table_names(params: Dict[str, Any]) -> List[str]:
+    if 'TableName' in params:
+        return [params['TableName']]
+    return list(params.get('RequestItems', {}))
+
+
+class TokenBucket:
+    """Token bucket refilled at rate units per second, holding at most one second of units.
+
+    The cost of a request is only known from the ConsumedCapacity of its response, so
+    requests wait while the bucket is empty and their consumed units are taken out
+    afterwards. The balance may go negative, which delays the following requests until
+    the debt is paid back.
+    """
+
+    def __init__(self, rate: float):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Units added per second
+        """
+        self.rate = rate
+        self.tokens = rate
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.rate, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, now: float) -> float:
+        """Return the seconds to wait before the next request may be sent."""
+        self._refill(now)
+        return 0.0 if self.tokens > 0 else (-self.tokens + 1e-3) / self.rate
+
+    def consume(self, units: float, now: float) -> None:
+        """Take consumed units out of the bucket."""
+        self._refill(now)
+        self.tokens -= units
+
+
+class TableMetrics:
+    """Consumed capacity and request counters of one table."""
+
+    def __init__(self, now: float):
+        """Initialize empty counters."""
+        self.read_units = 0.0
+        self.write_units = 0.0
+        self.requests = 0
+        self.throttled_requests = 0
+        self.limiter_wait_seconds = 0.0
+        self.first_request_at = now
+        self.last_request_at = now
+
+    def snapshot(self, region: str, table: str) -> Dict[str, Any]:
+        """Return the counters, and average throughput, as a JSON-serializable dictionary."""
+        elapsed = max(self.last_request_at - self.first_request_at, 1.0)
+        return {
+            'Region': region,
+            'TableName': table,
+            'Requests': self.requests,
+            'ThrottledRequests': self.throttled_requests,
+            'ReadCapacityUnits': round(self.read_units, 3),
+            'WriteCapacityUnits': round(self.write_units, 3),
+            'AverageReadUnitsPerSecond': round(self.read_units / elapsed, 3),
+            'AverageWriteUnitsPerSecond': round(self.write_units / elapsed, 3),
+            'LimiterWaitSeconds': round(self.limiter_wait_seconds, 3),
+        }
+
+
+class CapacityTracker:
+    """Per-table read/write capacity limits and throughput metrics for DynamoDB clients.
+
+    Clients passed to ``attach`` get botocore event handlers that, before each data-plane
+    request, wait until the read or write bucket of every table in the request has units
+    left, and after each response record the returned ConsumedCapacity. Limits are in
+    capacity units per second per table; None disables limiting but metrics are still
+    recorded.
+    """
+
+    def __init__(self, max_read_units: Optional[float], max_write_units: Optional[float]):
+        """Initialize the tracker.
+
+        Args:
+            max_read_units: Read capacity units per second allowed per table, or None
+            max_write_units: Write capacity units per second allowed per table, or None
+        """
+        self.limits = {'read': max_read_units, 'write': max_write_units}
+        self._buckets: Dict[Tuple[str, str, str], TokenBucket] = {}
+        self._metrics: Dict[Tuple[str, str], TableMetrics] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, client) -> None:
+        """Register the limiting and metrics handlers on a boto3 DynamoDB client."""
+        region = client.meta.region_name
+
+        def before_parameter_build(params, model, context, **kwargs):
+            kind = _operation_kind(model.name)
+            if kind is None:
+                return
+            # Consumed capacity drives both the limiter and the metrics
+            if params.get('ReturnConsumedCapacity', 'NONE') == 'NONE':
+                params['ReturnConsumedCapacity'] = 'TOTAL'
+            tables = _table_names(params)
+            context['capacity_tables'] = tables
+            for table in tables:
+                self.wait(region, table, kind)
+
+        def after_call(parsed, model, context, **kwargs):
+            kind = _operation_kind(model.name)
+            if kind is None:
+                return
+            if parsed.get('Error', {}).get('Code') in THROTTLING_ERRORS:
+                for table in context.get('capacity_tables', []):
+                    self.record(region, table, kind, 0.0, throttled=True)
+                return
+            consumed = parsed.get('ConsumedCapacity') or []
+            for entry in consumed if isinstance(consumed, list) else [consumed]:
+                if entry and 'TableName' in entry:
+                    self.record(region, entry['TableName'], kind, entry.get('CapacityUnits', 0.0))
+
+        client.meta.events.register('before-parameter-build.dynamodb', before_parameter_build)
+        client.meta.events.register('after-call.dynamodb', after_call)
+
+    def wait_time(self, region: str, table: str, kind: str) -> float:
+        """Return the seconds a request must wait before reading or writing table."""
+        rate = self.limits[kind]
+        if not rate:
+            return 0.0
+        with self._lock:
+            bucket = self._buckets.setdefault((region, table, kind), TokenBucket(rate))
+            return bucket.wait_time(time.monotonic())
+
+    def wait(self, region: str, table: str, kind: str) -> None:
+        """Block until a request may read or write table."""
+        waited = 0.0
+        delay = self.wait_time(region, table, kind)
+        while delay > 0:
+            time.sleep(delay)
+            waited += delay
+            delay = self.wait_time(region, table, kind)
+        if waited:
+            with self._lock:
+                self._table_metrics(region, table).limiter_wait_seconds += waited
+
+    def record(
+        self, region: str, table: str, kind: str, units: float, throttled: bool = False
+    ) -> None:
+        """Record one response and take its consumed units out of the table's bucket."""
+        now = time.monotonic()
+        with self._lock:
+            metrics = self._table_metrics(region, table)
+            metrics.last_request_at = now
+            if throttled:
+                metrics.throttled_requests += 1
+                return
+            metrics.requests += 1
+            if kind == 'read':
+                metrics.read_units += units
+            else:
+                metrics.write_units += units
+            bucket = self._buckets.get((region, table, kind))
+            if bucket is not None:
+                bucket.consume(units, now)
+
+    def metrics(
+        self, table: Optional[str] = None, region: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Return the metrics of all tables, or of the given table and region."""
+        with self._lock:
+            return [
+                metrics.snapshot(metrics_region, metrics_table)
+                for (metrics_region, metrics_table), metrics in sorted(self._metrics.items())
+                if (table is None or metrics_table == table)
+                and (region is None or metrics_region == region)
+            ]
+
+    def clear(self) -> None:
+        """Drop all buckets and metrics."""
+        with self._lock:
+            self._buckets.clear()
+            self._metrics.clear()
+
+    def _table_metrics(self, region: str, table: str) -> TableMetrics:
+        metrics = self._metrics.get((region, table))
+        if metrics is None:
+            metrics = self._metrics[(region, table)] = TableMetrics(time.monotonic())
+        return metrics
+
+
+# Limits are read from the environment, like DDB-MCP-READONLY
+capacity_tracker = CapacityTracker(
+    max_read_units=_env_limit('DDB-MCP-MAX-RCU'),
+    max_write_units=_env_limit('DDB-MCP-MAX-WCU'),
+)
@@ -115,6 +115,32 @@ class QueryInput(TypedDict, total=False):
     ReturnConsumedCapacity: Optional[ReturnConsumedCapacity]
 
 
+class KeysAndAttributes(TypedDict, total=False):
+    """Keys and read options of one table in a BatchGetItem request."""
+
+    Keys: List[
+        Dict[str, KeyAttributeValue]
+    ]  # required - primary keys in AttributeValue format e.g. {'S': 'value'}
+    ProjectionExpression: Optional[str]
+    ExpressionAttributeNames: Optional[Dict[str, str]]
+    ConsistentRead: Optional[bool]
+
+
+class PutRequest(TypedDict):
+    Item: Dict[str, AttributeValue]  # AttributeValue format e.g. {'S': 'value'}
+
+
+class DeleteRequest(TypedDict):
+    Key: Dict[str, KeyAttributeValue]  # AttributeValue format e.g. {'S': 'value'}
+
+
+class WriteRequest(TypedDict, total=False):
+    """A single put or delete in a BatchWriteItem request; set exactly one of the two."""
+
+    PutRequest: PutRequest
+    DeleteRequest: DeleteRequest
+
+
 class DeleteItemInput(TypedDict, total=False):
     """Parameters for DeleteItem operation."""
 
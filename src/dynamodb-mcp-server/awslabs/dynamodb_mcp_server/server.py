@@ -14,9 +14,19 @@
 
 #!/usr/bin/env python3
 
+import asyncio
 import boto3
+import hashlib
 import json
 import os
+import threading
+import time
+from awslabs.dynamodb_mcp_server.bulk import (
+    batch_get_items,
+    batch_write_items,
+    parallel_scan,
+)
+from awslabs.dynamodb_mcp_server.capacity import capacity_tracker
 from awslabs.dynamodb_mcp_server.common import (
     AttributeDefinition,
     AttributeValue,
@@ -27,6 +37,7 @@ from awslabs.dynamodb_mcp_server.common import (
     GlobalSecondaryIndex,
     GlobalSecondaryIndexUpdate,
     KeyAttributeValue,
+    KeysAndAttributes,
     KeySchemaElement,
     OnDemandThroughput,
     ProvisionedThroughput,
@@ -43,6 +54,7 @@ from awslabs.dynamodb_mcp_server.common import (
     UpdateItemInput,
     UpdateTableInput,
     WarmThroughput,
+    WriteRequest,
     handle_exceptions,
     mutation_check,
 )
@@ -50,7 +62,7 @@ from botocore.config import Config
 from mcp.server.fastmcp import FastMCP
 from pathlib import Path
 from pydantic import Field
-from typing import Any, Dict, List, Literal, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
 
 app = FastMCP(
@@ -110,21 +122,48 @@ advanced optimizations, cost analysis, and integration patterns.
 )
 
 
+# Clients are reused for this many seconds before being recreated, so changes to shared
+# credential files are picked up without building a client for every call
+CLIENT_CACHE_TTL = 900
+_client_cache: Dict[tuple, tuple] = {}
+_client_cache_lock = threading.Lock()
+
+
 def get_dynamodb_client(region_name: str | None):
-    """Create a boto3 DynamoDB client using credentials from environment variables. Falls back to 'us-west-2' if no region is specified or found in environment."""
+    """Return a cached boto3 DynamoDB client using credentials from environment variables. Falls back to 'us-west-2' if no region is specified or found in environment."""
     # Use provided region, or get from env, or fall back to us-west-2
     region = region_name or os.getenv('AWS_REGION') or 'us-west-2'
 
-    # Configure custom user agent to identify requests from LLM/MCP
-    config = Config(user_agent_extra='MCP/DynamoDBServer')
-
-    # Create a new session to force credentials to reload
-    # so that if user changes credential, it will be reflected immediately in the next call
-    session = boto3.Session()
-
-    # boto3 will automatically load credentials from environment variables:
-    # AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_SESSION_TOKEN
-    return session.client('dynamodb', region_name=region, config=config)
+    # Clients are cached per region and credential environment variables, so a change of
+    # these variables takes effect on the next call. Changes to shared credential files are
+    # only picked up once the cached client is older than CLIENT_CACHE_TTL. The secrets are
+    # hashed so they are not kept in the cache key.
+    secrets = hashlib.sha256(
+        '\0'.join(
+            (os.getenv('AWS_SECRET_ACCESS_KEY') or '', os.getenv('AWS_SESSION_TOKEN') or '')
+        ).encode()
+    ).hexdigest()
+    key = (region, os.getenv('AWS_PROFILE'), os.getenv('AWS_ACCESS_KEY_ID'), secrets)
+    with _client_cache_lock:
+        cached = _client_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < CLIENT_CACHE_TTL:
+            return cached[1]
+
+        # Configure custom user agent to identify requests from LLM/MCP
+        config = Config(user_agent_extra='MCP/DynamoDBServer')
+
+        # boto3 will automatically load credentials from environment variables:
+        # AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_SESSION_TOKEN
+        client = boto3.Session().client('dynamodb', region_name=region, config=config)
+        capacity_tracker.attach(client)
+        now = time.monotonic()
+        # Drop expired clients, e.g. of rotated credentials, so the cache does not grow
+        for expired in [
+            k for k, (created, _) in _client_cache.items() if now - created >= CLIENT_CACHE_TTL
+        ]:
+            del _client_cache[expired]
+        _client_cache[key] = (now, client)
+        return client
 
 
 table_name = Field(description='Table Name or Amazon Resource Name (ARN)')
@@ -262,7 +301,7 @@ async def scan(
         params['ExclusiveStartKey'] = exclusive_start_key
     params['ReturnConsumedCapacity'] = 'TOTAL'
 
-    response = client.scan(**params)
+    response = await asyncio.to_thread(client.scan, **params)
     return {
         'Items': response.get('Items', []),
         'Count': response.get('Count'),
@@ -272,6 +311,52 @@ async def scan(
     }
 
 
+@app.tool()
+@handle_exceptions
+async def parallel_scan_table(
+    table_name: str = table_name,
+    total_segments: int = Field(
+        default=4,
+        description='Number of segments scanned in parallel. Larger tables benefit from more segments.',
+        ge=1,
+        le=1000,
+    ),
+    max_items: int = Field(
+        default=1000,
+        description='Maximum number of items to return across all segments',
+        ge=1,
+    ),
+    index_name: str = index_name,
+    filter_expression: str = filter_expression,
+    projection_expression: str = projection_expression,
+    expression_attribute_names: Dict[str, str] = expression_attribute_names,
+    expression_attribute_values: Dict[str, AttributeValue] = expression_attribute_values,
+    segment_start_keys: Dict[str, Optional[Dict[str, KeyAttributeValue]]] = Field(
+        default=None,
+        description='Use the SegmentStartKeys from the previous call to continue the scan. total_segments must match the previous call.',
+    ),
+    region_name: str = Field(default=None, description='The aws region to run the tool'),
+) -> dict:
+    """Scans a table or secondary index with parallel segments until the scan completes or max_items items are read. Returns SegmentStartKeys to continue an incomplete scan."""
+    client = get_dynamodb_client(region_name)
+    params: ScanInput = {'TableName': table_name, 'ReturnConsumedCapacity': 'TOTAL'}
+
+    if index_name:
+        params['IndexName'] = index_name
+    if filter_expression:
+        params['FilterExpression'] = filter_expression
+    if projection_expression:
+        params['ProjectionExpression'] = projection_expression
+    if expression_attribute_names:
+        params['ExpressionAttributeNames'] = expression_attribute_names
+    if expression_attribute_values:
+        params['ExpressionAttributeValues'] = expression_attribute_values
+
+    return await asyncio.to_thread(
+        parallel_scan, client, dict(params), total_segments, max_items, segment_start_keys
+    )
+
+
 @app.tool()
 @handle_exceptions
 async def query(
@@ -319,7 +404,7 @@ async def query(
         params['ExclusiveStartKey'] = exclusive_start_key
     params['ReturnConsumedCapacity'] = 'TOTAL'
 
-    response = client.query(**params)
+    response = await asyncio.to_thread(client.query, **params)
     return {
         'Items': response.get('Items', []),
         'Count': response.get('Count'),
@@ -367,7 +452,7 @@ async def update_item(
     params['ReturnConsumedCapacity'] = 'TOTAL'
     params['ReturnValuesOnConditionCheckFailure'] = 'ALL_OLD'
 
-    response = client.update_item(**params)
+    response = await asyncio.to_thread(client.update_item, **params)
     return {
         'Attributes': response.get('Attributes'),
         'ConsumedCapacity': response.get('ConsumedCapacity'),
@@ -393,7 +478,7 @@ async def get_item(
         params['ProjectionExpression'] = projection_expression
     params['ReturnConsumedCapacity'] = 'TOTAL'
 
-    response = client.get_item(**params)
+    response = await asyncio.to_thread(client.get_item, **params)
     return {'Item': response.get('Item'), 'ConsumedCapacity': response.get('ConsumedCapacity')}
 
 
@@ -425,7 +510,7 @@ async def put_item(
         params['ExpressionAttributeValues'] = expression_attribute_values
     params['ReturnConsumedCapacity'] = 'TOTAL'
 
-    response = client.put_item(**params)
+    response = await asyncio.to_thread(client.put_item, **params)
     return {
         'Attributes': response.get('Attributes'),
         'ConsumedCapacity': response.get('ConsumedCapacity'),
@@ -458,7 +543,7 @@ async def delete_item(
         params['ExpressionAttributeValues'] = expression_attribute_values
     params['ReturnConsumedCapacity'] = 'TOTAL'
 
-    response = client.delete_item(**params)
+    response = await asyncio.to_thread(client.delete_item, **params)
     return {
         'Attributes': response.get('Attributes'),
         'ConsumedCapacity': response.get('ConsumedCapacity'),
@@ -466,6 +551,51 @@ async def delete_item(
     }
 
 
+@app.tool()
+@handle_exceptions
+async def batch_get_item(
+    request_items: Dict[str, KeysAndAttributes] = Field(
+        description='Map of table name to the keys to get and optional ProjectionExpression, ExpressionAttributeNames and ConsistentRead. Keys must use DynamoDB attribute value format (see IMPORTANT note about DynamoDB Attribute Value Format).'
+    ),
+    region_name: str = Field(default=None, description='The aws region to run the tool'),
+) -> dict:
+    """Returns the items with the given primary keys from one or more tables. Any number of keys can be passed; they are split into requests of 100 keys, and unprocessed keys are retried with backoff."""
+    client = get_dynamodb_client(region_name)
+    return await asyncio.to_thread(batch_get_items, client, dict(request_items))
+
+
+@app.tool()
+@handle_exceptions
+@mutation_check
+async def batch_write_item(
+    request_items: Dict[str, List[WriteRequest]] = Field(
+        description='Map of table name to a list of requests, each either {"PutRequest": {"Item": {...}}} or {"DeleteRequest": {"Key": {...}}}. Items and keys must use DynamoDB attribute value format (see IMPORTANT note about DynamoDB Attribute Value Format).'
+    ),
+    region_name: str = Field(default=None, description='The aws region to run the tool'),
+) -> dict:
+    """Puts or deletes multiple items in one or more tables. Any number of requests can be passed; they are split into batches of 25, and unprocessed items are retried with backoff."""
+    client = get_dynamodb_client(region_name)
+    return await asyncio.to_thread(batch_write_items, client, dict(request_items))
+
+
+@app.tool()
+@handle_exceptions
+async def get_throughput_metrics(
+    table_name: str = Field(
+        default=None, description='Only return metrics of this table (all tables if not set)'
+    ),
+    region_name: str = Field(
+        default=None, description='Only return metrics of this region (all regions if not set)'
+    ),
+) -> dict:
+    """Returns the read and write capacity units consumed per table by this server's item operations, the number of requests and throttled requests, and the time spent waiting on the per-table capacity limits set by DDB-MCP-MAX-RCU and DDB-MCP-MAX-WCU."""
+    return {
+        'Tables': capacity_tracker.metrics(table=table_name, region=region_name),
+        'MaxReadCapacityUnitsPerSecond': capacity_tracker.limits['read'],
+        'MaxWriteCapacityUnitsPerSecond': capacity_tracker.limits['write'],
+    }
+
+
 @app.tool()
 @handle_exceptions
 @mutation_check
@@ -0,0 +1,111 @@
+import pytest
+from awslabs.dynamodb_mcp_server import bulk
+from unittest.mock import MagicMock
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    """Retry unprocessed keys and items without waiting."""
+    monkeypatch.setattr(bulk, 'backoff_delay', lambda attempt: 0)
+
+
+def test_batch_get_items_retries_unprocessed_keys():
+    """Test that unprocessed keys are retried until they are processed."""
+    client = MagicMock()
+    key1 = {'id': {'S': '1'}}
+    key2 = {'id': {'S': '2'}}
+    client.batch_get_item.side_effect = [
+        {
+            'Responses': {'T': [key1]},
+            'UnprocessedKeys': {'T': {'Keys': [key2], 'ConsistentRead': True}},
+            'ConsumedCapacity': [{'TableName': 'T', 'CapacityUnits': 1.0}],
+        },
+        {
+            'Responses': {'T': [key2]},
+            'ConsumedCapacity': [{'TableName': 'T', 'CapacityUnits': 0.5}],
+        },
+    ]
+
+    result = bulk.batch_get_items(client, {'T': {'Keys': [key1, key2], 'ConsistentRead': True}})
+
+    assert result['Responses'] == {'T': [key1, key2]}
+    assert result['UnprocessedKeys'] == {}
+    assert result['ConsumedCapacity'] == [{'TableName': 'T', 'CapacityUnits': 1.5}]
+    retry = client.batch_get_item.call_args_list[1].kwargs['RequestItems']
+    assert retry == {'T': {'Keys': [key2], 'ConsistentRead': True}}
+
+
+def test_batch_write_items_chunks_and_reports_unprocessed(monkeypatch):
+    """Test that writes are chunked to the API limit and leftovers are returned."""
+    monkeypatch.setattr(bulk, 'MAX_BATCH_RETRIES', 1)
+    client = MagicMock()
+    stuck = {'PutRequest': {'Item': {'id': {'S': 'stuck'}}}}
+
+    def batch_write_item(RequestItems, ReturnConsumedCapacity):
+        assert len(RequestItems['T']) <= bulk.BATCH_WRITE_MAX_ITEMS
+        if stuck in RequestItems['T']:
+            return {'UnprocessedItems': {'T': [stuck]}}
+        return {'UnprocessedItems': {}}
+
+    client.batch_write_item.side_effect = batch_write_item
+    requests = [{'PutRequest': {'Item': {'id': {'S': str(i)}}}} for i in range(59)] + [stuck]
+
+    result = bulk.batch_write_items(client, {'T': requests})
+
+    assert result['ProcessedCount'] == 59
+    assert result['UnprocessedItems'] == {'T': [stuck]}
+    # Three chunks, plus one retry of the chunk holding the stuck item
+    assert client.batch_write_item.call_count == 4
+
+
+def test_batch_write_items_keeps_other_chunks_when_one_fails():
+    """Test that a failing batch is reported without losing the results of the others."""
+    client = MagicMock()
+    failing = {'PutRequest': {'Item': {'id': {'S': 'failing'}}}}
+
+    def batch_write_item(RequestItems, ReturnConsumedCapacity):
+        if failing in RequestItems['T']:
+            raise Exception('Throttled')
+        return {
+            'UnprocessedItems': {},
+            'ConsumedCapacity': [{'TableName': 'T', 'CapacityUnits': 25.0}],
+        }
+
+    client.batch_write_item.side_effect = batch_write_item
+    requests = [{'PutRequest': {'Item': {'id': {'S': str(i)}}}} for i in range(49)] + [failing]
+
+    result = bulk.batch_write_items(client, {'T': requests})
+
+    assert result['ProcessedCount'] == 25
+    assert result['UnprocessedItems'] == {'T': requests[25:]}
+    assert result['Errors'] == ['Throttled']
+    assert result['ConsumedCapacity'] == [{'TableName': 'T', 'CapacityUnits': 25.0}]
+
+
+def test_batch_get_items_keeps_other_chunks_when_one_fails():
+    """Test that keys of a failing request are returned as unprocessed next to the items."""
+    client = MagicMock()
+    keys = [{'id': {'S': str(i)}} for i in range(150)]
+
+    def batch_get_item(RequestItems, ReturnConsumedCapacity):
+        if keys[0] in RequestItems['T']['Keys']:
+            return {'Responses': {'T': RequestItems['T']['Keys']}}
+        raise Exception('Throttled')
+
+    client.batch_get_item.side_effect = batch_get_item
+
+    result = bulk.batch_get_items(client, {'T': {'Keys': keys}})
+
+    assert result['Responses'] == {'T': keys[:100]}
+    assert result['UnprocessedKeys'] == {'T': {'Keys': keys[100:]}}
+    assert result['Errors'] == ['Throttled']
+
+
+def test_item_budget_reserve_and_release():
+    """Test that reservations never exceed the budget and unused items are given back."""
+    budget = bulk.ItemBudget(10)
+    assert budget.reserve(6) == 6
+    assert budget.reserve(6) == 4
+    assert budget.reserve(1) == 0
+    budget.release(3)
+    assert budget.reserve(5) == 3
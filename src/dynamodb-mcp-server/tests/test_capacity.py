@@ -0,0 +1,89 @@
+import boto3
+from awslabs.dynamodb_mcp_server import capacity
+from awslabs.dynamodb_mcp_server.capacity import CapacityTracker, TokenBucket
+from botocore.stub import Stubber
+
+
+def test_token_bucket_waits_until_debt_is_paid():
+    """Test that consuming more than the bucket holds delays the next request."""
+    bucket = TokenBucket(rate=10)
+    assert bucket.wait_time(now=bucket.updated_at) == 0
+
+    bucket.consume(30, now=bucket.updated_at)
+    assert bucket.wait_time(now=bucket.updated_at) > 1.9
+    assert bucket.wait_time(now=bucket.updated_at + 2.1) == 0
+
+
+def test_token_bucket_holds_at_most_one_second_of_units():
+    """Test that an idle bucket does not accumulate more than its rate."""
+    bucket = TokenBucket(rate=5)
+    bucket.wait_time(now=bucket.updated_at + 60)
+    assert bucket.tokens == 5
+
+
+def test_tracker_without_limits_never_waits():
+    """Test that metrics are recorded without limiting when no limit is set."""
+    tracker = CapacityTracker(max_read_units=None, max_write_units=None)
+    tracker.record('us-west-2', 'T', 'read', 1000.0)
+    assert tracker.wait_time('us-west-2', 'T', 'read') == 0
+    assert tracker.metrics()[0]['ReadCapacityUnits'] == 1000.0
+
+
+def test_tracker_limits_each_table_and_kind_separately():
+    """Test that consumed read units only delay reads of the same table."""
+    tracker = CapacityTracker(max_read_units=10, max_write_units=10)
+    for table, kind in [('A', 'read'), ('A', 'write'), ('B', 'read')]:
+        tracker.wait_time('us-west-2', table, kind)
+
+    tracker.record('us-west-2', 'A', 'read', 50.0)
+    assert tracker.wait_time('us-west-2', 'A', 'read') > 3.9
+    assert tracker.wait_time('us-west-2', 'A', 'write') == 0
+    assert tracker.wait_time('us-west-2', 'B', 'read') == 0
+
+
+def test_tracker_wait_records_wait_time(monkeypatch):
+    """Test that time spent waiting on the limit is added to the table's metrics."""
+    tracker = CapacityTracker(max_read_units=10, max_write_units=None)
+    delays = iter([0.5, 0.0])
+    monkeypatch.setattr(tracker, 'wait_time', lambda region, table, kind: next(delays))
+    monkeypatch.setattr(capacity.time, 'sleep', lambda seconds: None)
+
+    tracker.wait('us-west-2', 'T', 'read')
+    assert tracker.metrics(table='T')[0]['LimiterWaitSeconds'] == 0.5
+
+
+def test_attached_client_records_consumed_capacity():
+    """Test that an attached client requests and records consumed capacity."""
+    tracker = CapacityTracker(max_read_units=None, max_write_units=None)
+    client = boto3.client(
+        'dynamodb',
+        region_name='us-west-2',
+        aws_access_key_id='testing',
+        aws_secret_access_key='testing',
+    )
+    tracker.attach(client)
+    sent = []
+    client.meta.events.register(
+        'before-parameter-build.dynamodb', lambda params, **kwargs: sent.append(dict(params))
+    )
+
+    with Stubber(client) as stubber:
+        stubber.add_response(
+            'get_item', {'ConsumedCapacity': {'TableName': 'T', 'CapacityUnits': 0.5}}
+        )
+        stubber.add_client_error(
+            'batch_write_item', service_error_code='ProvisionedThroughputExceededException'
+        )
+        client.get_item(TableName='T', Key={'id': {'S': '1'}})
+        try:
+            client.batch_write_item(
+                RequestItems={'T': [{'DeleteRequest': {'Key': {'id': {'S': '1'}}}}]}
+            )
+        except client.exceptions.ProvisionedThroughputExceededException:
+            pass
+
+    assert [params['ReturnConsumedCapacity'] for params in sent] == ['TOTAL', 'TOTAL']
+    metrics = tracker.metrics(table='T', region='us-west-2')[0]
+    assert metrics['Requests'] == 1
+    assert metrics['ReadCapacityUnits'] == 0.5
+    assert metrics['ThrottledRequests'] == 1
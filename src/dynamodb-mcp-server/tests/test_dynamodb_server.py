@@ -2,7 +2,12 @@ import asyncio
 import boto3
 import pytest
 import pytest_asyncio
+import time
+from awslabs.dynamodb_mcp_server import server
+from awslabs.dynamodb_mcp_server.capacity import capacity_tracker
 from awslabs.dynamodb_mcp_server.server import (
+    batch_get_item,
+    batch_write_item,
     create_backup,
     create_table,
     delete_item,
@@ -16,9 +21,11 @@ from awslabs.dynamodb_mcp_server.server import (
     dynamodb_data_modeling,
     get_item,
     get_resource_policy,
+    get_throughput_metrics,
     list_backups,
     list_tables,
     list_tags_of_resource,
+    parallel_scan_table,
     put_item,
     put_resource_policy,
     query,
@@ -45,6 +52,8 @@ async def aws_credentials():
 @pytest_asyncio.fixture
 async def dynamodb(aws_credentials):
     """DynamoDB resource."""
+    server._client_cache.clear()
+    capacity_tracker.clear()
     with mock_aws():
         yield boto3.client('dynamodb', region_name='us-west-2')
 
@@ -534,6 +543,142 @@ async def test_scan(test_table):
         assert 'category' not in item
 
 
+@pytest.mark.asyncio
+async def test_batch_write_and_get_items(test_table):
+    """Test batch writes and gets larger than a single API request."""
+    items = [{'id': {'S': f'user{i}'}, 'sort': {'S': 'data'}} for i in range(60)]
+    result = await batch_write_item(
+        request_items={'TestTable': [{'PutRequest': {'Item': item}} for item in items]},
+        region_name='us-west-2',
+    )
+    if 'error' in result:
+        pytest.fail(f'Failed to batch write items: {result["error"]}')
+    assert result['ProcessedCount'] == 60
+    assert result['UnprocessedItems'] == {}
+
+    keys = [{'id': {'S': f'user{i}'}, 'sort': {'S': 'data'}} for i in range(150)]
+    result = await batch_get_item(
+        request_items={'TestTable': {'Keys': keys, 'ProjectionExpression': 'id'}},
+        region_name='us-west-2',
+    )
+    if 'error' in result:
+        pytest.fail(f'Failed to batch get items: {result["error"]}')
+    assert sorted(item['id']['S'] for item in result['Responses']['TestTable']) == sorted(
+        f'user{i}' for i in range(60)
+    )
+    assert result['UnprocessedKeys'] == {}
+
+    result = await batch_write_item(
+        request_items={'TestTable': [{'DeleteRequest': {'Key': key}} for key in keys[:30]]},
+        region_name='us-west-2',
+    )
+    assert result['ProcessedCount'] == 30
+
+
+@pytest.mark.asyncio
+async def test_parallel_scan_table(test_table):
+    """Test that a parallel scan respects its item budget and can be resumed."""
+    await batch_write_item(
+        request_items={
+            'TestTable': [
+                {'PutRequest': {'Item': {'id': {'S': f'user{i}'}, 'sort': {'S': 'data'}}}}
+                for i in range(50)
+            ]
+        },
+        region_name='us-west-2',
+    )
+
+    seen = []
+    segment_start_keys = None
+    for _ in range(10):
+        result = await parallel_scan_table(
+            table_name='TestTable',
+            total_segments=4,
+            max_items=20,
+            index_name=None,
+            filter_expression=None,
+            projection_expression=None,
+            expression_attribute_names=None,
+            expression_attribute_values=None,
+            segment_start_keys=segment_start_keys,
+            region_name='us-west-2',
+        )
+        if 'error' in result:
+            pytest.fail(f'Failed to scan in parallel: {result["error"]}')
+        assert result['Count'] <= 20
+        seen.extend(item['id']['S'] for item in result['Items'])
+        segment_start_keys = result['SegmentStartKeys']
+        if segment_start_keys is None:
+            break
+
+    assert sorted(seen) == sorted(f'user{i}' for i in range(50))
+
+
+@pytest.mark.asyncio
+async def test_client_is_cached_per_region(dynamodb):
+    """Test that clients are reused for the same region and created per region."""
+    client = server.get_dynamodb_client('us-west-2')
+    assert server.get_dynamodb_client('us-west-2') is client
+    assert server.get_dynamodb_client('us-east-1') is not client
+
+
+@pytest.mark.asyncio
+async def test_client_cache_key_does_not_hold_secrets(dynamodb, monkeypatch):
+    """Test that a new secret key creates a new client and is not stored in the cache key."""
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'first-secret')
+    client = server.get_dynamodb_client('us-west-2')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'second-secret')
+    assert server.get_dynamodb_client('us-west-2') is not client
+    assert not any('secret' in str(part) for key in server._client_cache for part in key)
+
+
+@pytest.mark.asyncio
+async def test_client_cache_prunes_expired_clients(dynamodb, monkeypatch):
+    """Test that clients older than the TTL are dropped when a new client is cached."""
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'first-secret')
+    server.get_dynamodb_client('us-west-2')
+    for key, (_, client) in list(server._client_cache.items()):
+        server._client_cache[key] = (time.monotonic() - server.CLIENT_CACHE_TTL, client)
+
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'second-secret')
+    client = server.get_dynamodb_client('us-west-2')
+
+    assert [cached for _, cached in server._client_cache.values()] == [client]
+
+
+@pytest.mark.asyncio
+async def test_get_throughput_metrics(test_table):
+    """Test that consumed capacity of item operations is recorded per table."""
+    await batch_write_item(
+        request_items={
+            'TestTable': [
+                {'PutRequest': {'Item': {'id': {'S': f'user{i}'}, 'sort': {'S': 'data'}}}}
+                for i in range(5)
+            ]
+        },
+        region_name='us-west-2',
+    )
+    await get_item(
+        table_name='TestTable',
+        key={'id': {'S': 'user1'}, 'sort': {'S': 'data'}},
+        expression_attribute_names=None,
+        projection_expression=None,
+        region_name='us-west-2',
+    )
+
+    result = await get_throughput_metrics(table_name='TestTable', region_name=None)
+    assert len(result['Tables']) == 1
+    metrics = result['Tables'][0]
+    assert metrics['TableName'] == 'TestTable'
+    assert metrics['Region'] == 'us-west-2'
+    assert metrics['Requests'] == 2
+    assert metrics['ReadCapacityUnits'] > 0
+    assert metrics['WriteCapacityUnits'] > 0
+
+    result = await get_throughput_metrics(table_name='OtherTable', region_name=None)
+    assert result['Tables'] == []
+
+
 @pytest.mark.asyncio
 async def test_describe_table(test_table):
     """Test describing a table."""
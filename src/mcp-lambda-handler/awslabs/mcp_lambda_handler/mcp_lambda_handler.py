@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import contextvars
 import functools
 import inspect
 import json
@@ -27,6 +29,7 @@ from awslabs.mcp_lambda_handler.types import (
     ServerInfo,
     TextContent,
 )
+from concurrent.futures import ThreadPoolExecutor
 from contextvars import ContextVar
 from enum import Enum
 from typing import (
@@ -36,6 +39,7 @@ from typing import (
     Generic,
     List,
     Optional,
+    Tuple,
     TypeVar,
     Union,
     get_args,
@@ -49,6 +53,9 @@ logger = logging.getLogger(__name__)
 # Context variable to store current session ID
 current_session_id: ContextVar[Optional[str]] = ContextVar('current_session_id', default=None)
 
+# Response header set when the session updates made by a request could not be written
+SESSION_WARNING_HEADER = 'MCP-Session-Warning'
+
 T = TypeVar('T')
 
 
@@ -80,6 +87,7 @@ class MCPLambdaHandler:
         name: str,
         version: str = '1.0.0',
         session_store: Optional[Union[SessionStore, str]] = None,
+        max_workers: int = 10,
     ):
         """Initialize the MCP handler.
 
@@ -90,10 +98,12 @@ class MCPLambdaHandler:
                          - None for no sessions
                          - A SessionStore instance
                          - A string for DynamoDB table name (for backwards compatibility)
+            max_workers: Maximum number of synchronous tools run concurrently in a batch
 
         """
         self.name = name
         self.version = version
+        self.max_workers = max_workers
         self.tools: Dict[str, Dict] = {}
         self.tool_implementations: Dict[str, Callable] = {}
 
@@ -260,6 +270,14 @@ class MCPLambdaHandler:
             self.tools[tool_name] = tool_schema
             self.tool_implementations[tool_name] = func
 
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    return await func(*args, **kwargs)
+
+                return async_wrapper
+
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
                 return func(*args, **kwargs)
@@ -268,6 +286,80 @@ class MCPLambdaHandler:
 
         return decorator
 
+    def _convert_arguments(self, tool_func: Callable, tool_args: Dict) -> Dict:
+        """Convert enum string values to enum objects."""
+        converted_args = {}
+        hints = get_type_hints(tool_func)
+
+        for arg_name, arg_value in tool_args.items():
+            arg_type = hints.get(arg_name)
+            if isinstance(arg_type, type) and issubclass(arg_type, Enum):
+                converted_args[arg_name] = arg_type(arg_value)
+            else:
+                converted_args[arg_name] = arg_value
+        return converted_args
+
+    def _execute_tool(self, tool_name: str, tool_args: Dict) -> Any:
+        """Execute a tool, running it on an event loop if it is a coroutine function."""
+        tool_func = self.tool_implementations[tool_name]
+        result = tool_func(**self._convert_arguments(tool_func, tool_args))
+        if inspect.iscoroutine(result):
+            result = asyncio.run(result)
+        return result
+
+    def _execute_tools(self, calls: List[Tuple[str, Dict]]) -> List[Any]:
+        """Execute tool calls concurrently.
+
+        Coroutine functions run together on one event loop and other tools in a thread
+        pool, each in a copy of the current context so that they see the session.
+
+        Returns:
+            The result of each call, or the exception it raised, in order
+
+        """
+
+        async def execute_all() -> List[Any]:
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(calls))) as pool:
+
+                async def execute(tool_name: str, tool_args: Dict) -> Any:
+                    tool_func = self.tool_implementations[tool_name]
+                    converted_args = self._convert_arguments(tool_func, tool_args)
+                    if inspect.iscoroutinefunction(tool_func):
+                        return await tool_func(**converted_args)
+                    context = contextvars.copy_context()
+                    return await loop.run_in_executor(
+                        pool, functools.partial(context.run, tool_func, **converted_args)
+                    )
+
+                return await asyncio.gather(
+                    *(execute(tool_name, tool_args) for tool_name, tool_args in calls),
+                    return_exceptions=True,
+                )
+
+        return asyncio.run(execute_all())
+
+    def _tool_response(
+        self,
+        tool_name: str,
+        outcome: Any,
+        request_id: Optional[str],
+        session_id: Optional[str] = None,
+    ) -> Dict:
+        """Create the response to a tool call from its result or the exception it raised."""
+        if isinstance(outcome, Exception):
+            logger.error(f'Error executing tool {tool_name}: {outcome}')
+            error_content = [ErrorContent(text=str(outcome)).model_dump()]
+            return self._create_error_response(
+                -32603,
+                f'Error executing tool: {str(outcome)}',
+                request_id,
+                error_content,
+                session_id,
+            )
+        content = [TextContent(text=str(outcome)).model_dump()]
+        return self._create_success_response({'content': content}, request_id, session_id)
+
     def _create_error_response(
         self,
         code: int,
@@ -316,7 +408,113 @@ class MCPLambdaHandler:
 
         return {'statusCode': 200, 'body': response.model_dump_json(), 'headers': headers}
 
+    @staticmethod
+    def _validate_batch_member(message: Any) -> Optional[JSONRPCRequest]:
+        """Return the request of a batch member, or None if it is not a valid request."""
+        if (
+            not isinstance(message, dict)
+            or message.get('jsonrpc') != '2.0'
+            or not isinstance(message.get('method'), str)
+            or not isinstance(message.get('id'), (str, int))
+            or isinstance(message.get('id'), bool)
+            or not isinstance(message.get('params', {}), (dict, type(None)))
+        ):
+            return None
+        try:
+            return JSONRPCRequest.model_validate(message)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _handle_batch(self, messages: List[Any], session_id: Optional[str]) -> Dict:
+        """Handle a JSON-RPC batch, executing its tool calls concurrently.
+
+        The session is validated once for the whole batch. Notifications get no
+        response; the responses to the other messages are returned in one array.
+        """
+        if not messages:
+            return self._create_error_response(-32600, 'Invalid Request')
+
+        if session_id:
+            if self.session_store.get_session(session_id) is None:
+                return self._create_error_response(
+                    -32000, 'Invalid or expired session', status_code=404
+                )
+        elif not isinstance(self.session_store, NoOpSessionStore):
+            return self._create_error_response(-32000, 'Session required', status_code=400)
+
+        responses: List[Optional[Dict]] = [None] * len(messages)
+        calls: List[Tuple[int, Optional[str], str, Dict]] = []
+        for index, message in enumerate(messages):
+            # Notifications get no response
+            if isinstance(message, dict) and 'id' not in message:
+                continue
+            request = self._validate_batch_member(message)
+            if request is None:
+                # A malformed member only fails its own entry of the batch
+                request_id = None
+                if isinstance(message, dict) and isinstance(message.get('id'), (str, int)):
+                    request_id = message['id']
+                responses[index] = self._create_error_response(
+                    -32600, 'Invalid Request', request_id
+                )
+                continue
+
+            if request.method == 'initialize':
+                responses[index] = self._create_error_response(
+                    -32600, 'initialize must not be part of a batch', request.id
+                )
+            elif request.method == 'tools/list':
+                responses[index] = self._create_success_response(
+                    {'tools': list(self.tools.values())}, request.id
+                )
+            elif request.method == 'tools/call' and request.params:
+                tool_name = request.params.get('name')
+                if tool_name in self.tools:
+                    tool_args = request.params.get('arguments', {})
+                    calls.append((index, request.id, tool_name, tool_args))
+                else:
+                    responses[index] = self._create_error_response(
+                        -32601, f"Tool '{tool_name}' not found", request.id
+                    )
+            elif request.method == 'ping':
+                responses[index] = self._create_success_response({}, request.id)
+            else:
+                responses[index] = self._create_error_response(
+                    -32601, f'Method not found: {request.method}', request.id
+                )
+
+        if calls:
+            logger.info(f'Executing {len(calls)} tool calls from a batch')
+            outcomes = self._execute_tools([(name, args) for _, _, name, args in calls])
+            for (index, request_id, tool_name, _), outcome in zip(calls, outcomes):
+                responses[index] = self._tool_response(tool_name, outcome, request_id)
+
+        headers = {'Content-Type': 'application/json', 'MCP-Version': '0.6'}
+        if session_id:
+            headers['MCP-Session-Id'] = session_id
+
+        bodies = [response['body'] for response in responses if response is not None]
+        if not bodies:
+            # Only notifications
+            return {'statusCode': 202, 'body': '', 'headers': headers}
+        return {'statusCode': 200, 'body': f'[{",".join(bodies)}]', 'headers': headers}
+
     def handle_request(self, event: Dict, context: Any) -> Dict:
+        """Handle an incoming Lambda request.
+
+        Session updates made while handling the request are written once it is handled.
+        If they cannot be written, e.g. because a concurrent request changed the same
+        session keys, they are discarded and the response carries a SESSION_WARNING_HEADER.
+        """
+        with self.session_store.write_behind():
+            response = self._handle_request(event, context)
+            if not self.session_store.flush():
+                response.setdefault('headers', {})[SESSION_WARNING_HEADER] = (
+                    'Session updates of this request were discarded'
+                )
+            return response
+
+    def _handle_request(self, event: Dict, context: Any) -> Dict:
         """Handle an incoming Lambda request."""
         request_id = None
         session_id = None
@@ -351,6 +549,11 @@ class MCPLambdaHandler:
             try:
                 body = json.loads(event['body'])
                 logger.debug(f'Parsed request body: {body}')
+
+                # Handle batch requests
+                if isinstance(body, list):
+                    return self._handle_batch(body, session_id)
+
                 request_id = body.get('id') if isinstance(body, dict) else None
 
                 # Check if this is a notification (no id field)
@@ -422,33 +625,10 @@ class MCPLambdaHandler:
                     )
 
                 try:
-                    # Convert enum string values to enum objects
-                    converted_args = {}
-                    tool_func = self.tool_implementations[tool_name]
-                    hints = get_type_hints(tool_func)
-
-                    for arg_name, arg_value in tool_args.items():
-                        arg_type = hints.get(arg_name)
-                        if isinstance(arg_type, type) and issubclass(arg_type, Enum):
-                            converted_args[arg_name] = arg_type(arg_value)
-                        else:
-                            converted_args[arg_name] = arg_value
-
-                    result = tool_func(**converted_args)
-                    content = [TextContent(text=str(result)).model_dump()]
-                    return self._create_success_response(
-                        {'content': content}, request.id, session_id
-                    )
+                    outcome = self._execute_tool(tool_name, tool_args)
                 except Exception as e:
-                    logger.error(f'Error executing tool {tool_name}: {e}')
-                    error_content = [ErrorContent(text=str(e)).model_dump()]
-                    return self._create_error_response(
-                        -32603,
-                        f'Error executing tool: {str(e)}',
-                        request.id,
-                        error_content,
-                        session_id,
-                    )
+                    outcome = e
+                return self._tool_response(tool_name, outcome, request.id, session_id)
 
             # Handle pings
             if request.method == 'ping':
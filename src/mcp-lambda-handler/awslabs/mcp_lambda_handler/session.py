@@ -15,15 +15,39 @@
 """Session management for MCP server with pluggable storage."""
 
 import boto3
+import copy
+import dataclasses
 import logging
+import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from botocore.exceptions import ClientError
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Set
 
 
 logger = logging.getLogger(__name__)
 
+# Attribute incremented by every write of a session, for optimistic concurrency
+VERSION_ATTRIBUTE = 'version'
+
+# Above this many changed keys the whole session data map is written at once
+MAX_ATTRIBUTE_UPDATES = 100
+
+_MISSING = object()
+
+
+def _changed_keys(before: Dict[str, Any], after: Dict[str, Any]) -> Set[str]:
+    """Return the keys added, changed or removed between two versions of session data."""
+    return {
+        key
+        for key in before.keys() | after.keys()
+        if before.get(key, _MISSING) != after.get(key, _MISSING)
+    }
+
 
 class SessionStore(ABC):
     """Abstract base class for session storage implementations."""
@@ -81,6 +105,23 @@ class SessionStore(ABC):
         """
         pass
 
+    @contextmanager
+    def write_behind(self) -> Iterator[None]:
+        """Defer the session writes made within the block to its end.
+
+        Stores write immediately unless they override this.
+        """
+        yield
+
+    def flush(self) -> bool:
+        """Write the updates deferred in the current write_behind block.
+
+        Returns:
+            True if every update was written, False if any update was discarded
+
+        """
+        return True
+
 
 class NoOpSessionStore(SessionStore):
     """A no-op session store that doesn't actually store sessions."""
@@ -102,19 +143,220 @@ class NoOpSessionStore(SessionStore):
         return True
 
 
+@dataclass
+class _CachedSession:
+    """A session as last read from or written to DynamoDB, and its unwritten changes."""
+
+    data: Dict[str, Any]
+    version: Optional[int]
+    expires_at: float
+    has_data: bool
+    loaded_at: float
+    pending: Optional[Dict[str, Any]] = None
+
+
 class DynamoDBSessionStore(SessionStore):
     """Manages MCP sessions using DynamoDB."""
 
-    def __init__(self, table_name: str = 'mcp_sessions'):
+    def __init__(self, table_name: str = 'mcp_sessions', cache_ttl: float = 0):
         """Initialize the session store.
 
         Args:
             table_name: Name of DynamoDB table to use for sessions
+            cache_ttl: Seconds sessions stay cached in memory across requests handled by
+                the same (warm) Lambda container. With 0, sessions are only cached
+                within a write_behind block.
 
         """
         self.table_name = table_name
+        self.cache_ttl = cache_ttl
         self.dynamodb = boto3.resource('dynamodb')
         self.table = self.dynamodb.Table(table_name)  # pyright: ignore [reportAttributeAccessIssue]
+        self._cache: Dict[str, _CachedSession] = {}
+        self._lock = threading.Lock()
+        # Sessions used in the current write_behind block, shared with the threads it starts
+        self._scope: ContextVar[Optional[Dict[str, _CachedSession]]] = ContextVar(
+            f'session_scope_{id(self)}', default=None
+        )
+
+    @contextmanager
+    def write_behind(self) -> Iterator[None]:
+        """Cache sessions and defer their writes until the end of the block.
+
+        Each session used within the block is read from DynamoDB once, and its updates
+        are kept in memory, then written on exit by a single conditional update of the
+        changed keys only (see flush).
+        """
+        if self._scope.get() is not None:
+            yield
+            return
+        token = self._scope.set({})
+        try:
+            yield
+        finally:
+            try:
+                self.flush()
+            finally:
+                self._scope.reset(token)
+
+    def flush(self) -> bool:
+        """Write the session updates made in the current write_behind block.
+
+        Only the keys of the session data that changed are written, on condition that
+        the version of the session is still the one read. If another request updated
+        the session in between, the update is retried once against its new version,
+        unless that request changed the same keys. Then, as on any other write error,
+        the update is discarded: it is logged, the session is evicted from the cache and
+        False is returned.
+
+        Returns:
+            True if every update was written, False if any update was discarded
+
+        """
+        scope = self._scope.get()
+        if not scope:
+            return True
+        with self._lock:
+            dirty = [
+                (sid, entry, entry.pending)
+                for sid, entry in scope.items()
+                if entry.pending is not None
+            ]
+
+        success = True
+        for session_id, entry, pending in dirty:
+            try:
+                self._flush_session(session_id, entry, pending)
+            except Exception as e:
+                logger.error(f'Error updating session {session_id}: {e}')
+                self._evict(session_id)
+                success = False
+        return success
+
+    def _flush_session(
+        self, session_id: str, entry: _CachedSession, pending: Dict[str, Any]
+    ) -> None:
+        """Write the pending changes of a session, retrying once on a version conflict."""
+        try:
+            self._write_changes(session_id, entry, pending)
+            return
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+
+        changed = _changed_keys(entry.data, pending)
+        current = self._load(session_id)
+        if current is None:
+            raise ValueError('Session was deleted')
+        conflicts = sorted(
+            key
+            for key in changed
+            if current.data.get(key, _MISSING) != entry.data.get(key, _MISSING)
+        )
+        if conflicts:
+            raise ValueError(f'Session was modified concurrently, conflicting keys: {conflicts}')
+
+        # Apply the changes on top of the session as now stored
+        merged = dict(current.data)
+        for key in changed:
+            if key in pending:
+                merged[key] = pending[key]
+            else:
+                merged.pop(key, None)
+        self._write_changes(session_id, current, merged)
+        entry.data, entry.version, entry.has_data = current.data, current.version, True
+        entry.pending = None
+
+    def _write_changes(
+        self, session_id: str, entry: _CachedSession, pending: Dict[str, Any]
+    ) -> None:
+        """Write the changes from entry.data to pending if the version did not change."""
+        changed = _changed_keys(entry.data, pending)
+        if changed:
+            names = {'#data': 'data', '#version': VERSION_ATTRIBUTE}
+            values: Dict[str, Any] = {':one': 1}
+            updates, removes = [], []
+            if not entry.has_data or len(changed) > MAX_ATTRIBUTE_UPDATES:
+                updates.append('#data = :data')
+                values[':data'] = pending
+            else:
+                for i, key in enumerate(sorted(changed)):
+                    names[f'#k{i}'] = key
+                    if key in pending:
+                        updates.append(f'#data.#k{i} = :v{i}')
+                        values[f':v{i}'] = pending[key]
+                    else:
+                        removes.append(f'#data.#k{i}')
+
+            expression = 'ADD #version :one'
+            if removes:
+                expression = f'REMOVE {", ".join(removes)} {expression}'
+            if updates:
+                expression = f'SET {", ".join(updates)} {expression}'
+            if entry.version is None:
+                condition = 'attribute_exists(session_id) AND attribute_not_exists(#version)'
+            else:
+                condition = 'attribute_exists(session_id) AND #version = :version'
+                values[':version'] = entry.version
+
+            self.table.update_item(
+                Key={'session_id': session_id},
+                UpdateExpression=expression,
+                ConditionExpression=condition,
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+            )
+            entry.version = (entry.version or 0) + 1
+            entry.has_data = True
+
+        entry.data, entry.pending = pending, None
+        if self.cache_ttl > 0:
+            with self._lock:
+                self._cache[session_id] = dataclasses.replace(entry, loaded_at=time.time())
+
+    def _load(self, session_id: str) -> Optional[_CachedSession]:
+        """Read a session from DynamoDB."""
+        response = self.table.get_item(Key={'session_id': session_id})
+        item = response.get('Item')
+        if not item:
+            return None
+        return _CachedSession(
+            data=item.get('data', {}),
+            version=item.get(VERSION_ATTRIBUTE),
+            expires_at=item.get('expires_at', 0),
+            has_data='data' in item,
+            loaded_at=time.time(),
+        )
+
+    def _entry(self, session_id: str) -> Optional[_CachedSession]:
+        """Get a session from the current write_behind block, the cache, or DynamoDB."""
+        scope = self._scope.get()
+        with self._lock:
+            if scope is not None and session_id in scope:
+                return scope[session_id]
+            entry = self._cache.get(session_id)
+
+        if entry is None or time.time() - entry.loaded_at >= self.cache_ttl:
+            entry = self._load(session_id)
+            if entry is None:
+                self._evict(session_id)
+                return None
+            if self.cache_ttl > 0:
+                with self._lock:
+                    self._cache[session_id] = entry
+
+        if scope is not None:
+            with self._lock:
+                # Another thread of the block may have read the session meanwhile
+                entry = scope.setdefault(session_id, dataclasses.replace(entry))
+        return entry
+
+    def _evict(self, session_id: str) -> None:
+        scope = self._scope.get()
+        with self._lock:
+            self._cache.pop(session_id, None)
+            if scope is not None:
+                scope.pop(session_id, None)
 
     def create_session(self, session_data: Optional[Dict[str, Any]] = None) -> str:
         """Create a new session.
@@ -138,6 +380,7 @@ class DynamoDBSessionStore(SessionStore):
             'expires_at': expires_at,
             'created_at': int(time.time()),
             'data': session_data or {},
+            VERSION_ATTRIBUTE: 0,
         }
 
         self.table.put_item(Item=item)
@@ -156,18 +399,19 @@ class DynamoDBSessionStore(SessionStore):
 
         """
         try:
-            response = self.table.get_item(Key={'session_id': session_id})
-            item = response.get('Item')
+            entry = self._entry(session_id)
 
-            if not item:
+            if entry is None:
                 return None
 
             # Check if session has expired
-            if item.get('expires_at', 0) < time.time():
+            if entry.expires_at < time.time():
                 self.delete_session(session_id)
                 return None
 
-            return item.get('data', {})
+            data = entry.pending if entry.pending is not None else entry.data
+            # Callers must not change the cached data without update_session
+            return copy.deepcopy(data)
 
         except Exception as e:
             logger.error(f'Error getting session {session_id}: {e}')
@@ -176,6 +420,9 @@ class DynamoDBSessionStore(SessionStore):
     def update_session(self, session_id: str, session_data: Dict[str, Any]) -> bool:
         """Update session data.
 
+        Within a write_behind block the update is kept in memory until the block ends,
+        otherwise it is written immediately.
+
         Args:
             session_id: The session ID to update
             session_data: New session data
@@ -185,11 +432,21 @@ class DynamoDBSessionStore(SessionStore):
 
         """
         try:
+            if self._scope.get() is not None:
+                entry = self._entry(session_id)
+                if entry is None:
+                    logger.error(f'Error updating session {session_id}: session not found')
+                    return False
+                with self._lock:
+                    entry.pending = copy.deepcopy(session_data)
+                return True
+
+            self._evict(session_id)
             self.table.update_item(
                 Key={'session_id': session_id},
-                UpdateExpression='SET #data = :data',
-                ExpressionAttributeNames={'#data': 'data'},
-                ExpressionAttributeValues={':data': session_data},
+                UpdateExpression='SET #data = :data ADD #version :one',
+                ExpressionAttributeNames={'#data': 'data', '#version': VERSION_ATTRIBUTE},
+                ExpressionAttributeValues={':data': session_data, ':one': 1},
             )
             return True
         except Exception as e:
@@ -207,6 +464,7 @@ class DynamoDBSessionStore(SessionStore):
 
         """
         try:
+            self._evict(session_id)
             self.table.delete_item(Key={'session_id': session_id})
             logger.info(f'Deleted session {session_id}')
             return True
@@ -1,8 +1,14 @@
+import asyncio
 import json
 import pytest
+import threading
 import time
 import typing
-from awslabs.mcp_lambda_handler.mcp_lambda_handler import MCPLambdaHandler, SessionData
+from awslabs.mcp_lambda_handler.mcp_lambda_handler import (
+    SESSION_WARNING_HEADER,
+    MCPLambdaHandler,
+    SessionData,
+)
 from awslabs.mcp_lambda_handler.session import DynamoDBSessionStore, NoOpSessionStore
 from awslabs.mcp_lambda_handler.types import (
     Capabilities,
@@ -15,6 +21,7 @@ from awslabs.mcp_lambda_handler.types import (
     ServerInfo,
     TextContent,
 )
+from botocore.exceptions import ClientError
 from typing import Dict, List, Optional
 from unittest.mock import MagicMock, patch
 
@@ -783,3 +790,337 @@ def test_dynamodb_delete_session_exception():
         store = DynamoDBSessionStore('tbl')
         mock_table.delete_item.side_effect = Exception('fail')
         assert store.delete_session('sid') is False
+
+
+def test_handle_request_async_tool():
+    """Test that an async tool is awaited."""
+    handler = MCPLambdaHandler('test-server')
+
+    @handler.tool()
+    async def async_hello(name: str) -> str:
+        """Say hello asynchronously."""
+        await asyncio.sleep(0)
+        return f'Hello {name}!'
+
+    req = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'tools/call',
+        'params': {'name': 'asyncHello', 'arguments': {'name': 'Ana'}},
+    }
+    resp = handler.handle_request(make_lambda_event(req), None)
+    body = json.loads(resp['body'])
+    assert body['result']['content'][0]['text'] == 'Hello Ana!'
+
+
+def test_handle_request_batch():
+    """Test a batch mixing tool calls, a ping, a notification and invalid messages."""
+    handler = MCPLambdaHandler('test-server')
+    # Both sync tools must run at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    @handler.tool()
+    def sync_tool(value: int) -> int:
+        """Double a value."""
+        barrier.wait()
+        return value * 2
+
+    @handler.tool()
+    async def async_tool(value: int) -> int:
+        """Increment a value."""
+        await asyncio.sleep(0)
+        return value + 1
+
+    @handler.tool()
+    def fail_tool():
+        """Fail."""
+        raise ValueError('fail!')
+
+    def call(request_id, name, arguments=None):
+        return {
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'method': 'tools/call',
+            'params': {'name': name, 'arguments': arguments or {}},
+        }
+
+    batch = [
+        call(1, 'syncTool', {'value': 1}),
+        call(2, 'asyncTool', {'value': 1}),
+        {'jsonrpc': '2.0', 'method': 'notifications/initialized'},
+        call(3, 'syncTool', {'value': 2}),
+        {'jsonrpc': '2.0', 'id': 4, 'method': 'ping'},
+        call(5, 'failTool'),
+        call(6, 'missingTool'),
+        {'jsonrpc': '2.0', 'id': 7, 'method': 'unknown'},
+        {'id': 8},
+        {'jsonrpc': '2.0', 'id': 9, 'method': 'initialize'},
+        {'jsonrpc': '2.0', 'id': [10], 'method': 'ping'},
+        {'jsonrpc': '2.0', 'id': 11, 'method': 'tools/call', 'params': 'syncTool'},
+    ]
+    resp = handler.handle_request(make_lambda_event(json.dumps(batch)), None)
+
+    assert resp['statusCode'] == 200
+    body = json.loads(resp['body'])
+    assert [r['id'] for r in body] == [1, 2, 3, 4, 5, 6, 7, 8, 9, None, 11]
+    assert [r['result']['content'][0]['text'] for r in body[:3]] == ['2', '2', '4']
+    assert body[3]['result'] == {}
+    assert body[4]['error']['code'] == -32603
+    assert body[4]['errorContent'][0]['text'] == 'fail!'
+    assert [r['error']['code'] for r in body[5:]] == [-32601, -32601, -32600, -32600] + [
+        -32600
+    ] * 2
+
+
+def test_handle_request_batch_session():
+    """Test that the session is validated once and visible to tools in a batch."""
+    store = MagicMock(spec=DynamoDBSessionStore)
+    store.get_session.return_value = {'user': 'Ana'}
+    handler = MCPLambdaHandler('test-server', session_store=store)
+
+    @handler.tool()
+    def whoami() -> str:
+        """Return the user of the session."""
+        session = handler.get_session()
+        assert session is not None
+        return session.get('user')
+
+    @handler.tool()
+    async def async_whoami() -> str:
+        """Return the user of the session."""
+        session = handler.get_session()
+        assert session is not None
+        return session.get('user')
+
+    batch = [
+        {'jsonrpc': '2.0', 'id': i, 'method': 'tools/call', 'params': {'name': name}}
+        for i, name in enumerate(['whoami', 'asyncWhoami'])
+    ]
+    event = make_lambda_event(json.dumps(batch))
+    event['headers']['mcp-session-id'] = 'sid123'
+    resp = handler.handle_request(event, None)
+
+    assert resp['headers']['MCP-Session-Id'] == 'sid123'
+    assert [r['result']['content'][0]['text'] for r in json.loads(resp['body'])] == ['Ana'] * 2
+
+    store.get_session.return_value = None
+    resp = handler.handle_request(event, None)
+    assert resp['statusCode'] == 404
+
+    event['headers'].pop('mcp-session-id')
+    resp = handler.handle_request(event, None)
+    assert resp['statusCode'] == 400
+    assert json.loads(resp['body'])['error']['message'] == 'Session required'
+
+
+def test_handle_request_batch_empty_and_notifications():
+    """Test an empty batch and a batch of notifications only."""
+    handler = MCPLambdaHandler('test-server')
+
+    resp = handler.handle_request(make_lambda_event('[]'), None)
+    assert resp['statusCode'] == 400
+    assert json.loads(resp['body'])['error']['code'] == -32600
+
+    batch = [{'jsonrpc': '2.0', 'method': 'notifications/initialized'}]
+    resp = handler.handle_request(make_lambda_event(json.dumps(batch)), None)
+    assert resp['statusCode'] == 202
+    assert resp['body'] == ''
+
+
+def _conditional_check_failed():
+    return ClientError(
+        {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'failed'}},
+        'UpdateItem',
+    )
+
+
+@pytest.fixture
+def session_table():
+    """Patch boto3 with a table holding one session."""
+    with patch('boto3.resource') as mock_resource:
+        mock_table = MagicMock()
+        mock_resource.return_value.Table.return_value = mock_table
+        mock_table.get_item.return_value = {
+            'Item': {
+                'session_id': 'sid',
+                'expires_at': time.time() + 1000,
+                'data': {'a': 1, 'b': 2, 'c': 3},
+                'version': 4,
+            }
+        }
+        yield mock_table
+
+
+def test_dynamodb_session_store_write_behind(session_table):
+    """Test that sessions are read once and only changed keys written on exit."""
+    store = DynamoDBSessionStore('tbl')
+
+    with store.write_behind():
+        data = store.get_session('sid')
+        assert data is not None
+        data['a'] = 10
+        data.pop('b')
+        data['d'] = 4
+        assert store.update_session('sid', data) is True
+        assert store.get_session('sid') == {'a': 10, 'c': 3, 'd': 4}
+        session_table.update_item.assert_not_called()
+
+    session_table.get_item.assert_called_once()
+    session_table.update_item.assert_called_once_with(
+        Key={'session_id': 'sid'},
+        UpdateExpression='SET #data.#k0 = :v0, #data.#k2 = :v2 REMOVE #data.#k1 ADD #version :one',
+        ConditionExpression='attribute_exists(session_id) AND #version = :version',
+        ExpressionAttributeNames={
+            '#data': 'data',
+            '#version': 'version',
+            '#k0': 'a',
+            '#k1': 'b',
+            '#k2': 'd',
+        },
+        ExpressionAttributeValues={':one': 1, ':v0': 10, ':v2': 4, ':version': 4},
+    )
+
+    # Outside a block every read goes to DynamoDB
+    store.get_session('sid')
+    assert session_table.get_item.call_count == 2
+
+
+def test_dynamodb_session_store_write_behind_unchanged(session_table):
+    """Test that nothing is written when the session did not change."""
+    store = DynamoDBSessionStore('tbl')
+
+    with store.write_behind():
+        data = store.get_session('sid')
+        assert data is not None
+        store.update_session('sid', data)
+        session_table.get_item.return_value = {}
+        assert store.update_session('other', {'x': 1}) is False
+
+    session_table.update_item.assert_not_called()
+
+
+def test_dynamodb_session_store_write_behind_legacy_item(session_table):
+    """Test that the whole data map is written for sessions without data or version."""
+    session_table.get_item.return_value = {
+        'Item': {'session_id': 'sid', 'expires_at': time.time() + 1000}
+    }
+    store = DynamoDBSessionStore('tbl')
+
+    with store.write_behind():
+        store.update_session('sid', {'a': 1})
+
+    kwargs = session_table.update_item.call_args.kwargs
+    assert kwargs['UpdateExpression'] == 'SET #data = :data ADD #version :one'
+    assert kwargs['ConditionExpression'] == (
+        'attribute_exists(session_id) AND attribute_not_exists(#version)'
+    )
+    assert kwargs['ExpressionAttributeValues'][':data'] == {'a': 1}
+
+
+def test_dynamodb_session_store_write_behind_conflict(session_table):
+    """Test that a version conflict is retried unless the same keys changed."""
+    store = DynamoDBSessionStore('tbl')
+    session_table.update_item.side_effect = [_conditional_check_failed(), None]
+
+    with store.write_behind():
+        store.update_session('sid', {'a': 10, 'b': 2, 'c': 3})
+        # Another request changed c and bumped the version
+        session_table.get_item.return_value = {
+            'Item': {
+                'session_id': 'sid',
+                'expires_at': time.time() + 1000,
+                'data': {'a': 1, 'b': 2, 'c': 30},
+                'version': 5,
+            }
+        }
+
+    assert session_table.update_item.call_count == 2
+    retry = session_table.update_item.call_args.kwargs
+    assert retry['ExpressionAttributeValues'] == {':one': 1, ':v0': 10, ':version': 5}
+
+    # Another request changed the same key: the update is dropped
+    session_table.update_item.reset_mock()
+    session_table.update_item.side_effect = _conditional_check_failed()
+    with store.write_behind():
+        store.update_session('sid', {'a': 1, 'b': 2, 'c': 300})
+        session_table.get_item.return_value = {
+            'Item': {'session_id': 'sid', 'expires_at': time.time() + 1000, 'data': {'c': 31}}
+        }
+        assert store.flush() is False
+    session_table.update_item.assert_called_once()
+
+
+def test_dynamodb_session_store_cache_ttl(session_table):
+    """Test that sessions stay cached across blocks within the cache TTL."""
+    store = DynamoDBSessionStore('tbl', cache_ttl=60)
+
+    with store.write_behind():
+        store.update_session('sid', {'a': 10, 'b': 2, 'c': 3})
+    with store.write_behind():
+        assert store.get_session('sid') == {'a': 10, 'b': 2, 'c': 3}
+        store.update_session('sid', {'a': 11, 'b': 2, 'c': 3})
+
+    session_table.get_item.assert_called_once()
+    # The second write expects the version written by the first one
+    assert session_table.update_item.call_args.kwargs['ExpressionAttributeValues'][':version'] == 5
+
+    store.delete_session('sid')
+    store.get_session('sid')
+    assert session_table.get_item.call_count == 2
+
+
+def test_handle_request_flushes_session_once(session_table):
+    """Test that handle_request reads the session once and writes it once."""
+    handler = MCPLambdaHandler('test-server', session_store=DynamoDBSessionStore('tbl'))
+
+    @handler.tool()
+    def increment() -> int:
+        """Increment a counter in the session."""
+        handler.update_session(lambda s: s.set('a', s.get('a') + 1))
+        session = handler.get_session()
+        assert session is not None
+        return session.get('a')
+
+    req = {'jsonrpc': '2.0', 'id': 1, 'method': 'tools/call', 'params': {'name': 'increment'}}
+    event = make_lambda_event(req)
+    event['headers']['mcp-session-id'] = 'sid'
+    resp = handler.handle_request(event, None)
+
+    assert json.loads(resp['body'])['result']['content'][0]['text'] == '2'
+    session_table.get_item.assert_called_once()
+    session_table.update_item.assert_called_once()
+    assert session_table.update_item.call_args.kwargs['ExpressionAttributeValues'][':v0'] == 2
+
+
+def test_handle_request_warns_when_session_update_is_discarded(session_table):
+    """Test that a conflicting session update is reported in the response."""
+    handler = MCPLambdaHandler('test-server', session_store=DynamoDBSessionStore('tbl'))
+    session_table.update_item.side_effect = _conditional_check_failed()
+
+    @handler.tool()
+    def increment() -> int:
+        """Increment a counter in the session."""
+        handler.update_session(lambda s: s.set('a', s.get('a') + 1))
+        # Another request changes the same key meanwhile
+        session_table.get_item.return_value = {
+            'Item': {'session_id': 'sid', 'expires_at': time.time() + 1000, 'data': {'a': 7}}
+        }
+        session = handler.get_session()
+        assert session is not None
+        return session.get('a')
+
+    req = {'jsonrpc': '2.0', 'id': 1, 'method': 'tools/call', 'params': {'name': 'increment'}}
+    event = make_lambda_event(req)
+    event['headers']['mcp-session-id'] = 'sid'
+    resp = handler.handle_request(event, None)
+
+    assert json.loads(resp['body'])['result']['content'][0]['text'] == '2'
+    assert resp['headers'][SESSION_WARNING_HEADER] == (
+        'Session updates of this request were discarded'
+    )
+    session_table.update_item.assert_called_once()
+
+    # Without a conflict no warning is added
+    session_table.update_item.side_effect = None
+    resp = handler.handle_request(event, None)
+    assert SESSION_WARNING_HEADER not in resp['headers']
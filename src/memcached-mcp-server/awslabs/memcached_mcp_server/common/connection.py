@@ -16,26 +16,54 @@
 
 import os
 import ssl
+import time
 from pymemcache.client.base import Client
+from pymemcache.client.hash import HashClient
 from pymemcache.client.retrying import RetryingClient
 from pymemcache.exceptions import MemcacheError
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+def parse_servers(servers: str) -> List[Tuple[str, int]]:
+    """Parse a comma-separated list of host:port memcached nodes.
+
+    Args:
+        servers: Nodes such as 'node1:11211,node2:11211'; the port defaults to 11211
+
+    Returns:
+        List of (host, port) tuples
+    """
+    nodes = []
+    for server in servers.split(','):
+        server = server.strip()
+        if not server:
+            continue
+        host, _, port = server.rpartition(':') if ':' in server else (server, '', '11211')
+        nodes.append((host, int(port)))
+    return nodes
 
 
 class MemcachedConnectionManager:
     """Manages connection to Memcached."""
 
-    _client: Optional[RetryingClient] = None
+    _client: Optional[Union[RetryingClient, HashClient]] = None
 
     @classmethod
-    def get_connection(cls) -> RetryingClient:
+    def get_connection(cls) -> Union[RetryingClient, HashClient]:
         """Get or create a Memcached client connection.
 
+        When MEMCACHED_SERVERS lists several nodes, keys are distributed across them
+        with consistent (rendezvous) hashing by a HashClient keeping a connection pool
+        per node. A node failing MEMCACHED_MAX_RETRIES times in a row is ejected from
+        the ring for MEMCACHED_DEAD_TIMEOUT seconds, then tried again.
+
         Returns:
-            RetryingClient: A Memcached client with retry capabilities
+            RetryingClient: A Memcached client with retry capabilities, or a HashClient
+                in multi-node mode
         """
         if cls._client is None:
             # Get configuration from environment
+            servers = parse_servers(os.getenv('MEMCACHED_SERVERS', ''))
             host = os.getenv('MEMCACHED_HOST', '127.0.0.1')
             port = int(os.getenv('MEMCACHED_PORT', '11211'))
             timeout = float(os.getenv('MEMCACHED_TIMEOUT', '1'))
@@ -65,25 +93,41 @@ class MemcachedConnectionManager:
                 if tls_cert_path and tls_key_path:
                     tls_context.load_cert_chain(tls_cert_path, tls_key_path)
 
-            # Create base client
-            client_kwargs: Dict[str, Any] = {
-                'server': (host, port),
-                'timeout': timeout,
-                'connect_timeout': connect_timeout,
-                'no_delay': True,  # Disable Nagle's algorithm
-            }
-            if tls_context:
-                client_kwargs['tls_context'] = tls_context
-
-            base_client = Client(**client_kwargs)
-
-            # Wrap with retry capabilities
-            cls._client = RetryingClient(
-                base_client,
-                attempts=max_retries,
-                retry_delay=int(retry_timeout),
-                retry_for=[MemcacheError],
-            )
+            if servers:
+                hash_kwargs: Dict[str, Any] = {
+                    'timeout': timeout,
+                    'connect_timeout': connect_timeout,
+                    'no_delay': True,  # Disable Nagle's algorithm
+                    'use_pooling': True,
+                    'max_pool_size': int(os.getenv('MEMCACHED_MAX_POOL_SIZE', '10')),
+                    'retry_attempts': max_retries,
+                    'retry_timeout': retry_timeout,
+                    'dead_timeout': float(os.getenv('MEMCACHED_DEAD_TIMEOUT', '60')),
+                }
+                if tls_context:
+                    hash_kwargs['tls_context'] = tls_context
+
+                cls._client = HashClient(servers, **hash_kwargs)
+            else:
+                # Create base client
+                client_kwargs: Dict[str, Any] = {
+                    'server': (host, port),
+                    'timeout': timeout,
+                    'connect_timeout': connect_timeout,
+                    'no_delay': True,  # Disable Nagle's algorithm
+                }
+                if tls_context:
+                    client_kwargs['tls_context'] = tls_context
+
+                base_client = Client(**client_kwargs)
+
+                # Wrap with retry capabilities
+                cls._client = RetryingClient(
+                    base_client,
+                    attempts=max_retries,
+                    retry_delay=int(retry_timeout),
+                    retry_for=[MemcacheError],
+                )
 
         return cls._client
 
@@ -93,3 +137,43 @@ class MemcachedConnectionManager:
         if cls._client is not None:
             cls._client.close()
             cls._client = None
+
+    @classmethod
+    def get_node_clients(cls) -> Dict[str, Any]:
+        """Get a client for each memcached node, keyed by 'host:port'.
+
+        Returns:
+            Dict mapping each node to the client talking to it only
+        """
+        client = cls.get_connection()
+        if isinstance(client, HashClient):
+            return dict(client.clients)
+        host = os.getenv('MEMCACHED_HOST', '127.0.0.1')
+        port = os.getenv('MEMCACHED_PORT', '11211')
+        return {f'{host}:{port}': client}
+
+    @classmethod
+    def get_node_status(cls) -> Dict[str, Dict[str, Any]]:
+        """Get the health of each memcached node as tracked by the client.
+
+        Returns:
+            Dict mapping each node to its status: healthy, failing (with the number of
+            failed attempts) or ejected (with the seconds until it is tried again)
+        """
+        client = cls.get_connection()
+        if not isinstance(client, HashClient):
+            return {node: {'status': 'healthy'} for node in cls.get_node_clients()}
+
+        now = time.time()
+        status: Dict[str, Dict[str, Any]] = {}
+        for node, node_client in client.clients.items():
+            server = node_client.server
+            if server in client._dead_clients:
+                retry_in = client.dead_timeout - (now - client._dead_clients[server])
+                status[node] = {'status': 'ejected', 'retry_in': max(0, round(retry_in, 1))}
+            elif server in client._failed_clients:
+                attempts = client._failed_clients[server]['attempts']
+                status[node] = {'status': 'failing', 'failed_attempts': attempts}
+            else:
+                status[node] = {'status': 'healthy'}
+        return status
@@ -17,7 +17,7 @@
 import argparse
 from awslabs.memcached_mcp_server.common.server import mcp
 from awslabs.memcached_mcp_server.context import Context
-from awslabs.memcached_mcp_server.tools import cache  # noqa: F401
+from awslabs.memcached_mcp_server.tools import analytics, cache  # noqa: F401
 from loguru import logger
 from starlette.requests import Request  # noqa: F401
 from starlette.responses import Response
@@ -0,0 +1,297 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cache efficiency analytics for Memcached MCP Server."""
+
+import asyncio
+import socket
+import time
+import uuid
+from awslabs.memcached_mcp_server.common.connection import MemcachedConnectionManager
+from awslabs.memcached_mcp_server.common.server import mcp
+from collections import OrderedDict, defaultdict
+from pymemcache.exceptions import MemcacheError
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+
+# Snapshots kept for later comparison; the oldest one is dropped beyond this
+MAX_SNAPSHOTS = 10
+
+# Counters compared between two snapshots
+DELTA_COUNTERS = (
+    'cmd_get',
+    'cmd_set',
+    'get_hits',
+    'get_misses',
+    'evictions',
+    'expired_unfetched',
+    'evicted_unfetched',
+    'reclaimed',
+    'bytes_read',
+    'bytes_written',
+    'total_connections',
+)
+
+_snapshots: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+
+
+def _decode(stats: Dict[Any, Any]) -> Dict[str, Any]:
+    """Decode the byte keys and values returned by pymemcache stats."""
+    return {
+        (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+        for k, v in stats.items()
+    }
+
+
+def _ratio(part: float, total: float) -> Optional[float]:
+    return round(part / total, 4) if total else None
+
+
+def _slab_class_ids(items: Dict[str, Any]) -> List[int]:
+    """Return the ids of the slab classes holding items, from stats items."""
+    return sorted({int(key.split(':', 2)[1]) for key in items if key.startswith('items:')})
+
+
+def _metadump(client: Any, class_ids: List[int], max_keys: int) -> List[Tuple[str, int]]:
+    """List up to max_keys keys and their sizes with lru_crawler metadump.
+
+    Slab classes are dumped one at a time, so the response of a single class is held in
+    memory and no further class is dumped once max_keys keys are listed.
+    """
+    keys: List[Tuple[str, int]] = []
+    for class_id in class_ids:
+        response = client.raw_command(f'lru_crawler metadump {class_id}', 'END\r\n')
+        for line in response.decode().splitlines():
+            fields = dict(field.split('=', 1) for field in line.split() if '=' in field)
+            if 'key' not in fields:
+                continue
+            keys.append((unquote(fields['key']), int(fields.get('size', 0))))
+            if len(keys) >= max_keys:
+                return keys
+    return keys
+
+
+def _collect(client: Any, include_keys: bool, max_keys: int) -> Dict[str, Any]:
+    """Collect the statistics of one node, blocking on the server."""
+    node: Dict[str, Any] = {
+        'stats': _decode(client.stats()),
+        'slabs': _decode(client.stats('slabs')),
+        'items': _decode(client.stats('items')),
+    }
+    if include_keys:
+        try:
+            node['keys'] = _metadump(client, _slab_class_ids(node['items']), max_keys)
+        except MemcacheError as e:
+            # lru_crawler may be disabled on the server
+            node['keys_error'] = str(e)
+        except socket.timeout:
+            # A busy crawler answers BUSY without END, so the read waits for the timeout
+            node['keys_error'] = 'lru_crawler metadump timed out, the crawler may be busy'
+    return node
+
+
+def _summarize(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute hit ratio, eviction rate and memory usage from general stats."""
+    hits, misses = stats.get('get_hits', 0), stats.get('get_misses', 0)
+    uptime = stats.get('uptime', 0)
+    return {
+        'get_hits': hits,
+        'get_misses': misses,
+        'hit_ratio': _ratio(hits, hits + misses),
+        'evictions': stats.get('evictions', 0),
+        'evictions_per_second': round(stats.get('evictions', 0) / uptime, 4) if uptime else None,
+        'evicted_unfetched': stats.get('evicted_unfetched', 0),
+        'expired_unfetched': stats.get('expired_unfetched', 0),
+        'curr_items': stats.get('curr_items', 0),
+        'bytes': stats.get('bytes', 0),
+        'limit_maxbytes': stats.get('limit_maxbytes', 0),
+        'memory_usage': _ratio(stats.get('bytes', 0), stats.get('limit_maxbytes', 0)),
+        'uptime': uptime,
+    }
+
+
+def _slab_classes(slabs: Dict[str, Any], items: Dict[str, Any], top: int) -> Dict[str, Any]:
+    """Report memory and evictions per slab class and how skewed memory is across them."""
+    classes: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    for key, value in slabs.items():
+        slab, _, name = key.partition(':')
+        if slab.isdigit():
+            classes[slab][name] = value
+    for key, value in items.items():
+        _, slab, name = key.split(':', 2)
+        classes[slab]['items_' + name] = value
+
+    report = []
+    for slab, values in classes.items():
+        report.append(
+            {
+                'class': int(slab),
+                'chunk_size': values.get('chunk_size', 0),
+                'memory_bytes': values.get('chunk_size', 0) * values.get('total_chunks', 0),
+                'mem_requested': values.get('mem_requested', 0),
+                'items': values.get('items_number', 0),
+                'evicted': values.get('items_evicted', 0),
+                'evicted_unfetched': values.get('items_evicted_unfetched', 0),
+                'outofmemory': values.get('items_outofmemory', 0),
+                'oldest_item_age': values.get('items_age', 0),
+            }
+        )
+
+    memory = [c['memory_bytes'] for c in report if c['memory_bytes']]
+    return {
+        'total_malloced': slabs.get('total_malloced', 0),
+        'active_slabs': len(report),
+        # Largest class relative to the average one: 1 means evenly spread
+        'memory_skew': round(max(memory) / (sum(memory) / len(memory)), 2) if memory else None,
+        'top_by_memory': sorted(report, key=lambda c: c['memory_bytes'], reverse=True)[:top],
+        'top_by_evictions': [
+            c
+            for c in sorted(report, key=lambda c: c['evicted'], reverse=True)[:top]
+            if c['evicted']
+        ],
+    }
+
+
+def _key_distribution(
+    keys: List[Tuple[str, int]], delimiter: str, top: int
+) -> List[Dict[str, Any]]:
+    """Count keys and bytes per key prefix."""
+    prefixes: Dict[str, Dict[str, Any]] = {}
+    for key, size in keys:
+        prefix = key.split(delimiter, 1)[0] + delimiter if delimiter in key else '(none)'
+        entry = prefixes.setdefault(prefix, {'prefix': prefix, 'keys': 0, 'bytes': 0})
+        entry['keys'] += 1
+        entry['bytes'] += size
+    return sorted(prefixes.values(), key=lambda p: p['bytes'], reverse=True)[:top]
+
+
+def _deltas(before: Dict[str, Any], after: Dict[str, Any], elapsed: float) -> Dict[str, Any]:
+    """Compare the counters of two snapshots of one node."""
+    if after.get('uptime', 0) < before.get('uptime', 0):
+        return {'error': 'Node restarted since the baseline snapshot'}
+    changes = {name: after.get(name, 0) - before.get(name, 0) for name in DELTA_COUNTERS}
+    return {
+        'counters': changes,
+        'rates_per_second': {
+            name: round(change / elapsed, 4) if elapsed else None
+            for name, change in changes.items()
+        },
+        'hit_ratio': _ratio(changes['get_hits'], changes['get_hits'] + changes['get_misses']),
+    }
+
+
+@mcp.tool()
+async def cache_analytics(
+    baseline: Optional[str] = None,
+    include_keys: bool = False,
+    max_keys: int = 10000,
+    prefix_delimiter: str = ':',
+    top: int = 10,
+) -> str:
+    """Analyze cache efficiency across all nodes: hit ratios, evictions, slab and key skew.
+
+    Collects stats, stats slabs and stats items from every node concurrently and reports,
+    per node and overall, the hit ratio, eviction rate, memory usage, the slab classes
+    holding the most memory or evicting the most items, and how skewed memory is across
+    slab classes. Each report has a snapshot id; pass it as baseline to a later call to
+    get the change of counters and rates between the two snapshots, e.g. to diagnose an
+    eviction storm.
+
+    Args:
+        baseline: Snapshot id returned by a previous call to compare against
+        include_keys: Also list keys with lru_crawler metadump to report the key prefixes
+            using the most memory (the crawler must be enabled on the server). Warning:
+            this crawls the items of every slab class on each node and transfers their
+            metadata, which adds load on large caches; use a small max_keys there
+        max_keys: Maximum number of keys listed per node when include_keys is set; slab
+            classes are dumped one at a time until this many keys are listed
+        prefix_delimiter: Separator ending the prefix of a key
+        top: Number of slab classes and key prefixes listed
+
+    Returns:
+        Analytics report or error message
+    """
+    before = _snapshots.get(baseline) if baseline is not None else None
+    if baseline is not None and before is None:
+        return f"Snapshot '{baseline}' not found, it may have expired"
+
+    try:
+        nodes = MemcachedConnectionManager.get_node_clients()
+        collected = await asyncio.gather(
+            *(asyncio.to_thread(_collect, c, include_keys, max_keys) for c in nodes.values()),
+            return_exceptions=True,
+        )
+    except MemcacheError as e:
+        return f'Error collecting stats: {str(e)}'
+
+    taken_at = time.time()
+    report_nodes: Dict[str, Any] = {}
+    stats_by_node: Dict[str, Dict[str, Any]] = {}
+    for node, data in zip(nodes, collected):
+        if isinstance(data, BaseException):
+            report_nodes[node] = {'error': str(data)}
+            continue
+        stats_by_node[node] = data['stats']
+        report_nodes[node] = {
+            'summary': _summarize(data['stats']),
+            'slabs': _slab_classes(data['slabs'], data['items'], top),
+        }
+        if 'keys' in data:
+            report_nodes[node]['key_prefixes'] = _key_distribution(
+                data['keys'], prefix_delimiter, top
+            )
+        elif 'keys_error' in data:
+            report_nodes[node]['key_prefixes'] = {'error': data['keys_error']}
+
+    totals = {
+        name: sum(s.get(name, 0) for s in stats_by_node.values())
+        for name in (
+            'get_hits',
+            'get_misses',
+            'evictions',
+            'curr_items',
+            'bytes',
+            'limit_maxbytes',
+        )
+    }
+    overall = {
+        **totals,
+        'hit_ratio': _ratio(totals['get_hits'], totals['get_hits'] + totals['get_misses']),
+        'memory_usage': _ratio(totals['bytes'], totals['limit_maxbytes']),
+        # Share of the items held by each node, to spot an unbalanced hash ring
+        'item_share': {
+            node: _ratio(stats.get('curr_items', 0), totals['curr_items'])
+            for node, stats in stats_by_node.items()
+        },
+    }
+
+    snapshot_id = uuid.uuid4().hex[:12]
+    _snapshots[snapshot_id] = {'taken_at': taken_at, 'stats': stats_by_node}
+    while len(_snapshots) > MAX_SNAPSHOTS:
+        _snapshots.popitem(last=False)
+
+    report: Dict[str, Any] = {'snapshot': snapshot_id, 'overall': overall, 'nodes': report_nodes}
+    if before is not None:
+        elapsed = taken_at - before['taken_at']
+        report['deltas'] = {
+            'baseline': baseline,
+            'elapsed_seconds': round(elapsed, 1),
+            'nodes': {
+                node: _deltas(before['stats'][node], stats, elapsed)
+                for node, stats in stats_by_node.items()
+                if node in before['stats']
+            },
+        }
+    return str(report)
@@ -14,11 +14,48 @@
 
 """Cache operations for Memcached MCP Server."""
 
+import asyncio
 from awslabs.memcached_mcp_server.common.connection import MemcachedConnectionManager
 from awslabs.memcached_mcp_server.common.server import mcp
 from awslabs.memcached_mcp_server.context import Context
+from collections import defaultdict
+from pymemcache.client.hash import HashClient
 from pymemcache.exceptions import MemcacheError
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _group_by_node(client: Any, keys: List[str]) -> List[Tuple[Any, List[str]]]:
+    """Group keys by the node they hash to, so each group can be sent in parallel.
+
+    Each group is paired with the pooled client of its node. The groups are sent from
+    several threads, and the HashClient itself is not thread-safe: it updates its failed
+    and dead node bookkeeping and its hasher while handling a call.
+
+    Raises:
+        MemcacheError: If every node has been ejected from the ring
+    """
+    if not isinstance(client, HashClient):
+        return [(client, list(keys))]
+    groups: Dict[str, List[str]] = defaultdict(list)
+    for key in keys:
+        node = client.hasher.get_node(key)
+        if node is None:
+            raise MemcacheError('All servers seem to be down right now')
+        groups[node].append(key)
+    return [(client.clients[node], group) for node, group in groups.items()]
+
+
+async def _for_each_node(func: Callable[[Any], Any]) -> Dict[str, Any]:
+    """Call func with the client of every node concurrently, keyed by node."""
+    nodes = MemcachedConnectionManager.get_node_clients()
+    results = await asyncio.gather(
+        *(asyncio.to_thread(func, c) for c in nodes.values()), return_exceptions=True
+    )
+    # An unreachable node should not hide the results of the others
+    return {
+        node: f'Error: {str(result)}' if isinstance(result, Exception) else result
+        for node, result in zip(nodes, results)
+    }
 
 
 @mcp.tool()
@@ -66,6 +103,8 @@ async def cache_gets(key: str) -> str:
 async def cache_get_many(keys: List[str]) -> str:
     """Get multiple values from the cache.
 
+    With several nodes, the keys of each node are fetched in parallel.
+
     Args:
         keys: List of keys to retrieve
 
@@ -74,7 +113,13 @@ async def cache_get_many(keys: List[str]) -> str:
     """
     try:
         client = MemcachedConnectionManager.get_connection()
-        result = client.get_many(keys)
+        batches = await asyncio.gather(
+            *(
+                asyncio.to_thread(node_client.get_many, group)
+                for node_client, group in _group_by_node(client, keys)
+            )
+        )
+        result = {key: value for batch in batches for key, value in (batch or {}).items()}
         if not result:
             return 'No keys found'
         return str(result)
@@ -149,6 +194,8 @@ async def cache_cas(key: str, value: Any, cas: int, expire: Optional[int] = None
 async def cache_set_many(mapping: Dict[str, Any], expire: Optional[int] = None) -> str:
     """Set multiple values in the cache.
 
+    With several nodes, the keys of each node are set in parallel.
+
     Args:
         mapping: Dictionary of key-value pairs
         expire: Optional expiration time in seconds
@@ -161,7 +208,15 @@ async def cache_set_many(mapping: Dict[str, Any], expire: Optional[int] = None)
 
     try:
         client = MemcachedConnectionManager.get_connection()
-        failed = client.set_many(mapping, expire=expire)
+        batches = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    node_client.set_many, {key: mapping[key] for key in group}, expire=expire
+                )
+                for node_client, group in _group_by_node(client, list(mapping))
+            )
+        )
+        failed = [key for batch in batches for key in batch or []]
         if not failed:
             expiry_msg = f' with {expire}s expiry' if expire else ''
             return f'Successfully set {len(mapping)} keys{expiry_msg}'
@@ -413,6 +468,8 @@ async def cache_touch(key: str, expire: int) -> str:
 async def cache_stats(args: Optional[List[str]] = None) -> str:
     """Get cache statistics.
 
+    With several nodes, the statistics of every node are returned, keyed by node.
+
     Args:
         args: Optional list of stats to retrieve
 
@@ -421,6 +478,8 @@ async def cache_stats(args: Optional[List[str]] = None) -> str:
     """
     try:
         client = MemcachedConnectionManager.get_connection()
+        if isinstance(client, HashClient):
+            return str(await _for_each_node(lambda c: c.stats(*args if args else [])))
         result = client.stats(*args if args else [])
         return str(result)
     except MemcacheError as e:
@@ -469,12 +528,32 @@ async def cache_quit() -> str:
 async def cache_version() -> str:
     """Get the version of the cache server.
 
+    With several nodes, the version of every node is returned, keyed by node.
+
     Returns:
         Version string or error message
     """
     try:
         client = MemcachedConnectionManager.get_connection()
+        if isinstance(client, HashClient):
+            return str(await _for_each_node(lambda c: c.version()))
         result = client.version()
         return str(result)
     except MemcacheError as e:
         return f'Error getting version: {str(e)}'
+
+
+@mcp.tool()
+async def cache_nodes() -> str:
+    """Get the health of each cache node.
+
+    A node is healthy, failing (with its number of consecutive failed attempts) or
+    ejected from the hash ring (with the seconds until it is tried again).
+
+    Returns:
+        Status of each node or error message
+    """
+    try:
+        return str(MemcachedConnectionManager.get_node_status())
+    except MemcacheError as e:
+        return f'Error getting node status: {str(e)}'
@@ -0,0 +1,177 @@
+"""Unit tests for cache analytics."""
+
+import ast
+import pytest
+import socket
+from awslabs.memcached_mcp_server.tools import analytics
+from pymemcache.exceptions import MemcacheError
+from unittest.mock import Mock, patch
+
+
+def _node(hits, misses, evictions, items, uptime=100):
+    """Create a mock node client returning stats like pymemcache does."""
+    stats = {
+        b'get_hits': hits,
+        b'get_misses': misses,
+        b'evictions': evictions,
+        b'curr_items': items,
+        b'bytes': 500,
+        b'limit_maxbytes': 1000,
+        b'uptime': uptime,
+        b'version': b'1.6.21',
+    }
+    slabs = {
+        b'1:chunk_size': 96,
+        b'1:total_chunks': 100,
+        b'2:chunk_size': 120,
+        b'2:total_chunks': 20,
+        b'active_slabs': 2,
+        b'total_malloced': 12000,
+    }
+    items_stats = {
+        b'items:1:number': 90,
+        b'items:1:evicted': 0,
+        b'items:2:number': 10,
+        b'items:2:evicted': 7,
+    }
+    client = Mock()
+    client.stats.side_effect = lambda *args: dict(
+        {(): stats, ('slabs',): slabs, ('items',): items_stats}[args]
+    )
+    return client
+
+
+@pytest.fixture
+def nodes():
+    """Patch the node clients with two mock nodes."""
+    clients = {'node1:11211': _node(80, 20, 10, 300), 'node2:11211': _node(10, 30, 0, 100)}
+    with patch(
+        'awslabs.memcached_mcp_server.common.connection.MemcachedConnectionManager.get_node_clients'
+    ) as mock:
+        mock.return_value = clients
+        yield clients
+    analytics._snapshots.clear()
+
+
+@pytest.mark.asyncio
+async def test_cache_analytics(nodes):
+    """Test per node and overall hit ratios, evictions and slab skew."""
+    report = ast.literal_eval(await analytics.cache_analytics())
+
+    assert report['overall']['hit_ratio'] == 0.6429
+    assert report['overall']['evictions'] == 10
+    assert report['overall']['memory_usage'] == 0.5
+    assert report['overall']['item_share'] == {'node1:11211': 0.75, 'node2:11211': 0.25}
+
+    node1 = report['nodes']['node1:11211']
+    assert node1['summary']['hit_ratio'] == 0.8
+    assert node1['summary']['evictions_per_second'] == 0.1
+    assert node1['slabs']['memory_skew'] == 1.6
+    assert [c['class'] for c in node1['slabs']['top_by_memory']] == [1, 2]
+    assert [c['class'] for c in node1['slabs']['top_by_evictions']] == [2]
+    assert 'key_prefixes' not in node1
+    assert report['snapshot'] in analytics._snapshots
+
+
+@pytest.mark.asyncio
+async def test_cache_analytics_deltas(nodes):
+    """Test counter deltas against a baseline snapshot."""
+    first = ast.literal_eval(await analytics.cache_analytics())
+    nodes['node1:11211'] = _node(180, 30, 15, 300, uptime=110)
+    nodes['node2:11211'] = _node(5, 5, 0, 100, uptime=50)
+
+    with patch.object(analytics.time, 'time', return_value=analytics.time.time() + 10):
+        report = ast.literal_eval(await analytics.cache_analytics(baseline=first['snapshot']))
+
+    deltas = report['deltas']['nodes']
+    assert deltas['node1:11211']['counters']['get_hits'] == 100
+    assert deltas['node1:11211']['counters']['evictions'] == 5
+    assert deltas['node1:11211']['hit_ratio'] == 0.9091
+    assert deltas['node1:11211']['rates_per_second']['evictions'] == pytest.approx(0.5, 0.05)
+    assert deltas['node2:11211'] == {'error': 'Node restarted since the baseline snapshot'}
+
+
+@pytest.mark.asyncio
+async def test_cache_analytics_unknown_baseline(nodes):
+    """Test that an unknown baseline snapshot is reported."""
+    result = await analytics.cache_analytics(baseline='missing')
+    assert result == "Snapshot 'missing' not found, it may have expired"
+
+
+@pytest.mark.asyncio
+async def test_cache_analytics_key_prefixes(nodes):
+    """Test key prefix distribution from lru_crawler metadump."""
+    nodes['node1:11211'].raw_command.side_effect = [
+        b'key=user%3A1 exp=-1 la=1 cas=1 fetch=no cls=1 size=100\n'
+        b'key=user%3A2 exp=-1 la=1 cas=2 fetch=no cls=1 size=50\n',
+        b'key=session%3A1 exp=60 la=1 cas=3 fetch=yes cls=2 size=200\n'
+        b'key=counter exp=-1 la=1 cas=4 fetch=no cls=2 size=10\n',
+    ]
+    nodes['node2:11211'].raw_command.side_effect = MemcacheError(
+        'CLIENT_ERROR lru crawler disabled'
+    )
+
+    report = ast.literal_eval(await analytics.cache_analytics(include_keys=True, max_keys=3))
+
+    assert report['nodes']['node1:11211']['key_prefixes'] == [
+        {'prefix': 'session:', 'keys': 1, 'bytes': 200},
+        {'prefix': 'user:', 'keys': 2, 'bytes': 150},
+    ]
+    assert report['nodes']['node2:11211']['key_prefixes'] == {
+        'error': 'CLIENT_ERROR lru crawler disabled'
+    }
+    assert [c.args for c in nodes['node1:11211'].raw_command.call_args_list] == [
+        ('lru_crawler metadump 1', 'END\r\n'),
+        ('lru_crawler metadump 2', 'END\r\n'),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cache_analytics_key_listing_stops_at_max_keys(nodes):
+    """Test that no further slab class is dumped once max_keys keys are listed."""
+    nodes['node1:11211'].raw_command.return_value = (
+        b'key=user%3A1 exp=-1 la=1 cas=1 fetch=no cls=1 size=100\n'
+        b'key=user%3A2 exp=-1 la=1 cas=2 fetch=no cls=1 size=50\n'
+    )
+
+    report = ast.literal_eval(await analytics.cache_analytics(include_keys=True, max_keys=2))
+
+    assert report['nodes']['node1:11211']['key_prefixes'] == [
+        {'prefix': 'user:', 'keys': 2, 'bytes': 150}
+    ]
+    nodes['node1:11211'].raw_command.assert_called_once_with('lru_crawler metadump 1', 'END\r\n')
+
+
+@pytest.mark.asyncio
+async def test_cache_analytics_busy_crawler_keeps_node_stats(nodes):
+    """Test that a metadump timing out on a busy crawler only loses the node's keys."""
+    nodes['node1:11211'].raw_command.side_effect = socket.timeout('timed out')
+    nodes['node2:11211'].raw_command.return_value = b''
+
+    report = ast.literal_eval(await analytics.cache_analytics(include_keys=True))
+
+    node1 = report['nodes']['node1:11211']
+    assert node1['summary']['hit_ratio'] == 0.8
+    assert node1['key_prefixes'] == {
+        'error': 'lru_crawler metadump timed out, the crawler may be busy'
+    }
+
+
+@pytest.mark.asyncio
+async def test_cache_analytics_unreachable_node(nodes):
+    """Test that an unreachable node does not hide the others."""
+    nodes['node2:11211'].stats.side_effect = ConnectionRefusedError('refused')
+
+    report = ast.literal_eval(await analytics.cache_analytics())
+
+    assert report['nodes']['node2:11211'] == {'error': 'refused'}
+    assert report['overall']['hit_ratio'] == 0.8
+
+
+@pytest.mark.asyncio
+async def test_cache_analytics_snapshots_are_bounded(nodes, monkeypatch):
+    """Test that only the most recent snapshots are kept."""
+    monkeypatch.setattr(analytics, 'MAX_SNAPSHOTS', 2)
+    for _ in range(3):
+        await analytics.cache_analytics()
+    assert len(analytics._snapshots) == 2
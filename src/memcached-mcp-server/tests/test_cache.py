@@ -1,7 +1,10 @@
 """Unit tests for cache operations."""
 
+import ast
 import pytest
+import time
 from awslabs.memcached_mcp_server.tools import cache
+from pymemcache.client.hash import HashClient
 from pymemcache.exceptions import MemcacheError
 from unittest.mock import Mock, patch
 
@@ -474,3 +477,99 @@ async def test_cache_version_success(mock_client):
     result = await cache.cache_version()
     assert result == '1.6.9'
     mock_client.version.assert_called_once()
+
+
+@pytest.fixture
+def hash_client():
+    """Initialize a three node hash client whose node clients are mocks."""
+    client = HashClient([('node1', 11211), ('node2', 11211), ('node3', 11211)])
+    for node, node_client in list(client.clients.items()):
+        mock_node = Mock()
+        mock_node.server = node_client.server
+        mock_node.get_many.side_effect = lambda keys, node=node: {k: f'{node}/{k}' for k in keys}
+        mock_node.set_many.return_value = []
+        client.clients[node] = mock_node
+    with patch(
+        'awslabs.memcached_mcp_server.common.connection.MemcachedConnectionManager.get_connection'
+    ) as mock:
+        mock.return_value = client
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_cache_get_many_fans_out_per_node(hash_client):
+    """Test that get_many sends each node only the keys hashing to it."""
+    keys = [f'key{i}' for i in range(20)]
+    result = await cache.cache_get_many(keys)
+
+    expected = {key: f'{hash_client.hasher.get_node(key)}/{key}' for key in keys}
+    assert ast.literal_eval(result) == expected
+    for node, node_client in hash_client.clients.items():
+        node_client.get_many.assert_called_once_with(
+            [key for key in keys if hash_client.hasher.get_node(key) == node]
+        )
+
+
+@pytest.mark.asyncio
+async def test_cache_get_many_bypasses_shared_hash_client(hash_client):
+    """Test that parallel groups go to the node clients, not the shared HashClient."""
+    with patch.object(hash_client, 'get_many', side_effect=AssertionError('shared client')):
+        result = await cache.cache_get_many(['key1', 'key2', 'key3'])
+
+    assert len(ast.literal_eval(result)) == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_get_many_all_nodes_ejected(hash_client):
+    """Test that an empty ring is reported as an error."""
+    with patch.object(hash_client.hasher, 'get_node', return_value=None):
+        result = await cache.cache_get_many(['key1'])
+
+    assert result == 'Error getting multiple keys: All servers seem to be down right now'
+
+
+@pytest.mark.asyncio
+async def test_cache_set_many_fans_out_per_node(hash_client):
+    """Test that set_many sends each node only its keys and merges failures."""
+    mapping = {f'key{i}': i for i in range(20)}
+    failing = hash_client.clients['node2:11211']
+    failing.set_many.side_effect = lambda values, **kwargs: sorted(values)[:1]
+
+    result = await cache.cache_set_many(mapping, expire=30)
+
+    node2_keys = sorted(k for k in mapping if hash_client.hasher.get_node(k) == 'node2:11211')
+    assert result == f'Failed to set keys: {node2_keys[:1]}'
+    for node, node_client in hash_client.clients.items():
+        values = {k: v for k, v in mapping.items() if hash_client.hasher.get_node(k) == node}
+        node_client.set_many.assert_called_once_with(values, expire=30)
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_per_node(hash_client):
+    """Test that stats are collected from every node, even when one is unreachable."""
+    for node, node_client in hash_client.clients.items():
+        node_client.stats.return_value = {'curr_items': node}
+    hash_client.clients['node3:11211'].stats.side_effect = ConnectionRefusedError('refused')
+
+    result = await cache.cache_stats()
+
+    assert result == str(
+        {
+            'node1:11211': {'curr_items': 'node1:11211'},
+            'node2:11211': {'curr_items': 'node2:11211'},
+            'node3:11211': 'Error: refused',
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_nodes(hash_client):
+    """Test that failing and ejected nodes are reported."""
+    hash_client._failed_clients[('node1', 11211)] = {'attempts': 1, 'failed_time': 0}
+    hash_client._dead_clients[('node2', 11211)] = time.time()
+
+    result = ast.literal_eval(await cache.cache_nodes())
+
+    assert result['node1:11211'] == {'status': 'failing', 'failed_attempts': 1}
+    assert result['node2:11211']['status'] == 'ejected'
+    assert result['node3:11211'] == {'status': 'healthy'}
@@ -210,6 +210,52 @@ class TestMemcachedConnectionManager(unittest.TestCase):
                 tls_context=mock_context,
             )
 
+    @patch('awslabs.memcached_mcp_server.common.connection.HashClient')
+    @patch('awslabs.memcached_mcp_server.common.connection.RetryingClient')
+    def test_get_connection_multi_node(self, mock_retrying_client, mock_hash_client):
+        """Test get_connection creates a pooled hash client when several nodes are set."""
+        env_vars = {
+            'MEMCACHED_SERVERS': 'node1:11211, node2:11212,node3',
+            'MEMCACHED_MAX_POOL_SIZE': '4',
+            'MEMCACHED_DEAD_TIMEOUT': '30',
+        }
+
+        with patch.dict(os.environ, env_vars):
+            client = MemcachedConnectionManager.get_connection()
+
+        mock_hash_client.assert_called_once_with(
+            [('node1', 11211), ('node2', 11212), ('node3', 11211)],
+            timeout=1.0,
+            connect_timeout=5.0,
+            no_delay=True,
+            use_pooling=True,
+            max_pool_size=4,
+            retry_attempts=3,
+            retry_timeout=1.0,
+            dead_timeout=30.0,
+        )
+        mock_retrying_client.assert_not_called()
+        self.assertEqual(client, mock_hash_client.return_value)
+
+    def test_get_node_clients_multi_node(self):
+        """Test get_node_clients returns the client of every node."""
+        with patch.dict(os.environ, {'MEMCACHED_SERVERS': 'node1:11211,node2:11211'}):
+            nodes = MemcachedConnectionManager.get_node_clients()
+
+        self.assertEqual(list(nodes), ['node1:11211', 'node2:11211'])
+        self.assertEqual(nodes['node1:11211'].server, ('node1', 11211))
+
+    @patch('awslabs.memcached_mcp_server.common.connection.RetryingClient')
+    def test_get_node_clients_single_node(self, mock_retrying_client):
+        """Test get_node_clients returns the single client keyed by its node."""
+        nodes = MemcachedConnectionManager.get_node_clients()
+
+        self.assertEqual(nodes, {'127.0.0.1:11211': mock_retrying_client.return_value})
+        self.assertEqual(
+            MemcachedConnectionManager.get_node_status(),
+            {'127.0.0.1:11211': {'status': 'healthy'}},
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -17,7 +17,10 @@
 import argparse
 import asyncio
 import boto3
+import json
+import re
 import sys
+import time
 from awslabs.mysql_mcp_server.mutable_sql_detector import (
     check_sql_injection_risk,
     detect_mutating_keywords,
@@ -33,6 +36,8 @@ client_error_code_key = 'run_query ClientError code'
 unexpected_error_key = 'run_query unexpected error'
 write_query_prohibited_key = 'Your MCP tool only allows readonly query. If you want to write, change the MCP configuration per README.md'
 query_injection_risk_key = 'Your query contains risky injection patterns'
+# Key of the continuation of paged run_query results, None on the last page
+continuation_key = 'continuation'
 
 
 class DummyCtx:
@@ -150,29 +155,69 @@ def extract_cell(cell: dict):
     """Extracts the scalar or array value from a single cell."""
     if cell.get('isNull'):
         return None
-    for key in (
-        'stringValue',
-        'longValue',
-        'doubleValue',
-        'booleanValue',
-        'blobValue',
-        'arrayValue',
-    ):
-        if key in cell:
-            return cell[key]
+    # A cell holds a single typed value, so there is no need to probe every value key
+    for key, value in cell.items():
+        if key != 'isNull':
+            return value
     return None
 
 
 def parse_execute_response(response: dict) -> list[dict]:
-    """Convert RDS Data API execute_statement response to list of rows."""
+    """Convert RDS Data API execute_statement response to list of rows.
+
+    Results requested with formatRecordsAs='JSON' are decoded in one json.loads call;
+    typed records are decoded column by column otherwise.
+    """
+    formatted_records = response.get('formattedRecords')
+    if formatted_records:
+        return json.loads(formatted_records)
+
     columns = [col['name'] for col in response.get('columnMetadata', [])]
-    records = []
+    return [dict(zip(columns, map(extract_cell, row))) for row in response.get('records', [])]
+
+
+# Quoted text and comments, matched together so comment markers in quotes are skipped
+_QUOTED_OR_COMMENT = re.compile(
+    r"""'(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.|"")*"|`[^`]*`|/\*.*?\*/|--[^\n]*""",
+    re.DOTALL,
+)
+
+# Error of a wrapped query whose columns cannot form a derived table, e.g. SELECT a.id, b.id
+PAGING_ERROR_PATTERN = re.compile(r'Duplicate column name', re.IGNORECASE)
 
-    for row in response.get('records', []):
-        row_data = {col: extract_cell(cell) for col, cell in zip(columns, row)}
-        records.append(row_data)
 
-    return records
+def _strip_trailing_noise(sql: str) -> str:
+    """Remove trailing whitespace, semicolons and comments from a statement."""
+    while True:
+        stripped = sql.rstrip().rstrip(';').rstrip()
+        last = None
+        for last in _QUOTED_OR_COMMENT.finditer(stripped):
+            pass
+        if last and last.end() == len(stripped) and last.group().startswith(('--', '/*')):
+            stripped = stripped[: last.start()]
+        if stripped == sql:
+            return sql
+        sql = stripped
+
+
+def paginate_sql(sql: str, limit: int, offset: int) -> Optional[str]:
+    """Wrap a single SELECT statement so that the database returns only one page of rows.
+
+    Args:
+        sql: The SQL query
+        limit: Maximum number of rows to return
+        offset: Number of rows to skip
+
+    Returns:
+        The wrapped query, or None if the statement cannot be wrapped
+    """
+    body = _strip_trailing_noise(sql)
+    if ';' in body or not re.match(r'\s*(SELECT|WITH)\b', body, re.IGNORECASE):
+        return None
+    # Writes and SELECT ... INTO must run exactly once and as given
+    if detect_mutating_keywords(body) or re.search(r'\bINTO\b', body, re.IGNORECASE):
+        return None
+    return f'SELECT * FROM (\n{body}\n) AS paged_query LIMIT {int(limit)} OFFSET {int(offset)}'
 
 
 mcp = FastMCP(
@@ -190,7 +235,19 @@ async def run_query(
     query_parameters: Annotated[
         Optional[List[Dict[str, Any]]], Field(description='Parameters for the SQL query')
     ] = None,
-) -> list[dict]:  # type: ignore
+    max_rows: Annotated[
+        Optional[int],
+        Field(
+            description='Maximum number of rows to return. The result is then an object with the '
+            'rows and a continuation holding the offset of the next page, null on the last page. '
+            'Use ORDER BY for stable pages.',
+            ge=1,
+        ),
+    ] = None,
+    offset: Annotated[
+        int, Field(description='Number of rows to skip, from a previous continuation', ge=0)
+    ] = 0,
+) -> list[dict] | dict:  # type: ignore
     """Run a SQL query against a MySQL database.
 
     Args:
@@ -198,9 +255,12 @@ async def run_query(
         ctx: MCP context for logging and state management
         db_connection: DB connection object passed by unit test. It should be None if if called by MCP server.
         query_parameters: Parameters for the SQL query
+        max_rows: Maximum number of rows to return, None for all rows
+        offset: Number of rows to skip
 
     Returns:
-        List of dictionary that contains query response rows
+        List of dictionary that contains query response rows, or with max_rows a dictionary
+        with the rows of the page and the continuation to the next page
     """
     global client_error_code_key
     global unexpected_error_key
@@ -232,23 +292,18 @@ async def run_query(
     try:
         logger.info(f'run_query: readonly:{db_connection.readonly_query}, SQL:{sql}')
 
-        execute_params = {
-            'resourceArn': db_connection.cluster_arn,
-            'secretArn': db_connection.secret_arn,
-            'database': db_connection.database,
-            'sql': sql,
-            'includeResultMetadata': True,
-        }
-
-        if query_parameters:
-            execute_params['parameters'] = query_parameters
-
-        response = await asyncio.to_thread(
-            db_connection.data_client.execute_statement, **execute_params
-        )
+        if max_rows is None:
+            response = await execute_statement(db_connection, sql, query_parameters)
+            rows = decode_response(response)
+        else:
+            rows = await execute_paged_statement(
+                db_connection, sql, query_parameters, max_rows, offset
+            )
+            logger.success('run_query successfully executed query:{}', sql)
+            return page_result(rows, max_rows, offset)
 
         logger.success('run_query successfully executed query:{}', sql)
-        return parse_execute_response(response)
+        return rows
     except ClientError as e:
         logger.exception(client_error_code_key)
         await ctx.error(
@@ -308,6 +363,95 @@ async def get_table_schema(
     return await run_query(sql=sql, ctx=ctx, query_parameters=params)
 
 
+async def execute_statement(
+    db_connection, sql: str, query_parameters: Optional[List[Dict[str, Any]]] = None
+) -> dict:
+    """Run one statement.
+
+    Args:
+        db_connection: connection object
+        sql: query to run
+        query_parameters: parameters
+
+    Returns:
+        The execute_statement response
+    """
+    execute_params = {
+        'resourceArn': db_connection.cluster_arn,
+        'secretArn': db_connection.secret_arn,
+        'database': db_connection.database,
+        'sql': sql,
+        'includeResultMetadata': True,
+        'formatRecordsAs': 'JSON',
+    }
+
+    if query_parameters:
+        execute_params['parameters'] = query_parameters
+
+    return await asyncio.to_thread(db_connection.data_client.execute_statement, **execute_params)
+
+
+def decode_response(response: dict) -> list[dict]:
+    """Decode an execute_statement response and log how long decoding took."""
+    start = time.perf_counter()
+    rows = parse_execute_response(response)
+    logger.info('Decoded {} rows in {:.2f} ms', len(rows), (time.perf_counter() - start) * 1000)
+    return rows
+
+
+async def execute_paged_statement(
+    db_connection,
+    sql: str,
+    query_parameters: Optional[List[Dict[str, Any]]],
+    max_rows: int,
+    offset: int,
+) -> list[dict]:
+    """Run a query and return at most max_rows rows starting at offset.
+
+    SELECT statements are wrapped so the database applies LIMIT and OFFSET and only the
+    requested page crosses the wire. Other statements, or wrapped statements rejected for
+    duplicate column names, are run as is and the page is cut out of the full result.
+
+    Args:
+        db_connection: connection object
+        sql: query to run
+        query_parameters: parameters
+        max_rows: maximum number of rows to return
+        offset: number of rows to skip
+
+    Returns:
+        Up to max_rows + 1 rows; the extra row means there is a next page
+    """
+    # One extra row tells whether there is a next page
+    paged_sql = paginate_sql(sql, max_rows + 1, offset)
+    rows = None
+    if paged_sql is not None:
+        try:
+            rows = decode_response(
+                await execute_statement(db_connection, paged_sql, query_parameters)
+            )
+        except ClientError as e:
+            error = e.response['Error']
+            if error['Code'] != 'BadRequestException' or not PAGING_ERROR_PATTERN.search(
+                error.get('Message', '')
+            ):
+                raise
+            logger.info(f'Paged query rejected, paging the full result instead: {e}')
+
+    if rows is None:
+        rows = decode_response(await execute_statement(db_connection, sql, query_parameters))
+        rows = rows[offset : offset + max_rows + 1]
+    return rows
+
+
+def page_result(rows: list[dict], max_rows: int, offset: int) -> dict:
+    """Build the run_query result of a page from the rows of execute_paged_statement."""
+    continuation = None
+    if len(rows) > max_rows:
+        continuation = {'offset': offset + max_rows, 'max_rows': max_rows}
+    return {'rows': rows[:max_rows], continuation_key: continuation}
+
+
 def main():
     """Main entry point for the MCP server application."""
     global client_error_code_key
@@ -24,6 +24,7 @@ class Mock_boto3_client:
         self._responses: List[dict] = []
         self.error = error
         self._current_response_index = 0
+        self.execute_statement_calls: List[dict] = []
 
     def begin_transaction(self, **kwargs) -> dict:
         """Mock implementation of begin_transaction.
@@ -125,6 +126,7 @@ class Mock_boto3_client:
             ClientError
             Exception
         """
+        self.execute_statement_calls.append(kwargs)
         if self.error == MockException.Client:
             error_response = {
                 'Error': {
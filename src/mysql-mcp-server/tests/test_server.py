@@ -23,13 +23,20 @@ import uuid
 from awslabs.mysql_mcp_server.server import (
     DBConnectionSingleton,
     client_error_code_key,
+    continuation_key,
+    execute_paged_statement,
+    extract_cell,
     get_table_schema,
     main,
+    paginate_sql,
+    parse_execute_response,
     run_query,
     unexpected_error_key,
     write_query_prohibited_key,
 )
+from botocore.exceptions import ClientError
 from conftest import DummyCtx, Mock_DBConnection, MockException
+from unittest.mock import AsyncMock, patch
 
 
 SAFE_READONLY_QUERIES = [
@@ -743,6 +750,126 @@ def test_main_with_invalid_parameters(monkeypatch, capsys):
     assert excinfo.value.code == 1
 
 
+def test_parse_execute_response_json_format():
+    """Test that JSON formatted records are decoded without per-cell extraction."""
+    response = {'formattedRecords': json.dumps([{'id': 1, 'name': 'a'}, {'id': 2, 'name': None}])}
+
+    assert parse_execute_response(response) == [
+        {'id': 1, 'name': 'a'},
+        {'id': 2, 'name': None},
+    ]
+
+
+def test_parse_execute_response_typed_records():
+    """Test that typed records are decoded when no JSON formatted records are returned."""
+    response = mock_execute_statement_response(columns=['id', 'name'], rows=[[1, None]])
+
+    assert parse_execute_response(response) == [{'id': 1, 'name': None}]
+    assert extract_cell({'isNull': False, 'longValue': 3}) == 3
+    assert extract_cell({}) is None
+
+
+def test_paginate_sql():
+    """Test that single SELECT statements are wrapped with LIMIT and OFFSET."""
+    assert paginate_sql('SELECT * FROM t; -- comment', 11, 20) == (
+        'SELECT * FROM (\nSELECT * FROM t\n) AS paged_query LIMIT 11 OFFSET 20'
+    )
+    paged = paginate_sql('WITH a AS (SELECT 1) SELECT * FROM a; /* c */', 5, 0)
+    assert paged is not None
+    assert paged.startswith('SELECT * FROM (\nWITH a AS (SELECT 1) SELECT * FROM a\n)')
+    assert paginate_sql("SELECT '--x' AS a -- comment", 5, 0) == (
+        "SELECT * FROM (\nSELECT '--x' AS a\n) AS paged_query LIMIT 5 OFFSET 0"
+    )
+    assert paginate_sql('WITH a AS (SELECT 1) DELETE FROM t', 5, 0) is None
+    assert paginate_sql('SELECT 1; SELECT 2', 5, 0) is None
+    assert paginate_sql('SHOW TABLES', 5, 0) is None
+
+
+@pytest.mark.asyncio
+async def test_run_query_requests_json_format():
+    """Test that run_query asks the Data API for JSON formatted records."""
+    mock_db_connection = Mock_DBConnection(readonly=True)
+    mock_db_connection.data_client.add_mock_response({'formattedRecords': json.dumps([{'id': 1}])})
+
+    tool_response = await run_query('SELECT id FROM t', DummyCtx(), mock_db_connection)
+
+    assert tool_response == [{'id': 1}]
+    query_call = mock_db_connection.data_client.execute_statement_calls[-1]
+    assert query_call['formatRecordsAs'] == 'JSON'
+
+
+@pytest.mark.asyncio
+async def test_run_query_max_rows_returns_continuation():
+    """Test that run_query pages SELECT results in the database and returns a continuation."""
+    mock_db_connection = Mock_DBConnection(readonly=False)
+    mock_db_connection.data_client.add_mock_response(
+        {'formattedRecords': json.dumps([{'id': 3}, {'id': 4}, {'id': 5}])}
+    )
+
+    tool_response = await run_query(
+        'SELECT id FROM t ORDER BY id;',
+        DummyCtx(),
+        mock_db_connection,
+        max_rows=2,
+        offset=2,
+    )
+
+    assert tool_response == {
+        'rows': [{'id': 3}, {'id': 4}],
+        continuation_key: {'offset': 4, 'max_rows': 2},
+    }
+    assert mock_db_connection.data_client.execute_statement_calls[0]['sql'] == (
+        'SELECT * FROM (\nSELECT id FROM t ORDER BY id\n) AS paged_query LIMIT 3 OFFSET 2'
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_query_max_rows_pages_unwrappable_statements():
+    """Test that statements which cannot be wrapped are paged after decoding."""
+    mock_db_connection = Mock_DBConnection(readonly=False)
+    mock_db_connection.data_client.add_mock_response(
+        {'formattedRecords': json.dumps([{'table': str(i)} for i in range(5)])}
+    )
+
+    tool_response = await run_query(
+        'SHOW TABLES', DummyCtx(), mock_db_connection, max_rows=3, offset=3
+    )
+
+    assert tool_response == {'rows': [{'table': '3'}, {'table': '4'}], continuation_key: None}
+    assert mock_db_connection.data_client.execute_statement_calls[0]['sql'] == 'SHOW TABLES'
+
+
+def _bad_request(message):
+    return ClientError(
+        {'Error': {'Code': 'BadRequestException', 'Message': message}}, 'execute_statement'
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_paged_statement_falls_back_on_duplicate_columns():
+    """Test that a wrapped query rejected for duplicate column names is paged after decoding."""
+    response = {'formattedRecords': json.dumps([{'id': i} for i in range(4)])}
+    execute = AsyncMock(side_effect=[_bad_request("Duplicate column name 'id'"), response])
+
+    with patch('awslabs.mysql_mcp_server.server.execute_statement', execute):
+        rows = await execute_paged_statement(None, 'SELECT a.id, b.id FROM a, b', None, 2, 1)
+
+    assert rows == [{'id': 1}, {'id': 2}, {'id': 3}]
+    assert execute.await_args_list[1].args[1] == 'SELECT a.id, b.id FROM a, b'
+
+
+@pytest.mark.asyncio
+async def test_execute_paged_statement_raises_other_errors_once():
+    """Test that a query failing for another reason is not run a second time."""
+    execute = AsyncMock(side_effect=_bad_request("Unknown column 'x'"))
+
+    with patch('awslabs.mysql_mcp_server.server.execute_statement', execute):
+        with pytest.raises(ClientError):
+            await execute_paged_statement(None, 'SELECT x FROM t', None, 2, 0)
+
+    assert execute.await_count == 1
+
+
 if __name__ == '__main__':
     DBConnectionSingleton.initialize('mock', 'mock', 'mock', 'mock', readonly=True, is_test=True)
     asyncio.run(test_run_query_well_formatted_response())
@@ -0,0 +1,81 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""TTL-bounded caches of query results for the postgres MCP Server."""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a cache key from a query and its parameters."""
+    return json.dumps(parts, sort_keys=True, default=str)
+
+
+class QueryCache:
+    """Least recently used cache of query results whose entries expire after a TTL.
+
+    A TTL of 0 disables the cache. Rows are copied on the way in and out so callers
+    can modify the returned rows without affecting the cache.
+    """
+
+    def __init__(self, ttl: float = 0, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry is served for; 0 disables the cache
+            max_entries: Maximum number of entries kept
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores and serves entries."""
+        return self.ttl > 0
+
+    def get(self, key: str) -> Optional[list[dict]]:
+        """Return a copy of the cached rows for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, rows = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return [dict(row) for row in rows]
+
+    def put(self, key: str, rows: list[dict]) -> None:
+        """Cache a copy of rows under key, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+        self._entries[key] = (time.monotonic(), [dict(row) for row in rows])
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of entries, including expired ones not yet dropped."""
+        return len(self._entries)
@@ -17,12 +17,17 @@
 import argparse
 import asyncio
 import boto3
+import json
+import re
 import sys
+import time
 from awslabs.postgres_mcp_server.mutable_sql_detector import (
     check_sql_injection_risk,
     detect_mutating_keywords,
 )
+from awslabs.postgres_mcp_server.query_cache import QueryCache, make_cache_key
 from botocore.exceptions import BotoCoreError, ClientError
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
@@ -34,6 +39,17 @@ unexpected_error_key = 'run_query unexpected error'
 write_query_prohibited_key = 'Your MCP tool only allows readonly query. If you want to write, change the MCP configuration per README.md'
 query_comment_prohibited_key = 'The comment in query is prohibited because of injection risk'
 query_injection_risk_key = 'Your query contains risky injection patterns'
+# Key of the continuation of paged run_query results, None on the last page
+continuation_key = 'continuation'
+
+# Default seconds get_table_schema results are served from the schema cache
+DEFAULT_SCHEMA_CACHE_TTL = 300
+# Results of identical read-only queries; disabled unless --query_cache_ttl is set
+query_result_cache = QueryCache()
+# Results of get_table_schema; cleared whenever a write query runs
+table_schema_cache = QueryCache(ttl=DEFAULT_SCHEMA_CACHE_TTL)
+# Ends read-only transactions off the request path
+transaction_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='postgres-mcp-tx')
 
 
 class DummyCtx:
@@ -151,29 +167,66 @@ def extract_cell(cell: dict):
     """Extracts the scalar or array value from a single cell."""
     if cell.get('isNull'):
         return None
-    for key in (
-        'stringValue',
-        'longValue',
-        'doubleValue',
-        'booleanValue',
-        'blobValue',
-        'arrayValue',
-    ):
-        if key in cell:
-            return cell[key]
+    # A cell holds a single typed value, so there is no need to probe every value key
+    for key, value in cell.items():
+        if key != 'isNull':
+            return value
     return None
 
 
 def parse_execute_response(response: dict) -> list[dict]:
-    """Convert RDS Data API execute_statement response to list of rows."""
+    """Convert RDS Data API execute_statement response to list of rows.
+
+    Results requested with formatRecordsAs='JSON' are decoded in one json.loads call;
+    typed records are decoded column by column otherwise.
+    """
+    formatted_records = response.get('formattedRecords')
+    if formatted_records:
+        return json.loads(formatted_records)
+
     columns = [col['name'] for col in response.get('columnMetadata', [])]
-    records = []
+    return [dict(zip(columns, map(extract_cell, row))) for row in response.get('records', [])]
+
+
+# Quoted text and comments, matched together so comment markers in quotes are skipped
+_QUOTED_OR_COMMENT = re.compile(
+    r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|\$(\w*)\$.*?\$\1\$|/\*.*?\*/|--[^\n]*""",
+    re.DOTALL,
+)
+
 
-    for row in response.get('records', []):
-        row_data = {col: extract_cell(cell) for col, cell in zip(columns, row)}
-        records.append(row_data)
+def _strip_trailing_noise(sql: str) -> str:
+    """Remove trailing whitespace, semicolons and comments from a statement."""
+    while True:
+        stripped = sql.rstrip().rstrip(';').rstrip()
+        last = None
+        for last in _QUOTED_OR_COMMENT.finditer(stripped):
+            pass
+        if last and last.end() == len(stripped) and last.group().startswith(('--', '/*')):
+            stripped = stripped[: last.start()]
+        if stripped == sql:
+            return sql
+        sql = stripped
 
-    return records
+
+def paginate_sql(sql: str, limit: int, offset: int) -> Optional[str]:
+    """Wrap a single SELECT statement so that the database returns only one page of rows.
+
+    Args:
+        sql: The SQL query
+        limit: Maximum number of rows to return
+        offset: Number of rows to skip
+
+    Returns:
+        The wrapped query, or None if the statement cannot be wrapped
+    """
+    body = _strip_trailing_noise(sql)
+    if ';' in body or not re.match(r'\s*(SELECT|WITH)\b', body, re.IGNORECASE):
+        return None
+    # Writes and SELECT ... INTO must run exactly once and as given
+    if detect_mutating_keywords(body) or re.search(r'\bINTO\b', body, re.IGNORECASE):
+        return None
+    return f'SELECT * FROM (\n{body}\n) AS paged_query LIMIT {int(limit)} OFFSET {int(offset)}'
 
 
 mcp = FastMCP(
@@ -192,7 +245,19 @@ async def run_query(
     query_parameters: Annotated[
         Optional[List[Dict[str, Any]]], Field(description='Parameters for the SQL query')
     ] = None,
-) -> list[dict]:  # type: ignore
+    max_rows: Annotated[
+        Optional[int],
+        Field(
+            description='Maximum number of rows to return. The result is then an object with the '
+            'rows and a continuation holding the offset of the next page, null on the last page. '
+            'Use ORDER BY for stable pages.',
+            ge=1,
+        ),
+    ] = None,
+    offset: Annotated[
+        int, Field(description='Number of rows to skip, from a previous continuation', ge=0)
+    ] = 0,
+) -> list[dict] | dict:  # type: ignore
     """Run a SQL query using boto3 execute_statement.
 
     Args:
@@ -200,9 +265,12 @@ async def run_query(
         ctx: MCP context for logging and state management
         db_connection: DB connection object passed by unit test. It should be None if if called by MCP server.
         query_parameters: Parameters for the SQL query
+        max_rows: Maximum number of rows to return, None for all rows
+        offset: Number of rows to skip
 
     Returns:
-        List of dictionary that contains query response rows
+        List of dictionary that contains query response rows, or with max_rows a dictionary
+        with the rows of the page and the continuation to the next page
     """
     global client_error_code_key
     global unexpected_error_key
@@ -233,28 +301,36 @@ async def run_query(
     try:
         logger.info(f'run_query: readonly:{db_connection.readonly_query}, SQL:{sql}')
 
-        if db_connection.readonly_query:
-            response = await asyncio.to_thread(
-                execute_readonly_query, db_connection, sql, query_parameters
+        cache_key = None
+        if db_connection.readonly_query and query_result_cache.enabled:
+            cache_key = make_cache_key(
+                db_connection.database, sql, query_parameters, max_rows, offset
             )
+            cached_rows = query_result_cache.get(cache_key)
+            if cached_rows is not None:
+                logger.success('run_query served query from cache:{}', sql)
+                if max_rows is not None:
+                    return page_result(cached_rows, max_rows, offset)
+                return cached_rows
+
+        if max_rows is None:
+            response = await execute_statement(db_connection, sql, query_parameters)
+            rows = decode_response(response)
         else:
-            execute_params = {
-                'resourceArn': db_connection.cluster_arn,
-                'secretArn': db_connection.secret_arn,
-                'database': db_connection.database,
-                'sql': sql,
-                'includeResultMetadata': True,
-            }
-
-            if query_parameters:
-                execute_params['parameters'] = query_parameters
-
-            response = await asyncio.to_thread(
-                db_connection.data_client.execute_statement, **execute_params
+            rows = await execute_paged_statement(
+                db_connection, sql, query_parameters, max_rows, offset
             )
 
+        if cache_key is not None:
+            query_result_cache.put(cache_key, rows)
+        elif not db_connection.readonly_query and detect_mutating_keywords(sql):
+            # Writes may change table definitions
+            table_schema_cache.clear()
+
         logger.success('run_query successfully executed query:{}', sql)
-        return parse_execute_response(response)
+        if max_rows is not None:
+            return page_result(rows, max_rows, offset)
+        return rows
     except ClientError as e:
         logger.exception(client_error_code_key)
         await ctx.error(
@@ -302,7 +378,98 @@ async def get_table_schema(
 
     params = [{'name': 'table_name', 'value': {'stringValue': table_name}}]
 
-    return await run_query(sql=sql, ctx=ctx, query_parameters=params)
+    cache_key = make_cache_key(table_name)
+    rows = table_schema_cache.get(cache_key)
+    if rows is not None:
+        logger.info(f'get_table_schema: served {table_name} from cache')
+        return rows
+
+    rows = await run_query(sql=sql, ctx=ctx, query_parameters=params)
+    if not (rows and 'error' in rows[0]):
+        table_schema_cache.put(cache_key, rows)
+    return rows
+
+
+async def execute_statement(
+    db_connection, sql: str, query_parameters: Optional[List[Dict[str, Any]]] = None
+) -> dict:
+    """Run one statement, under a read-only transaction if the connection is read-only.
+
+    Args:
+        db_connection: connection object
+        sql: query to run
+        query_parameters: parameters
+
+    Returns:
+        The execute_statement response
+    """
+    if db_connection.readonly_query:
+        return await asyncio.to_thread(
+            execute_readonly_query, db_connection, sql, query_parameters
+        )
+
+    execute_params = {
+        'resourceArn': db_connection.cluster_arn,
+        'secretArn': db_connection.secret_arn,
+        'database': db_connection.database,
+        'sql': sql,
+        'includeResultMetadata': True,
+        'formatRecordsAs': 'JSON',
+    }
+
+    if query_parameters:
+        execute_params['parameters'] = query_parameters
+
+    return await asyncio.to_thread(db_connection.data_client.execute_statement, **execute_params)
+
+
+def decode_response(response: dict) -> list[dict]:
+    """Decode an execute_statement response and log how long decoding took."""
+    start = time.perf_counter()
+    rows = parse_execute_response(response)
+    logger.info('Decoded {} rows in {:.2f} ms', len(rows), (time.perf_counter() - start) * 1000)
+    return rows
+
+
+async def execute_paged_statement(
+    db_connection,
+    sql: str,
+    query_parameters: Optional[List[Dict[str, Any]]],
+    max_rows: int,
+    offset: int,
+) -> list[dict]:
+    """Run a query and return at most max_rows rows starting at offset.
+
+    SELECT statements are wrapped so the database applies LIMIT and OFFSET and only the
+    requested page crosses the wire. Other statements are run as is and the page is cut
+    out of the full result. A wrapped statement is valid whenever the statement itself
+    is, so its errors are raised rather than retried.
+
+    Args:
+        db_connection: connection object
+        sql: query to run
+        query_parameters: parameters
+        max_rows: maximum number of rows to return
+        offset: number of rows to skip
+
+    Returns:
+        Up to max_rows + 1 rows; the extra row means there is a next page
+    """
+    # One extra row tells whether there is a next page
+    paged_sql = paginate_sql(sql, max_rows + 1, offset)
+    if paged_sql is not None:
+        return decode_response(await execute_statement(db_connection, paged_sql, query_parameters))
+
+    rows = decode_response(await execute_statement(db_connection, sql, query_parameters))
+    return rows[offset : offset + max_rows + 1]
+
+
+def page_result(rows: list[dict], max_rows: int, offset: int) -> dict:
+    """Build the run_query result of a page from the rows of execute_paged_statement."""
+    continuation = None
+    if len(rows) > max_rows:
+        continuation = {'offset': offset + max_rows, 'max_rows': max_rows}
+    return {'rows': rows[:max_rows], continuation_key: continuation}
 
 
 def execute_readonly_query(
@@ -343,6 +510,7 @@ def execute_readonly_query(
             'database': db_connection.database,
             'sql': query,
             'includeResultMetadata': True,
+            'formatRecordsAs': 'JSON',
             'transactionId': tx_id,
         }
 
@@ -351,11 +519,9 @@ def execute_readonly_query(
 
         result = db_connection.data_client.execute_statement(**execute_params)
 
-        db_connection.data_client.commit_transaction(
-            resourceArn=db_connection.cluster_arn,
-            secretArn=db_connection.secret_arn,
-            transactionId=tx_id,
-        )
+        # The transaction only read data, so rather than making the caller wait for a
+        # commit it is rolled back in the background
+        transaction_executor.submit(rollback_readonly_transaction, db_connection, tx_id)
         return result
     except Exception as e:
         if tx_id:
@@ -367,6 +533,23 @@ def execute_readonly_query(
         raise e
 
 
+def rollback_readonly_transaction(db_connection: DBConnection, tx_id: str) -> None:
+    """End a read-only transaction, logging rather than raising failures.
+
+    Args:
+        db_connection: connection object
+        tx_id: id of the transaction to roll back
+    """
+    try:
+        db_connection.data_client.rollback_transaction(
+            resourceArn=db_connection.cluster_arn,
+            secretArn=db_connection.secret_arn,
+            transactionId=tx_id,
+        )
+    except Exception as e:
+        logger.warning(f'Failed to roll back read-only transaction {tx_id}: {e}')
+
+
 def main():
     """Main entry point for the MCP server application."""
     global client_error_code_key
@@ -388,8 +571,23 @@ def main():
     parser.add_argument(
         '--readonly', required=True, help='Enforce NL to SQL to only allow readonly sql statement'
     )
+    parser.add_argument(
+        '--query_cache_ttl',
+        type=float,
+        default=0,
+        help='Seconds to serve results of identical read-only queries from a cache (default: 0, disabled)',
+    )
+    parser.add_argument(
+        '--schema_cache_ttl',
+        type=float,
+        default=DEFAULT_SCHEMA_CACHE_TTL,
+        help=f'Seconds to serve get_table_schema results from a cache (default: {DEFAULT_SCHEMA_CACHE_TTL}, 0 disables)',
+    )
     args = parser.parse_args()
 
+    query_result_cache.ttl = args.query_cache_ttl
+    table_schema_cache.ttl = args.schema_cache_ttl
+
     logger.info(
         'Postgres MCP init with CLUSTER_ARN:{}, SECRET_ARN:{}, REGION:{}, DATABASE:{}, READONLY:{}',
         args.resource_arn,
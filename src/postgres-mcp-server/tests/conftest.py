@@ -24,6 +24,7 @@ class Mock_boto3_client:
         self._responses: List[dict] = []
         self.error = error
         self._current_response_index = 0
+        self.execute_statement_calls: List[dict] = []
 
     def begin_transaction(self, **kwargs) -> dict:
         """Mock implementation of begin_transaction.
@@ -125,6 +126,7 @@ class Mock_boto3_client:
             ClientError
             Exception
         """
+        self.execute_statement_calls.append(kwargs)
         if self.error == MockException.Client:
             error_response = {
                 'Error': {
@@ -215,3 +217,19 @@ def mock_DBConnection():
         Mock_DBConnection: A mock database connection
     """
     return Mock_DBConnection(readonly=True)
+
+
+@pytest.fixture(autouse=True)
+def reset_query_caches():
+    """Clear the query caches and restore their default TTLs around each test."""
+    from awslabs.postgres_mcp_server import server
+
+    def reset():
+        server.query_result_cache.clear()
+        server.query_result_cache.ttl = 0
+        server.table_schema_cache.clear()
+        server.table_schema_cache.ttl = server.DEFAULT_SCHEMA_CACHE_TTL
+
+    reset()
+    yield
+    reset()
@@ -20,16 +20,25 @@ import json
 import pytest
 import sys
 import uuid
+from awslabs.postgres_mcp_server import server
+from awslabs.postgres_mcp_server.query_cache import QueryCache
 from awslabs.postgres_mcp_server.server import (
     DBConnectionSingleton,
     client_error_code_key,
+    continuation_key,
+    execute_paged_statement,
+    extract_cell,
     get_table_schema,
     main,
+    paginate_sql,
+    parse_execute_response,
     run_query,
     unexpected_error_key,
     write_query_prohibited_key,
 )
+from botocore.exceptions import ClientError
 from conftest import DummyCtx, Mock_DBConnection, MockException
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 SAFE_READONLY_QUERIES = [
@@ -732,6 +741,188 @@ def test_main_with_invalid_parameters(monkeypatch, capsys):
     assert excinfo.value.code == 1
 
 
+def test_parse_execute_response_json_format():
+    """Test that JSON formatted records are decoded without per-cell extraction."""
+    response = {'formattedRecords': json.dumps([{'id': 1, 'name': 'a'}, {'id': 2, 'name': None}])}
+
+    assert parse_execute_response(response) == [
+        {'id': 1, 'name': 'a'},
+        {'id': 2, 'name': None},
+    ]
+
+
+def test_parse_execute_response_typed_records():
+    """Test that typed records are decoded when no JSON formatted records are returned."""
+    response = mock_execute_statement_response(columns=['id', 'name'], rows=[[1, None]])
+
+    assert parse_execute_response(response) == [{'id': 1, 'name': None}]
+    assert extract_cell({'isNull': False, 'longValue': 3}) == 3
+    assert extract_cell({}) is None
+
+
+def test_paginate_sql():
+    """Test that single SELECT statements are wrapped with LIMIT and OFFSET."""
+    assert paginate_sql('SELECT * FROM t; -- comment', 11, 20) == (
+        'SELECT * FROM (\nSELECT * FROM t\n) AS paged_query LIMIT 11 OFFSET 20'
+    )
+    paged = paginate_sql('WITH a AS (SELECT 1) SELECT * FROM a; /* c */', 5, 0)
+    assert paged is not None
+    assert paged.startswith('SELECT * FROM (\nWITH a AS (SELECT 1) SELECT * FROM a\n)')
+    assert paginate_sql("SELECT '--x' AS a -- comment", 5, 0) == (
+        "SELECT * FROM (\nSELECT '--x' AS a\n) AS paged_query LIMIT 5 OFFSET 0"
+    )
+    assert paginate_sql('WITH a AS (SELECT 1) DELETE FROM t', 5, 0) is None
+    assert paginate_sql('SELECT 1; SELECT 2', 5, 0) is None
+    assert paginate_sql('EXPLAIN SELECT 1', 5, 0) is None
+
+
+@pytest.mark.asyncio
+async def test_run_query_requests_json_format():
+    """Test that run_query asks the Data API for JSON formatted records."""
+    mock_db_connection = Mock_DBConnection(readonly=True)
+    mock_db_connection.data_client.add_mock_response({})
+    mock_db_connection.data_client.add_mock_response({'formattedRecords': json.dumps([{'id': 1}])})
+
+    tool_response = await run_query('SELECT id FROM t', DummyCtx(), mock_db_connection)
+
+    assert tool_response == [{'id': 1}]
+    query_call = mock_db_connection.data_client.execute_statement_calls[-1]
+    assert query_call['formatRecordsAs'] == 'JSON'
+    assert query_call['transactionId'] == 'txt-id-xxxxx'
+
+
+@pytest.mark.asyncio
+async def test_run_query_max_rows_returns_continuation():
+    """Test that run_query pages SELECT results in the database and returns a continuation."""
+    mock_db_connection = Mock_DBConnection(readonly=False)
+    mock_db_connection.data_client.add_mock_response(
+        {'formattedRecords': json.dumps([{'id': 3}, {'id': 4}, {'id': 5}])}
+    )
+
+    tool_response = await run_query(
+        'SELECT id FROM t ORDER BY id;',
+        DummyCtx(),
+        mock_db_connection,
+        max_rows=2,
+        offset=2,
+    )
+
+    assert tool_response == {
+        'rows': [{'id': 3}, {'id': 4}],
+        continuation_key: {'offset': 4, 'max_rows': 2},
+    }
+    assert mock_db_connection.data_client.execute_statement_calls[0]['sql'] == (
+        'SELECT * FROM (\nSELECT id FROM t ORDER BY id\n) AS paged_query LIMIT 3 OFFSET 2'
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_query_max_rows_pages_unwrappable_statements():
+    """Test that statements which cannot be wrapped are paged after decoding."""
+    mock_db_connection = Mock_DBConnection(readonly=False)
+    mock_db_connection.data_client.add_mock_response(
+        {'formattedRecords': json.dumps([{'plan': str(i)} for i in range(5)])}
+    )
+
+    tool_response = await run_query(
+        'EXPLAIN SELECT 1', DummyCtx(), mock_db_connection, max_rows=3, offset=3
+    )
+
+    assert tool_response == {'rows': [{'plan': '3'}, {'plan': '4'}], continuation_key: None}
+    assert mock_db_connection.data_client.execute_statement_calls[0]['sql'] == 'EXPLAIN SELECT 1'
+
+
+def test_query_cache_expires_and_evicts():
+    """Test that cache entries expire after the TTL and the least recently used is evicted."""
+    assert not QueryCache().enabled
+    disabled = QueryCache()
+    disabled.put('key', [{'a': 1}])
+    assert disabled.get('key') is None
+
+    cache = QueryCache(ttl=10, max_entries=2)
+    with patch('awslabs.postgres_mcp_server.query_cache.time.monotonic', return_value=100.0):
+        cache.put('a', [{'a': 1}])
+        cache.put('b', [{'b': 1}])
+        assert cache.get('a') == [{'a': 1}]
+        cache.put('c', [{'c': 1}])
+        assert cache.get('b') is None  # least recently used
+        assert len(cache) == 2
+
+        # Returned rows are copies
+        cache.get('a')[0]['a'] = 2  # type: ignore
+        assert cache.get('a') == [{'a': 1}]
+
+    with patch('awslabs.postgres_mcp_server.query_cache.time.monotonic', return_value=111.0):
+        assert cache.get('a') is None
+
+
+@pytest.mark.asyncio
+async def test_run_query_serves_identical_readonly_queries_from_cache():
+    """Test that identical read-only queries hit the result cache when it is enabled."""
+    server.query_result_cache.ttl = 60
+    mock_db_connection = Mock_DBConnection(readonly=True)
+    mock_db_connection.data_client.add_mock_response({})
+    mock_db_connection.data_client.add_mock_response({'formattedRecords': json.dumps([{'id': 1}])})
+
+    first = await run_query('SELECT id FROM t', DummyCtx(), mock_db_connection)
+    second = await run_query('SELECT id FROM t', DummyCtx(), mock_db_connection)
+
+    assert first == second == [{'id': 1}]
+    assert len(mock_db_connection.data_client.execute_statement_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_readonly_query_rolls_back_in_background():
+    """Test that read-only transactions are rolled back off the request path."""
+    mock_db_connection = Mock_DBConnection(readonly=True)
+    mock_db_connection.data_client.add_mock_response({})
+    mock_db_connection.data_client.add_mock_response(get_mock_normal_query_response())
+
+    with patch.object(server, 'transaction_executor', MagicMock()) as mock_executor:
+        await run_query('SELECT 1', DummyCtx(), mock_db_connection)
+
+    mock_executor.submit.assert_called_once_with(
+        server.rollback_readonly_transaction, mock_db_connection, 'txt-id-xxxxx'
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_table_schema_cache_cleared_by_writes():
+    """Test that get_table_schema results are cached until a write query runs."""
+    DBConnectionSingleton.initialize('mock', 'mock', 'mock', 'mock', readonly=False, is_test=True)
+    mock_db_connection = Mock_DBConnection(readonly=False)
+    for _ in range(2):
+        mock_db_connection.data_client.add_mock_response(get_mock_normal_query_response())
+    mock_db_connection.data_client.add_mock_response({})
+    DBConnectionSingleton._instance._db_connection = mock_db_connection  # type: ignore
+    calls = mock_db_connection.data_client.execute_statement_calls
+
+    first = await get_table_schema('table_name', DummyCtx())
+    second = await get_table_schema('table_name', DummyCtx())
+    assert first == second
+    assert len(calls) == 1
+
+    await run_query('ALTER TABLE table_name ADD COLUMN c int', DummyCtx(), mock_db_connection)
+    await get_table_schema('table_name', DummyCtx())
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_paged_statement_raises_errors_once():
+    """Test that a rejected wrapped query is not run a second time."""
+    error = ClientError(
+        {'Error': {'Code': 'BadRequestException', 'Message': 'column "x" does not exist'}},
+        'execute_statement',
+    )
+    execute = AsyncMock(side_effect=error)
+
+    with patch('awslabs.postgres_mcp_server.server.execute_statement', execute):
+        with pytest.raises(ClientError):
+            await execute_paged_statement(None, 'SELECT x FROM t', None, 2, 0)
+
+    assert execute.await_count == 1
+
+
 if __name__ == '__main__':
     DBConnectionSingleton.initialize('mock', 'mock', 'mock', 'mock', readonly=True, is_test=True)
     asyncio.run(test_run_query_well_formatted_response())
@@ -0,0 +1,128 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-workspace catalog of metric names, label names and label values."""
+
+import asyncio
+import bisect
+import difflib
+import time
+from awslabs.prometheus_mcp_server.consts import CATALOG_MAX_STALE, CATALOG_TTL
+from loguru import logger
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+Loader = Callable[[], Awaitable[List[str]]]
+
+
+class MetricCatalog:
+    """Stale-while-revalidate cache of sorted name lists per workspace.
+
+    Each entry is a sorted list of strings (metric names, label names, or the values
+    of one label) keyed by workspace and kind. Fresh entries are served from memory.
+    Entries older than ``ttl`` are still served, while a single background task
+    reloads them. Entries older than ``max_stale`` are reloaded before returning.
+    """
+
+    def __init__(self, ttl: float = CATALOG_TTL, max_stale: float = CATALOG_MAX_STALE):
+        """Initialize the catalog.
+
+        Args:
+            ttl: Seconds after which an entry is refreshed in the background
+            max_stale: Seconds after which an entry is no longer served without reloading
+        """
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._entries: Dict[Tuple, Tuple[float, List[str]]] = {}
+        self._refreshing: Dict[Tuple, asyncio.Task] = {}
+
+    async def get(self, key: Tuple, loader: Loader) -> List[str]:
+        """Return the sorted names for key, loading or refreshing them as needed.
+
+        Args:
+            key: Catalog key, e.g. (workspace, 'metrics')
+            loader: Coroutine function returning the names from Prometheus
+
+        Returns:
+            Sorted list of names
+        """
+        entry = self._entries.get(key)
+        now = time.time()
+        if entry is None or now - entry[0] > self.max_stale:
+            return await self._load(key, loader)
+
+        loaded_at, names = entry
+        if now - loaded_at > self.ttl and key not in self._refreshing:
+            logger.debug(f'Refreshing catalog entry {key} in the background')
+            task = asyncio.create_task(self._load(key, loader))
+            self._refreshing[key] = task
+            task.add_done_callback(lambda t: self._on_refreshed(key, t))
+        return names
+
+    async def _load(self, key: Tuple, loader: Loader) -> List[str]:
+        names = sorted(await loader() or [])
+        self._entries[key] = (time.time(), names)
+        return names
+
+    def _on_refreshed(self, key: Tuple, task: asyncio.Task) -> None:
+        self._refreshing.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f'Background refresh of catalog entry {key} failed: {task.exception()}')
+
+    def invalidate(self, workspace: Optional[str] = None) -> None:
+        """Drop all entries, or only those of one workspace."""
+        if workspace is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0] == workspace]:
+            del self._entries[key]
+
+
+metric_catalog = MetricCatalog()
+
+
+def search_names(
+    names: List[str],
+    prefix: Optional[str] = None,
+    search: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> List[str]:
+    """Filter a sorted name list by prefix and/or fuzzy search.
+
+    Args:
+        names: Sorted list of names
+        prefix: Only return names starting with this prefix
+        search: Case-insensitive substring to look for; when nothing contains it,
+            the closest names by similarity are returned instead
+        limit: Maximum number of names to return
+
+    Returns:
+        Matching names, sorted (or ranked by similarity for fuzzy matches)
+    """
+    candidates = names
+    if prefix:
+        lo = bisect.bisect_left(names, prefix)
+        hi = bisect.bisect_left(names, prefix + '\U0010ffff', lo)
+        candidates = names[lo:hi]
+
+    if search:
+        needle = search.lower()
+        matches = [name for name in candidates if needle in name.lower()]
+        if not matches:
+            matches = difflib.get_close_matches(search, candidates, n=limit or 20, cutoff=0.6)
+        candidates = matches
+
+    if limit:
+        candidates = candidates[:limit]
+    return list(candidates)
@@ -20,6 +20,19 @@ DEFAULT_SERVICE_NAME = 'aps'
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1  # seconds
 
+# Range query splitting and caching
+RANGE_QUERY_CHUNK_POINTS = 720  # samples per series per sub-range request
+RANGE_QUERY_MAX_POINTS = 11000  # samples per series per range query, as Prometheus allows
+RANGE_QUERY_MAX_CONCURRENCY = 4
+RANGE_QUERY_CACHE_MAX_ENTRIES = 512
+RANGE_QUERY_CACHE_TTL = 3600  # seconds
+RANGE_QUERY_CACHE_SETTLE_SECONDS = 300  # sub-ranges newer than this are never cached
+
+# Metric catalog and workspace resolution caching
+CATALOG_TTL = 300  # seconds before a catalog entry is refreshed in the background
+CATALOG_MAX_STALE = 3600  # seconds after which a catalog entry is reloaded before use
+WORKSPACE_CONFIG_TTL = 900  # seconds a resolved workspace URL is reused
+
 # API endpoints and paths
 API_VERSION_PATH = '/api/v1'
 
@@ -48,7 +61,10 @@ Execute an instant PromQL query against Prometheus.
 Execute a PromQL range query with start time, end time, and step interval.
 
 ### list_metrics
-List all available metrics in Prometheus.
+List available metrics in Prometheus, optionally filtered by prefix or fuzzy search.
+
+### list_labels
+List label names, or the values of one label, optionally filtered by prefix or fuzzy search.
 
 ### get_server_info
 Get information about the Prometheus server configuration.
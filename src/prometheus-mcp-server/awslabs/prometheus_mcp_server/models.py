@@ -30,6 +30,20 @@ class MetricsList(BaseModel):
     )
 
 
+class LabelsList(BaseModel):
+    """Label names, or the values of a single label, available in Prometheus.
+
+    Attributes:
+        label: The label whose values are listed, or None when listing label names.
+        values: List of label names or label values.
+    """
+
+    label: Optional[str] = Field(
+        None, description='The label whose values are listed, or None for label names'
+    )
+    values: List[str] = Field(description='List of label names or label values')
+
+
 class ServerInfo(BaseModel):
     """Information about the Prometheus server configuration.
 
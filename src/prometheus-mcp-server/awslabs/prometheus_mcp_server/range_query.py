@@ -0,0 +1,388 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Range query splitting, sub-range caching and result shaping for Prometheus."""
+
+import asyncio
+import math
+import re
+import time
+from awslabs.prometheus_mcp_server.consts import (
+    RANGE_QUERY_CACHE_MAX_ENTRIES,
+    RANGE_QUERY_CACHE_SETTLE_SECONDS,
+    RANGE_QUERY_CACHE_TTL,
+    RANGE_QUERY_CHUNK_POINTS,
+    RANGE_QUERY_MAX_CONCURRENCY,
+    RANGE_QUERY_MAX_POINTS,
+)
+from collections import OrderedDict
+from datetime import datetime, timezone
+from loguru import logger
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+# Prometheus duration units in seconds
+DURATION_UNITS = {
+    'ms': 0.001,
+    's': 1,
+    'm': 60,
+    'h': 3600,
+    'd': 86400,
+    'w': 604800,
+    'y': 31536000,
+}
+
+DOWNSAMPLE_METHODS = ('avg', 'min', 'max', 'last')
+OUTPUT_FORMATS = ('raw', 'compact', 'summary')
+
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h|d|w|y)')
+
+
+def parse_duration(value: str) -> float:
+    """Parse a Prometheus duration ('30s', '1h30m') or a float number of seconds.
+
+    Args:
+        value: The duration string
+
+    Returns:
+        The duration in seconds
+
+    Raises:
+        ValueError: If the duration cannot be parsed or is not positive
+    """
+    text = str(value).strip()
+    try:
+        seconds = float(text)
+    except ValueError:
+        parts = _DURATION_PART.findall(text)
+        if not parts or ''.join(f'{n}{u}' for n, u in parts) != text:
+            raise ValueError(f'Invalid duration: {value}')
+        seconds = sum(float(n) * DURATION_UNITS[u] for n, u in parts)
+
+    if seconds <= 0:
+        raise ValueError(f'Duration must be positive: {value}')
+    return seconds
+
+
+def parse_timestamp(value: str) -> float:
+    """Parse an RFC3339 or Unix timestamp into Unix seconds.
+
+    Args:
+        value: The timestamp string
+
+    Returns:
+        The timestamp as Unix seconds
+
+    Raises:
+        ValueError: If the timestamp cannot be parsed
+    """
+    text = str(value).strip()
+    try:
+        return float(text)
+    except ValueError:
+        pass
+
+    parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def split_range(
+    start: float,
+    end: float,
+    step: float,
+    chunk_points: int = RANGE_QUERY_CHUNK_POINTS,
+    max_points: int = RANGE_QUERY_MAX_POINTS,
+) -> List[Tuple[float, float]]:
+    """Split [start, end] into sub-ranges aligned to multiples of step and of the chunk width.
+
+    Evaluation timestamps are aligned to multiples of ``step`` (the first one is the
+    first multiple at or after ``start``), and sub-range boundaries fall on multiples of
+    ``step * chunk_points`` since the epoch. The same window therefore produces the same
+    sub-ranges for every query that overlaps it, which is what makes them cacheable.
+
+    Args:
+        start: Range start in Unix seconds
+        end: Range end in Unix seconds
+        step: Resolution step in seconds
+        chunk_points: Maximum number of samples per series in one sub-range
+        max_points: Maximum number of samples per series in the whole range
+
+    Returns:
+        List of (sub_start, sub_end) tuples, both inclusive, in chronological order
+
+    Raises:
+        ValueError: If end is before start, or the range holds more than max_points steps
+    """
+    if end < start:
+        raise ValueError('end timestamp must not be before start time')
+    first = math.ceil(start / step) * step
+    if first > end:
+        return []
+    points = math.floor((end - first) / step) + 1
+    if points > max_points:
+        raise ValueError(
+            f'exceeded maximum resolution of {max_points} points per timeseries '
+            f'({points} requested), try increasing the step or shortening the range'
+        )
+
+    width = step * chunk_points
+    windows = []
+    window_start = first
+    while window_start <= end:
+        boundary = (math.floor(window_start / width) + 1) * width
+        window_end = min(end, boundary - step)
+        # Keep the sub-range end on the step grid
+        window_end = first + math.floor((window_end - first) / step) * step
+        windows.append((window_start, window_end))
+        window_start = window_end + step
+    return windows
+
+
+class RangeQueryCache:
+    """LRU cache of immutable past sub-range results.
+
+    Entries are keyed by (workspace, query, step, sub-range start, sub-range end). Only
+    sub-ranges that ended at least ``settle_seconds`` ago are stored, so late samples
+    that are still being ingested never get pinned in the cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = RANGE_QUERY_CACHE_MAX_ENTRIES,
+        ttl: float = RANGE_QUERY_CACHE_TTL,
+        settle_seconds: float = RANGE_QUERY_CACHE_SETTLE_SECONDS,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of sub-range results to keep
+            ttl: Seconds after which an entry is discarded regardless of use
+            settle_seconds: Minimum age of a sub-range end before it is cacheable
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.settle_seconds = settle_seconds
+        self._entries: OrderedDict = OrderedDict()
+
+    def is_cacheable(self, window_end: float, now: Optional[float] = None) -> bool:
+        """Return True if a sub-range ending at window_end is old enough to be immutable."""
+        now = time.time() if now is None else now
+        return window_end <= now - self.settle_seconds
+
+    def get(self, key: Tuple) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached series for key, or None on a miss or expired entry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, series = entry
+        if time.time() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return series
+
+    def put(self, key: Tuple, series: List[Dict[str, Any]]) -> None:
+        """Store the series for key, evicting the least recently used entries."""
+        self._entries[key] = (time.time(), series)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+
+range_query_cache = RangeQueryCache()
+
+
+def merge_matrices(chunks: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Concatenate per-sub-range matrix results into one matrix.
+
+    Args:
+        chunks: The ``result`` lists of each sub-range, in chronological order
+
+    Returns:
+        A single matrix result with the values of each series concatenated
+    """
+    merged: Dict[Tuple, Dict[str, Any]] = {}
+    for chunk in chunks:
+        for series in chunk:
+            metric = series.get('metric', {})
+            key = tuple(sorted(metric.items()))
+            if key not in merged:
+                merged[key] = {'metric': metric, 'values': []}
+            merged[key]['values'].extend(series.get('values', []))
+    return list(merged.values())
+
+
+def downsample_values(
+    values: List[List[Any]], max_points: int, method: str = 'avg'
+) -> List[Tuple[float, float]]:
+    """Reduce a series to at most max_points numeric points.
+
+    Consecutive samples are grouped into equally sized buckets, each of which is
+    reduced with ``method`` and stamped with the timestamp of its last sample.
+
+    Args:
+        values: Prometheus ``[timestamp, "value"]`` pairs
+        max_points: Maximum number of points to return
+        method: One of 'avg', 'min', 'max' or 'last'
+
+    Returns:
+        List of (timestamp, value) tuples with numeric values
+    """
+    points = [(float(ts), float(val)) for ts, val in values]
+    if max_points <= 0 or len(points) <= max_points:
+        return points
+
+    bucket_size = math.ceil(len(points) / max_points)
+    reduced = []
+    for i in range(0, len(points), bucket_size):
+        bucket = points[i : i + bucket_size]
+        samples = [v for _, v in bucket if not math.isnan(v)] or [math.nan]
+        if method == 'min':
+            value = min(samples)
+        elif method == 'max':
+            value = max(samples)
+        elif method == 'last':
+            value = bucket[-1][1]
+        else:
+            value = sum(samples) / len(samples)
+        reduced.append((bucket[-1][0], value))
+    return reduced
+
+
+def summarize_values(values: List[List[Any]]) -> Dict[str, Any]:
+    """Aggregate a series into count, min, max, avg and last value."""
+    samples = [float(val) for _, val in values]
+    finite = [v for v in samples if not math.isnan(v)]
+    return {
+        'count': len(samples),
+        'min': min(finite) if finite else None,
+        'max': max(finite) if finite else None,
+        'avg': sum(finite) / len(finite) if finite else None,
+        'last': samples[-1] if samples else None,
+        'first_timestamp': float(values[0][0]) if values else None,
+        'last_timestamp': float(values[-1][0]) if values else None,
+    }
+
+
+def shape_matrix(
+    result: List[Dict[str, Any]],
+    output_format: str = 'raw',
+    max_points: Optional[int] = None,
+    downsample: str = 'avg',
+) -> List[Dict[str, Any]]:
+    """Convert a matrix result into the requested output format.
+
+    Args:
+        result: Matrix result with Prometheus string-valued samples
+        output_format: 'raw' keeps Prometheus pairs, 'compact' returns numeric
+            ``timestamps``/``values`` arrays, 'summary' returns per-series aggregates
+        max_points: Optional maximum number of points per series
+        downsample: Bucket reduction used when max_points is exceeded
+
+    Returns:
+        The shaped matrix result
+    """
+    shaped = []
+    for series in result:
+        values = series.get('values', [])
+        if output_format == 'summary':
+            shaped.append({'metric': series.get('metric', {}), **summarize_values(values)})
+            continue
+
+        if output_format == 'raw' and not max_points:
+            shaped.append(series)
+            continue
+
+        points = downsample_values(values, max_points or 0, downsample)
+        if output_format == 'compact':
+            shaped.append(
+                {
+                    'metric': series.get('metric', {}),
+                    'timestamps': [ts for ts, _ in points],
+                    'values': [val for _, val in points],
+                }
+            )
+        else:
+            shaped.append(
+                {
+                    'metric': series.get('metric', {}),
+                    'values': [[ts, str(val)] for ts, val in points],
+                }
+            )
+    return shaped
+
+
+async def fetch_range(
+    fetch: Callable[[float, float], Awaitable[Dict[str, Any]]],
+    cache_scope: Tuple,
+    start: float,
+    end: float,
+    step: float,
+    chunk_points: int = RANGE_QUERY_CHUNK_POINTS,
+    max_concurrency: int = RANGE_QUERY_MAX_CONCURRENCY,
+    cache: Optional[RangeQueryCache] = None,
+) -> Dict[str, Any]:
+    """Fetch a range query as step-aligned sub-ranges, concurrently and through the cache.
+
+    Args:
+        fetch: Coroutine function issuing one ``query_range`` call for (start, end)
+        cache_scope: Key prefix identifying the workspace, query and step
+        start: Range start in Unix seconds
+        end: Range end in Unix seconds
+        step: Resolution step in seconds
+        chunk_points: Maximum number of samples per series in one sub-range
+        max_concurrency: Maximum number of sub-range requests in flight
+        cache: Sub-range cache to use (defaults to the module-level cache)
+
+    Returns:
+        The merged matrix response
+
+    Raises:
+        ValueError: If the range is invalid or holds too many steps (see split_range)
+    """
+    cache = range_query_cache if cache is None else cache
+    windows = split_range(start, end, step, chunk_points)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    now = time.time()
+    hits = 0
+
+    async def fetch_window(window: Tuple[float, float]) -> List[Dict[str, Any]]:
+        nonlocal hits
+        key = (*cache_scope, window[0], window[1])
+        cached = cache.get(key)
+        if cached is not None:
+            hits += 1
+            return cached
+
+        async with semaphore:
+            data = await fetch(window[0], window[1])
+        series = (data or {}).get('result', [])
+        if cache.is_cacheable(window[1], now):
+            cache.put(key, series)
+        return series
+
+    chunks = await asyncio.gather(*(fetch_window(window) for window in windows))
+    logger.debug(f'Range query served {hits}/{len(windows)} sub-ranges from cache')
+
+    return {'resultType': 'matrix', 'result': merge_matrices(list(chunks))}
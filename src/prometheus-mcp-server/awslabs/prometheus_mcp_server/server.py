@@ -15,12 +15,15 @@
 """Prometheus MCP Server implementation."""
 
 import argparse
+import asyncio
 import boto3
 import json
 import os
+import re
 import requests
 import sys
 import time
+from awslabs.prometheus_mcp_server.catalog import metric_catalog, search_names
 from awslabs.prometheus_mcp_server.consts import (
     API_VERSION_PATH,
     DEFAULT_AWS_REGION,
@@ -31,11 +34,21 @@ from awslabs.prometheus_mcp_server.consts import (
     ENV_AWS_REGION,
     ENV_LOG_LEVEL,
     SERVER_INSTRUCTIONS,
+    WORKSPACE_CONFIG_TTL,
 )
 from awslabs.prometheus_mcp_server.models import (
+    LabelsList,
     MetricsList,
     ServerInfo,
 )
+from awslabs.prometheus_mcp_server.range_query import (
+    DOWNSAMPLE_METHODS,
+    OUTPUT_FORMATS,
+    fetch_range,
+    parse_duration,
+    parse_timestamp,
+    shape_matrix,
+)
 from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
 from botocore.config import Config
@@ -44,7 +57,8 @@ from dotenv import load_dotenv
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
-from typing import Any, Dict, Optional
+from pydantic.fields import FieldInfo
+from typing import Any, Dict, Optional, Tuple
 
 
 # Configure loguru
@@ -297,7 +311,8 @@ class PrometheusClient:
                     logger.debug(
                         f'Making request to {url} (attempt {retry_count + 1}/{max_retries})'
                     )
-                    response = req_session.send(prepared_request)
+                    # Send off the event loop so concurrent sub-range requests overlap
+                    response = await asyncio.to_thread(req_session.send, prepared_request)
                     response.raise_for_status()
                     data = response.json()
 
@@ -315,7 +330,7 @@ class PrometheusClient:
                         2 ** (retry_count - 1)
                     )  # Exponential backoff
                     logger.warning(f'Request failed: {e}. Retrying in {retry_delay_seconds}s...')
-                    time.sleep(retry_delay_seconds)
+                    await asyncio.sleep(retry_delay_seconds)
                 else:
                     logger.error(f'Request failed after {max_retries} attempts: {e}')
                     raise
@@ -574,6 +589,18 @@ async def execute_range_query(
     ),
     region: Optional[str] = Field(None, description='AWS region (defaults to current region)'),
     profile: Optional[str] = Field(None, description='AWS profile to use (defaults to None)'),
+    output_format: str = Field(
+        'raw',
+        description="Result format: 'raw' (Prometheus [ts, \"value\"] pairs), 'compact' (numeric timestamps/values arrays per series) or 'summary' (count/min/max/avg/last per series)",
+    ),
+    max_points: Optional[int] = Field(
+        None,
+        description='Optional maximum number of points per series; longer series are downsampled',
+    ),
+    downsample: str = Field(
+        'avg',
+        description="Reduction applied when downsampling to max_points: 'avg', 'min', 'max' or 'last'",
+    ),
 ) -> Dict[str, Any]:
     r"""Execute a range query and return the result.
 
@@ -584,6 +611,12 @@ async def execute_range_query(
     - If workspace_id is not known, use GetAvailableWorkspaces tool first to find available workspaces and ASK THE USER to choose one
     - Uses DescribeWorkspace API to get the exact workspace URL
     - No manual URL construction is performed
+    - Long ranges are split into step-aligned sub-ranges that are fetched concurrently;
+      evaluation timestamps are aligned to multiples of step
+    - Sub-ranges that lie fully in the past are cached, so repeated queries over the same
+      window only fetch the most recent data
+    - For long ranges prefer output_format 'compact' or 'summary', and/or max_points, to keep
+      the response small
 
     ## Example
     Input:
@@ -619,18 +652,57 @@ async def execute_range_query(
             await ctx.error(error_msg)
             raise ValueError(error_msg)
 
-        params = {'query': query, 'start': start, 'end': end, 'step': step}
+        # Handle Pydantic Field objects when called directly (not through MCP framework)
+        if isinstance(output_format, FieldInfo):
+            output_format = output_format.default
+        if isinstance(max_points, FieldInfo):
+            max_points = max_points.default
+        if isinstance(downsample, FieldInfo):
+            downsample = downsample.default
 
-        return await PrometheusClient.make_request(
-            prometheus_url=workspace_config['prometheus_url'],
-            endpoint='query_range',
-            params=params,
-            region=workspace_config['region'],
-            profile=workspace_config['profile'],
-            max_retries=DEFAULT_MAX_RETRIES,
-            retry_delay=DEFAULT_RETRY_DELAY,
-            service_name=DEFAULT_SERVICE_NAME,
-        )
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f'Invalid output_format {output_format}, expected one of {OUTPUT_FORMATS}'
+            )
+        if downsample not in DOWNSAMPLE_METHODS:
+            raise ValueError(
+                f'Invalid downsample {downsample}, expected one of {DOWNSAMPLE_METHODS}'
+            )
+
+        async def fetch(sub_start, sub_end):
+            return await PrometheusClient.make_request(
+                prometheus_url=workspace_config['prometheus_url'],
+                endpoint='query_range',
+                params={'query': query, 'start': sub_start, 'end': sub_end, 'step': step},
+                region=workspace_config['region'],
+                profile=workspace_config['profile'],
+                max_retries=DEFAULT_MAX_RETRIES,
+                retry_delay=DEFAULT_RETRY_DELAY,
+                service_name=DEFAULT_SERVICE_NAME,
+            )
+
+        try:
+            start_ts = parse_timestamp(start)
+            end_ts = parse_timestamp(end)
+            step_seconds = parse_duration(step)
+        except ValueError as e:
+            # Let Prometheus interpret anything we cannot parse ourselves
+            logger.debug(f'Not splitting range query: {e}')
+            data = await fetch(start, end)
+        else:
+            cache_scope = (
+                workspace_config.get('workspace_id') or workspace_config['prometheus_url'],
+                query,
+                step_seconds,
+            )
+            data = await fetch_range(fetch, cache_scope, start_ts, end_ts, step_seconds)
+
+        if data and data.get('resultType') == 'matrix' and (output_format != 'raw' or max_points):
+            data = {
+                **data,
+                'result': shape_matrix(data['result'], output_format, max_points, downsample),
+            }
+        return data
     except Exception as e:
         error_msg = f'Error executing range query: {str(e)}'
         logger.error(error_msg)
@@ -647,6 +719,14 @@ async def list_metrics(
     ),
     region: Optional[str] = Field(None, description='AWS region (defaults to current region)'),
     profile: Optional[str] = Field(None, description='AWS profile to use (defaults to None)'),
+    prefix: Optional[str] = Field(
+        None, description='Only return metric names starting with this prefix'
+    ),
+    search: Optional[str] = Field(
+        None,
+        description='Case-insensitive substring to search for; falls back to the closest matching names',
+    ),
+    limit: Optional[int] = Field(None, description='Maximum number of metric names to return'),
 ) -> MetricsList:
     """Get a list of all metric names.
 
@@ -655,6 +735,9 @@ async def list_metrics(
     - Returns a sorted list of all metric names
     - Useful for exploration before crafting specific queries
     - If workspace_id is not known, use GetAvailableWorkspaces tool first to find available workspaces and ASK THE USER to choose one
+    - Metric names are cached per workspace and refreshed in the background, so filtering
+      with prefix, search and limit does not add a round trip
+    - On workspaces with many metrics, prefer prefix/search/limit over listing everything
 
     ## Example
     Input:
@@ -671,6 +754,14 @@ async def list_metrics(
         ]
       }
     """
+    # Handle Pydantic Field objects when called directly (not through MCP framework)
+    if isinstance(prefix, FieldInfo):
+        prefix = prefix.default
+    if isinstance(search, FieldInfo):
+        search = search.default
+    if isinstance(limit, FieldInfo):
+        limit = limit.default
+
     try:
         # Configure workspace using the provided workspace_id
         workspace_config = await configure_workspace_for_request(
@@ -679,17 +770,11 @@ async def list_metrics(
 
         logger.info('Listing all available metrics')
 
-        data = await PrometheusClient.make_request(
-            prometheus_url=workspace_config['prometheus_url'],
-            endpoint='label/__name__/values',
-            params={},
-            region=workspace_config['region'],
-            profile=workspace_config['profile'],
-            max_retries=DEFAULT_MAX_RETRIES,
-            retry_delay=DEFAULT_RETRY_DELAY,
-            service_name=DEFAULT_SERVICE_NAME,
+        names = await metric_catalog.get(
+            (_catalog_scope(workspace_config), 'metrics'),
+            lambda: _fetch_names(workspace_config, 'label/__name__/values'),
         )
-        return MetricsList(metrics=sorted(data))
+        return MetricsList(metrics=search_names(names, prefix, search, limit))
     except Exception as e:
         error_msg = f'Error listing metrics: {str(e)}'
         logger.error(error_msg)
@@ -697,6 +782,105 @@ async def list_metrics(
         raise
 
 
+@mcp.tool(name='ListLabels')
+async def list_labels(
+    ctx: Context,
+    workspace_id: Optional[str] = Field(
+        None,
+        description='The Prometheus workspace ID to use (e.g., ws-12345678-abcd-1234-efgh-123456789012). Optional if a URL is configured via command line arguments.',
+    ),
+    label: Optional[str] = Field(
+        None, description='Label whose values to list; omit to list label names'
+    ),
+    prefix: Optional[str] = Field(
+        None, description='Only return entries starting with this prefix'
+    ),
+    search: Optional[str] = Field(
+        None,
+        description='Case-insensitive substring to search for; falls back to the closest matching entries',
+    ),
+    limit: Optional[int] = Field(None, description='Maximum number of entries to return'),
+    region: Optional[str] = Field(None, description='AWS region (defaults to current region)'),
+    profile: Optional[str] = Field(None, description='AWS profile to use (defaults to None)'),
+) -> LabelsList:
+    """Get label names, or the values of one label.
+
+    ## Usage
+    - Use this tool to discover label names and values before writing label matchers
+    - Without label, returns the sorted label names of the workspace
+    - With label, returns the sorted values of that label
+    - Results are cached per workspace and refreshed in the background
+    - If workspace_id is not known, use GetAvailableWorkspaces tool first to find available workspaces and ASK THE USER to choose one
+
+    ## Example
+    Input:
+      workspace_id: "ws-12345678-abcd-1234-efgh-123456789012"
+      label: "job"
+
+    Output:
+      {
+        "label": "job",
+        "values": ["node", "prometheus"]
+      }
+    """
+    # Handle Pydantic Field objects when called directly (not through MCP framework)
+    if isinstance(label, FieldInfo):
+        label = label.default
+    if isinstance(prefix, FieldInfo):
+        prefix = prefix.default
+    if isinstance(search, FieldInfo):
+        search = search.default
+    if isinstance(limit, FieldInfo):
+        limit = limit.default
+
+    try:
+        if label is not None and not re.fullmatch(r'[a-zA-Z_][a-zA-Z0-9_]*', label):
+            raise ValueError(f'Invalid label name: {label}')
+
+        # Configure workspace using the provided workspace_id
+        workspace_config = await configure_workspace_for_request(
+            ctx, workspace_id, region, profile
+        )
+
+        scope = _catalog_scope(workspace_config)
+        if label:
+            logger.info(f'Listing values of label {label}')
+            names = await metric_catalog.get(
+                (scope, 'label_values', label),
+                lambda: _fetch_names(workspace_config, f'label/{label}/values'),
+            )
+        else:
+            logger.info('Listing label names')
+            names = await metric_catalog.get(
+                (scope, 'labels'), lambda: _fetch_names(workspace_config, 'labels')
+            )
+        return LabelsList(label=label, values=search_names(names, prefix, search, limit))
+    except Exception as e:
+        error_msg = f'Error listing labels: {str(e)}'
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        raise
+
+
+def _catalog_scope(workspace_config: Dict[str, Any]) -> str:
+    """Return the key identifying a workspace in the metric catalog."""
+    return workspace_config.get('workspace_id') or workspace_config['prometheus_url']
+
+
+async def _fetch_names(workspace_config: Dict[str, Any], endpoint: str):
+    """Fetch a list of names from a Prometheus label endpoint."""
+    return await PrometheusClient.make_request(
+        prometheus_url=workspace_config['prometheus_url'],
+        endpoint=endpoint,
+        params={},
+        region=workspace_config['region'],
+        profile=workspace_config['profile'],
+        max_retries=DEFAULT_MAX_RETRIES,
+        retry_delay=DEFAULT_RETRY_DELAY,
+        service_name=DEFAULT_SERVICE_NAME,
+    )
+
+
 @mcp.tool(name='GetServerInfo')
 async def get_server_info(
     ctx: Context,
@@ -926,6 +1110,10 @@ def extract_workspace_id_from_url(url: str) -> Optional[str]:
     return None
 
 
+# Resolved workspace configurations, keyed by (workspace_id, region, profile, url)
+_workspace_config_cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+
+
 async def configure_workspace_for_request(
     ctx: Context,
     workspace_id: Optional[str] = None,
@@ -937,6 +1125,8 @@ async def configure_workspace_for_request(
     If a URL is provided via environment variable, it will be used directly.
     If a workspace ID is provided, it will be used to fetch the URL from AWS API.
     If no workspace ID is provided but the URL contains one, it will be extracted and used.
+    Successfully resolved and tested configurations are reused for WORKSPACE_CONFIG_TTL
+    seconds, so repeated tool calls skip DescribeWorkspace and the connection test.
 
     Args:
         ctx: The MCP context
@@ -955,6 +1145,12 @@ async def configure_workspace_for_request(
         # Check if we have a URL from environment
         prometheus_url = os.getenv('PROMETHEUS_URL')
 
+        cache_key = (workspace_id, aws_region, aws_profile, prometheus_url)
+        cached = _workspace_config_cache.get(cache_key)
+        if cached and time.time() - cached[0] < WORKSPACE_CONFIG_TTL:
+            logger.debug(f'Using cached workspace configuration for {workspace_id}')
+            return dict(cached[1])
+
         # If no workspace_id is provided, extract it from the URL if possible
         if not workspace_id and prometheus_url:
             extracted_workspace_id = extract_workspace_id_from_url(prometheus_url)
@@ -975,12 +1171,14 @@ async def configure_workspace_for_request(
                 await ctx.error(error_msg)
                 raise RuntimeError(error_msg)
 
-            return {
+            workspace_config = {
                 'prometheus_url': prometheus_url,
                 'region': aws_region,
                 'profile': aws_profile,
                 'workspace_id': workspace_id,
             }
+            _workspace_config_cache[cache_key] = (time.time(), workspace_config)
+            return dict(workspace_config)
 
         # If no URL is configured, require workspace_id
         if not workspace_id:
@@ -1012,12 +1210,14 @@ async def configure_workspace_for_request(
         logger.info(f'Successfully configured workspace {workspace_id} for request')
 
         # Return workspace configuration
-        return {
+        workspace_config = {
             'prometheus_url': prometheus_url,
             'region': aws_region,
             'profile': aws_profile,
             'workspace_id': workspace_id,
         }
+        _workspace_config_cache[cache_key] = (time.time(), workspace_config)
+        return dict(workspace_config)
     except Exception as e:
         error_msg = f'Error configuring workspace: {str(e)}'
         logger.error(error_msg)
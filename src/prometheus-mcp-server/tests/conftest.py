@@ -18,6 +18,19 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Reset the in-process caches so tests do not see each other's results."""
+    from awslabs.prometheus_mcp_server import server
+    from awslabs.prometheus_mcp_server.catalog import metric_catalog
+    from awslabs.prometheus_mcp_server.range_query import range_query_cache
+
+    server._workspace_config_cache.clear()
+    metric_catalog.invalidate()
+    range_query_cache.clear()
+    yield
+
+
 @pytest.fixture
 def mock_context():
     """Create a mock Context object for testing."""
@@ -0,0 +1,186 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the metric catalog and workspace resolution caching."""
+
+import asyncio
+import pytest
+import time
+from awslabs.prometheus_mcp_server.catalog import MetricCatalog, search_names
+from awslabs.prometheus_mcp_server.models import LabelsList
+from awslabs.prometheus_mcp_server.server import (
+    configure_workspace_for_request,
+    list_labels,
+    list_metrics,
+)
+from unittest.mock import AsyncMock, patch
+
+
+WORKSPACE_CONFIG = {
+    'prometheus_url': 'https://example.com',
+    'region': 'us-east-1',
+    'profile': None,
+    'workspace_id': 'ws-12345',
+}
+
+
+class TestSearchNames:
+    """Tests for prefix and fuzzy name search."""
+
+    NAMES = sorted(['http_requests_total', 'http_errors_total', 'node_cpu_seconds', 'up'])
+
+    def test_prefix(self):
+        """Test prefix filtering on a sorted list."""
+        assert search_names(self.NAMES, prefix='http_') == [
+            'http_errors_total',
+            'http_requests_total',
+        ]
+        assert search_names(self.NAMES, prefix='zzz') == []
+
+    def test_substring_and_limit(self):
+        """Test case-insensitive substring search with a limit."""
+        assert search_names(self.NAMES, search='TOTAL', limit=1) == ['http_errors_total']
+
+    def test_fuzzy_fallback(self):
+        """Test that close matches are returned when no name contains the search."""
+        assert search_names(self.NAMES, search='http_request_total')[0] == 'http_requests_total'
+
+
+class TestMetricCatalog:
+    """Tests for the stale-while-revalidate catalog."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_entries_are_served_from_memory(self):
+        """Test that the loader only runs once while an entry is fresh."""
+        catalog = MetricCatalog(ttl=60)
+        loader = AsyncMock(return_value=['b', 'a'])
+
+        assert await catalog.get(('ws', 'metrics'), loader) == ['a', 'b']
+        assert await catalog.get(('ws', 'metrics'), loader) == ['a', 'b']
+        loader.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stale_entries_refresh_in_background(self):
+        """Test that a stale entry is returned immediately and reloaded in the background."""
+        catalog = MetricCatalog(ttl=0, max_stale=60)
+        loader = AsyncMock(side_effect=[['old'], ['new']])
+
+        assert await catalog.get(('ws', 'metrics'), loader) == ['old']
+        time.sleep(0.01)
+        assert await catalog.get(('ws', 'metrics'), loader) == ['old']
+        await asyncio.sleep(0)
+        assert loader.call_count == 2
+        assert catalog._entries[('ws', 'metrics')][1] == ['new']
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_reload_before_returning(self):
+        """Test that entries past max_stale are reloaded synchronously."""
+        catalog = MetricCatalog(ttl=0, max_stale=0)
+        loader = AsyncMock(side_effect=[['old'], ['new']])
+
+        await catalog.get(('ws', 'metrics'), loader)
+        time.sleep(0.01)
+        assert await catalog.get(('ws', 'metrics'), loader) == ['new']
+
+    @pytest.mark.asyncio
+    async def test_invalidate_workspace(self):
+        """Test that invalidation is scoped to one workspace."""
+        catalog = MetricCatalog()
+        await catalog.get(('ws-1', 'metrics'), AsyncMock(return_value=['a']))
+        await catalog.get(('ws-2', 'metrics'), AsyncMock(return_value=['b']))
+
+        catalog.invalidate('ws-1')
+        assert list(catalog._entries) == [('ws-2', 'metrics')]
+
+
+class TestCatalogTools:
+    """Tests for list_metrics and list_labels backed by the catalog."""
+
+    @pytest.mark.asyncio
+    async def test_list_metrics_uses_catalog(self, mock_context):
+        """Test that repeated list_metrics calls reuse the cached metric names."""
+        mock_make_request = AsyncMock(return_value=['up', 'http_requests_total'])
+
+        with (
+            patch(
+                'awslabs.prometheus_mcp_server.server.configure_workspace_for_request',
+                AsyncMock(return_value=WORKSPACE_CONFIG),
+            ),
+            patch(
+                'awslabs.prometheus_mcp_server.server.PrometheusClient.make_request',
+                mock_make_request,
+            ),
+        ):
+            first = await list_metrics(ctx=mock_context, workspace_id='ws-12345')
+            second = await list_metrics(ctx=mock_context, workspace_id='ws-12345', prefix='up')
+
+        assert first.metrics == ['http_requests_total', 'up']
+        assert second.metrics == ['up']
+        mock_make_request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_list_labels(self, mock_context):
+        """Test listing label names and label values."""
+        mock_make_request = AsyncMock(side_effect=[['job', '__name__'], ['node', 'api']])
+
+        with (
+            patch(
+                'awslabs.prometheus_mcp_server.server.configure_workspace_for_request',
+                AsyncMock(return_value=WORKSPACE_CONFIG),
+            ),
+            patch(
+                'awslabs.prometheus_mcp_server.server.PrometheusClient.make_request',
+                mock_make_request,
+            ),
+        ):
+            names = await list_labels(ctx=mock_context, workspace_id='ws-12345')
+            values = await list_labels(ctx=mock_context, workspace_id='ws-12345', label='job')
+
+        assert names == LabelsList(label=None, values=['__name__', 'job'])
+        assert values == LabelsList(label='job', values=['api', 'node'])
+        assert mock_make_request.call_args.kwargs['endpoint'] == 'label/job/values'
+
+    @pytest.mark.asyncio
+    async def test_list_labels_invalid_label(self, mock_context):
+        """Test that label names are validated before building the endpoint."""
+        with pytest.raises(ValueError, match='Invalid label name'):
+            await list_labels(ctx=mock_context, workspace_id='ws-12345', label='job/../x')
+
+
+class TestWorkspaceConfigCache:
+    """Tests for memoized workspace resolution."""
+
+    @pytest.mark.asyncio
+    async def test_workspace_resolution_is_memoized(self, mock_context):
+        """Test that DescribeWorkspace and the connection test run once per workspace."""
+        mock_details = AsyncMock(
+            return_value={'prometheus_url': 'https://example.com/workspaces/ws-12345'}
+        )
+        mock_test_connection = AsyncMock(return_value=True)
+
+        with (
+            patch.dict('os.environ', {}, clear=True),
+            patch('awslabs.prometheus_mcp_server.server.get_workspace_details', mock_details),
+            patch(
+                'awslabs.prometheus_mcp_server.server.PrometheusConnection.test_connection',
+                mock_test_connection,
+            ),
+        ):
+            first = await configure_workspace_for_request(mock_context, 'ws-12345', 'us-east-1')
+            second = await configure_workspace_for_request(mock_context, 'ws-12345', 'us-east-1')
+            await configure_workspace_for_request(mock_context, 'ws-12345', 'us-west-2')
+
+        assert first == second
+        assert mock_details.call_count == 2
+        assert mock_test_connection.call_count == 2
@@ -2,7 +2,7 @@
 
 import pytest
 from awslabs.prometheus_mcp_server.server import PrometheusClient
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 class TestFinalCoverage:
@@ -14,7 +14,7 @@ class TestFinalCoverage:
         with (
             patch('boto3.Session') as mock_session,
             patch('requests.Session') as mock_req_session,
-            patch('time.sleep'),
+            patch('asyncio.sleep', new_callable=AsyncMock),
             patch('awslabs.prometheus_mcp_server.server.SigV4Auth'),
         ):
             mock_creds = MagicMock()
@@ -0,0 +1,295 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for range query splitting, caching and result shaping."""
+
+import pytest
+import time
+from awslabs.prometheus_mcp_server.range_query import (
+    RangeQueryCache,
+    downsample_values,
+    fetch_range,
+    merge_matrices,
+    parse_duration,
+    parse_timestamp,
+    shape_matrix,
+    split_range,
+)
+from awslabs.prometheus_mcp_server.server import execute_range_query
+from unittest.mock import AsyncMock, patch
+
+
+class TestParsing:
+    """Tests for duration and timestamp parsing."""
+
+    def test_parse_duration(self):
+        """Test Prometheus durations and plain seconds."""
+        assert parse_duration('15s') == 15
+        assert parse_duration('1h30m') == 5400
+        assert parse_duration('500ms') == 0.5
+        assert parse_duration('60') == 60
+
+    def test_parse_duration_invalid(self):
+        """Test that malformed or non-positive durations are rejected."""
+        for value in ('abc', '5x', '1m foo', '0s'):
+            with pytest.raises(ValueError):
+                parse_duration(value)
+
+    def test_parse_timestamp(self):
+        """Test RFC3339 and Unix timestamps."""
+        assert parse_timestamp('2023-04-01T00:00:00Z') == 1680307200
+        assert parse_timestamp('1680307200.5') == 1680307200.5
+
+
+class TestSplitRange:
+    """Tests for step-aligned range splitting."""
+
+    def test_single_window(self):
+        """Test that a short range produces one aligned window."""
+        assert split_range(1000, 1590, 60, chunk_points=100) == [(1020, 1560)]
+
+    def test_windows_are_contiguous_and_aligned(self):
+        """Test that windows cover every step exactly once on the shared grid."""
+        windows = split_range(0, 10000, 10, chunk_points=100)
+        assert windows[0] == (0, 990)
+        assert windows[-1] == (10000, 10000)
+        for (_, prev_end), (next_start, _) in zip(windows, windows[1:]):
+            assert next_start == prev_end + 10
+        assert all(start % 1000 == 0 for start, _ in windows)
+
+    def test_overlapping_ranges_share_windows(self):
+        """Test that interior windows are identical for different ranges."""
+        first = split_range(0, 5000, 10, chunk_points=100)
+        second = split_range(1500, 6000, 10, chunk_points=100)
+        assert set(first[2:-1]) <= set(second)
+
+    def test_empty_range(self):
+        """Test a range with no evaluation step in it."""
+        assert split_range(1001, 1015, 60) == []
+
+    def test_end_before_start(self):
+        """Test that a range ending before it starts is rejected."""
+        with pytest.raises(ValueError, match='end timestamp must not be before start time'):
+            split_range(2000, 1000, 60)
+
+    def test_too_many_points(self):
+        """Test that ranges above the per-series point limit are rejected."""
+        assert len(split_range(0, 109990, 10, chunk_points=100)) == 110
+        with pytest.raises(ValueError, match='exceeded maximum resolution'):
+            split_range(0, 110000, 10, chunk_points=100)
+        with pytest.raises(ValueError, match='exceeded maximum resolution'):
+            split_range(0, 365 * 86400, 1)
+
+
+class TestRangeQueryCache:
+    """Tests for the sub-range cache."""
+
+    def test_is_cacheable(self):
+        """Test that only settled sub-ranges are cacheable."""
+        cache = RangeQueryCache(settle_seconds=300)
+        assert cache.is_cacheable(1000, now=1300)
+        assert not cache.is_cacheable(1000, now=1299)
+
+    def test_lru_eviction_and_ttl(self):
+        """Test LRU eviction and TTL expiry."""
+        cache = RangeQueryCache(max_entries=2, ttl=60)
+        series_a = [{'metric': {'job': 'a'}, 'values': [[0, '1']]}]
+        series_b = [{'metric': {'job': 'b'}, 'values': [[0, '2']]}]
+        series_c = [{'metric': {'job': 'c'}, 'values': [[0, '3']]}]
+        cache.put(('a',), series_a)
+        cache.put(('b',), series_b)
+        assert cache.get(('a',)) == series_a
+        cache.put(('c',), series_c)
+        assert cache.get(('b',)) is None
+        assert len(cache) == 2
+
+        later = time.time() + 61
+        with patch('awslabs.prometheus_mcp_server.range_query.time.time', return_value=later):
+            assert cache.get(('a',)) is None
+
+
+class TestShaping:
+    """Tests for merging, downsampling and output formats."""
+
+    def test_merge_matrices(self):
+        """Test that series are concatenated across sub-ranges."""
+        merged = merge_matrices(
+            [
+                [{'metric': {'a': '1'}, 'values': [[0, '1']]}],
+                [
+                    {'metric': {'a': '1'}, 'values': [[10, '2']]},
+                    {'metric': {'a': '2'}, 'values': [[10, '3']]},
+                ],
+            ]
+        )
+        assert merged == [
+            {'metric': {'a': '1'}, 'values': [[0, '1'], [10, '2']]},
+            {'metric': {'a': '2'}, 'values': [[10, '3']]},
+        ]
+
+    def test_downsample_values(self):
+        """Test bucket reduction methods."""
+        values = [[i, str(i)] for i in range(10)]
+        assert downsample_values(values, 5, 'avg') == [
+            (1.0, 0.5),
+            (3.0, 2.5),
+            (5.0, 4.5),
+            (7.0, 6.5),
+            (9.0, 8.5),
+        ]
+        assert downsample_values(values, 2, 'max') == [(4.0, 4.0), (9.0, 9.0)]
+        assert downsample_values(values, 2, 'min') == [(4.0, 0.0), (9.0, 5.0)]
+        assert len(downsample_values(values, 20)) == 10
+
+    def test_shape_matrix_formats(self):
+        """Test compact and summary output formats."""
+        result = [{'metric': {'job': 'x'}, 'values': [[0, '1'], [10, '3'], [20, 'NaN']]}]
+
+        compact = shape_matrix(result, 'compact')
+        assert compact[0]['timestamps'] == [0.0, 10.0, 20.0]
+        assert compact[0]['values'][:2] == [1.0, 3.0]
+
+        summary = shape_matrix(result, 'summary')[0]
+        assert summary['count'] == 3
+        assert summary['min'] == 1.0
+        assert summary['max'] == 3.0
+        assert summary['avg'] == 2.0
+
+        assert shape_matrix(result, 'raw') == result
+
+
+class TestFetchRange:
+    """Tests for concurrent sub-range fetching."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_range_uses_cache(self):
+        """Test that settled sub-ranges are served from the cache on repeat queries."""
+        cache = RangeQueryCache()
+
+        async def fetch(start, end):
+            return {
+                'resultType': 'matrix',
+                'result': [{'metric': {}, 'values': [[start, '1'], [end, '1']]}],
+            }
+
+        mock_fetch = AsyncMock(side_effect=fetch)
+        first = await fetch_range(mock_fetch, ('ws', 'up', 10), 0, 2990, 10, 100, cache=cache)
+        assert mock_fetch.call_count == 3
+        assert first['result'][0]['values'][0] == [0, '1']
+        assert first['result'][0]['values'][-1] == [2990, '1']
+
+        second = await fetch_range(mock_fetch, ('ws', 'up', 10), 0, 2990, 10, 100, cache=cache)
+        assert mock_fetch.call_count == 3
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_recent_sub_ranges_are_not_cached(self):
+        """Test that sub-ranges ending after the settle window are always refetched."""
+        cache = RangeQueryCache()
+        mock_fetch = AsyncMock(return_value={'resultType': 'matrix', 'result': []})
+        now = time.time()
+
+        await fetch_range(mock_fetch, ('ws', 'up', 60), now - 600, now, 60, 5, cache=cache)
+        calls = mock_fetch.call_count
+        await fetch_range(mock_fetch, ('ws', 'up', 60), now - 600, now, 60, 5, cache=cache)
+        assert calls < mock_fetch.call_count < 2 * calls
+
+
+class TestExecuteRangeQuery:
+    """Tests for execute_range_query splitting and output shaping."""
+
+    @pytest.mark.asyncio
+    async def test_long_range_is_split_and_compacted(self, mock_context):
+        """Test that a week-long query is split and returned in compact form."""
+        mock_configure = AsyncMock(
+            return_value={
+                'prometheus_url': 'https://example.com',
+                'region': 'us-east-1',
+                'profile': None,
+                'workspace_id': 'ws-split',
+            }
+        )
+
+        async def make_request(**kwargs):
+            params = kwargs['params']
+            return {
+                'resultType': 'matrix',
+                'result': [{'metric': {'job': 'x'}, 'values': [[params['start'], '2']]}],
+            }
+
+        mock_make_request = AsyncMock(side_effect=make_request)
+
+        with (
+            patch(
+                'awslabs.prometheus_mcp_server.server.configure_workspace_for_request',
+                mock_configure,
+            ),
+            patch(
+                'awslabs.prometheus_mcp_server.server.PrometheusClient.make_request',
+                mock_make_request,
+            ),
+            patch(
+                'awslabs.prometheus_mcp_server.range_query.range_query_cache', RangeQueryCache()
+            ),
+        ):
+            result = await execute_range_query(
+                ctx=mock_context,
+                workspace_id='ws-split',
+                query='up',
+                start='2023-04-01T00:00:00Z',
+                end='2023-04-08T00:00:00Z',
+                step='1m',
+                region='us-east-1',
+                profile=None,
+                output_format='compact',
+                max_points=None,
+                downsample='avg',
+            )
+
+        assert mock_make_request.call_count == 15
+        series = result['result'][0]
+        assert series['metric'] == {'job': 'x'}
+        assert len(series['timestamps']) == 15
+        assert series['values'] == [2.0] * 15
+
+    @pytest.mark.asyncio
+    async def test_invalid_output_format(self, mock_context):
+        """Test that an unknown output format is rejected."""
+        mock_configure = AsyncMock(
+            return_value={
+                'prometheus_url': 'https://example.com',
+                'region': 'us-east-1',
+                'profile': None,
+                'workspace_id': 'ws-12345',
+            }
+        )
+
+        with patch(
+            'awslabs.prometheus_mcp_server.server.configure_workspace_for_request',
+            mock_configure,
+        ):
+            with pytest.raises(ValueError, match='Invalid output_format'):
+                await execute_range_query(
+                    ctx=mock_context,
+                    workspace_id='ws-12345',
+                    query='up',
+                    start='2023-04-01T00:00:00Z',
+                    end='2023-04-01T01:00:00Z',
+                    step='1m',
+                    region='us-east-1',
+                    profile=None,
+                    output_format='csv',
+                    max_points=None,
+                    downsample='avg',
+                )
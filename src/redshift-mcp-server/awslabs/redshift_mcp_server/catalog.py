@@ -0,0 +1,141 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Catalog metadata cache for Redshift MCP Server."""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+from awslabs.redshift_mcp_server.consts import CATALOG_CACHE_TTL
+from loguru import logger
+from typing import Any, Awaitable, Callable
+
+
+# Cache keys are tuples of (cluster_identifier, kind[, database_name])
+CatalogKey = tuple[str, ...]
+
+
+class CatalogCache:
+    """TTL cache of catalog metadata, optionally persisted to a JSON file.
+
+    Each entry holds the result of one bulk catalog query, e.g. all tables of a database
+    grouped by schema, so that drill-down calls are served from memory. Entries expire
+    after ``ttl`` seconds or when invalidated. When ``path`` is set, entries are loaded
+    from it at startup and written back after every load, so a new session does not
+    start with a cold cache.
+    """
+
+    def __init__(self, ttl: float = CATALOG_CACHE_TTL, path: str | None = None):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds after which an entry is reloaded.
+            path: Optional JSON file to persist entries to.
+        """
+        self.ttl = ttl
+        self.path = path
+        self._entries: dict[CatalogKey, tuple[float, Any]] = {}
+        self._locks: dict[CatalogKey, asyncio.Lock] = {}
+        if path:
+            self._load_from_disk()
+
+    async def get(self, key: CatalogKey, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, loading it if missing or expired.
+
+        Args:
+            key: Cache key.
+            loader: Coroutine function running the bulk catalog query.
+
+        Returns:
+            The cached value.
+        """
+        value = self._get_fresh(key)
+        if value is not None:
+            logger.debug(f'Catalog cache hit for {key}')
+            return value
+
+        # Concurrent callers for the same key wait for a single load
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            value = self._get_fresh(key)
+            if value is None:
+                logger.debug(f'Catalog cache miss for {key}, loading')
+                value = await loader()
+                self._entries[key] = (time.time(), value)
+                self._save_to_disk()
+            return value
+
+    def invalidate(
+        self, cluster_identifier: str | None = None, database_name: str | None = None
+    ) -> int:
+        """Drop cached entries.
+
+        Args:
+            cluster_identifier: Only drop entries of this cluster (all clusters if None).
+            database_name: Only drop entries of this database (all databases if None).
+                The database list of the cluster is dropped as well.
+
+        Returns:
+            Number of entries dropped.
+        """
+        keys = [
+            key
+            for key in self._entries
+            if (cluster_identifier is None or key[0] == cluster_identifier)
+            and (database_name is None or len(key) < 3 or key[2] == database_name)
+        ]
+        for key in keys:
+            del self._entries[key]
+        if keys:
+            self._save_to_disk()
+        return len(keys)
+
+    def _get_fresh(self, key: CatalogKey) -> Any:
+        entry = self._entries.get(key)
+        if entry is None or time.time() - entry[0] > self.ttl:
+            return None
+        return entry[1]
+
+    def _load_from_disk(self) -> None:
+        assert self.path is not None
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            now = time.time()
+            for key, loaded_at, value in data:
+                if now - loaded_at <= self.ttl:
+                    self._entries[tuple(key)] = (loaded_at, value)
+            logger.info(f'Loaded {len(self._entries)} catalog cache entries from {self.path}')
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f'Ignoring unreadable catalog cache file {self.path}: {str(e)}')
+
+    def _save_to_disk(self) -> None:
+        if not self.path:
+            return
+        data = [[list(key), loaded_at, value] for key, (loaded_at, value) in self._entries.items()]
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            # Write to a temporary file first so readers never see a partial file
+            with tempfile.NamedTemporaryFile('w', dir=directory, delete=False) as f:
+                json.dump(data, f, default=str)
+            os.replace(f.name, self.path)
+        except Exception as e:
+            logger.warning(f'Failed to persist catalog cache to {self.path}: {str(e)}')
+
+
+# Global catalog cache instance
+catalog_cache = CatalogCache(path=os.environ.get('REDSHIFT_CATALOG_CACHE_PATH'))
@@ -23,6 +23,13 @@ CLIENT_TIMEOUT = 60
 DATA_CLIENT_TIMEOUT = 60
 QUERY_TIMEOUT = 3600
 QUERY_POLL_INTERVAL = 2
+QUERY_POLL_MIN_INTERVAL = 0.1
+CLUSTER_TOPOLOGY_TTL = 300
+CATALOG_CACHE_TTL = 600
+
+# Query result budgets
+QUERY_RESULT_MAX_ROWS = 1000
+QUERY_RESULT_MAX_BYTES = 1024 * 1024
 
 # Best practices
 
@@ -90,8 +97,8 @@ SELECT
     table_type,
     remarks
 FROM pg_catalog.svv_all_tables
-WHERE database_name = {} AND schema_name = {}
-ORDER BY table_name;
+WHERE database_name = {}
+ORDER BY schema_name, table_name;
 """
 
 SVV_ALL_COLUMNS_QUERY = """
@@ -109,8 +116,8 @@ SELECT
     numeric_scale,
     remarks
 FROM pg_catalog.svv_all_columns
-WHERE database_name = {} AND schema_name = {} AND table_name = {}
-ORDER BY ordinal_position;
+WHERE database_name = {}
+ORDER BY schema_name, table_name, ordinal_position;
 """
 
 # SQL guardrails
@@ -139,3 +139,7 @@ class QueryResult(BaseModel):
         None, description='Query execution time in milliseconds'
     )
     query_id: str = Field(..., description='Unique identifier for the query execution')
+    next_cursor: Optional[str] = Field(
+        None,
+        description='Cursor to read the remaining rows with fetch_query_results, if the result was truncated',
+    )
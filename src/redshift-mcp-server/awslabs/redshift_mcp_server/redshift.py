@@ -15,14 +15,22 @@
 """AWS client management for Redshift MCP Server."""
 
 import asyncio
+import base64
 import boto3
+import json
 import os
 import regex
+import time
 from awslabs.redshift_mcp_server import __version__
+from awslabs.redshift_mcp_server.catalog import catalog_cache
 from awslabs.redshift_mcp_server.consts import (
     CLIENT_TIMEOUT,
+    CLUSTER_TOPOLOGY_TTL,
     DEFAULT_AWS_REGION,
     QUERY_POLL_INTERVAL,
+    QUERY_POLL_MIN_INTERVAL,
+    QUERY_RESULT_MAX_BYTES,
+    QUERY_RESULT_MAX_ROWS,
     QUERY_TIMEOUT,
     SUSPICIOUS_QUERY_REGEXP,
     SVV_ALL_COLUMNS_QUERY,
@@ -156,8 +164,194 @@ def protect_sql(sql: str, allow_read_write: bool) -> list[str]:
         return ['BEGIN READ ONLY;', sql, 'END;']
 
 
+class ClusterTopology:
+    """TTL cache mapping cluster identifiers to their type (provisioned or serverless).
+
+    Avoids listing every provisioned cluster and serverless workgroup before each query.
+    The map is refreshed from discover_clusters() when it expires, when an unknown
+    identifier is requested, or when list_clusters runs anyway.
+    """
+
+    def __init__(self, ttl: float = CLUSTER_TOPOLOGY_TTL):
+        """Initialize an empty topology cache."""
+        self.ttl = ttl
+        self._types: dict[str, str] = {}
+        self._refreshed_at = float('-inf')
+        self._lock = asyncio.Lock()
+
+    def update(self, clusters: list[dict]) -> None:
+        """Replace the cached topology with freshly discovered clusters."""
+        self._types = {cluster['identifier']: cluster['type'] for cluster in clusters}
+        self._refreshed_at = time.monotonic()
+
+    def invalidate(self, cluster_identifier: str | None = None) -> None:
+        """Forget one cluster, or the whole topology."""
+        if cluster_identifier is None:
+            self._types = {}
+            self._refreshed_at = float('-inf')
+        else:
+            self._types.pop(cluster_identifier, None)
+
+    async def get_cluster_type(self, cluster_identifier: str) -> str | None:
+        """Return the type of the cluster, refreshing the topology if needed.
+
+        Args:
+            cluster_identifier: The cluster identifier or workgroup name.
+
+        Returns:
+            'provisioned', 'serverless', or None if the cluster does not exist.
+        """
+        if self._is_fresh() and cluster_identifier in self._types:
+            return self._types[cluster_identifier]
+
+        async with self._lock:
+            # Another caller may have refreshed while we waited for the lock
+            if not (self._is_fresh() and cluster_identifier in self._types):
+                logger.debug(f'Refreshing cluster topology for {cluster_identifier}')
+                self.update(await discover_clusters())
+            return self._types.get(cluster_identifier)
+
+    def _is_fresh(self) -> bool:
+        return time.monotonic() - self._refreshed_at < self.ttl
+
+
+def _record_size(record: list[dict]) -> int:
+    """Approximate size in bytes of a Data API record."""
+    return sum(
+        len(value) if isinstance(value, str) else 8 for field in record for value in field.values()
+    )
+
+
+def encode_result_cursor(statement_id: str, next_token: str | None, skip: int) -> str:
+    """Encode the position of the next unread row of a statement result."""
+    payload = json.dumps({'id': statement_id, 'token': next_token, 'skip': skip})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_result_cursor(cursor: str) -> tuple[str, str | None, int]:
+    """Decode a cursor produced by encode_result_cursor.
+
+    Raises:
+        Exception: If the cursor is malformed.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return payload['id'], payload['token'], int(payload['skip'])
+    except Exception as e:
+        raise Exception(f'Invalid result cursor: {cursor}') from e
+
+
+async def read_statement_result(
+    statement_id: str,
+    max_rows: int | None = None,
+    max_bytes: int | None = None,
+    cursor: str | None = None,
+) -> dict:
+    """Read a statement result page by page, following NextToken up to a budget.
+
+    Args:
+        statement_id: The Data API statement (or sub-statement) ID.
+        max_rows: Maximum number of rows to read (None for no limit).
+        max_bytes: Approximate maximum number of bytes to read (None for no limit).
+        cursor: Cursor returned by a previous call, to resume reading where it stopped.
+
+    Returns:
+        Dictionary with ColumnMetadata, Records and NextCursor (None when all rows were read).
+    """
+    data_client = client_manager.redshift_data_client()
+
+    next_token, skip = None, 0
+    if cursor:
+        cursor_statement_id, next_token, skip = decode_result_cursor(cursor)
+        if cursor_statement_id != statement_id:
+            raise Exception(f'Result cursor does not belong to statement {statement_id}')
+
+    column_metadata = []
+    records = []
+    size = 0
+    while True:
+        kwargs = {'Id': statement_id}
+        if next_token:
+            kwargs['NextToken'] = next_token
+        response = await asyncio.to_thread(data_client.get_statement_result, **kwargs)
+        column_metadata = response.get('ColumnMetadata', column_metadata)
+        page = response.get('Records', [])
+
+        for i in range(skip, len(page)):
+            if (max_rows is not None and len(records) >= max_rows) or (
+                max_bytes is not None and records and size >= max_bytes
+            ):
+                # Budget exhausted in the middle of this page, resume from row i next time
+                logger.debug(f'Result budget reached for {statement_id} after {len(records)} rows')
+                return {
+                    'ColumnMetadata': column_metadata,
+                    'Records': records,
+                    'NextCursor': encode_result_cursor(statement_id, next_token, i),
+                }
+            records.append(page[i])
+            size += _record_size(page[i])
+
+        skip = 0
+        next_token = response.get('NextToken')
+        if not next_token:
+            return {'ColumnMetadata': column_metadata, 'Records': records, 'NextCursor': None}
+        if (max_rows is not None and len(records) >= max_rows) or (
+            max_bytes is not None and size >= max_bytes
+        ):
+            return {
+                'ColumnMetadata': column_metadata,
+                'Records': records,
+                'NextCursor': encode_result_cursor(statement_id, next_token, 0),
+            }
+
+
+async def wait_for_statement(statement_id: str) -> dict:
+    """Poll describe_statement until the statement finishes, backing off adaptively.
+
+    Polling starts at QUERY_POLL_MIN_INTERVAL so short catalog queries return quickly,
+    and doubles up to QUERY_POLL_INTERVAL for long-running queries.
+
+    Args:
+        statement_id: The Data API statement ID.
+
+    Returns:
+        The final describe_statement response.
+
+    Raises:
+        Exception: If the statement fails, is aborted, or times out.
+    """
+    data_client = client_manager.redshift_data_client()
+
+    deadline = time.monotonic() + QUERY_TIMEOUT
+    interval = QUERY_POLL_MIN_INTERVAL
+    while True:
+        status_response = await asyncio.to_thread(data_client.describe_statement, Id=statement_id)
+        status = status_response['Status']
+
+        if status == 'FINISHED':
+            logger.debug(f'Query execution completed: {statement_id}')
+            return status_response
+        elif status in ['FAILED', 'ABORTED']:
+            error_msg = status_response.get('Error', 'Unknown error')
+            logger.error(f'Query execution failed: {error_msg}')
+            raise Exception(f'Query failed: {error_msg}')
+
+        if time.monotonic() + interval > deadline:
+            logger.error(f'Query execution timed out: {statement_id}')
+            raise Exception(f'Query timed out after {QUERY_TIMEOUT} seconds')
+
+        # Wait before polling again
+        await asyncio.sleep(interval)
+        interval = min(interval * 2, QUERY_POLL_INTERVAL)
+
+
 async def execute_statement(
-    cluster_identifier: str, database_name: str, sql: str, allow_read_write: bool = False
+    cluster_identifier: str,
+    database_name: str,
+    sql: str,
+    allow_read_write: bool = False,
+    max_rows: int | None = None,
+    max_bytes: int | None = None,
 ) -> tuple[dict, str]:
     """Execute a SQL statement against a Redshift cluster using the Data API.
 
@@ -168,10 +362,12 @@ async def execute_statement(
         database_name: The database to execute the query against.
         sql: The SQL statement to execute.
         allow_read_write: Indicates if read-write mode should be activated.
+        max_rows: Maximum number of result rows to read (None for all rows).
+        max_bytes: Approximate maximum number of result bytes to read (None for no limit).
 
     Returns:
         Tuple containing:
-        - Dictionary with the raw results_response from get_statement_result.
+        - Dictionary with ColumnMetadata, Records and NextCursor of the result.
         - String with the query_id.
 
     Raises:
@@ -180,14 +376,9 @@ async def execute_statement(
     data_client = client_manager.redshift_data_client()
 
     # First, check if this is a provisioned cluster or serverless workgroup
-    clusters = await discover_clusters()
-    cluster_info = None
-    for cluster in clusters:
-        if cluster['identifier'] == cluster_identifier:
-            cluster_info = cluster
-            break
-
-    if not cluster_info:
+    cluster_type = await cluster_topology.get_cluster_type(cluster_identifier)
+
+    if not cluster_type:
         raise Exception(
             f'Cluster {cluster_identifier} not found. Please use list_clusters to get valid cluster identifiers.'
         )
@@ -197,48 +388,36 @@ async def execute_statement(
     logger.debug(f'Protected SQL: {" ".join(protected_sqls)}')
 
     # Execute the query using Data API
-    if cluster_info['type'] == 'provisioned':
+    if cluster_type == 'provisioned':
         logger.debug(f'Using ClusterIdentifier for provisioned cluster: {cluster_identifier}')
-        response = data_client.batch_execute_statement(
-            ClusterIdentifier=cluster_identifier, Database=database_name, Sqls=protected_sqls
-        )
-    elif cluster_info['type'] == 'serverless':
+        target = {'ClusterIdentifier': cluster_identifier}
+    elif cluster_type == 'serverless':
         logger.debug(f'Using WorkgroupName for serverless workgroup: {cluster_identifier}')
-        response = data_client.batch_execute_statement(
-            WorkgroupName=cluster_identifier, Database=database_name, Sqls=protected_sqls
-        )
+        target = {'WorkgroupName': cluster_identifier}
     else:
-        raise Exception(f'Unknown cluster type: {cluster_info["type"]}')
+        raise Exception(f'Unknown cluster type: {cluster_type}')
+
+    try:
+        response = await asyncio.to_thread(
+            data_client.batch_execute_statement,
+            **target,
+            Database=database_name,
+            Sqls=protected_sqls,
+        )
+    except Exception:
+        # The cluster may have been deleted or replaced since the topology was cached
+        cluster_topology.invalidate(cluster_identifier)
+        raise
 
     query_id = response['Id']
     logger.debug(f'Started query execution: {query_id}')
 
     # Wait for query completion
-    wait_time = 0
-    status_response = {}
-    while wait_time < QUERY_TIMEOUT:
-        status_response = data_client.describe_statement(Id=query_id)
-        status = status_response['Status']
-
-        if status == 'FINISHED':
-            logger.debug(f'Query execution completed: {query_id}')
-            break
-        elif status in ['FAILED', 'ABORTED']:
-            error_msg = status_response.get('Error', 'Unknown error')
-            logger.error(f'Query execution failed: {error_msg}')
-            raise Exception(f'Query failed: {error_msg}')
-
-        # Wait before polling again
-        await asyncio.sleep(QUERY_POLL_INTERVAL)
-        wait_time += QUERY_POLL_INTERVAL
-
-    if wait_time >= QUERY_TIMEOUT:
-        logger.error(f'Query execution timed out: {query_id}')
-        raise Exception(f'Query timed out after {QUERY_TIMEOUT} seconds')
+    status_response = await wait_for_statement(query_id)
 
     # Get user query results
     subquery1_id = status_response['SubStatements'][1]['Id']
-    results_response = data_client.get_statement_result(Id=subquery1_id)
+    results_response = await read_statement_result(subquery1_id, max_rows, max_bytes)
     return results_response, subquery1_id
 
 
@@ -325,12 +504,15 @@ async def discover_clusters() -> list[dict]:
         raise
 
     logger.info(f'Total clusters discovered: {len(clusters)}')
+    cluster_topology.update(clusters)
     return clusters
 
 
 async def discover_databases(cluster_identifier: str, database_name: str = 'dev') -> list[dict]:
     """Discover databases in a Redshift cluster using the Data API.
 
+    Results are served from the catalog cache while fresh.
+
     Args:
         cluster_identifier: The cluster identifier to query.
         database_name: The database to connect to for querying system views.
@@ -341,27 +523,29 @@ async def discover_databases(cluster_identifier: str, database_name: str = 'dev'
     try:
         logger.info(f'Discovering databases in cluster {cluster_identifier}')
 
-        # Execute the query using the common function
-        results_response, _ = await execute_statement(
-            cluster_identifier=cluster_identifier,
-            database_name=database_name,
-            sql=SVV_REDSHIFT_DATABASES_QUERY,
-        )
+        async def load_databases() -> list[dict]:
+            # Execute the query using the common function
+            results_response, _ = await execute_statement(
+                cluster_identifier=cluster_identifier,
+                database_name=database_name,
+                sql=SVV_REDSHIFT_DATABASES_QUERY,
+            )
+
+            databases = []
+            for record in results_response.get('Records', []):
+                # Extract values from the record
+                database_info = {
+                    'database_name': record[0].get('stringValue'),
+                    'database_owner': record[1].get('longValue'),
+                    'database_type': record[2].get('stringValue'),
+                    'database_acl': record[3].get('stringValue'),
+                    'database_options': record[4].get('stringValue'),
+                    'database_isolation_level': record[5].get('stringValue'),
+                }
+                databases.append(database_info)
+            return databases
 
-        databases = []
-        records = results_response.get('Records', [])
-
-        for record in records:
-            # Extract values from the record
-            database_info = {
-                'database_name': record[0].get('stringValue'),
-                'database_owner': record[1].get('longValue'),
-                'database_type': record[2].get('stringValue'),
-                'database_acl': record[3].get('stringValue'),
-                'database_options': record[4].get('stringValue'),
-                'database_isolation_level': record[5].get('stringValue'),
-            }
-            databases.append(database_info)
+        databases = await catalog_cache.get((cluster_identifier, 'databases'), load_databases)
 
         logger.info(f'Found {len(databases)} databases in cluster {cluster_identifier}')
         return databases
@@ -374,6 +558,8 @@ async def discover_databases(cluster_identifier: str, database_name: str = 'dev'
 async def discover_schemas(cluster_identifier: str, schema_database_name: str) -> list[dict]:
     """Discover schemas in a Redshift database using the Data API.
 
+    Results are served from the catalog cache while fresh.
+
     Args:
         cluster_identifier: The cluster identifier to query.
         schema_database_name: The database name to filter schemas for. Also used to connect to.
@@ -386,28 +572,32 @@ async def discover_schemas(cluster_identifier: str, schema_database_name: str) -
             f'Discovering schemas in database {schema_database_name} in cluster {cluster_identifier}'
         )
 
-        # Execute the query using the common function
-        results_response, _ = await execute_statement(
-            cluster_identifier=cluster_identifier,
-            database_name=schema_database_name,
-            sql=SVV_ALL_SCHEMAS_QUERY.format(quote_literal_string(schema_database_name)),
-        )
+        async def load_schemas() -> list[dict]:
+            # Execute the query using the common function
+            results_response, _ = await execute_statement(
+                cluster_identifier=cluster_identifier,
+                database_name=schema_database_name,
+                sql=SVV_ALL_SCHEMAS_QUERY.format(quote_literal_string(schema_database_name)),
+            )
+
+            schemas = []
+            for record in results_response.get('Records', []):
+                # Extract values from the record
+                schema_info = {
+                    'database_name': record[0].get('stringValue'),
+                    'schema_name': record[1].get('stringValue'),
+                    'schema_owner': record[2].get('longValue'),
+                    'schema_type': record[3].get('stringValue'),
+                    'schema_acl': record[4].get('stringValue'),
+                    'source_database': record[5].get('stringValue'),
+                    'schema_option': record[6].get('stringValue'),
+                }
+                schemas.append(schema_info)
+            return schemas
 
-        schemas = []
-        records = results_response.get('Records', [])
-
-        for record in records:
-            # Extract values from the record
-            schema_info = {
-                'database_name': record[0].get('stringValue'),
-                'schema_name': record[1].get('stringValue'),
-                'schema_owner': record[2].get('longValue'),
-                'schema_type': record[3].get('stringValue'),
-                'schema_acl': record[4].get('stringValue'),
-                'source_database': record[5].get('stringValue'),
-                'schema_option': record[6].get('stringValue'),
-            }
-            schemas.append(schema_info)
+        schemas = await catalog_cache.get(
+            (cluster_identifier, 'schemas', schema_database_name), load_schemas
+        )
 
         logger.info(
             f'Found {len(schemas)} schemas in database {schema_database_name} in cluster {cluster_identifier}'
@@ -426,6 +616,9 @@ async def discover_tables(
 ) -> list[dict]:
     """Discover tables in a Redshift schema using the Data API.
 
+    The tables of all schemas in the database are fetched in one query and cached,
+    so listing the tables of other schemas of the same database is served from memory.
+
     Args:
         cluster_identifier: The cluster identifier to query.
         table_database_name: The database name to filter tables for. Also used to connect to.
@@ -439,29 +632,32 @@ async def discover_tables(
             f'Discovering tables in schema {table_schema_name} in database {table_database_name} in cluster {cluster_identifier}'
         )
 
-        # Execute the query using the common function
-        results_response, _ = await execute_statement(
-            cluster_identifier=cluster_identifier,
-            database_name=table_database_name,
-            sql=SVV_ALL_TABLES_QUERY.format(
-                quote_literal_string(table_database_name), quote_literal_string(table_schema_name)
-            ),
-        )
+        async def load_tables() -> dict[str, list[dict]]:
+            # Execute the query using the common function
+            results_response, _ = await execute_statement(
+                cluster_identifier=cluster_identifier,
+                database_name=table_database_name,
+                sql=SVV_ALL_TABLES_QUERY.format(quote_literal_string(table_database_name)),
+            )
+
+            tables_by_schema: dict[str, list[dict]] = {}
+            for record in results_response.get('Records', []):
+                # Extract values from the record
+                table_info = {
+                    'database_name': record[0].get('stringValue'),
+                    'schema_name': record[1].get('stringValue'),
+                    'table_name': record[2].get('stringValue'),
+                    'table_acl': record[3].get('stringValue'),
+                    'table_type': record[4].get('stringValue'),
+                    'remarks': record[5].get('stringValue'),
+                }
+                tables_by_schema.setdefault(table_info['schema_name'], []).append(table_info)
+            return tables_by_schema
 
-        tables = []
-        records = results_response.get('Records', [])
-
-        for record in records:
-            # Extract values from the record
-            table_info = {
-                'database_name': record[0].get('stringValue'),
-                'schema_name': record[1].get('stringValue'),
-                'table_name': record[2].get('stringValue'),
-                'table_acl': record[3].get('stringValue'),
-                'table_type': record[4].get('stringValue'),
-                'remarks': record[5].get('stringValue'),
-            }
-            tables.append(table_info)
+        tables_by_schema = await catalog_cache.get(
+            (cluster_identifier, 'tables', table_database_name), load_tables
+        )
+        tables = tables_by_schema.get(table_schema_name, [])
 
         logger.info(
             f'Found {len(tables)} tables in schema {table_schema_name} in database {table_database_name} in cluster {cluster_identifier}'
@@ -483,6 +679,9 @@ async def discover_columns(
 ) -> list[dict]:
     """Discover columns in a Redshift table using the Data API.
 
+    The columns of all tables in the database are fetched in one query and cached,
+    so listing the columns of any other table of the same database is served from memory.
+
     Args:
         cluster_identifier: The cluster identifier to query.
         column_database_name: The database name to filter columns for. Also used to connect to.
@@ -497,37 +696,40 @@ async def discover_columns(
             f'Discovering columns in table {column_table_name} in schema {column_schema_name} in database {column_database_name} in cluster {cluster_identifier}'
         )
 
-        # Execute the query using the common function
-        results_response, _ = await execute_statement(
-            cluster_identifier=cluster_identifier,
-            database_name=column_database_name,
-            sql=SVV_ALL_COLUMNS_QUERY.format(
-                quote_literal_string(column_database_name),
-                quote_literal_string(column_schema_name),
-                quote_literal_string(column_table_name),
-            ),
-        )
+        async def load_columns() -> dict[str, dict[str, list[dict]]]:
+            # Execute the query using the common function
+            results_response, _ = await execute_statement(
+                cluster_identifier=cluster_identifier,
+                database_name=column_database_name,
+                sql=SVV_ALL_COLUMNS_QUERY.format(quote_literal_string(column_database_name)),
+            )
+
+            columns_by_schema: dict[str, dict[str, list[dict]]] = {}
+            for record in results_response.get('Records', []):
+                # Extract values from the record
+                column_info = {
+                    'database_name': record[0].get('stringValue'),
+                    'schema_name': record[1].get('stringValue'),
+                    'table_name': record[2].get('stringValue'),
+                    'column_name': record[3].get('stringValue'),
+                    'ordinal_position': record[4].get('longValue'),
+                    'column_default': record[5].get('stringValue'),
+                    'is_nullable': record[6].get('stringValue'),
+                    'data_type': record[7].get('stringValue'),
+                    'character_maximum_length': record[8].get('longValue'),
+                    'numeric_precision': record[9].get('longValue'),
+                    'numeric_scale': record[10].get('longValue'),
+                    'remarks': record[11].get('stringValue'),
+                }
+                columns_by_schema.setdefault(column_info['schema_name'], {}).setdefault(
+                    column_info['table_name'], []
+                ).append(column_info)
+            return columns_by_schema
 
-        columns = []
-        records = results_response.get('Records', [])
-
-        for record in records:
-            # Extract values from the record
-            column_info = {
-                'database_name': record[0].get('stringValue'),
-                'schema_name': record[1].get('stringValue'),
-                'table_name': record[2].get('stringValue'),
-                'column_name': record[3].get('stringValue'),
-                'ordinal_position': record[4].get('longValue'),
-                'column_default': record[5].get('stringValue'),
-                'is_nullable': record[6].get('stringValue'),
-                'data_type': record[7].get('stringValue'),
-                'character_maximum_length': record[8].get('longValue'),
-                'numeric_precision': record[9].get('longValue'),
-                'numeric_scale': record[10].get('longValue'),
-                'remarks': record[11].get('stringValue'),
-            }
-            columns.append(column_info)
+        columns_by_schema = await catalog_cache.get(
+            (cluster_identifier, 'columns', column_database_name), load_columns
+        )
+        columns = columns_by_schema.get(column_schema_name, {}).get(column_table_name, [])
 
         logger.info(
             f'Found {len(columns)} columns in table {column_table_name} in schema {column_schema_name} in database {column_database_name} in cluster {cluster_identifier}'
@@ -541,74 +743,107 @@ async def discover_columns(
         raise
 
 
-async def execute_query(cluster_identifier: str, database_name: str, sql: str) -> dict:
+def invalidate_catalog(cluster_identifier: str, database_name: str | None = None) -> int:
+    """Drop cached catalog metadata of a cluster, or of one database in it.
+
+    Args:
+        cluster_identifier: The cluster identifier.
+        database_name: Only drop the metadata of this database (all databases if None).
+
+    Returns:
+        Number of cache entries dropped.
+    """
+    dropped = catalog_cache.invalidate(cluster_identifier, database_name)
+    logger.info(f'Dropped {dropped} catalog cache entries for cluster {cluster_identifier}')
+    return dropped
+
+
+def _format_query_result(results_response: dict, query_id: str, execution_time_ms: int) -> dict:
+    """Convert a Data API result into the query result dictionary returned by the tools."""
+    # Extract column names
+    columns = []
+    column_metadata = results_response.get('ColumnMetadata', [])
+    for col_meta in column_metadata:
+        columns.append(col_meta.get('name'))
+
+    # Extract rows
+    rows = []
+    records = results_response.get('Records', [])
+
+    for record in records:
+        row = []
+        for field in record:
+            # Extract the actual value from the field based on its type
+            if 'stringValue' in field:
+                row.append(field['stringValue'])
+            elif 'longValue' in field:
+                row.append(field['longValue'])
+            elif 'doubleValue' in field:
+                row.append(field['doubleValue'])
+            elif 'booleanValue' in field:
+                row.append(field['booleanValue'])
+            elif 'isNull' in field and field['isNull']:
+                row.append(None)
+            else:
+                # Fallback for unknown field types
+                row.append(str(field))
+        rows.append(row)
+
+    return {
+        'columns': columns,
+        'rows': rows,
+        'row_count': len(rows),
+        'execution_time_ms': execution_time_ms,
+        'query_id': query_id,
+        'next_cursor': results_response.get('NextCursor'),
+    }
+
+
+async def execute_query(
+    cluster_identifier: str,
+    database_name: str,
+    sql: str,
+    max_rows: int = QUERY_RESULT_MAX_ROWS,
+    max_bytes: int = QUERY_RESULT_MAX_BYTES,
+) -> dict:
     """Execute a SQL query against a Redshift cluster using the Data API.
 
     Args:
         cluster_identifier: The cluster identifier to query.
         database_name: The database to execute the query against.
         sql: The SQL statement to execute.
+        max_rows: Maximum number of rows to return.
+        max_bytes: Approximate maximum number of bytes to return.
 
     Returns:
         Dictionary with query results including columns, rows, and metadata.
+        When the result exceeds the budget, next_cursor can be passed to
+        fetch_query_results to read the remaining rows.
     """
     try:
         logger.info(f'Executing query on cluster {cluster_identifier} in database {database_name}')
         logger.debug(f'SQL: {sql}')
 
         # Record start time for execution time calculation
-        import time
-
         start_time = time.time()
 
         # Execute the query using the common function
         results_response, query_id = await execute_statement(
-            cluster_identifier=cluster_identifier, database_name=database_name, sql=sql
+            cluster_identifier=cluster_identifier,
+            database_name=database_name,
+            sql=sql,
+            max_rows=max_rows,
+            max_bytes=max_bytes,
         )
 
         # Calculate execution time
         end_time = time.time()
         execution_time_ms = int((end_time - start_time) * 1000)
 
-        # Extract column names
-        columns = []
-        column_metadata = results_response.get('ColumnMetadata', [])
-        for col_meta in column_metadata:
-            columns.append(col_meta.get('name'))
-
-        # Extract rows
-        rows = []
-        records = results_response.get('Records', [])
-
-        for record in records:
-            row = []
-            for field in record:
-                # Extract the actual value from the field based on its type
-                if 'stringValue' in field:
-                    row.append(field['stringValue'])
-                elif 'longValue' in field:
-                    row.append(field['longValue'])
-                elif 'doubleValue' in field:
-                    row.append(field['doubleValue'])
-                elif 'booleanValue' in field:
-                    row.append(field['booleanValue'])
-                elif 'isNull' in field and field['isNull']:
-                    row.append(None)
-                else:
-                    # Fallback for unknown field types
-                    row.append(str(field))
-            rows.append(row)
-
-        query_result = {
-            'columns': columns,
-            'rows': rows,
-            'row_count': len(rows),
-            'execution_time_ms': execution_time_ms,
-            'query_id': query_id,
-        }
+        query_result = _format_query_result(results_response, query_id, execution_time_ms)
 
         logger.info(
-            f'Query executed successfully: {query_id}, returned {len(rows)} rows in {execution_time_ms}ms'
+            f'Query executed successfully: {query_id}, returned {query_result["row_count"]} rows in {execution_time_ms}ms'
         )
         return query_result
 
@@ -617,6 +852,36 @@ async def execute_query(cluster_identifier: str, database_name: str, sql: str) -
         raise
 
 
+async def fetch_query_results(
+    cursor: str,
+    max_rows: int = QUERY_RESULT_MAX_ROWS,
+    max_bytes: int = QUERY_RESULT_MAX_BYTES,
+) -> dict:
+    """Read the next rows of a query result from a cursor returned by execute_query.
+
+    Args:
+        cursor: The next_cursor value of a previous execute_query or fetch_query_results call.
+        max_rows: Maximum number of rows to return.
+        max_bytes: Approximate maximum number of bytes to return.
+
+    Returns:
+        Dictionary with query results including columns, rows, and metadata.
+    """
+    try:
+        query_id, _, _ = decode_result_cursor(cursor)
+        logger.info(f'Fetching more results for query {query_id}')
+
+        start_time = time.time()
+        results_response = await read_statement_result(query_id, max_rows, max_bytes, cursor)
+        execution_time_ms = int((time.time() - start_time) * 1000)
+
+        return _format_query_result(results_response, query_id, execution_time_ms)
+
+    except Exception as e:
+        logger.error(f'Error fetching query results: {str(e)}')
+        raise
+
+
 # Global client manager instance
 client_manager = RedshiftClientManager(
     config=Config(
@@ -628,3 +893,6 @@ client_manager = RedshiftClientManager(
     aws_region=os.environ.get('AWS_REGION', DEFAULT_AWS_REGION),
     aws_profile=os.environ.get('AWS_PROFILE'),
 )
+
+# Global cluster topology cache
+cluster_topology = ClusterTopology()
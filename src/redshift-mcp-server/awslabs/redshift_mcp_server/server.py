@@ -19,6 +19,7 @@ import sys
 from awslabs.redshift_mcp_server.consts import (
     CLIENT_BEST_PRACTICES,
     DEFAULT_LOG_LEVEL,
+    QUERY_RESULT_MAX_ROWS,
     REDSHIFT_BEST_PRACTICES,
 )
 from awslabs.redshift_mcp_server.models import (
@@ -36,10 +37,13 @@ from awslabs.redshift_mcp_server.redshift import (
     discover_schemas,
     discover_tables,
     execute_query,
+    fetch_query_results,
+    invalidate_catalog,
 )
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
+from typing import Annotated, Optional
 
 
 # Remove default handler and add custom configuration
@@ -79,9 +83,19 @@ This tool queries the SVV_ALL_TABLES system view to discover available tables.
 Lists all columns in a specified table within a Redshift schema.
 This tool queries the SVV_ALL_COLUMNS system view to discover available columns.
 
+Database, schema, table and column listings are cached per cluster and fetched in bulk
+(all schemas, tables and columns of a database), so drill-down calls are answered from memory.
+
+### refresh_catalog
+Drops the cached catalog metadata of a cluster or database, e.g. after tables were created or altered.
+
 ### execute_query
 Executes SQL queries against a Redshift cluster or serverless workgroup.
 This tool uses the Redshift Data API to run queries and return results.
+Large results are returned in batches; use fetch_query_results with the returned next_cursor to read more rows.
+
+### fetch_query_results
+Reads the next batch of rows of a previous execute_query result.
 
 ## Getting Started
 
@@ -536,6 +550,13 @@ async def execute_query_tool(
     sql: str = Field(
         ..., description='The SQL statement to execute. Should be a single SQL statement.'
     ),
+    max_rows: Annotated[
+        int,
+        Field(
+            description='Maximum number of rows to return. Use fetch_query_results with next_cursor to read more.',
+            ge=1,
+        ),
+    ] = QUERY_RESULT_MAX_ROWS,
 ) -> QueryResult:
     """Execute a SQL query against a Redshift cluster or serverless workgroup.
 
@@ -557,6 +578,7 @@ async def execute_query_tool(
     - database_name: The database name to execute the query against.
                     IMPORTANT: Use a valid database name from the list_databases tool.
     - sql: The SQL statement to execute. Should be a single SQL statement.
+    - max_rows: Maximum number of rows to return (the response is also capped at about 1 MB).
 
     ## Response Structure
 
@@ -567,6 +589,7 @@ async def execute_query_tool(
     - row_count: Number of rows returned.
     - execution_time_ms: Query execution time in milliseconds.
     - query_id: Unique identifier for the query execution.
+    - next_cursor: Set when more rows are available; pass it to fetch_query_results.
 
     ## Usage Tips
 
@@ -594,7 +617,9 @@ async def execute_query_tool(
     """
     try:
         logger.info(f'Executing query on cluster {cluster_identifier} in database {database_name}')
-        query_result_data = await execute_query(cluster_identifier, database_name, sql)
+        query_result_data = await execute_query(
+            cluster_identifier, database_name, sql, max_rows=max_rows
+        )
 
         # Convert to QueryResult model
         query_result = QueryResult(**query_result_data)
@@ -612,6 +637,90 @@ async def execute_query_tool(
         raise
 
 
+@mcp.tool(name='fetch_query_results')
+async def fetch_query_results_tool(
+    ctx: Context,
+    cursor: str = Field(
+        ...,
+        description='The next_cursor value returned by execute_query or a previous fetch_query_results call.',
+    ),
+    max_rows: Annotated[
+        int,
+        Field(description='Maximum number of rows to return.', ge=1),
+    ] = QUERY_RESULT_MAX_ROWS,
+) -> QueryResult:
+    """Read the next batch of rows of a query result.
+
+    execute_query returns at most max_rows rows (and about 1 MB) per call. When a result is
+    larger, it sets next_cursor; this tool continues reading from that position without
+    re-running the query. Results are available for 24 hours after the query finished.
+
+    ## Usage Requirements
+
+    - Required IAM permissions: redshift-data:GetStatementResult.
+
+    ## Parameters
+
+    - cursor: The next_cursor value returned by execute_query or fetch_query_results.
+    - max_rows: Maximum number of rows to return.
+
+    ## Response Structure
+
+    Returns a QueryResult object with the same structure as execute_query. next_cursor is
+    set again if further rows remain.
+    """
+    try:
+        query_result_data = await fetch_query_results(cursor, max_rows=max_rows)
+        query_result = QueryResult(**query_result_data)
+
+        logger.info(
+            f'Successfully fetched {query_result.row_count} more rows for query {query_result.query_id}'
+        )
+        return query_result
+
+    except Exception as e:
+        logger.error(f'Error in fetch_query_results_tool: {str(e)}')
+        await ctx.error(f'Failed to fetch query results: {str(e)}')
+        raise
+
+
+@mcp.tool(name='refresh_catalog')
+async def refresh_catalog_tool(
+    ctx: Context,
+    cluster_identifier: str = Field(
+        ...,
+        description='The cluster identifier whose cached catalog metadata should be dropped.',
+    ),
+    database_name: Annotated[
+        Optional[str],
+        Field(description='Only drop the cached metadata of this database.'),
+    ] = None,
+) -> str:
+    """Drop cached catalog metadata so the next list_* call reads it from Redshift again.
+
+    list_databases, list_schemas, list_tables and list_columns serve their results from a
+    catalog cache that expires after a few minutes. Use this tool when objects were created,
+    altered or dropped since they were listed.
+
+    ## Parameters
+
+    - cluster_identifier: The cluster identifier from list_clusters.
+    - database_name: Optional database name; when omitted, all cached metadata of the cluster is dropped.
+
+    ## Response Structure
+
+    Returns a message with the number of cache entries dropped.
+    """
+    try:
+        dropped = invalidate_catalog(cluster_identifier, database_name)
+        return f'Dropped {dropped} cached catalog entries for cluster {cluster_identifier}'
+
+    except Exception as e:
+        logger.error(f'Error in refresh_catalog_tool: {str(e)}')
+        await ctx.error(f'Failed to refresh catalog of cluster {cluster_identifier}: {str(e)}')
+        raise
+
+
 def main():
     """Run the MCP server with CLI argument support."""
     mcp.run()
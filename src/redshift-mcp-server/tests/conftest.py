@@ -0,0 +1,29 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared fixtures for the Redshift MCP Server tests."""
+
+import pytest
+from awslabs.redshift_mcp_server.catalog import catalog_cache
+from awslabs.redshift_mcp_server.redshift import cluster_topology
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """Start every test without a cached cluster topology or catalog."""
+    cluster_topology.invalidate()
+    catalog_cache.invalidate()
+    yield
+    cluster_topology.invalidate()
+    catalog_cache.invalidate()
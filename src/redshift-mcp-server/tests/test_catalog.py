@@ -0,0 +1,251 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the catalog metadata cache."""
+
+import asyncio
+import json
+import pytest
+from awslabs.redshift_mcp_server.catalog import CatalogCache
+from awslabs.redshift_mcp_server.server import (
+    list_columns_tool,
+    list_tables_tool,
+    refresh_catalog_tool,
+)
+from mcp.server.fastmcp import Context
+
+
+class TestCatalogCache:
+    """Tests for the CatalogCache class."""
+
+    @pytest.mark.asyncio
+    async def test_entries_are_cached_until_ttl(self, mocker):
+        """Test that the loader runs once while the entry is fresh."""
+        cache = CatalogCache(ttl=600)
+        loader = mocker.AsyncMock(return_value=['dev'])
+
+        assert await cache.get(('cluster', 'databases'), loader) == ['dev']
+        assert await cache.get(('cluster', 'databases'), loader) == ['dev']
+        assert loader.call_count == 1
+
+        cache.ttl = -1
+        await cache.get(('cluster', 'databases'), loader)
+        assert loader.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_results_are_cached(self, mocker):
+        """Test that an empty catalog is cached like any other result."""
+        cache = CatalogCache()
+        loader = mocker.AsyncMock(return_value={})
+
+        await cache.get(('cluster', 'tables', 'dev'), loader)
+        await cache.get(('cluster', 'tables', 'dev'), loader)
+        assert loader.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_load(self):
+        """Test that concurrent misses for the same key run the loader once."""
+        cache = CatalogCache()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return ['public']
+
+        results = await asyncio.gather(
+            *(cache.get(('cluster', 'schemas', 'dev'), loader) for _ in range(5))
+        )
+        assert results == [['public']] * 5
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_scopes(self, mocker):
+        """Test invalidation by cluster and by database."""
+        cache = CatalogCache()
+        loader = mocker.AsyncMock(return_value=[])
+        for key in (
+            ('a', 'databases'),
+            ('a', 'schemas', 'dev'),
+            ('a', 'schemas', 'prod'),
+            ('b', 'schemas', 'dev'),
+        ):
+            await cache.get(key, loader)
+
+        assert cache.invalidate('a', 'dev') == 2
+        assert set(cache._entries) == {('a', 'schemas', 'prod'), ('b', 'schemas', 'dev')}
+        assert cache.invalidate('b') == 1
+        assert cache.invalidate() == 1
+
+    @pytest.mark.asyncio
+    async def test_persistence(self, mocker, tmp_path):
+        """Test that entries survive a restart through the cache file."""
+        path = str(tmp_path / 'catalog.json')
+        loader = mocker.AsyncMock(return_value={'public': [{'table_name': 'users'}]})
+
+        await CatalogCache(path=path).get(('cluster', 'tables', 'dev'), loader)
+
+        restarted = CatalogCache(path=path)
+        assert await restarted.get(('cluster', 'tables', 'dev'), loader) == {
+            'public': [{'table_name': 'users'}]
+        }
+        assert loader.call_count == 1
+
+        # Expired entries in the file are ignored
+        assert CatalogCache(ttl=-1, path=path)._entries == {}
+
+    def test_unreadable_file_is_ignored(self, tmp_path):
+        """Test that a corrupt cache file does not prevent startup."""
+        path = tmp_path / 'catalog.json'
+        path.write_text('not json')
+        assert CatalogCache(path=str(path))._entries == {}
+
+        path.write_text(json.dumps([]))
+        assert CatalogCache(path=str(path))._entries == {}
+
+
+class TestCatalogTools:
+    """Tests for catalog caching in the list tools."""
+
+    @staticmethod
+    def _mock_data_client(mocker, records):
+        mock_data_client = mocker.Mock()
+        mock_data_client.batch_execute_statement.return_value = {'Id': 'batch-query-123'}
+        mock_data_client.describe_statement.return_value = {
+            'Status': 'FINISHED',
+            'SubStatements': [{'Id': 'sub-query-0'}, {'Id': 'query-123'}, {'Id': 'sub-query-2'}],
+        }
+        mock_data_client.get_statement_result.return_value = {'Records': records}
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.discover_clusters',
+            return_value=[{'identifier': 'test-cluster', 'type': 'provisioned'}],
+        )
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_data_client',
+            return_value=mock_data_client,
+        )
+        return mock_data_client
+
+    @pytest.mark.asyncio
+    async def test_tables_of_all_schemas_are_fetched_once(self, mocker):
+        """Test that listing tables of several schemas runs one bulk query."""
+        mock_data_client = self._mock_data_client(
+            mocker,
+            [
+                [{'stringValue': 'dev'}, {'stringValue': 'public'}, {'stringValue': 'users'}]
+                + [{'isNull': True}] * 3,
+                [{'stringValue': 'dev'}, {'stringValue': 'sales'}, {'stringValue': 'orders'}]
+                + [{'isNull': True}] * 3,
+            ],
+        )
+
+        public = await list_tables_tool(
+            Context(),
+            cluster_identifier='test-cluster',
+            table_database_name='dev',
+            table_schema_name='public',
+        )
+        sales = await list_tables_tool(
+            Context(),
+            cluster_identifier='test-cluster',
+            table_database_name='dev',
+            table_schema_name='sales',
+        )
+        empty = await list_tables_tool(
+            Context(),
+            cluster_identifier='test-cluster',
+            table_database_name='dev',
+            table_schema_name='missing',
+        )
+
+        assert [t.table_name for t in public] == ['users']
+        assert [t.table_name for t in sales] == ['orders']
+        assert empty == []
+        assert mock_data_client.batch_execute_statement.call_count == 1
+        sql = mock_data_client.batch_execute_statement.call_args.kwargs['Sqls'][1]
+        assert "WHERE database_name = 'dev'\n" in sql
+
+    @pytest.mark.asyncio
+    async def test_columns_of_all_schemas_are_fetched_once(self, mocker):
+        """Test that listing columns of tables in several schemas runs one bulk query."""
+        mock_data_client = self._mock_data_client(
+            mocker,
+            [
+                [{'stringValue': 'dev'}, {'stringValue': schema}, {'stringValue': table}]
+                + [{'stringValue': column}, {'longValue': 1}]
+                + [{'isNull': True}] * 7
+                for schema, table, column in [
+                    ('public', 'users', 'id'),
+                    ('sales', 'orders', 'order_id'),
+                    ('sales', 'users', 'user_id'),
+                ]
+            ],
+        )
+
+        async def columns(schema, table):
+            result = await list_columns_tool(
+                Context(),
+                cluster_identifier='test-cluster',
+                column_database_name='dev',
+                column_schema_name=schema,
+                column_table_name=table,
+            )
+            return [c.column_name for c in result]
+
+        assert await columns('public', 'users') == ['id']
+        assert await columns('sales', 'orders') == ['order_id']
+        assert await columns('sales', 'users') == ['user_id']
+        assert await columns('missing', 'users') == []
+        assert mock_data_client.batch_execute_statement.call_count == 1
+        sql = mock_data_client.batch_execute_statement.call_args.kwargs['Sqls'][1]
+        assert "WHERE database_name = 'dev'\n" in sql
+
+    @pytest.mark.asyncio
+    async def test_refresh_catalog(self, mocker):
+        """Test that refresh_catalog forces the next listing to query Redshift."""
+        mock_data_client = self._mock_data_client(
+            mocker,
+            [
+                [{'stringValue': 'dev'}, {'stringValue': 'public'}, {'stringValue': 'users'}]
+                + [{'stringValue': 'id'}, {'longValue': 1}]
+                + [{'isNull': True}] * 7,
+            ],
+        )
+
+        columns = []
+        for _ in range(2):
+            columns = await list_columns_tool(
+                Context(),
+                cluster_identifier='test-cluster',
+                column_database_name='dev',
+                column_schema_name='public',
+                column_table_name='users',
+            )
+        assert [c.column_name for c in columns] == ['id']
+        assert mock_data_client.batch_execute_statement.call_count == 1
+
+        message = await refresh_catalog_tool(
+            Context(), cluster_identifier='test-cluster', database_name='dev'
+        )
+        assert message == 'Dropped 1 cached catalog entries for cluster test-cluster'
+
+        await list_columns_tool(
+            Context(),
+            cluster_identifier='test-cluster',
+            column_database_name='dev',
+            column_schema_name='public',
+            column_table_name='users',
+        )
+        assert mock_data_client.batch_execute_statement.call_count == 2
@@ -16,9 +16,14 @@
 
 import pytest
 from awslabs.redshift_mcp_server.redshift import (
+    ClusterTopology,
     RedshiftClientManager,
+    decode_result_cursor,
+    execute_statement,
     protect_sql,
     quote_literal_string,
+    read_statement_result,
+    wait_for_statement,
 )
 from botocore.config import Config
 
@@ -270,3 +275,200 @@ class TestProtectSQL:
                 match='SQL contains suspicious pattern, execution rejected',
             ):
                 protect_sql(sql=sql, allow_read_write=False)
+
+
+class TestClusterTopology:
+    """Tests for the ClusterTopology cache."""
+
+    @pytest.mark.asyncio
+    async def test_topology_is_cached_until_ttl(self, mocker):
+        """Test that discover_clusters runs once while the topology is fresh."""
+        mock_discover_clusters = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.discover_clusters',
+            return_value=[
+                {'identifier': 'cluster-a', 'type': 'provisioned'},
+                {'identifier': 'workgroup-b', 'type': 'serverless'},
+            ],
+        )
+
+        topology = ClusterTopology(ttl=300)
+        assert await topology.get_cluster_type('cluster-a') == 'provisioned'
+        assert await topology.get_cluster_type('workgroup-b') == 'serverless'
+        assert mock_discover_clusters.call_count == 1
+
+        topology.ttl = 0
+        assert await topology.get_cluster_type('cluster-a') == 'provisioned'
+        assert mock_discover_clusters.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_cluster_triggers_refresh(self, mocker):
+        """Test that an identifier missing from the cache refreshes the topology."""
+        mock_discover_clusters = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.discover_clusters',
+            side_effect=[
+                [{'identifier': 'cluster-a', 'type': 'provisioned'}],
+                [
+                    {'identifier': 'cluster-a', 'type': 'provisioned'},
+                    {'identifier': 'cluster-new', 'type': 'provisioned'},
+                ],
+                [],
+            ],
+        )
+
+        topology = ClusterTopology()
+        assert await topology.get_cluster_type('cluster-a') == 'provisioned'
+        assert await topology.get_cluster_type('cluster-new') == 'provisioned'
+        assert await topology.get_cluster_type('missing') is None
+        assert mock_discover_clusters.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_statement_reuses_topology(self, mocker):
+        """Test that consecutive queries do not rediscover clusters."""
+        mock_discover_clusters = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.discover_clusters',
+            return_value=[{'identifier': 'cluster-a', 'type': 'provisioned'}],
+        )
+        mock_data_client = mocker.Mock()
+        mock_data_client.batch_execute_statement.return_value = {'Id': 'batch-1'}
+        mock_data_client.describe_statement.return_value = {
+            'Status': 'FINISHED',
+            'SubStatements': [{'Id': 'sub-0'}, {'Id': 'sub-1'}, {'Id': 'sub-2'}],
+        }
+        mock_data_client.get_statement_result.return_value = {'Records': [[{'longValue': 1}]]}
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_data_client',
+            return_value=mock_data_client,
+        )
+
+        results, query_id = {}, None
+        for _ in range(3):
+            results, query_id = await execute_statement('cluster-a', 'dev', 'SELECT 1')
+
+        assert query_id == 'sub-1'
+        assert results['Records'] == [[{'longValue': 1}]]
+        assert mock_discover_clusters.call_count == 1
+
+
+class TestWaitForStatement:
+    """Tests for adaptive describe_statement polling."""
+
+    @pytest.mark.asyncio
+    async def test_polling_backs_off(self, mocker):
+        """Test that the poll interval doubles up to QUERY_POLL_INTERVAL."""
+        mock_data_client = mocker.Mock()
+        mock_data_client.describe_statement.side_effect = [{'Status': 'STARTED'}] * 6 + [
+            {'Status': 'FINISHED', 'Id': 'q'}
+        ]
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_data_client',
+            return_value=mock_data_client,
+        )
+        mock_sleep = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.asyncio.sleep', new=mocker.AsyncMock()
+        )
+
+        result = await wait_for_statement('q')
+
+        assert result['Status'] == 'FINISHED'
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [
+            0.1,
+            0.2,
+            0.4,
+            0.8,
+            1.6,
+            2,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_statement(self, mocker):
+        """Test that a failed statement raises with its error message."""
+        mock_data_client = mocker.Mock()
+        mock_data_client.describe_statement.return_value = {
+            'Status': 'FAILED',
+            'Error': 'syntax error',
+        }
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_data_client',
+            return_value=mock_data_client,
+        )
+
+        with pytest.raises(Exception, match='Query failed: syntax error'):
+            await wait_for_statement('q')
+
+
+class TestReadStatementResult:
+    """Tests for paginated result reading with budgets and cursors."""
+
+    @staticmethod
+    def _paged_client(mocker, pages):
+        """Mock a data client serving the given pages of single-column records."""
+        mock_data_client = mocker.Mock()
+
+        def get_statement_result(Id, NextToken=None):
+            index = int(NextToken) if NextToken else 0
+            response = {
+                'ColumnMetadata': [{'name': 'n'}],
+                'Records': [[{'longValue': value}] for value in pages[index]],
+            }
+            if index + 1 < len(pages):
+                response['NextToken'] = str(index + 1)
+            return response
+
+        mock_data_client.get_statement_result.side_effect = get_statement_result
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_data_client',
+            return_value=mock_data_client,
+        )
+        return mock_data_client
+
+    @staticmethod
+    def _values(result):
+        return [record[0]['longValue'] for record in result['Records']]
+
+    @pytest.mark.asyncio
+    async def test_follows_next_token(self, mocker):
+        """Test that all pages are read when there is no budget."""
+        mock_data_client = self._paged_client(mocker, [[1, 2], [3, 4], [5]])
+
+        result = await read_statement_result('stmt')
+
+        assert self._values(result) == [1, 2, 3, 4, 5]
+        assert result['NextCursor'] is None
+        assert mock_data_client.get_statement_result.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_row_budget_and_resume(self, mocker):
+        """Test that reading stops at max_rows and resumes from the cursor."""
+        self._paged_client(mocker, [[1, 2], [3, 4], [5]])
+
+        first = await read_statement_result('stmt', max_rows=3)
+        assert self._values(first) == [1, 2, 3]
+        assert decode_result_cursor(first['NextCursor']) == ('stmt', '1', 1)
+
+        second = await read_statement_result('stmt', max_rows=3, cursor=first['NextCursor'])
+        assert self._values(second) == [4, 5]
+        assert second['NextCursor'] is None
+
+    @pytest.mark.asyncio
+    async def test_byte_budget(self, mocker):
+        """Test that reading stops once the byte budget is reached."""
+        self._paged_client(mocker, [[1, 2, 3, 4]])
+
+        result = await read_statement_result('stmt', max_bytes=16)
+
+        assert self._values(result) == [1, 2]
+        assert result['NextCursor'] is not None
+
+    @pytest.mark.asyncio
+    async def test_cursor_for_other_statement(self, mocker):
+        """Test that a cursor cannot be used with another statement."""
+        self._paged_client(mocker, [[1, 2]])
+        first = await read_statement_result('stmt', max_rows=1)
+
+        with pytest.raises(Exception, match='does not belong'):
+            await read_statement_result('other', cursor=first['NextCursor'])
+
+    def test_invalid_cursor(self):
+        """Test that malformed cursors are rejected."""
+        with pytest.raises(Exception, match='Invalid result cursor'):
+            decode_result_cursor('not-a-cursor')
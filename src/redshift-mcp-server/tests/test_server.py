@@ -25,6 +25,7 @@ from awslabs.redshift_mcp_server.models import (
 )
 from awslabs.redshift_mcp_server.server import (
     execute_query_tool,
+    fetch_query_results_tool,
     list_clusters_tool,
     list_columns_tool,
     list_databases_tool,
@@ -966,3 +967,59 @@ class TestExecuteQueryTool:
                 database_name='dev',
                 sql='SELECT * FROM users',
             )
+
+
+class TestFetchQueryResultsTool:
+    """Tests for the fetch_query_results MCP tool."""
+
+    @pytest.mark.asyncio
+    async def test_execute_then_fetch_remaining_rows(self, mocker):
+        """Test that a truncated result can be continued with its cursor."""
+        mock_data_client = mocker.Mock()
+        mock_data_client.batch_execute_statement.return_value = {'Id': 'batch-query-123'}
+        mock_data_client.describe_statement.return_value = {
+            'Status': 'FINISHED',
+            'SubStatements': [{'Id': 'sub-query-0'}, {'Id': 'query-123'}, {'Id': 'sub-query-2'}],
+        }
+        mock_data_client.get_statement_result.side_effect = lambda Id, NextToken=None: (
+            {
+                'ColumnMetadata': [{'name': 'n'}],
+                'Records': [[{'longValue': 1}], [{'longValue': 2}]],
+                'NextToken': 'page-2',
+            }
+            if NextToken is None
+            else {'ColumnMetadata': [{'name': 'n'}], 'Records': [[{'longValue': 3}]]}
+        )
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.discover_clusters',
+            return_value=[{'identifier': 'test-cluster', 'type': 'provisioned'}],
+        )
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_data_client',
+            return_value=mock_data_client,
+        )
+
+        first = await execute_query_tool(
+            Context(),
+            cluster_identifier='test-cluster',
+            database_name='dev',
+            sql='SELECT n FROM numbers',
+            max_rows=2,
+        )
+        assert first.rows == [[1], [2]]
+        assert first.next_cursor is not None
+
+        second = await fetch_query_results_tool(Context(), cursor=first.next_cursor, max_rows=2)
+        assert second.rows == [[3]]
+        assert second.query_id == 'query-123'
+        assert second.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_query_results_invalid_cursor(self, mocker):
+        """Test error handling for an invalid cursor."""
+        mock_context = mocker.Mock()
+        mock_context.error = mocker.AsyncMock()
+
+        with pytest.raises(Exception, match='Invalid result cursor'):
+            await fetch_query_results_tool(mock_context, cursor='bogus', max_rows=10)
+        mock_context.error.assert_called_once()
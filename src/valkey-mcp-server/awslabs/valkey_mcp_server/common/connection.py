@@ -15,11 +15,13 @@
 import sys
 from awslabs.valkey_mcp_server.common.config import VALKEY_CFG
 from awslabs.valkey_mcp_server.version import __version__
-from typing import Optional, Type, Union
+from typing import Any, Dict, Optional, Type, Union
 from valkey import (
     Valkey,
     exceptions,
 )
+from valkey.asyncio import Valkey as AsyncValkey
+from valkey.asyncio.cluster import ValkeyCluster as AsyncValkeyCluster
 from valkey.cluster import ValkeyCluster
 
 
@@ -27,6 +29,31 @@ class ValkeyConnectionManager:
     """Manages connection to Valkey."""
 
     _instance: Optional[Union[Valkey, ValkeyCluster]] = None
+    _async_instance: Optional[Union[AsyncValkey, AsyncValkeyCluster]] = None
+
+    @staticmethod
+    def _connection_kwargs(decode_responses: bool) -> Dict[str, Any]:
+        """Build the client arguments shared by the sync and async clients."""
+        # Get SSL settings with defaults
+        ssl_enabled = VALKEY_CFG.get('ssl', False)
+        ssl_cert_reqs = VALKEY_CFG.get('ssl_cert_reqs')
+        if ssl_enabled and ssl_cert_reqs is None:
+            ssl_cert_reqs = 'required'
+
+        return {
+            'host': VALKEY_CFG['host'],
+            'port': VALKEY_CFG['port'],
+            'username': VALKEY_CFG.get('username'),
+            'password': VALKEY_CFG.get('password', ''),
+            'ssl': ssl_enabled,
+            'ssl_ca_path': VALKEY_CFG.get('ssl_ca_path'),
+            'ssl_keyfile': VALKEY_CFG.get('ssl_keyfile'),
+            'ssl_certfile': VALKEY_CFG.get('ssl_certfile'),
+            'ssl_cert_reqs': ssl_cert_reqs,
+            'ssl_ca_certs': VALKEY_CFG.get('ssl_ca_certs'),
+            'decode_responses': decode_responses,
+            'lib_name': f'valkey-py(mcp-server_v{__version__})',
+        }
 
     @classmethod
     def get_connection(cls, decode_responses: bool = True) -> Union[Valkey, ValkeyCluster]:
@@ -44,33 +71,14 @@ class ValkeyConnectionManager:
                     ValkeyCluster if VALKEY_CFG['cluster_mode'] else Valkey
                 )
 
-                # Get SSL settings with defaults
-                ssl_enabled = VALKEY_CFG.get('ssl', False)
-                ssl_cert_reqs = VALKEY_CFG.get('ssl_cert_reqs')
-                if ssl_enabled and ssl_cert_reqs is None:
-                    ssl_cert_reqs = 'required'
-
-                # Build connection kwargs
-                connection_kwargs = {
-                    'host': VALKEY_CFG['host'],
-                    'port': VALKEY_CFG['port'],
-                    'username': VALKEY_CFG.get('username'),
-                    'password': VALKEY_CFG.get('password', ''),
-                    'ssl': ssl_enabled,
-                    'ssl_ca_path': VALKEY_CFG.get('ssl_ca_path'),
-                    'ssl_keyfile': VALKEY_CFG.get('ssl_keyfile'),
-                    'ssl_certfile': VALKEY_CFG.get('ssl_certfile'),
-                    'ssl_cert_reqs': ssl_cert_reqs,
-                    'ssl_ca_certs': VALKEY_CFG.get('ssl_ca_certs'),
-                    'decode_responses': decode_responses,
-                    'lib_name': f'valkey-py(mcp-server_v{__version__})',
-                }
+                connection_kwargs = cls._connection_kwargs(decode_responses)
 
                 # Add max_connections parameter based on mode
+                max_connections = VALKEY_CFG.get('max_connections', 10)
                 if VALKEY_CFG['cluster_mode']:
-                    connection_kwargs['max_connections_per_node'] = 10
+                    connection_kwargs['max_connections_per_node'] = max_connections
                 else:
-                    connection_kwargs['max_connections'] = 10
+                    connection_kwargs['max_connections'] = max_connections
 
                 # Create new instance
                 cls._instance = valkey_class(**connection_kwargs)
@@ -98,3 +106,40 @@ class ValkeyConnectionManager:
                 raise
 
         return cls._instance
+
+    @classmethod
+    def get_async_connection(
+        cls, decode_responses: bool = True
+    ) -> Union[AsyncValkey, AsyncValkeyCluster]:
+        """Create an asyncio connection to Valkey if none present or returns existing connection.
+
+        The asyncio client does not block the event loop while waiting on the server. It
+        keeps its own pool of up to VALKEY_MAX_CONNECTIONS connections (per node in
+        cluster mode) and connects lazily, on its first command.
+
+        Args:
+            decode_responses: Whether to decode response bytes to strings. Defaults to True.
+
+        Returns:
+            AsyncValkey: An asyncio Valkey connection instance.
+        """
+        if cls._async_instance is None:
+            valkey_class: Type[Union[AsyncValkey, AsyncValkeyCluster]] = (
+                AsyncValkeyCluster if VALKEY_CFG['cluster_mode'] else AsyncValkey
+            )
+            connection_kwargs = cls._connection_kwargs(decode_responses)
+            # The asyncio clients only accept a CA bundle file, not a CA directory
+            connection_kwargs.pop('ssl_ca_path')
+            # The asyncio cluster client applies max_connections to each node
+            connection_kwargs['max_connections'] = VALKEY_CFG.get('max_connections', 10)
+
+            try:
+                cls._async_instance = valkey_class(**connection_kwargs)
+            except exceptions.ValkeyError as e:
+                print(f'Valkey error: {e}', file=sys.stderr)
+                raise
+            except Exception as e:
+                print(f'Unexpected error: {e}', file=sys.stderr)
+                raise
+
+        return cls._async_instance
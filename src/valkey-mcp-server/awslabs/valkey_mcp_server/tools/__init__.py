@@ -17,10 +17,12 @@ Tool imports for Valkey MCP Server.
 """
 
 from . import (
+    batch,
     bitmap,
     hash,
     hyperloglog,
     json,
+    keyspace,
     list,
     misc,
     server_management,
@@ -0,0 +1,186 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.server import mcp
+from awslabs.valkey_mcp_server.context import Context
+from collections import defaultdict
+from typing import Any, Dict, List
+from valkey.asyncio import ConnectionPool
+from valkey.asyncio import Valkey as AsyncValkey
+from valkey.asyncio.cluster import ClusterNode
+from valkey.asyncio.cluster import ValkeyCluster as AsyncValkeyCluster
+from valkey.exceptions import ValkeyError
+
+
+# Largest number of commands accepted in one batch
+MAX_BATCH_COMMANDS = 1000
+
+# Commands allowed in a batch when the server runs in readonly mode
+READONLY_COMMANDS = frozenset(
+    {
+        'BITCOUNT',
+        'BITPOS',
+        'EXISTS',
+        'GET',
+        'GETBIT',
+        'GETRANGE',
+        'HEXISTS',
+        'HGET',
+        'HGETALL',
+        'HKEYS',
+        'HLEN',
+        'HMGET',
+        'HSTRLEN',
+        'HVALS',
+        'JSON.ARRLEN',
+        'JSON.GET',
+        'JSON.MGET',
+        'JSON.OBJKEYS',
+        'JSON.OBJLEN',
+        'JSON.STRLEN',
+        'JSON.TYPE',
+        'LINDEX',
+        'LLEN',
+        'LRANGE',
+        'MGET',
+        'PFCOUNT',
+        'PTTL',
+        'SCARD',
+        'SISMEMBER',
+        'SMEMBERS',
+        'STRLEN',
+        'TTL',
+        'TYPE',
+        'XLEN',
+        'XRANGE',
+        'XREVRANGE',
+        'ZCARD',
+        'ZCOUNT',
+        'ZRANGE',
+        'ZRANGEBYSCORE',
+        'ZRANK',
+        'ZREVRANGE',
+        'ZREVRANK',
+        'ZSCORE',
+    }
+)
+
+
+def _format_result(command: List[str], result: Any) -> Dict[str, Any]:
+    if isinstance(result, Exception):
+        return {'command': command[0], 'error': str(result)}
+    return {'command': command[0], 'result': result}
+
+
+async def _execute_slot_transaction(node: ClusterNode, commands: List[List[str]]) -> List[Any]:
+    """Run commands hashing to one slot as a MULTI/EXEC transaction on the slot's node."""
+    pool = ConnectionPool(connection_class=node.connection_class, **node.connection_kwargs)
+    async with AsyncValkey(connection_pool=pool) as client:
+        pipe = client.pipeline(transaction=True)
+        for command in commands:
+            pipe.execute_command(*command)
+        try:
+            return await pipe.execute(raise_on_error=False)
+        except ValkeyError as e:
+            # The transaction was aborted, report why against every command
+            return [e] * len(commands)
+
+
+async def _execute_cluster_transactions(
+    r: AsyncValkeyCluster, commands: List[List[str]]
+) -> List[Any]:
+    """Run one transaction per hash slot, the unit of atomicity in cluster mode."""
+    slots: Dict[int, List[int]] = defaultdict(list)
+    for i, command in enumerate(commands):
+        if len(command) < 2:
+            raise ValueError(f'{command[0]} has no key, transactions in cluster mode need one')
+        slots[r.keyslot(command[1])].append(i)
+
+    await r.initialize()
+    groups = list(slots.values())
+    nodes = []
+    for group in groups:
+        key = commands[group[0]][1]
+        node = r.get_node_from_key(key)
+        if node is None:
+            raise ValkeyError(f'No cluster node serves the slot of key {key}')
+        nodes.append(node)
+
+    group_results = await asyncio.gather(
+        *(
+            _execute_slot_transaction(node, [commands[i] for i in group])
+            for node, group in zip(nodes, groups)
+        )
+    )
+
+    results: List[Any] = [None] * len(commands)
+    for group, group_result in zip(groups, group_results):
+        for i, result in zip(group, group_result):
+            results[i] = result
+    return results
+
+
+@mcp.tool()
+async def execute_batch(commands: List[List[str]], transaction: bool = False) -> Dict[str, Any]:
+    """Execute a list of Valkey commands in a single round trip.
+
+    Commands are sent as one pipeline instead of one tool call and one round trip per
+    command, e.g. to write many hashes, JSON documents or sorted set members at once.
+    In cluster mode commands are grouped by hash slot and each node receives its
+    commands in a single pipeline.
+
+    Args:
+        commands: The commands to execute, each given as its name followed by its
+            arguments, e.g. [["HSET", "user:1", "name", "Ana"], ["EXPIRE", "user:1", "60"]].
+        transaction: Execute the commands atomically with MULTI/EXEC. In cluster mode
+            commands are atomic per hash slot: the commands on the keys of each slot
+            run in their own transaction.
+
+    Returns:
+        Dict[str, Any]: The result or error of each command, in order, and the number
+            of failed commands, or {"error": "..."}.
+    """
+    if not commands:
+        return {'error': 'No commands to execute'}
+    if len(commands) > MAX_BATCH_COMMANDS:
+        return {'error': f'A batch holds at most {MAX_BATCH_COMMANDS} commands'}
+    if any(not command for command in commands):
+        return {'error': 'Commands must not be empty'}
+
+    commands = [[command[0].upper(), *command[1:]] for command in commands]
+    if Context.readonly_mode():
+        writes = sorted({c[0] for c in commands if c[0] not in READONLY_COMMANDS})
+        if writes:
+            return {'error': f'Cannot execute {", ".join(writes)} in readonly mode'}
+
+    try:
+        r = ValkeyConnectionManager.get_async_connection()
+        if isinstance(r, AsyncValkeyCluster) and transaction:
+            results = await _execute_cluster_transactions(r, commands)
+        else:
+            # The cluster pipeline sends each node the commands of the slots it owns
+            pipe = r.pipeline() if isinstance(r, AsyncValkeyCluster) else r.pipeline(transaction)
+            for command in commands:
+                pipe.execute_command(*command)
+            results = await pipe.execute(raise_on_error=False)
+
+        formatted = [_format_result(c, result) for c, result in zip(commands, results)]
+        return {
+            'results': formatted,
+            'errors': sum('error' in result for result in formatted),
+        }
+    except (ValueError, ValkeyError) as e:
+        return {'error': str(e)}
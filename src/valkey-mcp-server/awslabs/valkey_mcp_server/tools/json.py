@@ -14,13 +14,23 @@
 
 """JSON operations for Valkey MCP Server."""
 
+import json
 from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
 from awslabs.valkey_mcp_server.common.server import mcp
 from awslabs.valkey_mcp_server.context import Context
-from typing import Any, Optional, Union
+from typing import Any, Dict, List, Optional, Union
+from valkey.cluster import ValkeyCluster
 from valkey.exceptions import ValkeyError
 
 
+# Keys read per round of JSON.MGET commands by json_mget
+JSON_MGET_BATCH_SIZE = 100
+
+# Default size limits of json_mget, measured on the serialized values
+DEFAULT_MAX_RESPONSE_BYTES = 256 * 1024
+DEFAULT_MAX_VALUE_BYTES = 64 * 1024
+
+
 @mcp.tool()
 async def json_set(key: str, path: str, value: Any, nx: bool = False, xx: bool = False) -> str:
     """Set the JSON value at path.
@@ -87,6 +97,100 @@ async def json_get(
         return f"Error getting JSON value from '{key}': {str(e)}"
 
 
+def _slot_groups(r, keys: List[str]) -> List[List[str]]:
+    """Group keys by hash slot in cluster mode, where one command cannot span slots."""
+    if not isinstance(r, ValkeyCluster):
+        return [keys]
+    groups: Dict[int, List[str]] = {}
+    for key in keys:
+        groups.setdefault(r.keyslot(key), []).append(key)
+    return list(groups.values())
+
+
+def _mget(r, keys: List[str], paths: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Read paths of keys with one JSON.MGET per path and slot, sent in one pipeline."""
+    groups = _slot_groups(r, keys)
+    pipe = r.pipeline(transaction=False)
+    for path in paths:
+        for group in groups:
+            pipe.execute_command('JSON.MGET', *group, path)
+    replies = iter(pipe.execute())
+
+    values: Dict[str, Dict[str, Any]] = {key: {} for key in keys}
+    for path in paths:
+        for group in groups:
+            for key, reply in zip(group, next(replies)):
+                if reply is not None:
+                    values[key][path] = json.loads(reply)
+    return values
+
+
+@mcp.tool()
+async def json_mget(
+    keys: List[str],
+    paths: Optional[List[str]] = None,
+    offset: int = 0,
+    max_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+    max_value_bytes: int = DEFAULT_MAX_VALUE_BYTES,
+) -> Dict[str, Any]:
+    """Get JSON values from many keys at once, optionally only at some paths.
+
+    Values are projected on the server with JSON.MGET, one command per path (and per
+    hash slot in cluster mode), so only the requested paths are transferred. To keep
+    responses small, keys are returned until max_bytes of values are collected; pass
+    the returned next_offset as offset to continue with the remaining keys. A value
+    larger than max_value_bytes is replaced by its size; read it with json_get and a
+    narrower path.
+
+    Args:
+        keys: The names of the keys
+        paths: Paths to read from each document (optional, defaults to the root)
+        offset: Index in keys to start from, as returned in next_offset
+        max_bytes: Approximate size limit of the returned values, in bytes
+        max_value_bytes: Size limit of a single value, in bytes
+
+    Returns:
+        Values by key (by key and path when several paths are given), the keys not
+        found, and the offset to continue from, or {"error": "..."}
+    """
+    paths = paths or ['.']
+    try:
+        r = ValkeyConnectionManager.get_connection()
+        documents: Dict[str, Any] = {}
+        missing: List[str] = []
+        used = 0
+        next_offset = None
+
+        for start in range(offset, len(keys), JSON_MGET_BATCH_SIZE):
+            batch = keys[start : start + JSON_MGET_BATCH_SIZE]
+            values = _mget(r, batch, paths)
+            for i, key in enumerate(batch):
+                if not values[key]:
+                    missing.append(key)
+                    continue
+                value = values[key] if len(paths) > 1 else values[key][paths[0]]
+                size = len(json.dumps(value))
+                if size > max_value_bytes:
+                    value = {'truncated': True, 'size_bytes': size}
+                    size = 0
+                if documents and used + size > max_bytes:
+                    next_offset = start + i
+                    break
+                documents[key] = value
+                used += size
+            if next_offset is not None:
+                break
+
+        return {
+            'documents': documents,
+            'missing': missing,
+            'next_offset': next_offset,
+            'truncated': next_offset is not None,
+        }
+    except ValkeyError as e:
+        return {'error': str(e)}
+
+
 @mcp.tool()
 async def json_type(key: str, path: Optional[str] = None) -> str:
     """Get the type of JSON value at path.
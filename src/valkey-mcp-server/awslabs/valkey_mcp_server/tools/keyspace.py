@@ -0,0 +1,251 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.server import mcp
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple, cast
+from valkey import Valkey
+from valkey.cluster import ValkeyCluster
+from valkey.exceptions import ValkeyError
+
+
+# Keys requested from the server per SCAN call
+DEFAULT_SCAN_COUNT = 100
+# Name of the only node scanned outside cluster mode
+STANDALONE_NODE = 'standalone'
+
+
+def _scan_targets(r) -> Dict[str, Valkey]:
+    """Return one client per node to scan, keyed by node name in scan order.
+
+    In cluster mode every primary is scanned, in the order of their names.
+    """
+    if isinstance(r, ValkeyCluster):
+        primaries = sorted(r.get_primaries(), key=lambda node: node.name)
+        return {node.name: r.get_valkey_connection(node) for node in primaries}
+    return {STANDALONE_NODE: r}
+
+
+def _parse_cursor(cursor: str, nodes: List[str]) -> Tuple[int, int]:
+    """Parse a cursor of the form '<node name>:<node cursor>'; '0' starts a new scan.
+
+    Returns:
+        The index of the node in nodes and the SCAN cursor on that node.
+    """
+    if cursor in ('', '0'):
+        return 0, 0
+    node, _, position = cursor.rpartition(':')
+    if not node or not position.isdigit():
+        raise ValueError(f"Invalid cursor '{cursor}', pass the cursor returned by a previous call")
+    if node not in nodes:
+        # A SCAN cursor is only meaningful on the node that returned it
+        raise ValueError(
+            f"Node '{node}' of the cursor is no longer a primary, e.g. after a failover or "
+            'resharding; start a new scan with cursor 0'
+        )
+    return nodes.index(node), int(position)
+
+
+def _scan(
+    targets: Dict[str, Valkey],
+    pattern: str,
+    key_type: Optional[str],
+    cursor: str,
+    count: int,
+    max_keys: int,
+) -> Tuple[Dict[str, List[str]], str]:
+    """Run SCAN node by node until max_keys keys are found or every node is scanned.
+
+    Returns:
+        The keys found per node name, and the cursor to resume from ('0' when complete).
+    """
+    nodes = list(targets)
+    index, position = _parse_cursor(cursor, nodes)
+    keys: Dict[str, List[str]] = defaultdict(list)
+    found = 0
+    while index < len(nodes) and found < max_keys:
+        position, batch = cast(
+            Tuple[int, List[str]],
+            targets[nodes[index]].scan(position, match=pattern, count=count, _type=key_type),
+        )
+        keys[nodes[index]].extend(batch)
+        found += len(batch)
+        if position == 0:
+            index += 1
+    next_cursor = '0' if index >= len(nodes) else f'{nodes[index]}:{position}'
+    return keys, next_cursor
+
+
+def _sample(client: Valkey, keys: List[str]) -> List[Dict[str, Any]]:
+    """Read the type, memory usage and TTL of keys of one node in a single pipeline."""
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        pipe.type(key)
+        pipe.memory_usage(key)
+        pipe.ttl(key)
+    results = pipe.execute(raise_on_error=False)
+
+    samples = []
+    for i, key in enumerate(keys):
+        key_type, memory, ttl = results[3 * i : 3 * i + 3]
+        samples.append(
+            {
+                'key': key,
+                'type': None if isinstance(key_type, Exception) else key_type,
+                'memory_bytes': memory if isinstance(memory, int) else None,
+                'ttl': ttl if isinstance(ttl, int) else None,
+            }
+        )
+    return samples
+
+
+def _prefix(key: str, delimiter: str, depth: int) -> str:
+    """Return the first depth delimited segments of a key, with a trailing delimiter."""
+    parts = key.split(delimiter)
+    segments = min(depth, len(parts) - 1)
+    if segments <= 0:
+        return '(none)'
+    return delimiter.join(parts[:segments]) + delimiter
+
+
+@mcp.tool()
+async def scan_keys(
+    pattern: str = '*',
+    key_type: Optional[str] = None,
+    cursor: str = '0',
+    count: int = DEFAULT_SCAN_COUNT,
+    max_keys: int = 1000,
+    with_details: bool = False,
+) -> Dict[str, Any]:
+    """Incrementally list keys matching a pattern, without blocking the server like KEYS.
+
+    In cluster mode every primary node is scanned in turn. A call returns once about
+    max_keys keys are found; pass the returned cursor to the next call to continue,
+    until complete is true.
+
+    Args:
+        pattern: Glob-style pattern keys must match (default: all keys).
+        key_type: Only return keys of this type (string, list, set, zset, hash, stream,
+            ReJSON-RL).
+        cursor: Cursor returned by a previous call, or '0' to start a new scan.
+        count: Number of keys the server examines per SCAN call.
+        max_keys: Number of keys after which the call returns; the last SCAN batch is
+            always returned whole, so slightly more keys may be returned.
+        with_details: Also return the type, memory usage in bytes and TTL of each key.
+
+    Returns:
+        Dict[str, Any]: The keys (or key details), the cursor to continue from and
+            whether the scan is complete, or {"error": "..."}.
+    """
+    try:
+        targets = _scan_targets(ValkeyConnectionManager.get_connection())
+        keys, next_cursor = _scan(targets, pattern, key_type, cursor, count, max_keys)
+        if with_details:
+            result: List[Any] = []
+            for node, node_keys in keys.items():
+                if node_keys:
+                    result.extend(_sample(targets[node], node_keys))
+        else:
+            result = [key for node_keys in keys.values() for key in node_keys]
+        return {
+            'keys': result,
+            'count': len(result),
+            'cursor': next_cursor,
+            'complete': next_cursor == '0',
+        }
+    except (ValueError, ValkeyError) as e:
+        return {'error': str(e)}
+
+
+@mcp.tool()
+async def keyspace_report(
+    pattern: str = '*',
+    key_type: Optional[str] = None,
+    cursor: str = '0',
+    max_keys: int = 10000,
+    delimiter: str = ':',
+    prefix_depth: int = 1,
+    top: int = 20,
+) -> Dict[str, Any]:
+    """Report which key prefixes hold the most keys and memory, e.g. to find cache bloat.
+
+    Keys are scanned incrementally as with scan_keys, and the type, memory usage and TTL
+    of every scanned key are sampled with pipelined commands, one pipeline per node.
+    Keys are grouped by their first prefix_depth segments separated by delimiter, e.g.
+    'session:' for 'session:1234'. A report covers at most about max_keys keys; when
+    complete is false, pass the returned cursor to report on the next keys.
+
+    Args:
+        pattern: Glob-style pattern keys must match (default: all keys).
+        key_type: Only report keys of this type.
+        cursor: Cursor returned by a previous call, or '0' to start a new scan.
+        max_keys: Number of keys after which the scan stops.
+        delimiter: Separator between key segments.
+        prefix_depth: Number of leading segments forming the prefix of a key.
+        top: Number of prefixes listed by memory and by key count.
+
+    Returns:
+        Dict[str, Any]: Totals, the top prefixes by memory and by key count, the cursor
+            to continue from and whether the scan is complete, or {"error": "..."}.
+    """
+    try:
+        targets = _scan_targets(ValkeyConnectionManager.get_connection())
+        keys, next_cursor = _scan(targets, pattern, key_type, cursor, DEFAULT_SCAN_COUNT, max_keys)
+
+        prefixes: Dict[str, Dict[str, Any]] = {}
+        scanned = 0
+        total_memory = 0
+        for node, node_keys in keys.items():
+            if not node_keys:
+                continue
+            for sample in _sample(targets[node], node_keys):
+                scanned += 1
+                memory = sample['memory_bytes'] or 0
+                total_memory += memory
+                prefix = _prefix(sample['key'], delimiter, prefix_depth)
+                stats = prefixes.get(prefix)
+                if stats is None:
+                    stats = prefixes[prefix] = {
+                        'prefix': prefix,
+                        'keys': 0,
+                        'memory_bytes': 0,
+                        'keys_without_ttl': 0,
+                        'types': defaultdict(int),
+                    }
+                stats['keys'] += 1
+                stats['memory_bytes'] += memory
+                if sample['ttl'] == -1:
+                    stats['keys_without_ttl'] += 1
+                stats['types'][sample['type']] += 1
+
+        for stats in prefixes.values():
+            stats['types'] = dict(stats['types'])
+            stats['avg_memory_bytes'] = round(stats['memory_bytes'] / stats['keys'], 2)
+
+        return {
+            'scanned_keys': scanned,
+            'total_memory_bytes': total_memory,
+            'prefix_count': len(prefixes),
+            'top_prefixes_by_memory': sorted(
+                prefixes.values(), key=lambda s: s['memory_bytes'], reverse=True
+            )[:top],
+            'top_prefixes_by_count': sorted(
+                prefixes.values(), key=lambda s: s['keys'], reverse=True
+            )[:top],
+            'cursor': next_cursor,
+            'complete': next_cursor == '0',
+        }
+    except (ValueError, ValkeyError) as e:
+        return {'error': str(e)}
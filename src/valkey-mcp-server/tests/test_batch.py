@@ -0,0 +1,254 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the batch functionality in the valkey MCP server."""
+
+import pytest
+from awslabs.valkey_mcp_server.tools.batch import MAX_BATCH_COMMANDS, execute_batch
+from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
+from valkey.asyncio.cluster import ValkeyCluster as AsyncValkeyCluster
+from valkey.crc import key_slot
+from valkey.exceptions import ExecAbortError, ResponseError, ValkeyError
+
+
+class TestBatch:
+    """Tests for batch operations."""
+
+    @pytest.fixture
+    def mock_manager(self):
+        """Patch the connection manager."""
+        with patch('awslabs.valkey_mcp_server.tools.batch.ValkeyConnectionManager') as manager:
+            yield manager
+
+    @pytest.fixture
+    def mock_context(self):
+        """Create a mock Context."""
+        with patch('awslabs.valkey_mcp_server.tools.batch.Context') as mock_ctx:
+            mock_ctx.readonly_mode.return_value = False
+            yield mock_ctx
+
+    @pytest.fixture
+    def mock_pipeline(self, mock_manager):
+        """Create a mock standalone connection and its pipeline."""
+        pipe = Mock()
+        pipe.execute = AsyncMock()
+        mock_conn = Mock()
+        mock_conn.pipeline.return_value = pipe
+        mock_manager.get_async_connection.return_value = mock_conn
+        return pipe
+
+    @pytest.fixture
+    def mock_cluster(self, mock_manager):
+        """Create a mock cluster connection whose nodes run MULTI/EXEC pipelines."""
+        pipes = {}
+
+        def get_node_from_key(key):
+            node = Mock()
+            node.connection_class = Mock()
+            node.connection_kwargs = {'slot': key_slot(key.encode())}
+            return node
+
+        def connection_pool(connection_class, slot):
+            return slot
+
+        def client(connection_pool):
+            slot = connection_pool
+            pipe = pipes.setdefault(slot, Mock())
+            if not isinstance(pipe.execute, AsyncMock):
+                pipe.execute = AsyncMock(
+                    side_effect=lambda raise_on_error: [
+                        f'{slot}:{c.args[1]}' for c in pipe.execute_command.call_args_list
+                    ]
+                )
+            conn = MagicMock()
+            conn.__aenter__.return_value = Mock(pipeline=Mock(return_value=pipe))
+            return conn
+
+        cluster = MagicMock(spec=AsyncValkeyCluster)
+        cluster.keyslot.side_effect = lambda key: key_slot(key.encode())
+        cluster.get_node_from_key.side_effect = get_node_from_key
+        mock_manager.get_async_connection.return_value = cluster
+        with (
+            patch(
+                'awslabs.valkey_mcp_server.tools.batch.ConnectionPool',
+                side_effect=connection_pool,
+            ),
+            patch(
+                'awslabs.valkey_mcp_server.tools.batch.AsyncValkey', side_effect=client
+            ) as valkey,
+        ):
+            yield cluster, pipes, valkey
+
+    @pytest.mark.asyncio
+    async def test_execute_batch(self, mock_manager, mock_pipeline, mock_context):
+        """Test that commands are sent in one pipeline and results kept in order."""
+        mock_pipeline.execute.return_value = [1, ResponseError('WRONGTYPE'), True]
+
+        result = await execute_batch(
+            [
+                ['hset', 'user:1', 'name', 'Ana'],
+                ['LPUSH', 'user:1', 'x'],
+                ['EXPIRE', 'user:1', '60'],
+            ]
+        )
+
+        assert result == {
+            'results': [
+                {'command': 'HSET', 'result': 1},
+                {'command': 'LPUSH', 'error': 'WRONGTYPE'},
+                {'command': 'EXPIRE', 'result': True},
+            ],
+            'errors': 1,
+        }
+        mock_manager.get_async_connection.return_value.pipeline.assert_called_once_with(False)
+        mock_pipeline.execute_command.assert_has_calls(
+            [
+                call('HSET', 'user:1', 'name', 'Ana'),
+                call('LPUSH', 'user:1', 'x'),
+                call('EXPIRE', 'user:1', '60'),
+            ]
+        )
+        mock_pipeline.execute.assert_awaited_once_with(raise_on_error=False)
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_transaction(self, mock_manager, mock_pipeline, mock_context):
+        """Test that a transaction uses a MULTI/EXEC pipeline."""
+        mock_pipeline.execute.return_value = ['OK', 'OK']
+
+        result = await execute_batch([['SET', 'a', '1'], ['SET', 'b', '2']], transaction=True)
+
+        assert result['errors'] == 0
+        mock_manager.get_async_connection.return_value.pipeline.assert_called_once_with(True)
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_transaction_aborted(self, mock_pipeline, mock_context):
+        """Test that an aborted transaction is reported as an error."""
+        mock_pipeline.execute.side_effect = ExecAbortError('EXECABORT')
+
+        result = await execute_batch([['SET', 'a']], transaction=True)
+
+        assert result == {'error': 'EXECABORT'}
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_cluster_pipeline(self, mock_cluster, mock_context):
+        """Test that the cluster pipeline is used to route commands without a transaction."""
+        cluster, _, _ = mock_cluster
+        pipe = Mock()
+        pipe.execute = AsyncMock(return_value=[1, 1])
+        cluster.pipeline.return_value = pipe
+
+        result = await execute_batch([['HSET', 'a', 'f', 'v'], ['HSET', 'b', 'f', 'v']])
+
+        assert result['errors'] == 0
+        cluster.pipeline.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_cluster_transaction(self, mock_cluster, mock_context):
+        """Test that cluster transactions run per hash slot and results keep their order."""
+        cluster, pipes, valkey = mock_cluster
+
+        result = await execute_batch(
+            [['SET', '{a}1', 'x'], ['SET', '{b}1', 'y'], ['SET', '{a}2', 'z']],
+            transaction=True,
+        )
+
+        slot_a, slot_b = key_slot(b'a'), key_slot(b'b')
+        assert [r['result'] for r in result['results']] == [
+            f'{slot_a}:{{a}}1',
+            f'{slot_b}:{{b}}1',
+            f'{slot_a}:{{a}}2',
+        ]
+        assert set(pipes) == {slot_a, slot_b}
+        pipes[slot_a].execute_command.assert_has_calls(
+            [call('SET', '{a}1', 'x'), call('SET', '{a}2', 'z')]
+        )
+        for conn_call in valkey.call_args_list:
+            assert conn_call.kwargs['connection_pool'] in (slot_a, slot_b)
+        cluster.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_cluster_transaction_aborted(self, mock_cluster, mock_context):
+        """Test that a queueing error is reported against every command of its slot."""
+        _, pipes, _ = mock_cluster
+        pipe = Mock()
+        pipe.execute = AsyncMock(side_effect=ResponseError('wrong number of arguments'))
+        pipes[key_slot(b'a')] = pipe
+
+        result = await execute_batch([['SET', 'a'], ['SET', 'a', 'x']], transaction=True)
+
+        assert result['results'] == [
+            {'command': 'SET', 'error': 'wrong number of arguments'},
+            {'command': 'SET', 'error': 'wrong number of arguments'},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_cluster_transaction_without_node(
+        self, mock_cluster, mock_context
+    ):
+        """Test that a slot no node serves is reported instead of failing on None."""
+        cluster, _, valkey = mock_cluster
+        cluster.get_node_from_key.side_effect = None
+        cluster.get_node_from_key.return_value = None
+
+        result = await execute_batch([['SET', 'a', 'x']], transaction=True)
+
+        assert result == {'error': 'No cluster node serves the slot of key a'}
+        valkey.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_cluster_transaction_requires_key(
+        self, mock_cluster, mock_context
+    ):
+        """Test that keyless commands are rejected in cluster transactions."""
+        result = await execute_batch([['PING']], transaction=True)
+
+        assert 'has no key' in result['error']
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_readonly(self, mock_manager, mock_context):
+        """Test that write commands are rejected in readonly mode."""
+        mock_context.readonly_mode.return_value = True
+
+        result = await execute_batch([['GET', 'a'], ['set', 'a', '1'], ['DEL', 'a']])
+
+        assert result == {'error': 'Cannot execute DEL, SET in readonly mode'}
+        mock_manager.get_async_connection.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_readonly_reads(self, mock_pipeline, mock_context):
+        """Test that read commands are allowed in readonly mode."""
+        mock_context.readonly_mode.return_value = True
+        mock_pipeline.execute.return_value = ['1']
+
+        result = await execute_batch([['GET', 'a']])
+
+        assert result['results'] == [{'command': 'GET', 'result': '1'}]
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_invalid(self, mock_manager, mock_context):
+        """Test that empty or oversized batches are rejected."""
+        assert 'No commands' in (await execute_batch([]))['error']
+        assert 'must not be empty' in (await execute_batch([['GET', 'a'], []]))['error']
+        too_many = [['GET', 'a']] * (MAX_BATCH_COMMANDS + 1)
+        assert 'at most' in (await execute_batch(too_many))['error']
+        mock_manager.get_async_connection.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_error(self, mock_manager, mock_context):
+        """Test that connection errors are returned."""
+        mock_manager.get_async_connection.side_effect = ValkeyError('Test error')
+
+        result = await execute_batch([['GET', 'a']])
+
+        assert result == {'error': 'Test error'}
@@ -11,6 +11,7 @@ class TestValkeyConnectionManager(unittest.TestCase):
     def setUp(self):
         """Reset the singleton instance before each test."""
         ValkeyConnectionManager._instance = None
+        ValkeyConnectionManager._async_instance = None
 
     def test_basic_connection(self):
         """Test basic connection creation without cluster mode or SSL."""
@@ -302,6 +303,102 @@ class TestValkeyConnectionManager(unittest.TestCase):
             with self.assertRaises(Exception):
                 ValkeyConnectionManager.get_connection()
 
+    def test_configured_pool_size(self):
+        """Test that the configured pool size is used in cluster mode."""
+        with (
+            patch('awslabs.valkey_mcp_server.common.connection.VALKEY_CFG') as mock_cfg,
+            patch('awslabs.valkey_mcp_server.common.connection.ValkeyCluster') as mock_cluster,
+        ):
+            mock_cfg.__getitem__.side_effect = {
+                'cluster_mode': True,
+                'host': 'localhost',
+                'port': 6379,
+            }.__getitem__
+            mock_cfg.get.side_effect = lambda key, default=None: {
+                'max_connections': 32,
+            }.get(key, default)
+
+            ValkeyConnectionManager.get_connection()
+
+            self.assertEqual(mock_cluster.call_args.kwargs['max_connections_per_node'], 32)
+
+    def test_async_connection(self):
+        """Test creation and reuse of the asyncio connection."""
+        with (
+            patch('awslabs.valkey_mcp_server.common.connection.VALKEY_CFG') as mock_cfg,
+            patch('awslabs.valkey_mcp_server.common.connection.AsyncValkey') as mock_valkey,
+        ):
+            mock_cfg.__getitem__.side_effect = {
+                'cluster_mode': False,
+                'host': 'localhost',
+                'port': 6379,
+            }.__getitem__
+            mock_cfg.get.side_effect = lambda key, default=None: {
+                'username': None,
+                'password': '',
+                'ssl': False,
+                'max_connections': 25,
+            }.get(key, default)
+
+            conn1 = ValkeyConnectionManager.get_async_connection()
+            conn2 = ValkeyConnectionManager.get_async_connection()
+
+            mock_valkey.assert_called_once_with(
+                host='localhost',
+                port=6379,
+                username=None,
+                password='',
+                ssl=False,
+                ssl_keyfile=None,
+                ssl_certfile=None,
+                ssl_cert_reqs=None,
+                ssl_ca_certs=None,
+                decode_responses=True,
+                max_connections=25,
+                lib_name=f'valkey-py(mcp-server_v{__version__})',
+            )
+            self.assertEqual(conn1, mock_valkey.return_value)
+            self.assertEqual(conn1, conn2)
+
+    def test_async_cluster_connection(self):
+        """Test creation of the asyncio connection in cluster mode."""
+        with (
+            patch('awslabs.valkey_mcp_server.common.connection.VALKEY_CFG') as mock_cfg,
+            patch(
+                'awslabs.valkey_mcp_server.common.connection.AsyncValkeyCluster'
+            ) as mock_cluster,
+        ):
+            mock_cfg.__getitem__.side_effect = {
+                'cluster_mode': True,
+                'host': 'localhost',
+                'port': 6379,
+            }.__getitem__
+            mock_cfg.get.side_effect = lambda key, default=None: {}.get(key, default)
+
+            conn = ValkeyConnectionManager.get_async_connection()
+
+            self.assertEqual(conn, mock_cluster.return_value)
+            self.assertEqual(mock_cluster.call_args.kwargs['max_connections'], 10)
+            self.assertNotIn('ssl_ca_path', mock_cluster.call_args.kwargs)
+
+    def test_async_connection_error(self):
+        """Test that errors creating the asyncio connection are raised."""
+        with (
+            patch('awslabs.valkey_mcp_server.common.connection.VALKEY_CFG') as mock_cfg,
+            patch('awslabs.valkey_mcp_server.common.connection.AsyncValkey') as mock_valkey,
+        ):
+            mock_valkey.side_effect = exceptions.ValkeyError('Invalid configuration')
+            mock_cfg.__getitem__.side_effect = {
+                'cluster_mode': False,
+                'host': 'localhost',
+                'port': 6379,
+            }.__getitem__
+            mock_cfg.get.return_value = None
+
+            with self.assertRaises(exceptions.ValkeyError):
+                ValkeyConnectionManager.get_async_connection()
+            self.assertIsNone(ValkeyConnectionManager._async_instance)
+
 
 if __name__ == '__main__':
     unittest.main()
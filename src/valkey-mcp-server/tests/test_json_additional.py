@@ -14,17 +14,21 @@
 
 """Additional tests for the JSON functionality in the valkey MCP server."""
 
+import json
 import pytest
 from awslabs.valkey_mcp_server.tools.json import (
     json_arrindex,
     json_arrlen,
     json_get,
+    json_mget,
     json_objkeys,
     json_objlen,
     json_strlen,
     json_type,
 )
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, call, patch
+from valkey.cluster import ValkeyCluster
+from valkey.crc import key_slot
 from valkey.exceptions import ValkeyError
 
 
@@ -265,3 +269,125 @@ class TestJsonAdditional:
         result = await json_objlen(key, path)
         assert f"Error getting JSON object length from '{key}'" in result
         assert 'Test error' in result
+
+
+class TestJsonMget:
+    """Tests for bulk JSON reads."""
+
+    @pytest.fixture
+    def mock_pipeline(self):
+        """Create a mock Valkey connection whose pipeline answers JSON.MGET from documents."""
+        documents = {
+            'session:1': {'user': 'ana', 'cart': [1, 2]},
+            'session:2': {'user': 'bo', 'cart': []},
+            'session:3': {'user': 'cy', 'cart': [3]},
+        }
+
+        def execute():
+            replies = []
+            for args in pipe.commands:
+                *keys, path = args[1:]
+                field = path.lstrip('.')
+                replies.append(
+                    [
+                        None
+                        if key not in documents
+                        else json.dumps(documents[key][field] if field else documents[key])
+                        for key in keys
+                    ]
+                )
+            pipe.commands = []
+            return replies
+
+        pipe = Mock()
+        pipe.commands = []
+        pipe.execute_command.side_effect = lambda *args: pipe.commands.append(args)
+        pipe.execute.side_effect = execute
+        with patch('awslabs.valkey_mcp_server.tools.json.ValkeyConnectionManager') as mock_manager:
+            mock_conn = Mock()
+            mock_conn.pipeline.return_value = pipe
+            mock_manager.get_connection.return_value = mock_conn
+            yield mock_conn, pipe
+
+    @pytest.mark.asyncio
+    async def test_json_mget(self, mock_pipeline):
+        """Test reading whole documents of several keys with one JSON.MGET."""
+        mock_conn, pipe = mock_pipeline
+
+        result = await json_mget(['session:1', 'missing', 'session:2'])
+
+        assert result == {
+            'documents': {
+                'session:1': {'user': 'ana', 'cart': [1, 2]},
+                'session:2': {'user': 'bo', 'cart': []},
+            },
+            'missing': ['missing'],
+            'next_offset': None,
+            'truncated': False,
+        }
+        mock_conn.pipeline.assert_called_once_with(transaction=False)
+        pipe.execute_command.assert_called_once_with(
+            'JSON.MGET', 'session:1', 'missing', 'session:2', '.'
+        )
+
+    @pytest.mark.asyncio
+    async def test_json_mget_paths(self, mock_pipeline):
+        """Test projecting several paths, with one JSON.MGET per path."""
+        _, pipe = mock_pipeline
+
+        result = await json_mget(['session:1', 'session:3'], paths=['.user', '.cart'])
+
+        assert result['documents'] == {
+            'session:1': {'.user': 'ana', '.cart': [1, 2]},
+            'session:3': {'.user': 'cy', '.cart': [3]},
+        }
+        assert pipe.execute_command.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_json_mget_continuation(self, mock_pipeline):
+        """Test that the response stops at max_bytes and continues from next_offset."""
+        keys = ['session:1', 'session:2', 'session:3']
+
+        first = await json_mget(keys, paths=['.user'], max_bytes=12)
+        second = await json_mget(keys, paths=['.user'], offset=first['next_offset'])
+
+        assert first['documents'] == {'session:1': 'ana', 'session:2': 'bo'}
+        assert first['next_offset'] == 2
+        assert first['truncated'] is True
+        assert second['documents'] == {'session:3': 'cy'}
+        assert second['next_offset'] is None
+
+    @pytest.mark.asyncio
+    async def test_json_mget_large_value(self, mock_pipeline):
+        """Test that a value larger than max_value_bytes is replaced by its size."""
+        result = await json_mget(['session:1', 'session:2'], max_value_bytes=30)
+
+        assert result['documents']['session:1'] == {'truncated': True, 'size_bytes': 31}
+        assert result['documents']['session:2'] == {'user': 'bo', 'cart': []}
+
+    @pytest.mark.asyncio
+    async def test_json_mget_cluster_groups_by_slot(self, mock_pipeline):
+        """Test that keys are grouped by hash slot in cluster mode."""
+        mock_conn, pipe = mock_pipeline
+        cluster = MagicMock(spec=ValkeyCluster)
+        cluster.keyslot.side_effect = lambda key: key_slot(key.encode())
+        cluster.pipeline.return_value = pipe
+        with patch('awslabs.valkey_mcp_server.tools.json.ValkeyConnectionManager') as manager:
+            manager.get_connection.return_value = cluster
+            result = await json_mget(['{session}:1', 'session:2', '{session}:3'], paths=['.user'])
+
+        assert pipe.execute_command.call_args_list == [
+            call('JSON.MGET', '{session}:1', '{session}:3', '.user'),
+            call('JSON.MGET', 'session:2', '.user'),
+        ]
+        assert result['missing'] == ['{session}:1', '{session}:3']
+
+    @pytest.mark.asyncio
+    async def test_json_mget_error(self, mock_pipeline):
+        """Test that errors are returned."""
+        _, pipe = mock_pipeline
+        pipe.execute.side_effect = ValkeyError('Test error')
+
+        result = await json_mget(['session:1'])
+
+        assert result == {'error': 'Test error'}
@@ -0,0 +1,185 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the keyspace explorer in the valkey MCP server."""
+
+import pytest
+from awslabs.valkey_mcp_server.tools.keyspace import _prefix, keyspace_report, scan_keys
+from unittest.mock import MagicMock, Mock, call, patch
+from valkey.cluster import ValkeyCluster
+from valkey.exceptions import ValkeyError
+
+
+def _node_client(pages, samples=None):
+    """Create a mock node client returning pages of SCAN results and pipelined samples."""
+    client = Mock()
+    client.scan.side_effect = pages
+    pipe = Mock()
+    pipe.execute.return_value = samples or []
+    client.pipeline.return_value = pipe
+    return client
+
+
+class TestKeyspace:
+    """Tests for keyspace exploration."""
+
+    @pytest.fixture
+    def mock_manager(self):
+        """Patch the connection manager."""
+        with patch(
+            'awslabs.valkey_mcp_server.tools.keyspace.ValkeyConnectionManager'
+        ) as mock_manager:
+            yield mock_manager
+
+    @pytest.mark.asyncio
+    async def test_scan_keys(self, mock_manager):
+        """Test scanning a standalone server until the cursor returns to 0."""
+        client = _node_client([(5, ['a', 'b']), (0, ['c'])])
+        mock_manager.get_connection.return_value = client
+
+        result = await scan_keys('user:*', 'hash', count=50)
+
+        assert result == {'keys': ['a', 'b', 'c'], 'count': 3, 'cursor': '0', 'complete': True}
+        client.scan.assert_has_calls(
+            [
+                call(0, match='user:*', count=50, _type='hash'),
+                call(5, match='user:*', count=50, _type='hash'),
+            ]
+        )
+
+    @pytest.mark.asyncio
+    async def test_scan_keys_resumes_from_cursor(self, mock_manager):
+        """Test that a scan stops at max_keys and resumes from the returned cursor."""
+        client = _node_client([(7, ['a', 'b']), (0, ['c'])])
+        mock_manager.get_connection.return_value = client
+
+        first = await scan_keys(max_keys=2)
+        second = await scan_keys(cursor=first['cursor'], max_keys=2)
+
+        assert first['keys'] == ['a', 'b']
+        assert first['cursor'] == 'standalone:7'
+        assert first['complete'] is False
+        assert second['keys'] == ['c']
+        assert second['complete'] is True
+        assert client.scan.call_args_list[1] == call(7, match='*', count=100, _type=None)
+
+    @pytest.mark.asyncio
+    async def test_scan_keys_across_cluster_primaries(self, mock_manager):
+        """Test that every primary of a cluster is scanned in turn."""
+        nodes = [Mock(name='node-b'), Mock(name='node-a')]
+        nodes[0].name, nodes[1].name = 'b:6379', 'a:6379'
+        clients = {
+            'a:6379': _node_client([(0, ['a1', 'a2'])]),
+            'b:6379': _node_client([(3, ['b1']), (0, ['b2'])]),
+        }
+        cluster = MagicMock(spec=ValkeyCluster)
+        cluster.get_primaries.return_value = nodes
+        cluster.get_valkey_connection.side_effect = lambda node: clients[node.name]
+        mock_manager.get_connection.return_value = cluster
+
+        first = await scan_keys(max_keys=3)
+        second = await scan_keys(cursor=first['cursor'])
+
+        assert first['keys'] == ['a1', 'a2', 'b1']
+        assert first['cursor'] == 'b:6379:3'
+        assert second['keys'] == ['b2']
+        assert second['complete'] is True
+
+    @pytest.mark.asyncio
+    async def test_scan_keys_cursor_of_a_node_gone(self, mock_manager):
+        """Test that a cursor is not resumed on another node after a failover."""
+        node = Mock()
+        node.name = 'c:6379'
+        cluster = MagicMock(spec=ValkeyCluster)
+        cluster.get_primaries.return_value = [node]
+        cluster.get_valkey_connection.return_value = _node_client([(0, ['c1'])])
+        mock_manager.get_connection.return_value = cluster
+
+        result = await scan_keys(cursor='b:6379:3')
+
+        assert 'no longer a primary' in result['error']
+        cluster.get_valkey_connection.return_value.scan.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_scan_keys_with_details(self, mock_manager):
+        """Test that type, memory usage and TTL are sampled in one pipeline."""
+        client = _node_client([(0, ['a', 'b'])], ['string', 64, -1, 'hash', 128, 30])
+        mock_manager.get_connection.return_value = client
+
+        result = await scan_keys(with_details=True)
+
+        assert result['keys'] == [
+            {'key': 'a', 'type': 'string', 'memory_bytes': 64, 'ttl': -1},
+            {'key': 'b', 'type': 'hash', 'memory_bytes': 128, 'ttl': 30},
+        ]
+        client.pipeline.assert_called_once_with(transaction=False)
+        client.pipeline.return_value.execute.assert_called_once_with(raise_on_error=False)
+
+    @pytest.mark.asyncio
+    async def test_scan_keys_invalid_cursor(self, mock_manager):
+        """Test that a malformed cursor is rejected."""
+        mock_manager.get_connection.return_value = _node_client([])
+
+        result = await scan_keys(cursor='abc')
+
+        assert 'Invalid cursor' in result['error']
+
+    @pytest.mark.asyncio
+    async def test_scan_keys_error(self, mock_manager):
+        """Test that server errors are returned."""
+        client = Mock()
+        client.scan.side_effect = ValkeyError('Test error')
+        mock_manager.get_connection.return_value = client
+
+        result = await scan_keys()
+
+        assert result == {'error': 'Test error'}
+
+    @pytest.mark.asyncio
+    async def test_keyspace_report(self, mock_manager):
+        """Test aggregating keys and memory by prefix."""
+        client = _node_client(
+            [(0, ['session:1', 'session:2', 'user:1', 'counter'])],
+            [
+                'string', 100, -1,
+                'string', 100, 60,
+                'hash', 500, -1,
+                'string', ValkeyError('no such key'), -2,
+            ],
+        )  # fmt: skip
+        mock_manager.get_connection.return_value = client
+
+        result = await keyspace_report(top=2)
+
+        assert result['scanned_keys'] == 4
+        assert result['total_memory_bytes'] == 700
+        assert result['prefix_count'] == 3
+        assert [p['prefix'] for p in result['top_prefixes_by_memory']] == ['user:', 'session:']
+        assert [p['prefix'] for p in result['top_prefixes_by_count']] == ['session:', 'user:']
+        assert result['top_prefixes_by_count'][0] == {
+            'prefix': 'session:',
+            'keys': 2,
+            'memory_bytes': 200,
+            'keys_without_ttl': 1,
+            'types': {'string': 2},
+            'avg_memory_bytes': 100,
+        }
+        assert result['complete'] is True
+
+    def test_prefix(self):
+        """Test grouping keys by their leading segments."""
+        assert _prefix('app:user:1', ':', 1) == 'app:'
+        assert _prefix('app:user:1', ':', 2) == 'app:user:'
+        assert _prefix('app:user:1', ':', 5) == 'app:user:'
+        assert _prefix('counter', ':', 1) == '(none)'